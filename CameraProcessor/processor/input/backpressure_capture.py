@@ -0,0 +1,272 @@
+"""Contains the BackpressureCapture class, which drops frames when processing falls behind.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import logging
+import threading
+
+from processor.input.i_capture import ICapture, FRAME_WAIT_TIMEOUT
+
+# Drop policies supported by the BackpressureCapture.
+DROP_POLICIES = ['none', 'latest', 'nth', 'deadline', 'rate']
+
+
+class BackpressureCapture(ICapture):
+    """Wraps a capture and drops frames according to a policy, counting every frame that is dropped.
+
+    With the none policy every frame of the capture is returned. With the latest policy a separate thread keeps
+    reading the capture and only the most recent frame is returned, older frames that were never returned are dropped.
+    The nth policy drops every drop_interval-th frame, lowering the frame rate by a fixed fraction.
+    The deadline policy drops frames that are more than max_latency seconds late. How late a frame is, is the time
+    passed since the first frame minus the position of the frame in the stream. The position is based on the frame
+    timestamps, or on the frame number if fps is given, which is needed for captures that timestamp frames when
+    they are read (videos and images). The rate policy returns at most target_fps frames per second, positioned by
+    the frame number if fps is given, otherwise by the time they are read.
+
+    When the drop of a frame is known before it is read (nth, rate and deadline with fps), the frame is skipped
+    without decoding it (skip_frame).
+
+    Attributes:
+        capture (ICapture): The wrapped capture.
+        policy (str): The drop policy.
+        frames_read (int): Number of frames read from the wrapped capture.
+        frames_dropped (int): Number of frames that were dropped.
+        frames_skipped (int): Number of dropped frames that were skipped without decoding them.
+
+        __drop_interval (int): Every how many frames a frame is dropped for the nth policy.
+        __max_latency (float): Seconds a frame may be late for the deadline policy.
+        __fps (float): Frame rate used to calculate the position of a frame in the stream, 0 uses the timestamps.
+        __target_fps (float): Maximum frames per second returned by the rate policy.
+        __next_position (float): Position in the stream from which the next frame is returned by the rate policy.
+
+        __first_time (float): Wall clock time of the first frame.
+        __first_time_stamp (float): Timestamp of the first frame.
+
+        __latest_frame (FrameObj): Most recent frame not yet returned by the latest policy.
+        __condition (threading.Condition): Signals a new latest frame or the end of the reading thread.
+        __reading (bool): Whether the reading thread of the latest policy runs and should keep running.
+        __reading_thread (threading.Thread): Thread reading the capture for the latest policy.
+    """
+    def __init__(self, capture, policy='none', drop_interval=0, max_latency=0.5, fps=0, target_fps=0):
+        """Wraps the capture and starts the reading thread when the latest policy is used.
+
+        Args:
+            capture (ICapture): The capture to wrap.
+            policy (str): The drop policy, one of DROP_POLICIES.
+            drop_interval (int): Every how many frames a frame is dropped for the nth policy, 0 drops nothing.
+            max_latency (float): Seconds a frame may be late for the deadline policy.
+            fps (float): Frame rate used to calculate the position of a frame in the stream, 0 uses the timestamps.
+            target_fps (float): Maximum frames per second returned by the rate policy, 0 returns every frame.
+
+        Raises:
+            NameError: The drop policy is unknown.
+        """
+        if policy not in DROP_POLICIES:
+            raise NameError(f'Drop policy "{policy}" is unknown')
+
+        self.capture = capture
+        self.policy = policy
+        self.frames_read = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+
+        self.__drop_interval = drop_interval
+        self.__max_latency = max_latency
+        self.__fps = fps
+        self.__target_fps = target_fps
+        self.__next_position = None
+
+        self.__first_time = None
+        self.__first_time_stamp = None
+
+        self.__latest_frame = None
+        self.__condition = threading.Condition()
+        self.__reading = False
+        self.__reading_thread = None
+
+        if self.policy == 'latest':
+            self.__reading = True
+            self.__reading_thread = threading.Thread(target=self.__read, daemon=True)
+            self.__reading_thread.start()
+
+    @property
+    def frames_returned(self):
+        """Number of frames that were read and not dropped.
+
+        Returns:
+            int: Frames read minus frames dropped.
+        """
+        return self.frames_read - self.frames_dropped
+
+    def opened(self):
+        """Check whether the wrapped capture is still opened, or a frame is still waiting to be returned.
+
+        Returns:
+            bool: Whether the capture still has frames to return.
+        """
+        # The reading thread of the latest policy may still be handing over the last frame of the capture.
+        if self.__reading_thread is not None:
+            return self.__reading_thread.is_alive() or self.__latest_frame is not None
+
+        return self.capture.opened()
+
+    def close(self):
+        """Stops the reading thread and closes the wrapped capture."""
+        logging.info(f'Capture closing after reading {self.frames_read} frames, '
+                     f'of which {self.frames_dropped} were dropped ({self.frames_skipped} without decoding them)')
+
+        if self.__reading_thread is not None:
+            self.__reading = False
+            self.__reading_thread.join()
+
+        self.capture.close()
+
+    def get_next_frame(self):
+        """Gets the next frame that is not dropped by the policy.
+
+        Returns:
+            bool, FrameObj: Boolean whether a next frame was found.
+                            Frame from the capture object.
+        """
+        if self.policy == 'latest':
+            return self.__get_latest_frame()
+
+        while self.capture.opened():
+            # A frame of which the drop is known beforehand is not decoded.
+            if self.__drop_before_read():
+                if not self.capture.skip_frame():
+                    return False, None
+
+                self.frames_read += 1
+                self.frames_dropped += 1
+                self.frames_skipped += 1
+                continue
+
+            ret, frame_obj = self.capture.get_next_frame()
+
+            if not ret:
+                return False, None
+
+            self.frames_read += 1
+
+            if self.__should_drop(frame_obj):
+                self.frames_dropped += 1
+                continue
+
+            return True, frame_obj
+
+        return False, None
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until a new frame may be returned or the capture closed.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        if self.policy != 'latest':
+            return self.capture.wait_for_frame(timeout)
+
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: self.__latest_frame is not None or not self.__reading, timeout
+            )
+
+    def __drop_before_read(self):
+        """Check whether the next frame should be dropped, for the policies that know so before reading it.
+
+        Returns:
+            bool: Whether the next frame should be dropped.
+        """
+        if self.policy == 'nth':
+            return self.__drop_interval > 0 and (self.frames_read + 1) % self.__drop_interval == 0
+
+        # The position of the next frame is known from its number, once the first frame was read.
+        if self.policy == 'deadline' and self.__fps > 0 and self.__first_time is not None:
+            return (time.time() - self.__first_time) - self.frames_read / self.__fps > self.__max_latency
+
+        if self.policy == 'rate' and self.__target_fps > 0:
+            position = self.frames_read / self.__fps if self.__fps > 0 else time.time()
+
+            # Allow for rounding, so a target that divides the frame rate returns every so many frames exactly.
+            if self.__next_position is not None and position < self.__next_position - 1e-6:
+                return True
+
+            # After a gap in the stream the next frames are due from this frame on, instead of in a burst.
+            next_position = position if self.__next_position is None else max(self.__next_position, position)
+            self.__next_position = next_position + 1 / self.__target_fps
+            return False
+
+        return False
+
+    def __should_drop(self, frame_obj):
+        """Check whether the frame that was read should be dropped by the deadline policy.
+
+        Args:
+            frame_obj (FrameObj): Frame that was read.
+
+        Returns:
+            bool: Whether the frame should be dropped.
+        """
+        if self.policy == 'deadline':
+            now = time.time()
+
+            # The first frame is never late.
+            if self.__first_time is None:
+                self.__first_time = now
+                self.__first_time_stamp = frame_obj.timestamp
+                return False
+
+            if self.__fps > 0:
+                stream_position = (self.frames_read - 1) / self.__fps
+            else:
+                stream_position = frame_obj.timestamp - self.__first_time_stamp
+
+            return (now - self.__first_time) - stream_position > self.__max_latency
+
+        return False
+
+    def __get_latest_frame(self):
+        """Gets the most recent frame read by the reading thread, without waiting for a new frame.
+
+        The caller waits for a new frame in wait_for_frame, on the condition the reading thread notifies.
+
+        Returns:
+            bool, FrameObj: Boolean whether a frame was found that was not returned before.
+                            The most recent frame.
+        """
+        with self.__condition:
+            frame_obj, self.__latest_frame = self.__latest_frame, None
+
+        return frame_obj is not None, frame_obj
+
+    def __read(self):
+        """Keeps reading the wrapped capture, replacing the latest frame and dropping the replaced one."""
+        while self.__reading and self.capture.opened():
+            ret, frame_obj = self.capture.get_next_frame()
+
+            # No new frame was ready yet, wait for it without keeping a core busy.
+            if not ret:
+                self.capture.wait_for_frame(FRAME_WAIT_TIMEOUT)
+                continue
+
+            with self.__condition:
+                self.frames_read += 1
+
+                # The previous frame was never returned, so it is dropped.
+                if self.__latest_frame is not None:
+                    self.frames_dropped += 1
+
+                self.__latest_frame = frame_obj
+                self.__condition.notify_all()
+
+        # Wake up the callers waiting for a frame, no frames follow anymore.
+        with self.__condition:
+            self.__reading = False
+            self.__condition.notify_all()
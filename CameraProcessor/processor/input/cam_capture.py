@@ -40,6 +40,14 @@ class CamCapture(ICapture):
         """Releases webcam."""
         self.cap.release()
 
+    def skip_frame(self):
+        """Moves past the next frame of the webcam, without decoding and converting it.
+
+        Returns:
+            bool: Whether a frame was skipped.
+        """
+        return self.cap.grab()
+
     def get_next_frame(self):
         """Gets the next frame from the capture object.
 
@@ -0,0 +1,139 @@
+"""Contains the ConnectionPool class, which reuses keep-alive HTTP connections.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import threading
+import http.client
+import urllib.error
+from collections import deque
+from urllib.parse import urlsplit
+
+
+class ConnectionPool:
+    """Keeps HTTP connections open after a request, so the next request to the same host does not connect again.
+
+    Fetching a playlist and its segments every few seconds otherwise costs a TCP (and TLS) handshake per request.
+    Requests may come from multiple threads, every request takes an idle connection or opens a new one.
+
+    Attributes:
+        max_idle (int): Maximum amount of idle connections kept per host.
+        timeout (float): Seconds a connection may block on connecting or reading.
+        requests (int): Amount of requests sent.
+        connections_opened (int): Amount of connections opened.
+
+        __idle (dict[(str, str), deque]): Idle connections per scheme and host.
+        __lock (threading.Lock): Guards the idle connections.
+    """
+    def __init__(self, max_idle=4, timeout=10.):
+        """Inits an empty pool.
+
+        Args:
+            max_idle (int): Maximum amount of idle connections kept per host.
+            timeout (float): Seconds a connection may block on connecting or reading.
+        """
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.requests = 0
+        self.connections_opened = 0
+
+        self.__idle = {}
+        self.__lock = threading.Lock()
+
+    def get(self, url):
+        """Gets the body of the url.
+
+        A kept connection may have been closed by the server in the meantime, the request is then retried once
+        on a new connection.
+
+        Args:
+            url (str): Http(s) url to get.
+
+        Returns:
+            bytes: Body of the response.
+
+        Raises:
+            urllib.error.HTTPError: The server did not respond with 200 OK.
+            ConnectionError: The request failed.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query != '' else '')
+
+        for attempt in range(2):
+            connection, reused = self.__take(key)
+            try:
+                self.requests += 1
+                connection.request('GET', path)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError(f'Request to {url} failed: {error}') from error
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.__give(key, connection)
+
+            if response.status != 200:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return body
+
+        # Not reached, the second attempt returns or raises.
+        raise ConnectionError(f'Request to {url} failed')
+
+    def close(self):
+        """Closes the idle connections."""
+        with self.__lock:
+            for connections in self.__idle.values():
+                for connection in connections:
+                    connection.close()
+            self.__idle.clear()
+
+    def __take(self, key):
+        """Takes an idle connection to the host or opens a new one.
+
+        Args:
+            key ((str, str)): Scheme and host.
+
+        Returns:
+            http.client.HTTPConnection, bool: The connection and whether it was used before.
+
+        Raises:
+            ConnectionError: The scheme is not http or https.
+        """
+        with self.__lock:
+            connections = self.__idle.get(key)
+            if connections:
+                return connections.pop(), True
+
+        scheme, host = key
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(host, timeout=self.timeout)
+        elif scheme == 'http':
+            connection = http.client.HTTPConnection(host, timeout=self.timeout)
+        else:
+            raise ConnectionError(f'Scheme {scheme} is not supported')
+
+        self.connections_opened += 1
+        return connection, False
+
+    def __give(self, key, connection):
+        """Keeps a connection of which the response was read completely.
+
+        Args:
+            key ((str, str)): Scheme and host.
+            connection (http.client.HTTPConnection): The connection.
+        """
+        with self.__lock:
+            connections = self.__idle.setdefault(key, deque())
+            if len(connections) < self.max_idle:
+                connections.append(connection)
+                return
+
+        connection.close()
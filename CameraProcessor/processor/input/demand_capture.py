@@ -0,0 +1,102 @@
+"""Contains the DemandCapture class, which lowers the frame rate while nothing needs the output of the camera.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import logging
+
+from processor.input.i_capture import ICapture
+
+
+class DemandCapture(ICapture):
+    """Wraps a capture and skips frames while the demand of the camera is zero.
+
+    The demand is sent by the orchestrator, it is zero when no client watches the camera and no object is tracked.
+    Without demand only idle_fps frames per second are returned, or none at all when idle_fps is zero,
+    so the stages after the capture are paused. The wrapped capture keeps being read, so the first frame returned
+    when the demand is back is a recent one, which is returned right away.
+    Between skipped frames the caller waits for the next frame of the wrapped capture (wait_for_frame),
+    so an idle camera does not keep a core busy. Skipped frames are not decoded (skip_frame), as the demand is known
+    before the frame is read.
+
+    Attributes:
+        capture (ICapture): The wrapped capture.
+        demand (func): Function returning the demand of the camera, None if it is unknown.
+        idle_fps (float): Frames per second returned while the demand is zero.
+        frames_skipped (int): Number of frames that were skipped for lack of demand.
+
+        __last_time (float): Time the last frame was returned.
+        __idle (bool): Whether the previous frame was read without demand.
+    """
+    def __init__(self, capture, demand, idle_fps=1):
+        """Wraps the capture.
+
+        Args:
+            capture (ICapture): The capture to wrap.
+            demand (func): Function returning the demand of the camera, None if it is unknown.
+            idle_fps (float): Frames per second returned while the demand is zero, 0 returns no frames.
+        """
+        self.capture = capture
+        self.demand = demand
+        self.idle_fps = idle_fps
+        self.frames_skipped = 0
+
+        self.__last_time = 0
+        self.__idle = False
+
+    def opened(self):
+        """Check whether the wrapped capture is still opened.
+
+        Returns:
+            bool: Whether the capture still has frames to return.
+        """
+        return self.capture.opened()
+
+    def close(self):
+        """Closes the wrapped capture."""
+        logging.info(f'Capture closing after skipping {self.frames_skipped} frames without demand')
+        self.capture.close()
+
+    def get_next_frame(self):
+        """Gets the next frame of the wrapped capture, unless it is skipped for lack of demand.
+
+        Returns:
+            bool, FrameObj: Boolean whether a frame was found that is not skipped.
+                            Frame from the capture object.
+        """
+        demand = self.demand()
+        now = time.time()
+        idle = demand is not None and demand <= 0
+
+        if idle != self.__idle:
+            self.__idle = idle
+            logging.info('Lowering the frame rate, nothing needs the output of the camera' if idle else
+                         'Resuming the frame rate, the output of the camera is needed')
+
+        # Unknown demand is treated as demand, an orchestrator that never sends it always needs the output.
+        if idle and (self.idle_fps <= 0 or now - self.__last_time < 1 / self.idle_fps):
+            if self.capture.skip_frame():
+                self.frames_skipped += 1
+            return False, None
+
+        ret, frame_obj = self.capture.get_next_frame()
+
+        if not ret:
+            return False, None
+
+        self.__last_time = now
+        return True, frame_obj
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the wrapped capture may return a new frame or closed.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        return self.capture.wait_for_frame(timeout)
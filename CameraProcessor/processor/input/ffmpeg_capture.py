@@ -0,0 +1,340 @@
+"""Contains the FfmpegCapture class, which decodes a stream with an ffmpeg subprocess into a ring of buffers.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import re
+import sys
+import time
+import queue
+import logging
+import threading
+import ffmpeg
+import numpy as np
+
+from processor.input.i_capture import ICapture
+from processor.data_object.frame_obj import FrameObj
+
+# Pattern of the line the showinfo filter logs for every decoded frame.
+PTS_PATTERN = re.compile(r'Parsed_showinfo.*\bpts_time:\s*(-?[0-9.]+)')
+# Seconds to wait for the timestamp of a frame that was read.
+PTS_TIMEOUT = 1.
+
+
+class FfmpegCapture(ICapture):
+    """Implementation of the ICapture class which decodes an HLS stream (or any input of ffmpeg) in a subprocess.
+
+    A single ffmpeg process decodes the stream to raw BGR frames on its stdout, while its showinfo filter logs the
+    timestamp of every frame on stderr. With -copyts these are the timestamps of the stream itself, so no separate
+    probe of the start time is needed. A reading thread reads every frame straight into a buffer of a fixed ring,
+    and get_next_frame hands out the most recent frame as a view of its buffer, without copying.
+
+    A buffer is owned by the pipeline as long as any array viewing it is alive, e.g. the frame buffer or a cutout,
+    and only returns to the ring when the last of them is gone. The reading thread never writes to a buffer that is
+    owned or holds the frame about to be returned, so a returned frame is never overwritten.
+    When all buffers are owned, new frames are dropped until a buffer returns.
+    Buffers are allocated when the ring first needs them and reused afterwards.
+
+    Attributes:
+        url (str): Url (or path) of the stream.
+        width (int): Width of the frames.
+        height (int): Height of the frames.
+        fps (float): Frame rate of the stream, 0 if unknown.
+        buffers (int): Maximum amount of buffers of the ring.
+        frames_read (int): Amount of frames decoded into a buffer.
+        frames_dropped (int): Amount of frames dropped because all buffers were owned.
+
+        __retries (int): Number of restarts of ffmpeg before the capture closes.
+        __frame_size (int): Amount of bytes of a frame.
+        __ring ([bytearray]): Buffers of the ring.
+        __discard (bytearray): Buffer reading the frames that are dropped.
+        __latest ((int, float)): Index in the ring and timestamp of the frame to return next, None if returned.
+        __condition (threading.Condition): Signals a new frame or the closing of the capture.
+        __running (bool): Whether the reading thread runs and should keep running.
+        __process (subprocess.Popen): The running ffmpeg process.
+        __reading_thread (threading.Thread): Thread reading the frames from ffmpeg.
+    """
+    def __init__(self, url, buffers=160, retries=10):
+        """Probes the stream and starts decoding it.
+
+        Args:
+            url (str): Url (or path) of the stream.
+            buffers (int): Maximum amount of buffers of the ring, should exceed the amount of frames the pipeline
+                holds on to (the frame buffer and frames in progress).
+            retries (int): Number of failed probes or restarts of ffmpeg before the capture gives up.
+
+        Raises:
+            TimeoutError: The stream could not be probed.
+        """
+        self.url = url
+        # A buffer is written while another waits to be returned and the pipeline holds the previous frame.
+        self.buffers = max(buffers, 3)
+        self.frames_read = 0
+        self.frames_dropped = 0
+        self.__retries = retries
+
+        self.width, self.height, self.fps = self.__probe()
+        self.__frame_size = self.width * self.height * 3
+        self.__ring = []
+        self.__discard = bytearray(self.__frame_size)
+        self.__latest = None
+
+        self.__condition = threading.Condition()
+        self.__running = True
+        self.__process = None
+        self.__reading_thread = threading.Thread(target=self.__read, name='ffmpeg capture', daemon=True)
+        self.__reading_thread.start()
+
+    def opened(self):
+        """Check whether the capture still decodes the stream or has a frame left.
+
+        Returns:
+            bool: Whether the capture is opened.
+        """
+        return self.__running or self.__latest is not None
+
+    def close(self):
+        """Stops ffmpeg and the reading thread."""
+        logging.info(f'ffmpeg capture closing after reading {self.frames_read} frames, '
+                     f'dropping {self.frames_dropped} frames while all buffers were owned')
+
+        with self.__condition:
+            self.__running = False
+            self.__latest = None
+            self.__condition.notify_all()
+
+        process = self.__process
+        if process is not None and process.poll() is None:
+            process.kill()
+        self.__reading_thread.join()
+
+    def get_next_frame(self):
+        """Gets the most recent decoded frame, as a view of its buffer in the ring.
+
+        Returns:
+            bool, FrameObj: Whether a new frame was returned and the frame object containing it.
+        """
+        with self.__condition:
+            if self.__latest is None:
+                return False, None
+
+            index, timestamp = self.__latest
+
+            # The view keeps the buffer owned until the pipeline is done with the frame.
+            frame = np.frombuffer(self.__ring[index], dtype=np.uint8).reshape((self.height, self.width, 3))
+            self.__latest = None
+
+        return True, FrameObj(frame, timestamp)
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the reading thread decoded a frame that was not returned yet, or the capture closed.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__latest is not None or not self.__running, timeout)
+
+    @property
+    def buffers_owned(self):
+        """Gets the amount of buffers of the ring owned by the pipeline.
+
+        Returns:
+            int: Amount of buffers viewed by an array outside the ring or holding the next frame to return.
+        """
+        with self.__condition:
+            return sum(not self.__is_free(index) for index in range(len(self.__ring)))
+
+    def __probe(self):
+        """Probes the size and frame rate of the stream, retrying when it cannot be found.
+
+        Returns:
+            int, int, float: Width and height of the frames and the frame rate of the stream (0 if unknown).
+
+        Raises:
+            TimeoutError: The stream could not be probed.
+        """
+        for tries_left in range(self.__retries, 0, -1):
+            logging.info(f'Probing stream {self.url}. Attempts left: {tries_left}')
+            try:
+                # pylint: disable=no-member
+                meta_data = ffmpeg.probe(self.url)
+                # pylint: enable=no-member
+                stream = next(stream for stream in meta_data['streams'] if stream['codec_type'] == 'video')
+                numerator, denominator = stream.get('avg_frame_rate', '0/0').split('/')
+                fps = float(numerator) / float(denominator) if float(denominator) > 0 else 0.
+                return int(stream['width']), int(stream['height']), fps
+
+            # pylint: disable=protected-access
+            except ffmpeg._run.Error as error:
+                logging.warning(f'ffmpeg could not find stream, giving the following error: {error}')
+            except (StopIteration, KeyError, ValueError):
+                logging.warning('Stream does not contain a video stream of known size')
+
+            time.sleep(1)
+
+        raise TimeoutError('ffmpeg capture never opened')
+
+    def __start_process(self):
+        """Starts ffmpeg decoding the stream to raw BGR frames, logging their timestamps.
+
+        Frames are passed through as decoded, so every frame written matches a logged timestamp.
+
+        Returns:
+            subprocess.Popen: The ffmpeg process.
+        """
+        # pylint: disable=no-member
+        return (ffmpeg
+                .input(self.url)
+                .filter('showinfo')
+                .output('pipe:', format='rawvideo', pix_fmt='bgr24', vsync='passthrough')
+                .global_args('-copyts', '-hide_banner', '-nostats', '-loglevel', 'info')
+                .run_async(pipe_stdout=True, pipe_stderr=True))
+        # pylint: enable=no-member
+
+    def __read(self):
+        """Decodes the stream until the capture is closed, restarting ffmpeg when it fails."""
+        retries_left = self.__retries
+
+        while self.__running:
+            self.__process = self.__start_process()
+            frames = self.__read_process(self.__process)
+
+            if self.__process.poll() is None:
+                self.__process.kill()
+            return_code = self.__process.wait()
+
+            # The stream ended, or the capture was closed.
+            if not self.__running or return_code == 0:
+                break
+
+            retries_left = self.__retries if frames > 0 else retries_left - 1
+            if retries_left <= 0:
+                logging.error(f'ffmpeg failed {self.__retries} times in a row, closing the capture')
+                break
+
+            logging.warning(f'ffmpeg stopped with code {return_code}, restarting')
+            time.sleep(1)
+
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+
+    def __read_process(self, process):
+        """Reads the frames of an ffmpeg process into the ring until it stops.
+
+        Args:
+            process (subprocess.Popen): The ffmpeg process.
+
+        Returns:
+            int: Amount of frames read.
+        """
+        timestamps = queue.Queue()
+        log_thread = threading.Thread(target=self.__read_timestamps, args=(process.stderr, timestamps),
+                                      name='ffmpeg log', daemon=True)
+        log_thread.start()
+
+        frames = 0
+        while self.__running:
+            index = self.__take_buffer()
+            buffer = self.__ring[index] if index is not None else self.__discard
+
+            read = self.__read_into(process.stdout, buffer)
+
+            # Without a reference of the reading thread, the buffer is free once the pipeline is done with it.
+            buffer = None
+            if not read:
+                break
+
+            # The timestamp is logged before the frame is written, so it is normally already there.
+            try:
+                timestamp = timestamps.get(timeout=PTS_TIMEOUT)
+            except queue.Empty:
+                logging.warning('ffmpeg did not log the timestamp of a frame, restarting')
+                break
+
+            frames += 1
+            with self.__condition:
+                if index is None:
+                    self.frames_dropped += 1
+                    continue
+
+                self.frames_read += 1
+                self.__latest = (index, timestamp)
+                self.__condition.notify_all()
+
+        return frames
+
+    def __take_buffer(self):
+        """Takes a buffer of the ring that is not owned and does not hold the next frame to return.
+
+        Returns:
+            int: Index of the buffer in the ring, None if all buffers are owned.
+        """
+        with self.__condition:
+            for index in range(len(self.__ring)):
+                if self.__is_free(index):
+                    return index
+
+            if len(self.__ring) < self.buffers:
+                self.__ring.append(bytearray(self.__frame_size))
+                return len(self.__ring) - 1
+
+        return None
+
+    def __is_free(self, index):
+        """Checks whether a buffer of the ring can be written.
+
+        Args:
+            index (int): Index of the buffer in the ring.
+
+        Returns:
+            bool: Whether nothing views the buffer and it does not hold the next frame to return.
+        """
+        if self.__latest is not None and self.__latest[0] == index:
+            return False
+
+        # Only the ring and the argument refer to a buffer that is not viewed by any array.
+        return sys.getrefcount(self.__ring[index]) <= 2
+
+    @staticmethod
+    def __read_into(pipe, buffer):
+        """Reads a whole frame from the pipe into the buffer.
+
+        Args:
+            pipe (io.BufferedReader): Stdout of ffmpeg.
+            buffer (bytearray): Buffer to read into.
+
+        Returns:
+            bool: Whether a whole frame was read, False if the pipe was closed.
+        """
+        with memoryview(buffer) as view:
+            position = 0
+            while position < len(view):
+                count = pipe.readinto(view[position:])
+                if not count:
+                    return False
+                position += count
+
+        return True
+
+    @staticmethod
+    def __read_timestamps(pipe, timestamps):
+        """Puts the timestamp of every frame logged by ffmpeg in the queue until the pipe is closed.
+
+        Args:
+            pipe (io.BufferedReader): Stderr of ffmpeg.
+            timestamps (queue.Queue): Queue receiving the timestamps.
+        """
+        for line in pipe:
+            line = line.decode(errors='replace')
+            match = PTS_PATTERN.search(line)
+            if match is not None:
+                timestamps.put(float(match.group(1)))
+            elif 'error' in line.lower():
+                logging.warning(f'ffmpeg: {line.strip()}')
@@ -7,34 +7,54 @@ Utrecht University within the Software Project course.
 
 import time
 import logging
+import threading
 import kthread
 import ffmpeg
 import cv2
 
 from processor.input.i_capture import ICapture
+from processor.input.variant_selector import VariantSelector
 from processor.data_object.frame_obj import FrameObj
 
+# Seconds of frames over which decoding and processing are measured to select the variant.
+VARIANT_WINDOW = 2.
+
 
 class HlsCapture(ICapture):
     """Implementation of the ICapture class which handles an HLS stream with timestamps.
 
     Main thread runs the implementation with open, close and getting the next frame.
-    Separate thread runs the reading loop, which reads the next frame at a constant rate.
+    Separate thread runs the reading loop, which reads the next frame at a constant rate
+    and signals every new frame to callers waiting in wait_for_frame.
     Another thread gets the time stamp of the stream once and going from there.
 
+    When a target width is given and the url is a master playlist, the variant closest to the target width
+    is decoded instead, switching to a smaller variant when decoding falls behind and to a larger variant
+    when decoding and processing have headroom (see VariantSelector).
+
+    With a target frame rate below the frame rate of the stream, the reading thread only decodes the frames the
+    pipeline processes (retrieve), the frames in between are demuxed without decoding them (grab).
+
     Attributes:
         hls_url (str): Url of hls stream.
         fps (int): FPS of the stream.
+        target_width (int): Width of the variant to decode, the input width of the detector, 0 decodes the url as is.
+        target_fps (float): Frames per second decoded at most, 0 decodes every frame.
+        frames_grabbed (int): Amount of frames read without decoding them.
 
         __start_time_stamp (float): Start time of capture object.
         __frame_time_stamp (float): Time stamp of current frame.
         __last_frame_time_stamp (float): Time stamp of previous frame.
         __hls_start_time_stamp (float): Start time of hls stream.
 
+        __stream_url (str): Url of the decoded stream, the selected variant or the hls url.
+        __selector (VariantSelector): Selects the variant of the master playlist, None if not selecting one.
+
         __thread_start_time (float): Start time of thread.
         __wait_ms (float): Time between frames in ms
 
         __current_frame (numpy.ndarray): The current frame.
+        __frame_condition (threading.Condition): Signals a new frame, a reconnect or the closing of the capture.
 
         __previous_time (float): a time float to determine the time diff between frame readings.
         __timeout (int): an integer for timeout in seconds (used as float).
@@ -50,7 +70,7 @@ class HlsCapture(ICapture):
         __drop_reconnect (bool): Boolean indicating the reconnect-thread can be closed
         __found_stream (bool): Boolean indicating whether stream was found.
     """
-    def __init__(self, hls_url='http://81.83.10.9:8001/mjpg/video.mjpg', retries=10):
+    def __init__(self, hls_url='http://81.83.10.9:8001/mjpg/video.mjpg', retries=10, target_width=0, target_fps=0):
         """Initiates the capture object with a hls url and starts reading frames.
 
         Default hls_url is of a public stream that is available 24/7.
@@ -58,11 +78,19 @@ class HlsCapture(ICapture):
         Args:
             hls_url (str): Url the cv2.VideoCapture has to connect to.
             retries (int): Number of retries before it is concluded connection cannot be made.
+            target_width (int): Width of the variant to decode, the input width of the detector,
+                0 decodes the url as is.
+            target_fps (float): Frames per second decoded at most, 0 decodes every frame.
         """
 
         # Stream related properties.
         self.hls_url = hls_url
         self.fps = 0
+        self.target_width = target_width
+        self.target_fps = target_fps
+        self.frames_grabbed = 0
+        self.__stream_url = hls_url
+        self.__selector = None
 
         # Time stamps.
         self.__start_time_stamp = 0
@@ -76,6 +104,7 @@ class HlsCapture(ICapture):
 
         # Frame numbers.
         self.__current_frame = None
+        self.__frame_condition = threading.Condition()
 
         # Tells thread they should keep running.
         self.__thread_running = False
@@ -110,8 +139,9 @@ class HlsCapture(ICapture):
         logging.info('HLS stream closing')
         logging.info("Joining threads")
 
-        # Join the reading thread.
+        # Join the reading thread, waking up the callers waiting for a frame.
         self.__thread_running = False
+        self.__notify_waiting()
         self.__reading_thread.join()
 
         # Join the reconnecting thread.
@@ -153,6 +183,29 @@ class HlsCapture(ICapture):
         self.__last_frame_time_stamp = self.__frame_time_stamp
         return True, FrameObj(self.__current_frame, self.__frame_time_stamp)
 
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the reading thread read a frame that was not returned yet, or the capture closed.
+
+        While reconnecting, the caller waits until the stream is connected again.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        with self.__frame_condition:
+            return self.__frame_condition.wait_for(
+                lambda: not self.__thread_running or
+                (not self.__reconnecting and self.__frame_time_stamp != self.__last_frame_time_stamp),
+                timeout
+            )
+
+    def __notify_waiting(self):
+        """Wakes up the callers waiting for a frame."""
+        with self.__frame_condition:
+            self.__frame_condition.notify_all()
+
     def __read(self, cap, hls_start_time_stamp, wait_ms):
         """Method that runs in separate thread that goes through the frames of the stream at a consistent pace.
 
@@ -168,21 +221,43 @@ class HlsCapture(ICapture):
         current_frame_nr = 0
         thread_start_time = time.time()
 
+        # Position in the stream (in ms) from which the next frame is decoded, the ones before it are only grabbed.
+        next_decode_time = 0.
+
+        # Statistics of the current window of the variant selection.
+        window_frames = 0
+        window_skipped = 0
+        window_read_time = 0.
+
         while self.__thread_running and not self.__reconnecting:
-            # Reads next frame.
+            # Reads next frame, only decoding it if it is due for the target frame rate.
+            current_frame_time = current_frame_nr * wait_ms
+            decode = self.target_fps <= 0 or current_frame_time >= next_decode_time - 1e-3
             try:
-                ret, self.__current_frame = cap.read()
+                read_start = time.time()
+                ret, frame = cap.read() if decode else (cap.grab(), None)
+                read_time = time.time() - read_start
             except SystemExit as error:
                 logging.warning('Capture read has been blocked')
                 raise TimeoutError('Capture read has been blocked.') from error
 
-            # If frame was not yet ready.
+            # If frame was not yet ready, retry after a frame interval instead of spinning.
             if not ret:
+                time.sleep(wait_ms / 1000)
                 continue
 
-            # Saves timestamp of the current frame.
-            current_frame_time = current_frame_nr * wait_ms
-            self.__frame_time_stamp = hls_start_time_stamp + (current_frame_time / 1000)
+            # Saves the decoded frame with its timestamp, and signals it to the callers waiting for a frame.
+            if decode:
+                if self.target_fps > 0:
+                    next_decode_time = max(next_decode_time, current_frame_time) + 1000 / self.target_fps
+                with self.__frame_condition:
+                    # The previous frame was overwritten before it was returned.
+                    window_skipped += self.__frame_time_stamp != self.__last_frame_time_stamp
+                    self.__current_frame = frame
+                    self.__frame_time_stamp = hls_start_time_stamp + (current_frame_time / 1000)
+                    self.__frame_condition.notify_all()
+            else:
+                self.frames_grabbed += 1
 
             # Calculate the wait time for the next frame.
             time_into_stream = time.time() - thread_start_time
@@ -190,11 +265,32 @@ class HlsCapture(ICapture):
 
             current_frame_nr += 1
 
+            # Let the selector switch the variant after every window.
+            window_frames += 1
+            window_read_time += read_time
+            if self.__selector is not None and window_frames * wait_ms >= VARIANT_WINDOW * 1000:
+                if self.__selector.update(window_read_time * 1000 / (window_frames * wait_ms),
+                                          1 - window_skipped / window_frames):
+                    self.__switch_variant(cap)
+                    return
+                window_frames, window_skipped, window_read_time = 0, 0, 0.
+
             # Next frame should already have been read.
             if wait_time <= 0:
                 continue
 
-            cv2.waitKey(wait_time)
+            time.sleep(wait_time / 1000)
+
+    def __switch_variant(self, cap):
+        """Reconnects to the variant chosen by the selector, called by the reading thread before it stops.
+
+        Args:
+            cap (cv2.VideoCapture): Capture serving the current variant.
+        """
+        cap.release()
+        self.__stream_url = self.__selector.url
+        with self.__frame_condition:
+            self.__reconnecting = True
 
     def sync(self):
         """Method to instantiate the video connection with the HLS stream.
@@ -207,13 +303,21 @@ class HlsCapture(ICapture):
         """
         logging.info(f'Connecting to HLS stream, url: {self.hls_url}')
 
+        # Select the variant of the master playlist to decode, retried on every connect until it is loaded.
+        if self.target_width > 0 and self.__selector is None:
+            self.__selector = VariantSelector.load(self.hls_url, self.target_width)
+            if self.__selector is not None:
+                self.__stream_url = self.__selector.url
+                logging.info(f'Decoding the variant of width {self.__selector.variants[self.__selector.index][0]} '
+                             f'closest to {self.target_width}, url: {self.__stream_url}')
+
         # Creating meta thread for meta data collection.
         meta_thread = kthread.KThread(target=self.__get_meta_data)
         meta_thread.daemon = True
         meta_thread.start()
 
         # Instantiates the connection with the hls stream.
-        cap = cv2.VideoCapture(self.hls_url)
+        cap = cv2.VideoCapture(self.__stream_url)
 
         meta_thread.join()
 
@@ -243,6 +347,7 @@ class HlsCapture(ICapture):
         self.__thread_running = True
         self.__previous_time = time.time()
         self.__reading_thread.start()
+        self.__notify_waiting()
         logging.info('Reading thread started successfully!')
 
         # Start the reconnect thread.
@@ -276,7 +381,7 @@ class HlsCapture(ICapture):
         # Probe HLS stream link.
         try:
             # pylint: disable=no-member
-            meta_data = ffmpeg.probe(self.hls_url)
+            meta_data = ffmpeg.probe(self.__stream_url)
             # pylint: enable=no-member
             self.__hls_start_time_stamp = float(meta_data['format']['start_time'])
 
@@ -306,5 +411,6 @@ class HlsCapture(ICapture):
         # Raise error when capture is never created in other thread.
         if not self.__found_stream:
             self.__thread_running = False
+            self.__notify_waiting()
             logging.error('cv2.VideoCapture probably raised exception')
             raise TimeoutError('HLS Capture never opened')
@@ -5,9 +5,23 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 
+import time
+import asyncio
+
+# Seconds a caller waits for a frame at most, so a capture that closed without signalling is still noticed.
+FRAME_WAIT_TIMEOUT = 0.5
+
+# Seconds waited before retrying a capture that cannot signal when its next frame is ready.
+FRAME_POLL_INTERVAL = 0.01
+
 
 class ICapture:
-    """Superclass for a capture without implemented methods to enforce the definition of them."""
+    """Superclass for a capture without implemented methods to enforce the definition of them.
+
+    Besides calling get_next_frame, the frames can be iterated over, blocking (for frame_obj in capture)
+    or asynchronously (async for frame_obj in capture). While no new frame is ready, the iteration waits
+    in wait_for_frame instead of calling get_next_frame again, so waiting for a frame costs no CPU time.
+    """
     def opened(self):
         """Returns whether the capture object still opened.
 
@@ -28,3 +42,72 @@ class ICapture:
                             Frame from the capture object.
         """
         raise NotImplementedError('No implementation for getting next frame')
+
+    def skip_frame(self):
+        """Moves past the next frame without decoding it, for a frame that would be dropped anyway.
+
+        By default the frame is read and thrown away, captures that can skip decoding (grab) override this.
+
+        Returns:
+            bool: Whether a frame was skipped.
+        """
+        ret, _ = self.get_next_frame()
+        return ret
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until get_next_frame may return a new frame or the capture closed.
+
+        By default get_next_frame reads the next frame itself, so there is no signal to wait for.
+        Instead a short poll interval is waited, at most the timeout, so retrying does not keep a core busy.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        time.sleep(FRAME_POLL_INTERVAL if timeout is None else min(timeout, FRAME_POLL_INTERVAL))
+        return True
+
+    def __iter__(self):
+        """Iterates over the frames of the capture until it closes, blocking while no frame is ready.
+
+        Returns:
+            Generator: Generator yielding the frame object of every frame of the capture.
+        """
+        while self.opened():
+            ret, frame_obj = self.get_next_frame()
+
+            if ret:
+                yield frame_obj
+            else:
+                self.wait_for_frame(FRAME_WAIT_TIMEOUT)
+
+    def __aiter__(self):
+        """Iterates asynchronously over the frames of the capture until it closes.
+
+        Returns:
+            AsyncGenerator: Generator yielding the frame object of every frame of the capture.
+        """
+        return self.iterate_async()
+
+    async def iterate_async(self, executor=None):
+        """Iterates over the frames of the capture until it closes, waiting for a frame on the executor.
+
+        The event loop stays free while no frame is ready, frames are read on the event loop.
+
+        Args:
+            executor (concurrent.futures.Executor): executor to wait on, None uses the default of the loop.
+
+        Returns:
+            Generator: Generator yielding the frame object of every frame of the capture.
+        """
+        loop = asyncio.get_running_loop()
+
+        while self.opened():
+            ret, frame_obj = self.get_next_frame()
+
+            if ret:
+                yield frame_obj
+            else:
+                await loop.run_in_executor(executor, self.wait_for_frame, FRAME_WAIT_TIMEOUT)
@@ -51,6 +51,18 @@ class ImageCapture(ICapture):
         """Close the capture by setting the index higher than the number of images."""
         self.image_index = self.nr_images + 1
 
+    def skip_frame(self):
+        """Moves past the next image without reading it.
+
+        Returns:
+            bool: Whether an image was skipped.
+        """
+        if not self.opened():
+            return False
+
+        self.image_index += 1
+        return True
+
     def get_next_frame(self):
         """Gets the next frame from the list of images.
 
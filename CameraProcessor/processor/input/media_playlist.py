@@ -0,0 +1,120 @@
+"""Contains the MediaPlaylist class, which holds the segments of an HLS media playlist.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from datetime import datetime
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+
+def resolve_url(base_url, reference):
+    """Resolves a url in a playlist against the url of the playlist.
+
+    The query of the playlist url (e.g. an authentication token) is passed on to urls without a query of their own.
+
+    Args:
+        base_url (str): Url of the playlist.
+        reference (str): Url in the playlist, absolute or relative.
+
+    Returns:
+        str: The absolute url.
+    """
+    query = urlsplit(base_url).query
+    parts = urlsplit(urljoin(base_url, reference))
+    if parts.query == '' and query != '':
+        parts = parts._replace(query=query)
+    return urlunsplit(parts)
+
+
+class MediaPlaylist:
+    """Segments of an HLS media playlist, in the order they are played.
+
+    Attributes:
+        media_sequence (int): Sequence number of the first segment.
+        target_duration (float): Maximum duration of a segment in seconds.
+        segments ([(int, str, float, float)]): Sequence number, url, duration and program date time (as seconds
+            since the epoch, None if unknown) of every segment.
+        ended (bool): Whether no segments will be added anymore.
+    """
+    def __init__(self, media_sequence, target_duration, segments, ended):
+        """Inits the playlist.
+
+        Args:
+            media_sequence (int): Sequence number of the first segment.
+            target_duration (float): Maximum duration of a segment in seconds.
+            segments ([(int, str, float, float)]): Sequence number, url, duration and program date time of every
+                segment.
+            ended (bool): Whether no segments will be added anymore.
+        """
+        self.media_sequence = media_sequence
+        self.target_duration = target_duration
+        self.segments = segments
+        self.ended = ended
+
+    @classmethod
+    def parse(cls, url, playlist):
+        """Parses a media playlist.
+
+        A segment without a program date time of its own continues from the one before it.
+
+        Args:
+            cls (type): The class of the playlist to create.
+            url (str): Url of the playlist, to resolve the segment urls against.
+            playlist (str): Contents of the playlist.
+
+        Returns:
+            MediaPlaylist: The parsed playlist.
+
+        Raises:
+            ValueError: The playlist is not a media playlist.
+        """
+        lines = [line.strip() for line in playlist.splitlines()]
+        if len(lines) == 0 or lines[0] != '#EXTM3U':
+            raise ValueError(f'Playlist {url} does not start with #EXTM3U')
+        if any(line.startswith('#EXT-X-STREAM-INF:') for line in lines):
+            raise ValueError(f'Playlist {url} is a master playlist')
+
+        media_sequence = 0
+        target_duration = 0.
+        ended = False
+        segments = []
+        duration = None
+        program_date_time = None
+
+        for line in lines:
+            if line.startswith('#EXT-X-MEDIA-SEQUENCE:'):
+                media_sequence = int(line.split(':', 1)[1])
+            elif line.startswith('#EXT-X-TARGETDURATION:'):
+                target_duration = float(line.split(':', 1)[1])
+            elif line.startswith('#EXT-X-ENDLIST'):
+                ended = True
+            elif line.startswith('#EXTINF:'):
+                duration = float(line.split(':', 1)[1].split(',')[0])
+            elif line.startswith('#EXT-X-PROGRAM-DATE-TIME:'):
+                program_date_time = cls.__parse_date_time(line.split(':', 1)[1])
+
+            # The url of a segment follows its tags.
+            elif line != '' and not line.startswith('#') and duration is not None:
+                segments.append((media_sequence + len(segments), resolve_url(url, line), duration, program_date_time))
+                if program_date_time is not None:
+                    program_date_time += duration
+                duration = None
+
+        return cls(media_sequence, target_duration, segments, ended)
+
+    @staticmethod
+    def __parse_date_time(value):
+        """Parses an ISO 8601 program date time.
+
+        Args:
+            value (str): Date time of the tag, e.g. 2021-06-01T12:00:00.000+00:00 or 2021-06-01T12:00:00Z.
+
+        Returns:
+            float: Seconds since the epoch, None if the date time could not be parsed.
+        """
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
@@ -0,0 +1,166 @@
+"""Contains the ReadAheadCapture class, which decodes the frames of a capture ahead on a separate thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import logging
+import threading
+from collections import deque
+
+from processor.input.i_capture import ICapture, FRAME_WAIT_TIMEOUT
+
+
+class ReadAheadCapture(ICapture):
+    """Wraps a capture and reads its frames ahead on a decoder thread into a bounded queue.
+
+    Decoding then overlaps with the processing of the previous frames, instead of running on the thread of the pipeline.
+    Nothing is dropped: when the queue is full, the decoder thread waits until the pipeline took a frame.
+    Frames keep the timestamps of the wrapped capture, so it should stamp them with their position in the video
+    (e.g. VideoCapture with video_timestamps) instead of the time they were decoded.
+    An exception raised by the wrapped capture ends the decoding, it is raised by get_next_frame once the frames
+    decoded before it were returned.
+
+    Attributes:
+        capture (ICapture): The wrapped capture.
+        queue_size (int): Maximum amount of frames decoded ahead.
+        frames_read (int): Amount of frames read from the wrapped capture.
+
+        __frames (deque): Frames decoded and not yet returned, oldest first.
+        __error (Exception): Exception raised by the wrapped capture and not yet raised, None if there is none.
+        __condition (threading.Condition): Signals a decoded frame, a returned frame or the end of the decoder thread.
+        __reading (bool): Whether the decoder thread runs and should keep running.
+        __reading_thread (threading.Thread): Thread decoding the frames.
+    """
+    def __init__(self, capture, queue_size=32):
+        """Wraps the capture and starts the decoder thread.
+
+        Args:
+            capture (ICapture): The capture to wrap.
+            queue_size (int): Maximum amount of frames decoded ahead, at least 1.
+        """
+        self.capture = capture
+        self.queue_size = max(queue_size, 1)
+        self.frames_read = 0
+
+        self.__frames = deque()
+        self.__error = None
+        self.__condition = threading.Condition()
+        self.__reading = False
+        self.__reading_thread = None
+        self.__start_reading()
+
+    def opened(self):
+        """Check whether frames are left, decoded or still to decode, or an error is left to raise.
+
+        Returns:
+            bool: Whether the capture is opened.
+        """
+        with self.__condition:
+            return self.__reading or len(self.__frames) > 0 or self.__error is not None
+
+    def close(self):
+        """Stops the decoder thread, drops the frames decoded ahead and closes the wrapped capture."""
+        logging.info(f'Read-ahead capture closing after {self.frames_read} frames')
+        self.__stop_reading()
+        self.__frames.clear()
+        self.__error = None
+        self.capture.close()
+
+    def get_next_frame(self):
+        """Gets the oldest decoded frame.
+
+        Returns:
+            bool, FrameObj: Whether a frame was decoded, and the frame.
+
+        Raises:
+            Exception: The exception the wrapped capture raised after the last decoded frame.
+        """
+        with self.__condition:
+            if len(self.__frames) == 0:
+                if self.__error is not None:
+                    error, self.__error = self.__error, None
+                    raise error
+                return False, None
+
+            frame_obj = self.__frames.popleft()
+            self.__condition.notify_all()
+
+        return True, frame_obj
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until a frame was decoded or the capture has no frames left.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: len(self.__frames) > 0 or not self.__reading, timeout)
+
+    def seek(self, seconds):
+        """Moves the wrapped capture to a position, dropping the frames decoded from before the position.
+
+        Args:
+            seconds (float): Position to move to, in seconds from the start.
+
+        Returns:
+            bool: Whether the wrapped capture could move to the position.
+        """
+        self.__stop_reading()
+        self.__frames.clear()
+        self.__error = None
+        moved = self.capture.seek(seconds)
+        self.__start_reading()
+        return moved
+
+    def __start_reading(self):
+        """Starts the decoder thread."""
+        self.__reading = True
+        self.__reading_thread = threading.Thread(target=self.__read, name='read ahead', daemon=True)
+        self.__reading_thread.start()
+
+    def __stop_reading(self):
+        """Stops the decoder thread, waiting until it ended."""
+        with self.__condition:
+            self.__reading = False
+            self.__condition.notify_all()
+        self.__reading_thread.join()
+
+    def __read(self):
+        """Decodes the frames of the wrapped capture until it closes, fails or the thread is stopped."""
+        try:
+            while True:
+                # Wait for room in the queue, so at most queue_size frames are decoded ahead.
+                with self.__condition:
+                    self.__condition.wait_for(lambda: len(self.__frames) < self.queue_size or not self.__reading)
+                    if not self.__reading or not self.capture.opened():
+                        break
+
+                ret, frame_obj = self.capture.get_next_frame()
+
+                # Wait for the next frame of a live capture, so waiting does not keep a core busy.
+                if not ret:
+                    self.capture.wait_for_frame(FRAME_WAIT_TIMEOUT)
+                    continue
+
+                with self.__condition:
+                    # The frame was decoded before a seek, from the old position.
+                    if not self.__reading:
+                        break
+
+                    self.__frames.append(frame_obj)
+                    self.frames_read += 1
+                    self.__condition.notify_all()
+        # Any exception is stored and raised on the thread of the pipeline.
+        # pylint: disable=broad-except
+        except Exception as error:
+            with self.__condition:
+                self.__error = error
+        finally:
+            with self.__condition:
+                self.__reading = False
+                self.__condition.notify_all()
@@ -0,0 +1,95 @@
+"""Contains the RecordingCapture class, which records the frames of a capture to a binary log.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import cv2
+
+from processor.input.i_capture import ICapture
+from processor.input.video_capture import VideoCapture
+
+
+class RecordingCapture(ICapture):
+    """Wraps a capture and writes every frame it returns to a record log.
+
+    Depending on the frames mode of the log, a frame is stored encoded as an image, as index into the video file
+    of a VideoCapture, or only its size and timestamp are stored. Closing the capture closes the log.
+
+    Attributes:
+        capture (ICapture): The wrapped capture.
+        writer (RecordLogWriter): Log the frames are written to.
+        frame_format (str): Image format of the encoded frames, for example .jpg or .png.
+    """
+    def __init__(self, capture, writer, frame_format='.jpg'):
+        """Wraps the capture.
+
+        Args:
+            capture (ICapture): The capture to record.
+            writer (RecordLogWriter): Log the frames are written to.
+            frame_format (str): Image format of the encoded frames, for example .jpg or .png.
+
+        Raises:
+            ValueError: Frames are stored as reference while the capture does not read every frame of a video.
+        """
+        if writer.frames == 'reference' and not isinstance(capture, VideoCapture):
+            raise ValueError('Frames can only be recorded as reference when every frame of a video is processed')
+
+        self.capture = capture
+        self.writer = writer
+        self.frame_format = frame_format
+
+    def opened(self):
+        """Check whether the wrapped capture is still opened.
+
+        Returns:
+            bool: Whether the capture still has frames to return.
+        """
+        return self.capture.opened()
+
+    def close(self):
+        """Closes the wrapped capture and the log."""
+        self.capture.close()
+        self.writer.close()
+
+    def get_next_frame(self):
+        """Gets the next frame of the wrapped capture and records it.
+
+        Returns:
+            bool, FrameObj: Boolean whether a next frame was found.
+                            Frame from the capture object.
+        """
+        ret, frame_obj = self.capture.get_next_frame()
+
+        if not ret:
+            return ret, frame_obj
+
+        if self.writer.frames == 'encoded':
+            self.writer.write_frame(frame_obj, encoded=cv2.imencode(self.frame_format, frame_obj.frame)[1].tobytes())
+        elif self.writer.frames == 'reference':
+            # The frame that was just read is the one before the next frame of the video.
+            self.writer.write_frame(frame_obj, reference=self.capture.frame_nr - 1)
+        else:
+            self.writer.write_frame(frame_obj)
+
+        return ret, frame_obj
+
+    def skip_frame(self):
+        """Skips the next frame of the wrapped capture, which is not recorded since it is not processed.
+
+        Returns:
+            bool: Whether a frame was skipped.
+        """
+        return self.capture.skip_frame()
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until the wrapped capture may return a new frame or closed.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        return self.capture.wait_for_frame(timeout)
@@ -0,0 +1,106 @@
+"""Contains the ReplayCapture class, which replays the frames of a recording.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import logging
+import numpy as np
+import cv2
+
+from processor.input.i_capture import ICapture
+from processor.data_object.frame_obj import FrameObj
+
+
+class ReplayCapture(ICapture):
+    """Returns the recorded frames of a record log as fast as they are requested, with their recorded timestamps.
+
+    Encoded frames are decoded from the log, referenced frames are read from the recorded video,
+    and recordings without frames return black frames of the recorded size.
+    The timestamps identify the frames, so replay stages find their recorded outputs.
+
+    Attributes:
+        record_log (RecordLog): The recording.
+        frame_nr (int): Amount of frames returned.
+
+        __file (BufferedReader): The log, opened to read encoded frames.
+        __video (cv2.VideoCapture): The recorded video, opened to read referenced frames.
+        __video_frame_nr (int): Index of the next frame of the video.
+    """
+    def __init__(self, record_log):
+        """Opens the frames of the recording.
+
+        Args:
+            record_log (RecordLog): The recording.
+        """
+        self.record_log = record_log
+        self.frame_nr = 0
+
+        self.__file = open(record_log.path, 'rb') if record_log.frames == 'encoded' else None
+        self.__video = None
+        self.__video_frame_nr = 0
+
+        if record_log.frames == 'reference':
+            logging.info(f'Opening recorded video from path: {record_log.video_path}')
+            self.__video = cv2.VideoCapture(record_log.video_path)
+
+    def opened(self):
+        """Check whether recorded frames are left.
+
+        Returns:
+            bool: Whether there are frames left.
+        """
+        return self.frame_nr < len(self.record_log.frame_records)
+
+    def close(self):
+        """Closes the capture by skipping all frames that are left."""
+        self.frame_nr = len(self.record_log.frame_records)
+
+        if self.__file is not None:
+            self.__file.close()
+        if self.__video is not None:
+            self.__video.release()
+
+    def get_next_frame(self):
+        """Gets the next recorded frame.
+
+        Returns:
+            bool, FrameObj: Boolean whether the frame could be read.
+                            Frame with its recorded timestamp.
+        """
+        if not self.opened():
+            return False, None
+
+        frame_record = self.record_log.frame_records[self.frame_nr]
+        timestamp, width, height, reference = frame_record[:4]
+        self.frame_nr += 1
+
+        if self.record_log.frames == 'encoded':
+            encoded = self.record_log.read_encoded_frame(self.__file, frame_record)
+            frame = cv2.imdecode(np.frombuffer(encoded, dtype=np.uint8), cv2.IMREAD_COLOR)
+        elif self.record_log.frames == 'reference':
+            frame = self.__read_video_frame(reference)
+        else:
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+        if frame is None:
+            return False, None
+
+        return True, FrameObj(frame, timestamp)
+
+    def __read_video_frame(self, reference):
+        """Reads a frame of the recorded video, only seeking when frames were not recorded in order.
+
+        Args:
+            reference (int): Index of the frame in the video.
+
+        Returns:
+            numpy.ndarray: The frame, None if it could not be read.
+        """
+        if reference != self.__video_frame_nr:
+            self.__video.set(cv2.CAP_PROP_POS_FRAMES, reference)
+
+        ret, frame = self.__video.read()
+        self.__video_frame_nr = reference + 1
+        return frame if ret else None
@@ -0,0 +1,308 @@
+"""Contains the SegmentCapture class, which fetches and decodes the segments of an HLS stream itself.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from processor.input.i_capture import ICapture
+from processor.input.connection_pool import ConnectionPool
+from processor.input.media_playlist import MediaPlaylist
+from processor.input.segment_decoder import SegmentDecoder
+from processor.input.variant_selector import VariantSelector
+from processor.data_object.frame_obj import FrameObj
+
+# Maximum amount of segments fetched ahead of the segment being played.
+SEGMENT_QUEUE = 3
+# Seconds the playback may be ahead or behind the timestamps of the stream before it restarts from the next frame.
+RESYNC_DELAY = 1.
+
+
+class SegmentCapture(ICapture):
+    """Implementation of the ICapture class which plays an HLS stream by fetching and decoding its segments.
+
+    An asyncio loop on a separate thread reloads the media playlist as often as RFC 8216 prescribes and fetches every
+    new segment over a pool of keep-alive connections, while a worker decodes the previous segment. The frames carry
+    the presentation timestamps of the stream, or the program date time of their segment if the playlist has one,
+    instead of timestamps counted from the start of the capture, so they do not drift from the stream.
+
+    The frames of a live stream are played at the pace of their timestamps and the pipeline gets the most recent one,
+    like the HlsCapture. Without real-time playback every frame is kept until the pipeline took it.
+    A live stream starts at its newest segment, a stream that ended (e.g. a recording) at its first.
+
+    Attributes:
+        hls_url (str): Url of the master or media playlist.
+        playlist_url (str): Url of the played media playlist.
+        realtime (bool): Whether frames are played at the pace of their timestamps.
+        retries (int): Number of failed playlist reloads in a row before the capture closes.
+        segments_fetched (int): Amount of segments fetched.
+        frames_read (int): Amount of frames decoded and played.
+        frames_dropped (int): Amount of frames replaced by a newer frame before the pipeline took them.
+
+        __pool (ConnectionPool): Keep-alive connections fetching the playlist and segments.
+        __decoder (SegmentDecoder): Decodes the segments.
+        __latest (FrameObj): Frame to return next, None if it was returned.
+        __condition (threading.Condition): Signals a new frame, a returned frame or the closing of the capture.
+        __running (bool): Whether the stream is still played.
+        __loop (asyncio.AbstractEventLoop): Event loop of the playing thread.
+        __task (asyncio.Task): Task playing the stream.
+        __playing_thread (threading.Thread): Thread running the event loop.
+    """
+    def __init__(self, hls_url, target_width=0, realtime=True, retries=10):
+        """Loads the playlist and starts playing the stream.
+
+        Args:
+            hls_url (str): Url of the master or media playlist.
+            target_width (int): Width of the variant of a master playlist to play, the input width of the detector,
+                0 plays the largest variant.
+            realtime (bool): Whether frames are played at the pace of their timestamps.
+            retries (int): Number of failed loads of the playlist before the capture gives up.
+
+        Raises:
+            TimeoutError: The playlist could not be loaded.
+        """
+        self.hls_url = hls_url
+        self.realtime = realtime
+        self.retries = retries
+        self.segments_fetched = 0
+        self.frames_read = 0
+        self.frames_dropped = 0
+
+        self.__pool = ConnectionPool()
+        self.__decoder = SegmentDecoder()
+        self.playlist_url = self.__load_playlist(target_width)
+
+        self.__latest = None
+        self.__condition = threading.Condition()
+        self.__running = True
+        self.__loop = None
+        self.__task = None
+        self.__playing_thread = threading.Thread(target=asyncio.run, args=(self.__play(),),
+                                                 name='segment capture', daemon=True)
+        self.__playing_thread.start()
+
+    def opened(self):
+        """Check whether the stream is still played or a frame is left.
+
+        Returns:
+            bool: Whether the capture is opened.
+        """
+        return self.__running or self.__latest is not None
+
+    def close(self):
+        """Stops playing the stream."""
+        logging.info(f'Segment capture closing after {self.segments_fetched} segments and {self.frames_read} frames '
+                     f'({self.frames_dropped} dropped), {self.__pool.requests} requests over '
+                     f'{self.__pool.connections_opened} connections')
+
+        with self.__condition:
+            self.__running = False
+            self.__latest = None
+            self.__condition.notify_all()
+
+        if self.__loop is not None:
+            try:
+                self.__loop.call_soon_threadsafe(self.__task.cancel)
+            # The loop already stopped.
+            except RuntimeError:
+                pass
+        self.__playing_thread.join()
+
+    def get_next_frame(self):
+        """Gets the most recent played frame.
+
+        Returns:
+            bool, FrameObj: Whether a new frame was returned and the frame object containing it.
+        """
+        with self.__condition:
+            frame_obj, self.__latest = self.__latest, None
+            self.__condition.notify_all()
+
+        return frame_obj is not None, frame_obj
+
+    def wait_for_frame(self, timeout=None):
+        """Blocks until a frame was played that was not returned yet, or the capture closed.
+
+        Args:
+            timeout (float): Seconds to wait at most, None waits until a frame is ready.
+
+        Returns:
+            bool: Whether a new frame may be ready, False if the timeout passed.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__latest is not None or not self.__running, timeout)
+
+    def __load_playlist(self, target_width):
+        """Loads the playlist, selecting a variant if it is a master playlist.
+
+        Args:
+            target_width (int): Width of the variant to play, 0 plays the largest variant.
+
+        Returns:
+            str: Url of the media playlist.
+
+        Raises:
+            TimeoutError: The playlist could not be loaded.
+        """
+        for tries_left in range(self.retries, 0, -1):
+            logging.info(f'Loading HLS playlist {self.hls_url}. Attempts left: {tries_left}')
+            try:
+                playlist = self.__pool.get(self.hls_url).decode(errors='replace')
+
+                variants = VariantSelector.parse_master_playlist(self.hls_url, playlist)
+                if len(variants) > 0:
+                    selector = VariantSelector(variants, target_width if target_width > 0 else max(variants)[0])
+                    logging.info(f'Playing the variant of width {selector.variants[selector.index][0]}')
+                    return selector.url
+
+                MediaPlaylist.parse(self.hls_url, playlist)
+                return self.hls_url
+
+            # Http errors are OSErrors as well, ValueError is an invalid playlist.
+            except (OSError, ValueError) as error:
+                logging.warning(f'Could not load playlist: {error}')
+
+            time.sleep(1)
+
+        raise TimeoutError('HLS segment capture never opened')
+
+    async def __play(self):
+        """Fetches, decodes and plays the segments until the stream ends or the capture is closed."""
+        # The task is set first, close cancels it once the loop is set.
+        self.__task = asyncio.current_task()
+        self.__loop = asyncio.get_running_loop()
+
+        fetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='segment fetcher')
+        decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='segment decoder')
+        segments = asyncio.Queue(maxsize=SEGMENT_QUEUE)
+        fetching = asyncio.ensure_future(self.__fetch(segments, fetch_executor, decode_executor))
+
+        try:
+            if self.__running:
+                await self.__publish(segments, fetch_executor)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            fetching.cancel()
+            await asyncio.gather(fetching, return_exceptions=True)
+            fetch_executor.shutdown(wait=False)
+            decode_executor.shutdown(wait=False)
+            self.__pool.close()
+
+            with self.__condition:
+                self.__running = False
+                self.__condition.notify_all()
+
+    async def __fetch(self, segments, fetch_executor, decode_executor):
+        """Reloads the media playlist and fetches its new segments, handing them to the decoder.
+
+        The decoding of a segment is queued while it runs, so the next segment is fetched in the meantime.
+
+        Args:
+            segments (asyncio.Queue): Receives the decoding of every segment and its program date time,
+                None when the stream ended.
+            fetch_executor (ThreadPoolExecutor): Runs the requests.
+            decode_executor (ThreadPoolExecutor): Decodes the segments.
+        """
+        loop = asyncio.get_running_loop()
+        last_sequence = None
+        failures = 0
+
+        while True:
+            reload_start = loop.time()
+            try:
+                body = await loop.run_in_executor(fetch_executor, self.__pool.get, self.playlist_url)
+                playlist = MediaPlaylist.parse(self.playlist_url, body.decode(errors='replace'))
+                failures = 0
+            except (OSError, ValueError) as error:
+                failures += 1
+                if failures >= self.retries:
+                    logging.error(f'Could not reload playlist {failures} times in a row, stopping: {error}')
+                    break
+                logging.warning(f'Could not reload playlist: {error}')
+                await asyncio.sleep(1)
+                continue
+
+            new_segments = [segment for segment in playlist.segments
+                            if last_sequence is None or segment[0] > last_sequence]
+
+            # A live stream starts at its newest segment.
+            if last_sequence is None and not playlist.ended:
+                new_segments = new_segments[-1:]
+
+            for sequence, url, _, program_date_time in new_segments:
+                last_sequence = sequence
+                try:
+                    segment = await loop.run_in_executor(fetch_executor, self.__pool.get, url)
+                except OSError as error:
+                    logging.warning(f'Could not fetch segment {sequence}, skipping it: {error}')
+                    continue
+
+                self.segments_fetched += 1
+                decoding = loop.run_in_executor(decode_executor, self.__decoder.decode, segment)
+                await segments.put((decoding, program_date_time))
+
+            if playlist.ended:
+                break
+
+            # Reload after the target duration when the playlist changed, otherwise after half of it (RFC 8216 6.3.4).
+            interval = playlist.target_duration if len(new_segments) > 0 else playlist.target_duration / 2
+            await asyncio.sleep(max(interval - (loop.time() - reload_start), 0))
+
+        await segments.put(None)
+
+    async def __publish(self, segments, executor):
+        """Plays the frames of the decoded segments until the stream ended.
+
+        Args:
+            segments (asyncio.Queue): Decoding of every segment and its program date time, None when the stream ended.
+            executor (ThreadPoolExecutor): Waits for the pipeline to take a frame without real-time playback.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Presentation timestamp and loop time of the frame the playback is synchronised on.
+        sync_pts, sync_time = None, None
+
+        while True:
+            item = await segments.get()
+            if item is None:
+                return
+
+            decoding, program_date_time = item
+            try:
+                frames = await decoding
+            except ValueError as error:
+                logging.warning(error)
+                continue
+
+            for frame, pts in frames:
+                # A program date time stamps the frames relative to the first frame of the segment.
+                timestamp = pts if program_date_time is None else program_date_time + pts - frames[0][1]
+
+                if self.realtime:
+                    now = loop.time()
+                    if sync_pts is None or abs(sync_time + pts - sync_pts - now) > RESYNC_DELAY:
+                        sync_pts, sync_time = pts, now
+                    await asyncio.sleep(max(sync_time + pts - sync_pts - now, 0))
+                else:
+                    await loop.run_in_executor(executor, self.__wait_until_taken)
+
+                with self.__condition:
+                    if not self.__running:
+                        return
+                    if self.__latest is not None:
+                        self.frames_dropped += 1
+                    self.__latest = FrameObj(frame, timestamp)
+                    self.frames_read += 1
+                    self.__condition.notify_all()
+
+    def __wait_until_taken(self):
+        """Blocks until the pipeline took the last played frame or the capture closed."""
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__latest is None or not self.__running)
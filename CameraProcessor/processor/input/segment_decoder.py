@@ -0,0 +1,74 @@
+"""Contains the SegmentDecoder class, which decodes an HLS segment with the timestamps of its frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import re
+import ffmpeg
+import numpy as np
+
+# Pattern of the line the showinfo filter logs for every decoded frame, with its timestamp and size.
+FRAME_PATTERN = re.compile(r'Parsed_showinfo.*\bpts_time:\s*(-?[0-9.]+).*\bs:(\d+)x(\d+)')
+
+
+class SegmentDecoder:
+    """Decodes the MPEG-TS segments of an HLS stream to BGR frames with their presentation timestamps.
+
+    Every segment is piped through ffmpeg, of which the showinfo filter logs the presentation timestamp of every frame.
+    With -copyts these are the timestamps of the stream itself, which continue over the segments, instead of starting
+    from 0 for every segment.
+
+    Attributes:
+        segments_decoded (int): Amount of segments decoded.
+        frames_decoded (int): Amount of frames decoded.
+    """
+    def __init__(self):
+        """Inits the decoder."""
+        self.segments_decoded = 0
+        self.frames_decoded = 0
+
+    def decode(self, segment):
+        """Decodes a segment.
+
+        Args:
+            segment (bytes): Contents of the segment.
+
+        Returns:
+            [(numpy.ndarray, float)]: Every frame of the segment with its presentation timestamp in seconds.
+
+        Raises:
+            ValueError: The segment could not be decoded.
+        """
+        try:
+            # pylint: disable=no-member
+            output, log = (ffmpeg
+                           .input('pipe:', format='mpegts')
+                           .filter('showinfo')
+                           .output('pipe:', format='rawvideo', pix_fmt='bgr24', vsync='passthrough')
+                           .global_args('-copyts', '-hide_banner', '-nostats', '-loglevel', 'info')
+                           .run(input=segment, capture_stdout=True, capture_stderr=True))
+            # pylint: enable=no-member
+        # pylint: disable=protected-access
+        except ffmpeg._run.Error as error:
+            raise ValueError(f'Could not decode segment: {error.stderr.decode(errors="replace")[-200:]}') from error
+
+        # Frames should be writable, as the pipeline may draw on them.
+        output = bytearray(output)
+
+        frames = []
+        position = 0
+        for match in FRAME_PATTERN.finditer(log.decode(errors='replace')):
+            width, height = int(match.group(2)), int(match.group(3))
+            size = width * height * 3
+            if position + size > len(output):
+                break
+
+            frame = np.frombuffer(output, dtype=np.uint8, count=size, offset=position).reshape((height, width, 3))
+            frames.append((frame, float(match.group(1))))
+            position += size
+
+        self.segments_decoded += 1
+        self.frames_decoded += len(frames)
+        return frames
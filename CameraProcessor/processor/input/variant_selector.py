@@ -0,0 +1,179 @@
+"""Contains the VariantSelector class, which picks the variant of an HLS stream to decode.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import re
+import logging
+import urllib.request
+
+from processor.input.media_playlist import resolve_url
+
+# Attributes of a tag in a playlist, of which values may be quoted.
+ATTRIBUTE_PATTERN = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+# Fraction of the frame interval spent reading a frame above which decoding falls behind.
+DOWN_LOAD = 0.8
+# Fraction of the frame interval spent reading a frame below which decoding has headroom.
+UP_LOAD = 0.4
+# Fraction of the read frames returned to the pipeline from which processing has headroom.
+UP_DELIVERED = 0.95
+# Amount of consecutive windows with headroom before switching to a larger variant.
+UP_WINDOWS = 3
+
+
+class VariantSelector:
+    """Selects the variant of an HLS stream published under a master playlist, e.g. by the video forwarder.
+
+    The stream starts on the variant of which the width is closest to the input size of the detector, since a larger
+    variant is only decoded to be scaled down again. While the stream plays, the capture reports every window how
+    much of the frame interval reading a frame takes and which fraction of the frames reached the pipeline.
+    When decoding falls behind, the selector switches to the next smaller variant. Frames dropped because processing
+    falls behind do not switch down, as the detector scales every variant to the same input size, so a smaller
+    variant only lowers the cost of decoding. After UP_WINDOWS windows in which both decoding and processing had
+    headroom it switches back up, never above the variant closest to the detector.
+
+    Attributes:
+        variants ([(int, int, str)]): Width, height and url of every variant, from small to large.
+        preferred (int): Index of the variant closest to the detector input size.
+        index (int): Index of the current variant.
+        switches (int): Amount of times the variant was switched.
+
+        __headroom_windows (int): Amount of consecutive windows with headroom.
+    """
+    def __init__(self, variants, target_width):
+        """Inits the selector on the variant closest to the target width.
+
+        Args:
+            variants ([(int, int, str)]): Width, height and url of every variant.
+            target_width (int): Input width of the detector.
+
+        Raises:
+            ValueError: There are no variants.
+        """
+        if len(variants) == 0:
+            raise ValueError('No variants to select from')
+
+        self.variants = sorted(variants)
+        self.preferred = min(range(len(self.variants)), key=lambda i: abs(self.variants[i][0] - target_width))
+        self.index = self.preferred
+        self.switches = 0
+
+        self.__headroom_windows = 0
+
+    @classmethod
+    def load(cls, url, target_width, timeout=5.):
+        """Downloads the playlist and creates a selector if it is a master playlist.
+
+        Args:
+            cls (type): The class of the selector to create.
+            url (str): Url of the playlist.
+            target_width (int): Input width of the detector.
+            timeout (float): Seconds to wait for the playlist.
+
+        Returns:
+            VariantSelector: Selector over the variants of the master playlist, None if it has no variants
+                of a known size or could not be downloaded.
+        """
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                playlist = response.read().decode(errors='replace')
+        except (OSError, ValueError) as error:
+            logging.warning(f'Could not download playlist {url}, not selecting a variant: {error}')
+            return None
+
+        variants = cls.parse_master_playlist(url, playlist)
+        if len(variants) == 0:
+            logging.info(f'Playlist {url} has no variants of a known size, decoding it as is')
+            return None
+
+        return cls(variants, target_width)
+
+    @staticmethod
+    def parse_master_playlist(url, playlist):
+        """Parses the variants of a master playlist.
+
+        Relative variant urls are resolved against the url of the master playlist, of which the query (e.g. an
+        authentication token) is passed on to variants without a query of their own.
+
+        Args:
+            url (str): Url of the master playlist.
+            playlist (str): Contents of the master playlist.
+
+        Returns:
+            [(int, int, str)]: Width, height and url of every variant with a resolution.
+        """
+        variants = []
+        resolution = None
+
+        for line in playlist.splitlines():
+            line = line.strip()
+
+            if line.startswith('#EXT-X-STREAM-INF:'):
+                attributes = dict(ATTRIBUTE_PATTERN.findall(line[len('#EXT-X-STREAM-INF:'):]))
+                try:
+                    width, height = attributes['RESOLUTION'].strip('"').lower().split('x')
+                    resolution = (int(width), int(height))
+                except (KeyError, ValueError):
+                    resolution = None
+
+            # The url of a variant follows its tag.
+            elif line != '' and not line.startswith('#'):
+                if resolution is not None:
+                    variants.append((*resolution, resolve_url(url, line)))
+                resolution = None
+
+        return variants
+
+    @property
+    def url(self):
+        """Gets the url of the current variant.
+
+        Returns:
+            str: Url of the variant playlist.
+        """
+        return self.variants[self.index][2]
+
+    def update(self, decode_load, delivered):
+        """Reports how the last window went, switching the variant when needed.
+
+        Args:
+            decode_load (float): Mean fraction of the frame interval spent reading a frame.
+            delivered (float): Fraction of the read frames that were returned to the pipeline.
+
+        Returns:
+            bool: Whether the variant was switched.
+        """
+        if decode_load > DOWN_LOAD:
+            self.__headroom_windows = 0
+            if self.index == 0:
+                return False
+            return self.__switch(self.index - 1, f'decoding uses {decode_load:.0%} of the frame interval')
+
+        if decode_load < UP_LOAD and delivered >= UP_DELIVERED and self.index < self.preferred:
+            self.__headroom_windows += 1
+            if self.__headroom_windows >= UP_WINDOWS:
+                self.__headroom_windows = 0
+                return self.__switch(self.index + 1, f'decoding and processing kept up for {UP_WINDOWS} windows')
+            return False
+
+        self.__headroom_windows = 0
+        return False
+
+    def __switch(self, index, reason):
+        """Switches to another variant.
+
+        Args:
+            index (int): Index of the variant to switch to.
+            reason (str): Why the variant is switched, for the logs.
+
+        Returns:
+            bool: Always True, the variant was switched.
+        """
+        previous_width = self.variants[self.index][0]
+        self.index = index
+        self.switches += 1
+        logging.info(f'Switching HLS variant from width {previous_width} to {self.variants[index][0]}: {reason}')
+        return True
@@ -17,15 +17,19 @@ class VideoCapture(ICapture):
 
     Attributes:
         cap (cv2.VideoCapture): VideoCapture that reads stream as frames.
+        fps (float): Frame rate of the video.
+        video_timestamps (bool): Whether frames are stamped with their position in the video instead of the time read.
         __nr_frames (int): Number of frames of video.
         __current_frame_nr (int): Index number of current frame.
     """
     # Default path is the path to venice.mp4.
-    def __init__(self, path):
+    def __init__(self, path, video_timestamps=False):
         """Create a VideoCapture given a path.
 
         Args:
             path (str): path to the video.
+            video_timestamps (bool): Stamp frames with their position in the video (in s),
+                so the timestamps do not depend on how fast the video is processed.
         """
         # Open VideoCapture.
         logging.info(f'Opening video from path: {path}')
@@ -35,6 +39,8 @@ class VideoCapture(ICapture):
         # Frame counter to stop at last frame.
         self.__nr_frames = self.cap.get(cv2.CAP_PROP_FRAME_COUNT)
         self.__current_frame_nr = 0
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.video_timestamps = video_timestamps
         logging.info(f'Video has {self.__nr_frames} frames')
 
     def opened(self):
@@ -49,11 +55,53 @@ class VideoCapture(ICapture):
 
         return self.cap.isOpened()
 
+    @property
+    def frame_nr(self):
+        """Gets the amount of frames read, which is the index of the next frame in the video.
+
+        Returns:
+            int: Amount of frames read.
+        """
+        return self.__current_frame_nr
+
     def close(self):
         """Close video capture."""
         self.__current_frame_nr = self.__nr_frames
         self.cap.release()
 
+    def skip_frame(self):
+        """Moves past the next frame of the video, demuxing it without decoding it.
+
+        Returns:
+            bool: Whether a frame was skipped.
+        """
+        if not self.opened():
+            return False
+
+        self.__current_frame_nr += 1
+        return self.cap.grab()
+
+    def seek(self, seconds):
+        """Moves to a position in the video, so processing can start in the middle of a long video.
+
+        The next frame read is the frame at the position, or the first frame after it.
+
+        Args:
+            seconds (float): Position in the video to move to, in seconds from its start.
+
+        Returns:
+            bool: Whether the video could move to the position.
+        """
+        if not self.cap.isOpened():
+            return False
+
+        moved = self.cap.set(cv2.CAP_PROP_POS_MSEC, seconds * 1000)
+
+        # The frame number is where the video ended up, which may differ from the position asked for.
+        self.__current_frame_nr = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        logging.info(f'Moved video to {seconds:.2f} seconds, frame {self.__current_frame_nr}')
+        return moved
+
     def get_next_frame(self):
         """Gets the next frame of the video.
 
@@ -66,4 +114,7 @@ class VideoCapture(ICapture):
 
         self.__current_frame_nr += 1
         ret, frame = self.cap.read()
-        return ret, FrameObj(frame, time.time())
+
+        # After reading, the position of the video is the presentation time of the frame that was read.
+        timestamp = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000 if self.video_timestamps else time.time()
+        return ret, FrameObj(frame, timestamp)
@@ -9,21 +9,31 @@ import os
 import sys
 import logging
 import asyncio
+import functools
 
 import tornado.ioloop
 import tornado.web
 
 from processor.utils.config_parser import ConfigParser
-from processor.utils.display import opencv_display
+from processor.utils.datawriter import get_data_writer
 
-from processor.pipeline.prepare_pipeline import prepare_objects
-from processor.pipeline.process_frames import process_stream
+import processor.scheduling.plan.pipeline_plan as pipeline_plan
+from processor.input.video_capture import VideoCapture
+from processor.pipeline.camera import parse_cameras
+from processor.pipeline.prepare_pipeline import \
+    prepare_objects, prepare_cameras, prepare_detector, prepare_tracker, prepare_detection_gate, \
+    prepare_frame_budget, prepare_demand, prepare_checkpoint, prepare_output
+from processor.pipeline.process_frames import \
+    process_stream, process_stream_scheduler, process_stream_pipelined, process_stream_async, process_cameras, \
+    process_offline
+from processor.pipeline.stream_options import StreamOptions
 
 from processor.websocket.websocket_client import WebsocketClient
 from processor.webhosting.html_page_handler import HtmlPageHandler
 from processor.webhosting.stream_handler import StreamHandler
 
-from processor.websocket.boxes_message import BoxesMessage
+from processor.output.websocket_sink import WebsocketSink
+from processor.output.display_sink import DisplaySink
 
 
 def create_app(configs, port):
@@ -62,6 +72,76 @@ def enforce_deploy_environment_variables():
     return os.getenv('CAMERA_ID'), os.getenv('ORCHESTRATOR_URL'), os.getenv('HLS_STREAM_URL')
 
 
+def enforce_multi_deploy_environment_variables(configs):
+    """Makes sure the cameras and orchestrator are set when running in multi-camera deploy mode.
+
+    Args:
+        configs (configparser.ConfigParser): configurations of the application.
+
+    Returns:
+        [(str, str)], str: Id and HLS url of every camera.
+                           URL of the orchestrator WebSocket.
+    """
+    camera_urls = parse_cameras(configs['Input'].get('cameras', ''))
+    if os.getenv('ORCHESTRATOR_URL') is None or len(camera_urls) == 0:
+        raise EnvironmentError('Environment variable CAMERAS or ORCHESTRATOR_URL'
+                               ' is missing but is required during multi-camera deployment.')
+
+    return camera_urls, os.getenv('ORCHESTRATOR_URL')
+
+
+def select_process_stream(configs, frame_budget=None, camera_id=None):
+    """Selects the function processing the stream based on the configured execution.
+
+    Args:
+        configs (configparser.ConfigParser): configurations of the application.
+        frame_budget (FrameBudget): Latency budget of a frame, used when the execution is sequential or scheduler.
+        camera_id (str): Id of the camera of which the sections are used, None uses the camera id of [Input].
+
+    Returns:
+        Function: Coroutine function processing a stream of frames.
+
+    Raises:
+        NameError: The execution is unknown.
+        ValueError: A detection gate or frame budget is configured for an execution that does not apply it.
+    """
+    main_config = configs['Main']
+    execution = main_config.get('execution', 'sequential').lower()
+
+    # Every execution restores and snapshots the state of the camera if checkpoints are configured.
+    checkpoint = prepare_checkpoint(configs, camera_id)
+
+    # Only the sequential execution skips detections, the other executions would silently detect every frame.
+    detection_gate = prepare_detection_gate(configs, camera_id)
+    if detection_gate is not None and execution != 'sequential':
+        raise ValueError(f'Skipping detections ([Keyframes] or [Motion]) needs the sequential execution, '
+                         f'not {execution}')
+
+    # The stages of the pipelined and async executions overlap, so the cost of a single frame is not known.
+    if frame_budget is not None and execution in ['pipelined', 'async']:
+        raise ValueError(f'A frame budget (Main.frame_budget) needs the sequential or scheduler execution, '
+                         f'not {execution}')
+
+    if execution == 'sequential':
+        return functools.partial(process_stream, options=StreamOptions(
+            detection_gate=detection_gate, frame_budget=frame_budget, checkpoint=checkpoint
+        ))
+    if execution == 'scheduler':
+        return functools.partial(process_stream_scheduler, options=StreamOptions(
+            frame_budget=frame_budget, checkpoint=checkpoint, scheduler_config=configs['Scheduler']
+        ))
+    if execution == 'pipelined':
+        return functools.partial(process_stream_pipelined, options=StreamOptions(
+            checkpoint=checkpoint, queue_size=main_config.getint('queue_size', 2)
+        ))
+    if execution == 'async':
+        return functools.partial(process_stream_async, options=StreamOptions(
+            checkpoint=checkpoint, max_frames_in_flight=main_config.getint('max_frames_in_flight', 2)
+        ))
+
+    raise NameError(f'Execution "{execution}" is unknown')
+
+
 async def deploy(configs, websocket_id, websocket_url, hls_url):
     """Connects to the orchestrator and starts the process_frames loop
 
@@ -80,18 +160,98 @@ async def deploy(configs, websocket_id, websocket_url, hls_url):
     capture, detector, tracker, re_identifier, websocket_url = prepare_objects(configs)
     websocket_client = WebsocketClient(websocket_url, websocket_id)
     await websocket_client.connect()
+
+    # Sends the bounding boxes to the orchestrator using the websocket client, besides the configured outputs.
+    output = prepare_output(configs, {'websocket': WebsocketSink(websocket_client, asyncio.get_running_loop())})
+
     # Initiate the stream processing loop, giving the websocket client.
-    await process_stream(
-        capture,
+    await select_process_stream(configs, prepare_frame_budget(configs))(
+        # Lower the frame rate while the orchestrator reports that nothing needs the output of the camera.
+        prepare_demand(capture, websocket_client, configs['Input']),
         detector,
         tracker,
         re_identifier,
-        # Function to call when frame is processed.
-        lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
-        # Sends the bounding boxes to the orchestrator using a websocket client.
-        websocket_client.send_message(BoxesMessage(frame_obj.timestamp, tracked_boxes)),
+        # Function to call when frame is processed, only queuing the outputs for the sinks.
+        output,
         websocket_client
     )
+    output.close()
+
+
+async def deploy_cameras(configs, camera_urls, websocket_url):
+    """Connects every camera to the orchestrator and starts the loop processing all cameras.
+
+    The detector and re-identifier are loaded once and shared by the cameras,
+    every camera identifies to the orchestrator as its own processor.
+
+    Args:
+        configs (configparser.ConfigParser): configurations for the prepared streams.
+        camera_urls ([(str, str)]): Id and HLS url of every camera.
+        websocket_url (str): Url of the orchestrator websocket.
+    """
+    configs['Input']['type'] = 'hls'
+
+    # Open the captures in combination with the shared stages, and connect every camera.
+    detector, re_identifier, cameras = prepare_cameras(configs, camera_urls)
+    for camera in cameras:
+        camera.ws_client = WebsocketClient(websocket_url, camera.identifier)
+        await camera.ws_client.connect()
+
+        # Lower the frame rate of the camera while the orchestrator reports that nothing needs its output.
+        camera.capture = prepare_demand(camera.capture, camera.ws_client, configs['Input'])
+
+        # Sends the bounding boxes to the orchestrator using the websocket client of the camera.
+        camera.output = prepare_output(configs, {'websocket': WebsocketSink(camera.ws_client,
+                                                                            asyncio.get_running_loop())},
+                                       camera.identifier)
+
+    await process_cameras(
+        cameras,
+        detector,
+        re_identifier,
+        # Function to call when frame is processed, only queuing the outputs for the sinks of the camera.
+        lambda camera, frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+        camera.output(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
+    )
+
+    for camera in cameras:
+        camera.output.close()
+
+
+def run_offline(configs):
+    """Processes the configured video file for throughput and writes the results through data writers.
+
+    The detections and tracks are written to the output path of the [Offline] section,
+    with the suffixes _det and _tracks, in the formats of the detection and tracking of the [Runner] section.
+
+    Args:
+        configs (configparser.ConfigParser): configurations of the application.
+    """
+    offline_config = configs['Offline']
+    output_path = offline_config['output_path']
+    os.makedirs(os.path.dirname(os.path.realpath(output_path)), exist_ok=True)
+
+    # The detector is shared by the frames of a batch, so the adaptive resolution of a live camera does not apply.
+    stages = pipeline_plan.parse_plan(configs['Main'].get('plan', 'full'))
+    detector = prepare_detector(configs, per_camera=False)
+    tracker = prepare_tracker(configs) if 'tracking' in stages else None
+
+    capture = VideoCapture(configs['Input']['video_file_path'], video_timestamps=True)
+    video_start = configs['Input'].getfloat('video_start', 0)
+    if video_start > 0:
+        capture.seek(video_start)
+    det_writer = get_data_writer(configs, 'detection', f'{output_path}_det')
+    track_writer = get_data_writer(configs, 'tracking', f'{output_path}_tracks')
+
+    try:
+        process_offline(capture, detector, tracker, det_writer, track_writer,
+                        batch_size=offline_config.getint('batch_size', 8),
+                        read_ahead=offline_config.getint('read_ahead', 32),
+                        start_frame_nr=capture.frame_nr)
+    finally:
+        capture.close()
+        det_writer.close()
+        track_writer.close()
 
 
 def main():
@@ -103,6 +263,7 @@ def main():
     Raises:
         AttributeError: Mode in which is run does not exist.
         EnvironmentError: CAMERA_ID is missing, but the application is running in deploy mode.
+            Or CAMERAS is missing, but the application is running in multi-camera deploy mode.
     """
     # Load the config file.
     config_parser = ConfigParser('configs.ini', True)
@@ -117,14 +278,28 @@ def main():
     # If we want to run it with opencv gui.
     elif configs['Main']['mode'].lower() == 'opencv':
         capture, detector, tracker, re_identifier, _ = prepare_objects(configs)
+
+        # The tiled display is rendered by the worker of its sink, which drops the frames it falls behind on.
+        output = prepare_output(configs, {'display': DisplaySink()})
+
         asyncio.get_event_loop().run_until_complete(
-            process_stream(capture, detector, tracker, re_identifier, opencv_display, None)
+            select_process_stream(configs, prepare_frame_budget(configs))(
+                capture, detector, tracker, re_identifier, output, None
+            )
         )
+        output.close()
+    # Offline mode processing a recording as fast as possible, writing the results to files.
+    elif configs['Main']['mode'].lower() == 'offline':
+        run_offline(configs)
     # Deploy mode where all is sent to the orchestrator using the websocket URL.
     elif configs['Main']['mode'].lower() == 'deploy':
         # Make environment variables are set when running in deploy.
         ws_id, ws_url, hls_url = enforce_deploy_environment_variables()
         asyncio.get_event_loop().run_until_complete(deploy(configs, ws_id, ws_url, hls_url))
+    # Deploy mode where one processor serves multiple cameras, each sent to the orchestrator as its own processor.
+    elif configs['Main']['mode'].lower() == 'deploy_multi':
+        camera_urls, ws_url = enforce_multi_deploy_environment_variables(configs)
+        asyncio.get_event_loop().run_until_complete(deploy_cameras(configs, camera_urls, ws_url))
     else:
         raise AttributeError('Mode you try to run in does not exist, did you make a typo?')
 
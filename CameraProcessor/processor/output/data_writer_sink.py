@@ -0,0 +1,56 @@
+"""Contains the DataWriterSink class, which writes the boxes of a stage through a data writer.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.output.i_sink import ISink
+from processor.data_object.bounding_boxes import BoundingBoxes
+
+# Position of the boxes of every stage in the outputs of a frame.
+STAGE_OUTPUTS = {'detection': 1, 'tracking': 2, 're-identification': 3}
+
+
+class DataWriterSink(ISink):
+    """Writes the detected, tracked or re-identified boxes of every frame through an IDataWriter.
+
+    Frames are numbered from 1 in the order they were processed, like the offline mode does.
+
+    Attributes:
+        data_writer (IDataWriter): The data writer.
+        stage (str): Stage of which the boxes are written, one of STAGE_OUTPUTS.
+        frame_nr (int): Number of the last written frame.
+    """
+    def __init__(self, data_writer, stage):
+        """Inits the sink.
+
+        Args:
+            data_writer (IDataWriter): The data writer.
+            stage (str): Stage of which the boxes are written, one of STAGE_OUTPUTS.
+
+        Raises:
+            NameError: The stage is unknown.
+        """
+        if stage not in STAGE_OUTPUTS:
+            raise NameError(f'Stage "{stage}" is unknown, stages: {list(STAGE_OUTPUTS)}')
+
+        self.data_writer = data_writer
+        self.stage = stage
+        self.frame_nr = 0
+
+    def write(self, outputs):
+        """Writes the boxes of the stage of every frame.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        for frame_outputs in outputs:
+            self.frame_nr += 1
+            bounding_boxes = frame_outputs[STAGE_OUTPUTS[self.stage]]
+            self.data_writer.write(BoundingBoxes(bounding_boxes.bounding_boxes, self.frame_nr),
+                                   frame_outputs[0].shape)
+
+    def close(self):
+        """Closes the data writer."""
+        self.data_writer.close()
@@ -0,0 +1,26 @@
+"""Contains the DisplaySink class, which shows the tiled stages in an OpenCV window.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import _thread
+
+from processor.output.i_sink import ISink
+from processor.utils.display import opencv_display
+
+
+class DisplaySink(ISink):
+    """Shows the latest frame of every batch in the tiled OpenCV display, older frames of the batch are stale."""
+    def write(self, outputs):
+        """Displays the last frame of the batch.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        try:
+            opencv_display(*outputs[-1])
+        # Quitting the display exits the worker only, so the main thread is interrupted to stop the application.
+        except SystemExit:
+            _thread.interrupt_main()
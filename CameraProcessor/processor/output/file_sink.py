@@ -0,0 +1,45 @@
+"""Contains the FileSink class, which writes the tracked boxes to a JSON lines file.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import os
+import json
+
+from processor.output.i_sink import ISink
+from processor.utils.text import bounding_boxes_to_dict
+
+
+class FileSink(ISink):
+    """Writes the tracked boxes of every frame as a line of JSON in the format of the boxes message.
+
+    Attributes:
+        path (str): Path of the file.
+
+        __file (TextIOWrapper): The opened file.
+    """
+    def __init__(self, path):
+        """Opens the file, replacing a previous one.
+
+        Args:
+            path (str): Path of the file.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.realpath(path)), exist_ok=True)
+        self.__file = open(path, 'w', encoding='utf-8')
+
+    def write(self, outputs):
+        """Writes a line for every frame, flushing once per batch.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        self.__file.writelines(f'{json.dumps(bounding_boxes_to_dict(tracked_boxes, frame_obj.timestamp))}\n'
+                               for frame_obj, _, tracked_boxes, _ in outputs)
+        self.__file.flush()
+
+    def close(self):
+        """Closes the file."""
+        self.__file.close()
@@ -0,0 +1,24 @@
+"""Contains the ISink interface for the outputs of processed frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class ISink:
+    """Superclass for a sink writing the outputs of processed frames somewhere, run on the worker of a QueuedSink.
+
+    The outputs of a frame are a tuple of the frame object, the detected boxes, the tracked boxes
+    and the boxes where re-identification is performed.
+    """
+    def write(self, outputs):
+        """Writes the outputs of a batch of processed frames, in the order they were processed.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        raise NotImplementedError('No implementation for writing the outputs')
+
+    def close(self):
+        """Closes the sink after the last batch was written, by default nothing has to be closed."""
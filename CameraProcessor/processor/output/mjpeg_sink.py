@@ -0,0 +1,43 @@
+"""Contains the MjpegSink class, which encodes the tiled stages for the MJPEG stream of the tornado page.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import cv2
+
+from processor.output.i_sink import ISink
+from processor.utils.display import generate_tiled_image
+
+
+class MjpegSink(ISink):
+    """Encodes the latest frame of every batch as tiled JPEG image, which is written on the tornado IOLoop.
+
+    Attributes:
+        io_loop (tornado.ioloop.IOLoop): Loop the request is handled on.
+        write_image (Function): Writes the encoded image to the stream, called on the IOLoop.
+    """
+    def __init__(self, io_loop, write_image):
+        """Inits the sink.
+
+        Args:
+            io_loop (tornado.ioloop.IOLoop): Loop the request is handled on.
+            write_image (Function): Writes the encoded image (bytes) to the stream, called on the IOLoop.
+        """
+        self.io_loop = io_loop
+        self.write_image = write_image
+
+    def write(self, outputs):
+        """Encodes the last frame of the batch and hands it to the IOLoop.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        ret, jpeg = cv2.imencode('.jpg', generate_tiled_image(*outputs[-1]))
+
+        # Frame could not be encoded.
+        if not ret:
+            return
+
+        self.io_loop.add_callback(self.write_image, jpeg.tobytes())
@@ -0,0 +1,52 @@
+"""Contains the OutputSinks class, which hands the outputs of processed frames to every sink.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class OutputSinks:
+    """Callback of processed frames queuing their outputs for every sink, each written by its own worker.
+
+    Can be given as on_processed_frame to every execution, calling it only costs queuing the outputs.
+
+    Attributes:
+        sinks ([QueuedSink]): Queued sinks the outputs are written to.
+    """
+    def __init__(self, sinks):
+        """Inits the callback.
+
+        Args:
+            sinks ([QueuedSink]): Queued sinks the outputs are written to.
+        """
+        self.sinks = sinks
+
+    def __call__(self, frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes):
+        """Queues the outputs of the processed frame for every sink.
+
+        Args:
+            frame_obj (FrameObj): Frame object containing the frame.
+            detected_boxes (BoundingBoxes): Boxes generated by the detection.
+            tracked_boxes (BoundingBoxes): The tracked boxes from the frame processing loop.
+            re_id_tracked_boxes (BoundingBoxes): Boxes where re-id is performed after tracking.
+        """
+        for sink in self.sinks:
+            sink.put((frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes))
+
+    def stats(self):
+        """Gets the counters of every sink.
+
+        Returns:
+            dict[str, dict]: Counters of every sink by its name, see QueuedSink.stats.
+        """
+        return {sink.name: sink.stats() for sink in self.sinks}
+
+    def close(self, timeout=None):
+        """Writes the queued outputs and closes every sink.
+
+        Args:
+            timeout (float): Seconds to wait for the queued outputs of a sink, None waits until they are written.
+        """
+        for sink in self.sinks:
+            sink.close(timeout)
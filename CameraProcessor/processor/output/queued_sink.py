@@ -0,0 +1,189 @@
+"""Contains the QueuedSink class, which writes to a sink on its own worker thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+
+# Policies when the queue of a sink is full.
+DROP_POLICIES = ['oldest', 'newest', 'block']
+
+
+class QueuedSink:
+    """Hands the outputs of processed frames to a sink through a bounded queue, written by a worker thread.
+
+    Putting outputs never waits for the sink, unless the drop policy is block, so a slow sink does not stall
+    the frame loop. When the queue is full, the oldest queued outputs are dropped (oldest),
+    the new outputs are dropped (newest) or the frame loop waits until there is room (block).
+    The worker takes up to max_batch queued frames at a time and writes them in a single call.
+
+    Attributes:
+        name (str): Name of the sink in the logs and statistics.
+        sink (ISink): The sink written to.
+        queue_size (int): Maximum amount of frames waiting to be written.
+        max_batch (int): Maximum amount of frames written at once.
+        drop_policy (str): Policy when the queue is full, one of DROP_POLICIES.
+        frames_received (int): Amount of frames put into the queue.
+        frames_dropped (int): Amount of frames dropped because the queue was full.
+        frames_written (int): Amount of frames written to the sink.
+        batches_written (int): Amount of batches written to the sink.
+        errors (int): Amount of batches of which writing raised an error.
+        total_latency (float): Sum of the seconds from putting to writing of all written frames.
+        max_latency (float): Largest amount of seconds from putting to writing a frame.
+
+        __queue (deque): Queued outputs and the time they were put.
+        __condition (threading.Condition): Signals queued outputs, room in the queue or the closing of the sink.
+        __closed (bool): Whether no more outputs are accepted.
+        __worker (threading.Thread): Thread writing to the sink.
+    """
+    def __init__(self, name, sink, queue_size=8, max_batch=4, drop_policy='oldest'):
+        """Wraps the sink and starts the worker.
+
+        Args:
+            name (str): Name of the sink in the logs and statistics.
+            sink (ISink): The sink to write to.
+            queue_size (int): Maximum amount of frames waiting to be written.
+            max_batch (int): Maximum amount of frames written at once.
+            drop_policy (str): Policy when the queue is full, one of DROP_POLICIES.
+
+        Raises:
+            NameError: The drop policy is unknown.
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise NameError(f'Drop policy "{drop_policy}" is unknown, policies: {DROP_POLICIES}')
+
+        self.name = name
+        self.sink = sink
+        self.queue_size = max(queue_size, 1)
+        self.max_batch = max(max_batch, 1)
+        self.drop_policy = drop_policy
+
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.frames_written = 0
+        self.batches_written = 0
+        self.errors = 0
+        self.total_latency = 0.
+        self.max_latency = 0.
+
+        self.__queue = deque()
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__worker = threading.Thread(target=self.__write_batches, name=f'sink {name}', daemon=True)
+        self.__worker.start()
+
+    def put(self, outputs):
+        """Queues the outputs of a processed frame.
+
+        Args:
+            outputs ((FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)): Outputs of the frame.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+
+            self.frames_received += 1
+
+            if len(self.__queue) >= self.queue_size:
+                if self.drop_policy == 'newest':
+                    self.frames_dropped += 1
+                    return
+                if self.drop_policy == 'oldest':
+                    self.__queue.popleft()
+                    self.frames_dropped += 1
+                else:
+                    while len(self.__queue) >= self.queue_size and not self.__closed:
+                        self.__condition.wait()
+
+                    # The sink was closed while waiting for room, so the outputs are never written.
+                    if self.__closed:
+                        self.frames_dropped += 1
+                        return
+
+            self.__queue.append((outputs, time.perf_counter()))
+            self.__condition.notify_all()
+
+    @property
+    def queue_depth(self):
+        """Gets the amount of frames waiting to be written.
+
+        Returns:
+            int: Amount of queued frames.
+        """
+        return len(self.__queue)
+
+    def stats(self):
+        """Gets the counters of the sink.
+
+        Returns:
+            dict: Received, dropped and written frames, queue depth and the mean and largest latency in seconds.
+        """
+        return {
+            'received': self.frames_received,
+            'dropped': self.frames_dropped,
+            'written': self.frames_written,
+            'batches': self.batches_written,
+            'errors': self.errors,
+            'queued': self.queue_depth,
+            'mean_latency': self.total_latency / self.frames_written if self.frames_written > 0 else 0.,
+            'max_latency': self.max_latency
+        }
+
+    def close(self, timeout=None):
+        """Stops accepting outputs and waits until the worker wrote the queued outputs and closed the sink.
+
+        The worker closes the sink itself once the queue is empty, so a sink is never closed while it is written,
+        even when the timeout passes first.
+
+        Args:
+            timeout (float): Seconds to wait for the queued outputs to be written, None waits until they are.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        self.__worker.join(timeout)
+        if self.__worker.is_alive():
+            logging.warning(f'sink {self.name} is still writing after {timeout} seconds, it is closed when done')
+
+        stats = self.stats()
+        logging.info(f'sink {self.name} wrote {stats["written"]} of {stats["received"]} frames '
+                     f'({stats["dropped"]} dropped, {stats["errors"]} failed batches), '
+                     f'latency mean {stats["mean_latency"] * 1000:.1f} ms, max {stats["max_latency"] * 1000:.1f} ms')
+
+    def __write_batches(self):
+        """Writes batches of queued outputs until the sink is closed and the queue is empty, then closes the sink."""
+        while True:
+            with self.__condition:
+                while len(self.__queue) == 0 and not self.__closed:
+                    self.__condition.wait()
+
+                if len(self.__queue) == 0:
+                    break
+
+                batch = [self.__queue.popleft() for _ in range(min(self.max_batch, len(self.__queue)))]
+
+                # Let a frame loop waiting for room continue.
+                self.__condition.notify_all()
+
+            try:
+                self.sink.write([outputs for outputs, _ in batch])
+            # A failing sink should not stop the other outputs, the error is counted and logged.
+            except Exception as error:  # pylint: disable=broad-except
+                self.errors += 1
+                logging.error(f'sink {self.name} failed to write {len(batch)} frames: {error}')
+                continue
+
+            now = time.perf_counter()
+            self.frames_written += len(batch)
+            self.batches_written += 1
+            for _, put_time in batch:
+                self.total_latency += now - put_time
+                self.max_latency = max(self.max_latency, now - put_time)
+
+        self.sink.close()
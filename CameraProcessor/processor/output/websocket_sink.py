@@ -0,0 +1,41 @@
+"""Contains the WebsocketSink class, which sends the tracked boxes to the orchestrator.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import json
+
+from processor.output.i_sink import ISink
+from processor.websocket.boxes_message import BoxesMessage
+
+
+class WebsocketSink(ISink):
+    """Sends the tracked boxes of every frame to the orchestrator as a boxes message.
+
+    The messages are serialized on the worker, writing them is handed to the event loop of the websocket client.
+
+    Attributes:
+        ws_client (WebsocketClient): Connection to the orchestrator.
+        loop (asyncio.AbstractEventLoop): Event loop the websocket client runs on.
+    """
+    def __init__(self, ws_client, loop):
+        """Inits the sink.
+
+        Args:
+            ws_client (WebsocketClient): Connection to the orchestrator.
+            loop (asyncio.AbstractEventLoop): Event loop the websocket client runs on.
+        """
+        self.ws_client = ws_client
+        self.loop = loop
+
+    def write(self, outputs):
+        """Sends a boxes message for every frame.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        for frame_obj, _, tracked_boxes, _ in outputs:
+            json_message = json.dumps(BoxesMessage(frame_obj.timestamp, tracked_boxes).to_message())
+            self.ws_client.send_json_threadsafe(json_message, self.loop)
@@ -0,0 +1,67 @@
+"""Contains the Camera class, which holds the state of a single camera of a multi-camera processor.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.stream_state import StreamState
+
+
+def parse_cameras(cameras):
+    """Parses a list of cameras declared as a string.
+
+    Cameras are separated by semicolons, the id and HLS url of a camera by an equals sign,
+    for example: camera_1=https://host/1/stream.m3u8; camera_2=https://host/2/stream.m3u8
+
+    Args:
+        cameras (str): The declared cameras.
+
+    Returns:
+        [(str, str)]: Id and HLS url of every camera.
+
+    Raises:
+        ValueError: A camera has no id or url, or an id is used twice.
+    """
+    camera_urls = []
+
+    for camera in cameras.split(';'):
+        if camera.strip() == '':
+            continue
+
+        camera_id, _, hls_url = camera.partition('=')
+        camera_id, hls_url = camera_id.strip(), hls_url.strip()
+        if camera_id == '' or hls_url == '':
+            raise ValueError(f'Camera "{camera.strip()}" should be declared as <id>=<hls url>')
+        if camera_id in [identifier for identifier, _ in camera_urls]:
+            raise ValueError(f'Camera id "{camera_id}" is declared twice')
+
+        camera_urls.append((camera_id, hls_url))
+
+    return camera_urls
+
+
+class Camera(StreamState):
+    """State of one of the cameras served by a processor, the models are shared with the other cameras.
+
+    Besides the state of its stream, every camera has its own capture and outputs.
+
+    Attributes:
+        identifier (str): Id of the camera, under which it identifies to the orchestrator.
+        capture (ICapture): Capture of the stream of the camera.
+        output (OutputSinks): Sinks the outputs of the processed frames of the camera are written to, None if not set.
+    """
+    def __init__(self, identifier, capture, tracker, ws_client=None, checkpoint=None):
+        """Inits the state of the camera.
+
+        Args:
+            identifier (str): Id of the camera, under which it identifies to the orchestrator.
+            capture (ICapture): Capture of the stream of the camera.
+            tracker (ITracker): Tracker following the objects of the camera, None if left out.
+            ws_client (WebsocketClient): Connection of the camera to the orchestrator, None if not connected.
+            checkpoint (Checkpoint): Checkpoint of the tracker and re-identification data, None if not checkpointed.
+        """
+        super().__init__(tracker, ws_client, checkpoint)
+        self.identifier = identifier
+        self.capture = capture
+        self.output = None
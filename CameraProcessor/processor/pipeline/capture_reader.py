@@ -0,0 +1,72 @@
+"""Contains the capture reader class used to read the frames of a capture on its own thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import queue
+import threading
+
+from processor.input.i_capture import FRAME_WAIT_TIMEOUT
+from processor.pipeline.pipeline_stage import END_OF_STREAM, put_until_stopped
+
+
+class CaptureReader:
+    """Reads frames from a capture into a bounded queue on a separate thread, the first stage of a pipeline.
+
+    The end of the stream is always put in the queue, also when reading a frame raised an exception,
+    so the consumer of the queue never waits for a frame that does not come. Like the error of a PipelineStage,
+    the exception is stored to be reraised by the consumer.
+
+    Attributes:
+        capture (ICapture): The capture to read.
+        output_queue (queue.Queue): Bounded queue the frames are put in.
+        error (Exception): Exception raised by the capture, None if no exception occurred.
+        __stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+        __thread (threading.Thread): Thread reading the capture.
+    """
+    def __init__(self, capture, stop_event, queue_size=2, name='capture'):
+        """Inits the reader and creates its output queue.
+
+        Args:
+            capture (ICapture): The capture to read.
+            stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+            queue_size (int): Maximum amount of frames waiting in the output queue.
+            name (str): Name of the reading thread.
+        """
+        self.capture = capture
+        self.output_queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.__stop_event = stop_event
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+
+    def start(self):
+        """Starts the reading thread."""
+        self.__thread.start()
+
+    def join(self, timeout=None):
+        """Waits until the reading thread has finished.
+
+        Args:
+            timeout (float): Maximum amount of seconds to wait.
+        """
+        self.__thread.join(timeout)
+
+    def __run(self):
+        """Reads frames from the capture until the capture closes, fails or the pipeline stops."""
+        try:
+            while self.capture.opened() and not self.__stop_event.is_set():
+                ret, frame_obj = self.capture.get_next_frame()
+
+                # Wait for the next frame, so waiting does not keep a core busy.
+                if not ret:
+                    self.capture.wait_for_frame(FRAME_WAIT_TIMEOUT)
+                    continue
+
+                put_until_stopped(self.output_queue, frame_obj, self.__stop_event)
+        # Any exception is stored and reraised by the consumer of the pipeline.
+        # pylint: disable=broad-except
+        except Exception as error:
+            self.error = error
+        finally:
+            put_until_stopped(self.output_queue, END_OF_STREAM, self.__stop_event)
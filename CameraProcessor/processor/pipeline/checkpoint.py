@@ -0,0 +1,175 @@
+"""Contains the Checkpoint class, which snapshots the tracker and re-identification state for a warm restart.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import os
+import time
+import pickle
+import logging
+import threading
+
+
+class Checkpoint:
+    """Periodically snapshots the state of the tracker and the re-identification data of a camera to local disk.
+
+    A restarted processor restores the snapshot if it is fresh, so track ids continue where they were and the
+    queries of the orchestrator do not have to be resent. The state is pickled on the thread processing the frames,
+    so it is consistent, while writing the file happens on a separate thread. The file is replaced atomically,
+    so a crash while writing leaves the previous snapshot intact.
+
+    Attributes:
+        path (str): Path of the snapshot file.
+        interval (float): Seconds between two snapshots.
+        max_age (float): Seconds a snapshot may be old to be restored.
+        snapshots (int): Amount of snapshots taken.
+
+        __last_time (float): Time the last snapshot was taken.
+        __tracker_supported (bool): Whether the tracker can get and restore its state.
+        __pending (bytes): Snapshot waiting to be written.
+        __condition (threading.Condition): Signals a pending snapshot or the closing of the checkpoint.
+        __closed (bool): Whether the checkpoint is closed.
+        __writing_thread (threading.Thread): Thread writing the snapshots.
+    """
+    def __init__(self, path, interval=1., max_age=30.):
+        """Inits the checkpoint, the writing thread is started by the first snapshot.
+
+        Args:
+            path (str): Path of the snapshot file.
+            interval (float): Seconds between two snapshots.
+            max_age (float): Seconds a snapshot may be old to be restored.
+        """
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+        self.snapshots = 0
+
+        self.__last_time = time.time()
+        self.__tracker_supported = True
+        self.__pending = None
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__writing_thread = None
+
+    def restore(self, tracker, re_id_data):
+        """Restores the tracker and re-identification data from the snapshot if it is fresh.
+
+        Args:
+            tracker (ITracker): Tracker to restore, None if left out.
+            re_id_data (ReidData): Re-identification data to restore.
+
+        Returns:
+            bool: Whether a snapshot was restored.
+        """
+        start = time.perf_counter()
+
+        try:
+            with open(self.path, 'rb') as file:
+                snapshot = pickle.load(file)
+        except FileNotFoundError:
+            return False
+        except (OSError, pickle.UnpicklingError, EOFError) as error:
+            logging.warning(f'Could not read checkpoint {self.path}: {error}')
+            return False
+
+        age = time.time() - snapshot['time']
+        if age > self.max_age:
+            logging.info(f'Not restoring checkpoint {self.path}, it is {age:.1f} seconds old')
+            return False
+
+        if tracker is not None and snapshot['tracker'] is not None:
+            try:
+                tracker.set_state(snapshot['tracker'])
+            except NotImplementedError:
+                logging.warning('Tracker cannot restore its state, only restoring the re-identification data')
+        re_id_data.set_state(snapshot['re_id_data'])
+
+        logging.info(f'Restored checkpoint {self.path} of {age:.1f} seconds old '
+                     f'in {(time.perf_counter() - start) * 1000:.1f} ms')
+        return True
+
+    def update(self, tracker, re_id_data):
+        """Takes a snapshot if the interval passed since the last one.
+
+        Args:
+            tracker (ITracker): Tracker to snapshot, None if left out.
+            re_id_data (ReidData): Re-identification data to snapshot.
+        """
+        if time.time() - self.__last_time >= self.interval:
+            self.snapshot(tracker, re_id_data)
+
+    def snapshot(self, tracker, re_id_data):
+        """Takes a snapshot, which is written by the writing thread.
+
+        Should be called while no other thread changes the tracker or re-identification data.
+
+        Args:
+            tracker (ITracker): Tracker to snapshot, None if left out.
+            re_id_data (ReidData): Re-identification data to snapshot.
+        """
+        self.__last_time = time.time()
+
+        tracker_state = None
+        if tracker is not None and self.__tracker_supported:
+            try:
+                tracker_state = tracker.get_state()
+            except NotImplementedError:
+                logging.warning('Tracker cannot get its state, only the re-identification data is checkpointed')
+                self.__tracker_supported = False
+
+        snapshot = pickle.dumps({'time': self.__last_time, 'tracker': tracker_state,
+                                 're_id_data': re_id_data.get_state()}, pickle.HIGHEST_PROTOCOL)
+
+        with self.__condition:
+            if self.__closed:
+                return
+
+            # Only the latest snapshot is written, an older one still waiting is replaced.
+            self.__pending = snapshot
+            self.snapshots += 1
+            self.__condition.notify()
+
+        if self.__writing_thread is None:
+            self.__writing_thread = threading.Thread(target=self.__write_snapshots, name='checkpoint', daemon=True)
+            self.__writing_thread.start()
+
+    def close(self, tracker=None, re_id_data=None):
+        """Takes a last snapshot if the state is given, and waits until the pending snapshot is written.
+
+        Args:
+            tracker (ITracker): Tracker to snapshot, None if left out.
+            re_id_data (ReidData): Re-identification data to snapshot, None takes no last snapshot.
+        """
+        if re_id_data is not None:
+            self.snapshot(tracker, re_id_data)
+
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+
+        if self.__writing_thread is not None:
+            self.__writing_thread.join()
+
+        logging.info(f'Checkpoint {self.path} took {self.snapshots} snapshots')
+
+    def __write_snapshots(self):
+        """Writes the pending snapshots until the checkpoint is closed."""
+        while True:
+            with self.__condition:
+                while self.__pending is None and not self.__closed:
+                    self.__condition.wait()
+
+                snapshot, self.__pending = self.__pending, None
+
+                if snapshot is None:
+                    return
+
+            try:
+                temporary_path = f'{self.path}.tmp'
+                with open(temporary_path, 'wb') as file:
+                    file.write(snapshot)
+                os.replace(temporary_path, self.path)
+            except OSError as error:
+                logging.warning(f'Could not write checkpoint {self.path}: {error}')
@@ -0,0 +1,64 @@
+"""Contains the detector wrapper letting a resolution controller change the inference size.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class AdaptiveResolutionDetector(IDetector):
+    """Detector wrapper that measures the latency of every detection and lets a controller change the inference size.
+
+    The size is changed in place between two detections, so the model does not need to be reloaded and the
+    processor keeps running.
+
+    Attributes:
+        detector (IYoloDetector): The wrapped detector, of which the inference size is changed.
+        controller (ResolutionController): Controller choosing the inference size.
+        queue_depth (func): Function giving the amount of frames waiting to be detected,
+            set through set_queue_depth by executions that queue frames.
+    """
+
+    def __init__(self, detector, controller):
+        """Inits the wrapper, setting the initial size of the controller on the detector.
+
+        Args:
+            detector (IYoloDetector): The detector to wrap.
+            controller (ResolutionController): Controller choosing the inference size.
+        """
+        self.detector = detector
+        self.controller = controller
+        self.queue_depth = lambda: 0
+
+        self.detector.set_img_size(self.controller.size)
+
+    def detect(self, frame_obj):
+        """Detects using the current inference size, after which the controller may change the size.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: returns BoundingBoxes object containing a list of BoundingBox objects.
+        """
+        start = time.perf_counter()
+        bounding_boxes = self.detector.detect(frame_obj)
+        latency = time.perf_counter() - start
+
+        size = self.controller.size
+        if self.controller.update(latency, self.queue_depth()) != size:
+            self.detector.set_img_size(self.controller.size)
+
+        return bounding_boxes
+
+    def set_queue_depth(self, queue_depth):
+        """Lets the controller also lower the size when frames are waiting to be detected.
+
+        Args:
+            queue_depth (func): Function giving the amount of frames waiting to be detected.
+        """
+        self.queue_depth = queue_depth
@@ -0,0 +1,41 @@
+"""Detection gate abstract class.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class IDetectionGate:
+    """Detection gate interface, deciding per frame whether the detector has to run.
+
+    On frames on which the detector does not run, the tracker is asked for the positions of the tracked objects,
+    so the pipeline still outputs boxes for every frame.
+
+    Attributes:
+        frames_detected (int): Number of frames on which the detector ran.
+        frames_skipped (int): Number of frames on which the detector was skipped.
+    """
+
+    def __init__(self):
+        """Inits the counters of the gate."""
+        self.frames_detected = 0
+        self.frames_skipped = 0
+
+    def process(self, frame_obj, detector, tracker, re_id_data):
+        """Runs the detection and tracking stage on a frame, skipping the detector when it is not needed.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+            detector (IDetector): detector performing the detections on a given frame.
+            tracker (ITracker): tracker performing simple tracking of all objects using the detections.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes, BoundingBoxes: The detected boxes, empty if the detector was skipped.
+                                          The tracked boxes.
+
+        Raises:
+            NotImplementedError: The function is not overridden in the subclass.
+        """
+        raise NotImplementedError('Process function not implemented')
@@ -31,3 +31,24 @@ class IDetector(IComponent):
             NotImplementedError: The function is not overridden in the subclass.
         """
         raise NotImplementedError("Detect function not implemented")
+
+    def detect_batch(self, frame_objs):
+        """Run detection on frames of multiple cameras, by default detecting on every frame separately.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object of every frame, in the same order as the frames.
+        """
+        return [self.detect(frame_obj) for frame_obj in frame_objs]
+
+    def set_queue_depth(self, queue_depth):
+        """Hands the detector the amount of frames waiting to be detected, ignored by default.
+
+        Executions that queue frames before the detection stage call this, detectors wrapping another detector
+        pass it on, so an adaptive detector gets it however it is wrapped.
+
+        Args:
+            queue_depth (func): Function giving the amount of frames waiting to be detected.
+        """
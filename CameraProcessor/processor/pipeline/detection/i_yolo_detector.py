@@ -4,17 +4,79 @@ This program has been developed by students from the bachelor Computer Science a
 Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
+import math
 import numpy as np
 import torch
 
 from processor.pipeline.detection.i_detector import IDetector
 from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
 from processor.data_object.rectangle import Rectangle
 from processor.pipeline.detection.yolor.utils.general import non_max_suppression, scale_coords
 
 
 class IYoloDetector(IDetector):
-    """Detection runner interface that can be run as Scheduler component."""
+    """Detection runner interface that can be run as Scheduler component.
+
+    Attributes:
+        img_size (int): Inference size in pixels, set by the implementation.
+        stride (int): Stride of the model in pixels, set by the implementation.
+    """
+    def __init__(self):
+        """Inits the inference size and stride, which are set by the implementation once the model is known."""
+        self.img_size = None
+        self.stride = None
+
+    def set_img_size(self, img_size):
+        """Changes the inference size of the following detections, without reloading the model.
+
+        Args:
+            img_size (int): Inference size in pixels, rounded up to a multiple of the stride of the model.
+        """
+        self.img_size = int(math.ceil(img_size / self.stride) * self.stride)
+
+    def letterbox_square(self, frame):
+        """Resizes and pads the frame to a square of the inference size.
+
+        Args:
+            frame (np.ndarray): Frame to resize.
+
+        Returns:
+            np.ndarray: Frame of img_size by img_size pixels.
+
+        Raises:
+            NotImplementedError: The function is not overridden in the subclass.
+        """
+        raise NotImplementedError('Letterbox square function not implemented')
+
+    def detect_batch(self, frame_objs):
+        """Run detection on frames of multiple cameras in a single forward pass of the model.
+
+        Every frame is padded to the same square size, so frames of different resolutions can be stacked.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object of every frame, in the same order as the frames.
+        """
+        if len(frame_objs) == 0:
+            return []
+
+        # Stack the converted frames into a single batch.
+        img = torch.cat([self.convert_image(self.letterbox_square(frame_obj.frame), self.device, self.half)
+                         for frame_obj in frame_objs])
+        pred = self.generate_predictions(img, self.model, self.config)
+
+        # Create the bounding boxes of every frame from the predictions of its image.
+        batch_boxes = []
+        for frame_obj, det in zip(frame_objs, pred):
+            bounding_boxes = []
+            self.create_bounding_boxes([det], img, frame_obj, bounding_boxes, self.filter, self.names)
+            batch_boxes.append(BoundingBoxes(bounding_boxes))
+
+        return batch_boxes
+
     @staticmethod
     def convert_image(img, device, half):
         """Converts the image to the size used for the detection.
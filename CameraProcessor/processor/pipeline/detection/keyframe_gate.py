@@ -0,0 +1,117 @@
+"""Contains the keyframe gate, which only runs the detector on keyframes.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.pipeline.detection.i_detection_gate import IDetectionGate
+
+
+class KeyframeGate(IDetectionGate):
+    """Runs the detector every interval frames, the tracker predicts the tracked objects on the frames in between.
+
+    With an adaptive interval, the interval shrinks when the tracked objects move fast or their position becomes
+    uncertain, and grows again while both stay below their thresholds. Motion is measured in object sizes per frame,
+    uncertainty as the standard deviation of the predicted position in object sizes, see ITracker.
+
+    Attributes:
+        interval (int): Current amount of frames from one keyframe to the next.
+        adaptive (bool): Whether the interval adapts to the motion and uncertainty of the tracked objects.
+        min_interval (int): Smallest interval when adaptive.
+        max_interval (int): Largest interval when adaptive.
+        motion_threshold (float): Motion above which the interval shrinks.
+        uncertainty_threshold (float): Uncertainty above which a keyframe is forced and the interval shrinks.
+
+        __frames_since_keyframe (int): Amount of frames processed since the last keyframe.
+    """
+
+    def __init__(self, interval=1, adaptive=False, min_interval=1, max_interval=10,
+                 motion_threshold=0.1, uncertainty_threshold=0.5):
+        """Inits the keyframe gate.
+
+        Args:
+            interval (int): Amount of frames from one keyframe to the next, the initial interval when adaptive.
+            adaptive (bool): Whether the interval adapts to the motion and uncertainty of the tracked objects.
+            min_interval (int): Smallest interval when adaptive.
+            max_interval (int): Largest interval when adaptive.
+            motion_threshold (float): Motion above which the interval shrinks.
+            uncertainty_threshold (float): Uncertainty above which a keyframe is forced and the interval shrinks.
+
+        Raises:
+            ValueError: An interval is smaller than 1.
+        """
+        super().__init__()
+
+        if min(interval, min_interval, max_interval) < 1:
+            raise ValueError('Keyframe intervals should be at least 1')
+
+        self.interval = interval
+        self.adaptive = adaptive
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.motion_threshold = motion_threshold
+        self.uncertainty_threshold = uncertainty_threshold
+
+        self.__frames_since_keyframe = None
+
+    def process(self, frame_obj, detector, tracker, re_id_data):
+        """Detects and tracks on a keyframe, on the frames in between the tracker predicts the objects.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+            detector (IDetector): detector performing the detections on a given frame.
+            tracker (ITracker): tracker performing simple tracking of all objects using the detections.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes, BoundingBoxes: The detected boxes, empty if the frame is not a keyframe.
+                                          The tracked boxes.
+        """
+        if self.__is_keyframe(tracker):
+            self.__frames_since_keyframe = 0
+            self.frames_detected += 1
+
+            detected_boxes = detector.detect(frame_obj)
+            tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+
+            if self.adaptive:
+                self.__adapt_interval(tracker)
+
+            return detected_boxes, tracked_boxes
+
+        self.__frames_since_keyframe += 1
+        self.frames_skipped += 1
+
+        return BoundingBoxes([]), tracker.predict(frame_obj, re_id_data)
+
+    def __is_keyframe(self, tracker):
+        """Check whether the detector has to run on the next frame.
+
+        Args:
+            tracker (ITracker): tracker of the pipeline.
+
+        Returns:
+            bool: Whether the next frame is a keyframe.
+        """
+        # The first frame is always a keyframe.
+        if self.__frames_since_keyframe is None:
+            return True
+
+        if self.__frames_since_keyframe + 1 >= self.interval:
+            return True
+
+        # The predictions drifted too far to be trusted, so detect early.
+        return self.adaptive and tracker.uncertainty() > self.uncertainty_threshold
+
+    def __adapt_interval(self, tracker):
+        """Shrinks the interval when the tracked objects are hard to predict, otherwise grows it by one frame.
+
+        Args:
+            tracker (ITracker): tracker that was just updated with detections.
+        """
+        if tracker.motion() > self.motion_threshold or tracker.uncertainty() > self.uncertainty_threshold:
+            self.interval = max(self.min_interval, self.interval // 2)
+        else:
+            self.interval = min(self.max_interval, self.interval + 1)
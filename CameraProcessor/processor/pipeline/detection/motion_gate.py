@@ -0,0 +1,157 @@
+"""Contains the motion gate, which skips the detector on frames without significant change.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import cv2
+import numpy as np
+
+from processor.pipeline.detection.i_detection_gate import IDetectionGate
+
+# What replaces the detections on a static frame.
+REUSE_MODES = ['detections', 'predict']
+
+
+class MotionGate(IDetectionGate):
+    """Runs a cheap motion detector ahead of the detector, skipping inference on static frames.
+
+    Frames are downscaled, converted to grayscale and blurred, after which they are compared with a reference.
+    With a background rate of 0 the reference is the frame the detector last ran on (frame differencing),
+    otherwise it is a running average of all frames (background model), updated with the background rate.
+    A frame is static when the fraction of pixels differing more than pixel_threshold from the reference
+    is below motion_threshold. On static frames either the previous detections are reused, or the tracker predicts.
+
+    Frames with motion are passed to the wrapped gate if there is one, so motion gating can be combined with keyframes.
+
+    Attributes:
+        width (int): Width in pixels of the downscaled frames.
+        pixel_threshold (int): Difference in gray value above which a pixel changed.
+        motion_threshold (float): Fraction of changed pixels above which a frame contains motion.
+        background_rate (float): Weight of a new frame in the background model, 0 compares with the last detected frame.
+        reuse (str): What replaces the detections on a static frame, one of REUSE_MODES.
+        max_skipped_frames (int): Amount of consecutive static frames after which detection is forced, 0 never forces.
+        gate (IDetectionGate): Gate processing the frames with motion, None detects on all of them.
+
+        __reference (np.ndarray): Downscaled frame or background the frames are compared with.
+        __previous_detections (BoundingBoxes): Detections of the last frame the detector ran on.
+        __skipped_in_row (int): Amount of consecutive frames that were skipped.
+    """
+
+    def __init__(self, width=64, pixel_threshold=25, motion_threshold=0.01, background_rate=0.,
+                 reuse='detections', max_skipped_frames=0, gate=None):
+        """Inits the motion gate.
+
+        Args:
+            width (int): Width in pixels of the downscaled frames.
+            pixel_threshold (int): Difference in gray value above which a pixel changed.
+            motion_threshold (float): Fraction of changed pixels above which a frame contains motion.
+            background_rate (float): Weight of a new frame in the background model,
+                0 compares with the last detected frame.
+            reuse (str): What replaces the detections on a static frame, one of REUSE_MODES.
+            max_skipped_frames (int): Amount of consecutive static frames after which detection is forced,
+                0 never forces.
+            gate (IDetectionGate): Gate processing the frames with motion, None detects on all of them.
+
+        Raises:
+            NameError: The reuse mode is unknown.
+        """
+        super().__init__()
+
+        if reuse not in REUSE_MODES:
+            raise NameError(f'Reuse mode "{reuse}" is unknown')
+
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.motion_threshold = motion_threshold
+        self.background_rate = background_rate
+        self.reuse = reuse
+        self.max_skipped_frames = max_skipped_frames
+        self.gate = gate
+
+        self.__reference = None
+        self.__previous_detections = None
+        self.__skipped_in_row = 0
+
+    def process(self, frame_obj, detector, tracker, re_id_data):
+        """Detects and tracks on a frame with motion, on a static frame the previous detections are reused.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+            detector (IDetector): detector performing the detections on a given frame.
+            tracker (ITracker): tracker performing simple tracking of all objects using the detections.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes, BoundingBoxes: The detected boxes, the previous detections if the frame is static.
+                                          The tracked boxes.
+        """
+        small_frame = self.__downscale(frame_obj.frame)
+
+        if self.__is_static(small_frame):
+            self.__skipped_in_row += 1
+            self.frames_skipped += 1
+
+            if self.reuse == 'predict':
+                return self.__previous_detections, tracker.predict(frame_obj, re_id_data)
+            return self.__previous_detections, tracker.track(frame_obj, self.__previous_detections, re_id_data)
+
+        self.__skipped_in_row = 0
+        self.frames_detected += 1
+
+        if self.background_rate == 0:
+            self.__reference = small_frame
+
+        if self.gate is None:
+            detected_boxes = detector.detect(frame_obj)
+            tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+            self.__previous_detections = detected_boxes
+            return detected_boxes, tracked_boxes
+
+        frames_detected = self.gate.frames_detected
+        detected_boxes, tracked_boxes = self.gate.process(frame_obj, detector, tracker, re_id_data)
+
+        # Only remember detections when the wrapped gate did not skip the detector itself.
+        if self.gate.frames_detected > frames_detected:
+            self.__previous_detections = detected_boxes
+        return detected_boxes, tracked_boxes
+
+    def __downscale(self, frame):
+        """Downscales the frame to the configured width, converts it to grayscale and removes noise.
+
+        Args:
+            frame (np.ndarray): BGR frame.
+
+        Returns:
+            np.ndarray: Downscaled grayscale frame as float32.
+        """
+        height = max(1, round(frame.shape[0] * self.width / frame.shape[1]))
+        small_frame = cv2.resize(frame, (self.width, height), interpolation=cv2.INTER_AREA)
+        small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(small_frame, (3, 3), 0).astype(np.float32)
+
+    def __is_static(self, small_frame):
+        """Check whether the frame contains no significant change compared with the reference.
+
+        Args:
+            small_frame (np.ndarray): Downscaled grayscale frame.
+
+        Returns:
+            bool: Whether the detector can be skipped on the frame.
+        """
+        # Nothing to compare with or to reuse yet.
+        if self.__reference is None or self.__previous_detections is None:
+            self.__reference = small_frame
+            return False
+
+        changed = np.mean(cv2.absdiff(small_frame, self.__reference) > self.pixel_threshold)
+
+        # Update the background model with every frame, so gradual changes like lighting are absorbed.
+        if self.background_rate > 0:
+            cv2.accumulateWeighted(small_frame, self.__reference, self.background_rate)
+
+        if 0 < self.max_skipped_frames <= self.__skipped_in_row:
+            return False
+
+        return changed < self.motion_threshold
@@ -0,0 +1,116 @@
+"""Contains the controller switching the inference size of the detector based on the measured latency.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import logging
+
+
+class ResolutionController:
+    """Chooses an inference size from a set of sizes, using hysteresis to prevent switching back and forth.
+
+    The detection latency is smoothed using an exponential moving average. The size is lowered when the latency
+    stays above high_latency or the queue of waiting frames stays deeper than max_queue_depth for patience updates,
+    and raised when the latency stays below low_latency with no frames waiting for patience updates.
+    After a switch, the latency of the new size is measured from scratch and no switch happens for patience updates.
+
+    Attributes:
+        sizes ([int]): Available inference sizes, ascending.
+        size (int): Current inference size.
+        high_latency (float): Seconds of detection latency above which the size is lowered.
+        low_latency (float): Seconds of detection latency below which the size is raised.
+        max_queue_depth (int): Amount of waiting frames above which the size is lowered.
+        patience (int): Amount of consecutive updates a condition has to hold before switching.
+        smoothing (float): Weight of a new measurement in the latency.
+        latency (float): Smoothed latency of the current size, None if not measured yet.
+        switches (int): Amount of switches made.
+
+        __overloaded (int): Amount of consecutive updates the size was too large.
+        __underloaded (int): Amount of consecutive updates the size was too small.
+        __cooldown (int): Amount of updates left in which no switch is made.
+    """
+
+    def __init__(self, sizes, size, high_latency, low_latency, max_queue_depth=0, patience=10, smoothing=0.2):
+        """Inits the controller.
+
+        Args:
+            sizes ([int]): Available inference sizes.
+            size (int): Initial inference size, the closest available size is used.
+            high_latency (float): Seconds of detection latency above which the size is lowered.
+            low_latency (float): Seconds of detection latency below which the size is raised.
+            max_queue_depth (int): Amount of waiting frames above which the size is lowered.
+            patience (int): Amount of consecutive updates a condition has to hold before switching.
+            smoothing (float): Weight of a new measurement in the latency.
+
+        Raises:
+            ValueError: No sizes are given, or the low latency is not below the high latency.
+        """
+        if len(sizes) == 0:
+            raise ValueError('At least one inference size is needed')
+        if low_latency >= high_latency:
+            raise ValueError(f'Low latency {low_latency} should be smaller than high latency {high_latency}')
+
+        self.sizes = sorted(sizes)
+        self.size = min(self.sizes, key=lambda available_size: abs(available_size - size))
+        self.high_latency = high_latency
+        self.low_latency = low_latency
+        self.max_queue_depth = max_queue_depth
+        self.patience = patience
+        self.smoothing = smoothing
+        self.latency = None
+        self.switches = 0
+
+        self.__overloaded = 0
+        self.__underloaded = 0
+        self.__cooldown = 0
+
+    def update(self, latency, queue_depth=0):
+        """Reports a measurement and switches the size when needed.
+
+        Args:
+            latency (float): Seconds the last detection took.
+            queue_depth (int): Amount of frames waiting to be detected.
+
+        Returns:
+            int: The inference size to use for the next detection.
+        """
+        self.latency = latency if self.latency is None else self.latency + self.smoothing * (latency - self.latency)
+
+        if self.__cooldown > 0:
+            self.__cooldown -= 1
+            return self.size
+
+        if self.latency > self.high_latency or queue_depth > self.max_queue_depth:
+            self.__overloaded += 1
+            self.__underloaded = 0
+        elif self.latency < self.low_latency and queue_depth == 0:
+            self.__underloaded += 1
+            self.__overloaded = 0
+        else:
+            self.__overloaded = 0
+            self.__underloaded = 0
+
+        index = self.sizes.index(self.size)
+        if self.__overloaded >= self.patience and index > 0:
+            self.__switch(self.sizes[index - 1])
+        elif self.__underloaded >= self.patience and index < len(self.sizes) - 1:
+            self.__switch(self.sizes[index + 1])
+
+        return self.size
+
+    def __switch(self, size):
+        """Switches to another size, starting the cooldown.
+
+        Args:
+            size (int): The new inference size.
+        """
+        logging.info(f'Switching inference size from {self.size} to {size}, latency was {self.latency * 1000:.1f} ms')
+
+        self.size = size
+        self.switches += 1
+        self.latency = None
+        self.__overloaded = 0
+        self.__underloaded = 0
+        self.__cooldown = self.patience
@@ -0,0 +1,153 @@
+"""Contains the region of interest detector, which only detects inside the regions of interest of a camera.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import re
+import math
+import numpy as np
+import cv2
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.i_detector import IDetector
+
+
+def parse_regions(regions):
+    """Parses regions of interest written as points, regions are separated by semicolons.
+
+    A region of two points is a rectangle given by its top-left and bottom-right corner,
+    a region of more points is a polygon. Coordinates are normalized, for example:
+    (0.1, 0.2) (0.5, 0.9); (0.6, 0.1) (0.9, 0.1) (0.9, 0.5)
+
+    Args:
+        regions (str): The regions of interest.
+
+    Returns:
+        [np.ndarray]: Polygon of every region, as an array of normalized points.
+
+    Raises:
+        ValueError: A region has less than two points or a point lies outside the frame.
+    """
+    polygons = []
+
+    for region in regions.split(';'):
+        if region.strip() == '':
+            continue
+
+        points = [tuple(float(value) for value in point.split(','))
+                  for point in re.findall(r'\(([^)]*)\)', region)]
+
+        if len(points) < 2 or any(len(point) != 2 for point in points):
+            raise ValueError(f'Region of interest "{region.strip()}" should contain at least two (x, y) points')
+        if any(not 0 <= value <= 1 for point in points for value in point):
+            raise ValueError(f'Region of interest "{region.strip()}" should contain normalized points')
+
+        # Two points describe a rectangle.
+        if len(points) == 2:
+            (x1, y1), (x2, y2) = points
+            points = [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+
+        polygons.append(np.array(points, dtype=np.float32))
+
+    return polygons
+
+
+class RoiDetector(IDetector):
+    """Detector wrapper that only runs the detector on the part of the frame containing the regions of interest.
+
+    The detector infers on the bounding crop of all regions, so fewer pixels are processed per frame.
+    The boxes found in the crop are mapped back to normalized coordinates of the full frame,
+    and boxes of which the centre lies outside every region are dropped.
+
+    Attributes:
+        detector (IDetector): The detector running on the crop.
+        polygons ([np.ndarray]): Polygon of every region, as an array of normalized points.
+
+        __crop (float, float, float, float): Normalized bounding box of all regions.
+    """
+
+    def __init__(self, detector, polygons):
+        """Inits the wrapper.
+
+        Args:
+            detector (IDetector): The detector to run on the crop.
+            polygons ([np.ndarray]): Polygon of every region, as an array of normalized points.
+
+        Raises:
+            ValueError: No regions of interest were given.
+        """
+        if len(polygons) == 0:
+            raise ValueError('At least one region of interest is needed')
+
+        self.detector = detector
+        self.polygons = polygons
+
+        points = np.concatenate(polygons)
+        self.__crop = (*points.min(axis=0).tolist(), *points.max(axis=0).tolist())
+
+    def detect(self, frame_obj):
+        """Detects objects inside the regions of interest.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: Bounding boxes inside the regions, in normalized coordinates of the full frame.
+        """
+        width, height = frame_obj.shape
+
+        # Pixel bounds of the crop, rounded outwards so no part of a region is cut off.
+        # Rounding for float precision errors first, so a bound on a pixel edge does not add a pixel.
+        crop_x1, crop_y1 = math.floor(round(self.__crop[0] * width, 3)), math.floor(round(self.__crop[1] * height, 3))
+        crop_x2 = max(math.ceil(round(self.__crop[2] * width, 3)), crop_x1 + 1)
+        crop_y2 = max(math.ceil(round(self.__crop[3] * height, 3)), crop_y1 + 1)
+
+        crop = np.ascontiguousarray(frame_obj.frame[crop_y1:crop_y2, crop_x1:crop_x2])
+        crop_width, crop_height = crop_x2 - crop_x1, crop_y2 - crop_y1
+
+        bounding_boxes = []
+        for bounding_box in self.detector.detect(FrameObj(crop, frame_obj.timestamp)):
+            rectangle = bounding_box.rectangle
+
+            # Map the box from the crop to the full frame.
+            x1 = (crop_x1 + rectangle.x1 * crop_width) / width
+            y1 = (crop_y1 + rectangle.y1 * crop_height) / height
+            x2 = (crop_x1 + rectangle.x2 * crop_width) / width
+            y2 = (crop_y1 + rectangle.y2 * crop_height) / height
+
+            if not self.inside_regions((x1 + x2) / 2, (y1 + y2) / 2):
+                continue
+
+            bounding_boxes.append(BoundingBox(
+                len(bounding_boxes),
+                Rectangle(min(x1, 1), min(y1, 1), min(x2, 1), min(y2, 1)),
+                bounding_box.classification,
+                bounding_box.certainty
+            ))
+
+        return BoundingBoxes(bounding_boxes)
+
+    def set_queue_depth(self, queue_depth):
+        """Passes the amount of frames waiting to be detected on to the wrapped detector.
+
+        Args:
+            queue_depth (func): Function giving the amount of frames waiting to be detected.
+        """
+        self.detector.set_queue_depth(queue_depth)
+
+    def inside_regions(self, x, y):
+        """Check whether a normalized point lies inside any of the regions.
+
+        Args:
+            x (float): Normalized x coordinate.
+            y (float): Normalized y coordinate.
+
+        Returns:
+            bool: Whether the point lies inside or on the border of a region.
+        """
+        return any(cv2.pointPolygonTest(polygon, (float(x), float(y)), False) >= 0 for polygon in self.polygons)
@@ -29,6 +29,8 @@ class YolorDetector(IYoloDetector):
         half (bool): Whether to half the model or not.
         classify (bool): Whether to classify.
         names ([str]): List of names, which that should get detected.
+        img_size (int): Inference size in pixels, can be changed at runtime using set_img_size.
+        stride (int): Amount of pixels the neural network moves at a time.
     """
     def __init__(self, config, filters):
         """Initiate the YolorDetector.
@@ -37,10 +39,14 @@ class YolorDetector(IYoloDetector):
             config (ConfigParser): Configurations, which also contain YOLOR configurations.
             filters (SectionProxy): Filtering for boundingBoxes.
         """
+        super().__init__()
+
         curr_dir = os.path.dirname(os.path.abspath(__file__))
         sys.path.insert(0, os.path.join(curr_dir, './yolor'))
 
         self.config = config
+        self.img_size = self.config.getint('img-size')
+        self.stride = self.config.getint('stride')
         self.filter = []
         with open(filters['targets_path']) as filter_names:
             self.filter = filter_names.read().splitlines()
@@ -92,6 +98,17 @@ class YolorDetector(IYoloDetector):
         img = torch.zeros((1, 3, self.config.getint('img-size'), self.config.getint('img-size')), device=self.device)
         _ = self.model(img.half() if self.half else img) if self.device.type != 'cpu' else None  # run once.
 
+    def letterbox_square(self, frame):
+        """Resizes and pads the frame to a square of the inference size.
+
+        Args:
+            frame (np.ndarray): Frame to resize.
+
+        Returns:
+            np.ndarray: Frame of img_size by img_size pixels.
+        """
+        return letterbox(frame, self.img_size, auto=False, auto_size=self.stride)[0]
+
     # pylint: disable=duplicate-code
     def detect(self, frame_obj):
         """Run detection on a Detection Object.
@@ -105,8 +122,7 @@ class YolorDetector(IYoloDetector):
         bounding_boxes = []
 
         # Resize.
-        img = letterbox(frame_obj.frame, self.config.getint('img-size'),
-                        auto_size=self.config.getint('stride'))[0]
+        img = letterbox(frame_obj.frame, self.img_size, auto_size=self.stride)[0]
 
         # Generate predictions and create corresponding bounding boxes.
         img = self.convert_image(img, self.device, self.half)
@@ -31,6 +31,8 @@ class Yolov5Detector(IYoloDetector):
         half (bool): Whether to half the model or not.
         classify (bool): Whether to classify.
         names ([str]): List of names, which that should get detected.
+        img_size (int): Inference size in pixels, can be changed at runtime using set_img_size.
+        stride (int): Stride of the model in pixels.
     """
 
     def __init__(self, config, filters):
@@ -40,6 +42,8 @@ class Yolov5Detector(IYoloDetector):
             config (ConfigParser): Yolov5 config file.
             filters (SectionProxy): Filter configurations for boundingBoxes.
         """
+        super().__init__()
+
         curr_dir = os.path.dirname(os.path.abspath(__file__))
         sys.path.insert(0, os.path.join(curr_dir, './yolov5'))
 
@@ -67,6 +71,7 @@ class Yolov5Detector(IYoloDetector):
                                   map_location=self.device)  # load FP32 model.
         self.stride = int(self.model.stride.max())  # model stride
         imgsz = check_img_size(self.config.getint('img-size'), s=self.stride)  # check img_size.
+        self.img_size = imgsz
         if self.half:
             self.model.half()  # to FP16
 
@@ -96,6 +101,17 @@ class Yolov5Detector(IYoloDetector):
         """
         return self.detect
 
+    def letterbox_square(self, frame):
+        """Resizes and pads the frame to a square of the inference size.
+
+        Args:
+            frame (np.ndarray): Frame to resize.
+
+        Returns:
+            np.ndarray: Frame of img_size by img_size pixels.
+        """
+        return letterbox(frame, self.img_size, stride=self.stride, auto=False)[0]
+
     # pylint: disable=duplicate-code
     def detect(self, frame_obj):
         """Run detection on a Detection Object.
@@ -109,7 +125,7 @@ class Yolov5Detector(IYoloDetector):
         bounding_boxes = []
 
         # Resize the image and convert it.
-        img = letterbox(frame_obj.frame, self.config.getint('img-size'), stride=self.stride)[0]
+        img = letterbox(frame_obj.frame, self.img_size, stride=self.stride)[0]
 
         # Generate predictions and create corresponding bounding boxes.
         img = self.convert_image(img, self.device, self.half)
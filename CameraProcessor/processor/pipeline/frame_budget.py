@@ -0,0 +1,127 @@
+"""Contains the frame budget class, which skips optional stages when a frame runs late.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+
+class FrameBudget:
+    """Latency budget of a frame, deciding which optional stages to skip to keep the latency of a frame bounded.
+
+    Every stage reports its cost by running inside measure, which keeps an exponential moving average per stage.
+    An optional stage only runs when its estimated cost fits in the time left for the current frame,
+    otherwise it is skipped. A skipped stage is not measured, so its estimate decays every time it is skipped
+    until it fits again, after which it is measured again. This way a stage that got cheaper is not skipped forever.
+
+    Attributes:
+        budget (float): Seconds a frame may take from the moment it is read, 0 never skips.
+        smoothing (float): Weight of a new measurement in the estimated cost of a stage.
+        costs (dict[str, float]): Estimated cost in seconds of every stage.
+        skipped (dict[str, int]): Amount of times every stage was skipped.
+
+        __frame_start (float): Time the current frame was read.
+        __lock (threading.Lock): Guards the costs when stages run on multiple threads.
+    """
+
+    def __init__(self, budget, smoothing=0.2):
+        """Inits the frame budget.
+
+        Args:
+            budget (float): Seconds a frame may take from the moment it is read, 0 never skips.
+            smoothing (float): Weight of a new measurement in the estimated cost of a stage.
+        """
+        self.budget = budget
+        self.smoothing = smoothing
+        self.costs = {}
+        self.skipped = {}
+
+        self.__frame_start = time.perf_counter()
+        self.__lock = threading.Lock()
+
+    def start_frame(self):
+        """Starts the budget of a new frame, should be called as soon as the frame is read."""
+        self.__frame_start = time.perf_counter()
+
+    def remaining(self):
+        """Gets the time left for the current frame.
+
+        Returns:
+            float: Seconds left, negative when the frame is late.
+        """
+        return self.budget - (time.perf_counter() - self.__frame_start)
+
+    def record(self, stage, seconds):
+        """Reports the cost of a stage.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Time the stage took.
+        """
+        with self.__lock:
+            cost = self.costs.get(stage)
+            self.costs[stage] = seconds if cost is None else cost + self.smoothing * (seconds - cost)
+
+    @contextmanager
+    def measure(self, stage):
+        """Context manager reporting the time spent in the body of the with statement as cost of a stage.
+
+        Args:
+            stage (str): Name of the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def allows(self, stage):
+        """Check whether an optional stage fits in the time left for the current frame, counting it as skipped if not.
+
+        Args:
+            stage (str): Name of the stage.
+
+        Returns:
+            bool: Whether the stage should run.
+        """
+        if self.budget <= 0:
+            return True
+
+        with self.__lock:
+            cost = self.costs.get(stage, 0.)
+            if self.remaining() >= cost:
+                return True
+
+            # Decay the estimate, so the stage is tried again once the frame would have been on time.
+            self.costs[stage] = cost * (1 - self.smoothing)
+            self.skipped[stage] = self.skipped.get(stage, 0) + 1
+            return False
+
+    def run(self, stage, function, arguments, default=None, optional=True):
+        """Runs a stage measuring its cost, skipping it when it is optional and does not fit.
+
+        Args:
+            stage (str): Name of the stage.
+            function (func): Function performing the stage.
+            arguments (tuple): Arguments to call the function with.
+            default (object): Output of the stage when it is skipped.
+            optional (bool): Whether the stage may be skipped.
+
+        Returns:
+            object: Output of the function, or the default when the stage was skipped.
+        """
+        if optional and not self.allows(stage):
+            return default
+
+        with self.measure(stage):
+            return function(*arguments)
+
+    def log(self):
+        """Logs the estimated cost and the amount of skips of every stage."""
+        for stage, cost in self.costs.items():
+            logging.info(f'stage {stage} costs {cost * 1000:.1f} ms, skipped {self.skipped.get(stage, 0)} times')
@@ -0,0 +1,191 @@
+"""Contains the MessageWorker class, which handles the commands of the orchestrator next to the frame loop.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import logging
+import threading
+from collections import deque
+
+from processor.websocket.start_message import StartMessage
+from processor.websocket.stop_message import StopMessage
+from processor.websocket.update_message import UpdateMessage
+
+
+class MessageWorker:
+    """Handles the start, stop and update commands received by the websocket client on a worker thread.
+
+    Extracting the features of the object to follow takes long, so the frame loop only hands the commands with their
+    cutout to the worker. The worker extracts the features of the cutouts of all pending start commands in a single
+    call, after which the frame loop applies the handled commands to the re-identification data between two frames,
+    in the order they were received.
+
+    Attributes:
+        ws_client (WebsocketClient): Websocket client receiving the commands.
+        re_identifier (IReIdentifier): Re-identifier extracting the features, None if left out of the plan.
+        max_batch (int): Maximum amount of cutouts of which the features are extracted at once.
+        commands_handled (int): Amount of commands applied to the re-identification data.
+        batches (int): Amount of calls extracting features.
+
+        __pending (deque): Commands with their cutout waiting for the worker.
+        __handled (deque): Commands with their feature map waiting to be applied.
+        __condition (threading.Condition): Signals pending commands or the closing of the worker.
+        __closed (bool): Whether the worker is closed.
+        __worker (threading.Thread): Thread extracting the features.
+    """
+    def __init__(self, ws_client, re_identifier, max_batch=8):
+        """Inits the worker and starts its thread.
+
+        Args:
+            ws_client (WebsocketClient): Websocket client receiving the commands.
+            re_identifier (IReIdentifier): Re-identifier extracting the features, None if left out of the plan.
+            max_batch (int): Maximum amount of cutouts of which the features are extracted at once.
+        """
+        self.ws_client = ws_client
+        self.re_identifier = re_identifier
+        self.max_batch = max(max_batch, 1)
+        self.commands_handled = 0
+        self.batches = 0
+
+        self.__pending = deque()
+        self.__handled = deque()
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__worker = threading.Thread(target=self.__handle_commands, name='message worker', daemon=True)
+        self.__worker.start()
+
+    def process(self, frame_buffer, re_id_data):
+        """Applies the handled commands and hands the newly received commands to the worker.
+
+        Should be called between two frames, while no other thread uses the re-identification data.
+
+        Args:
+            frame_buffer (FrameBuffer): Frame buffer containing previous frames and bounding boxes.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+        """
+        self.__apply_handled(re_id_data)
+
+        commands = []
+        while len(self.ws_client.message_queue) > 0:
+            command = self.ws_client.message_queue.popleft()
+            logging.info(f'Handling command: {command}')
+
+            if not isinstance(command, StartMessage):
+                commands.append((command, None))
+            # Start command, which can only be handled when re-identification is part of the plan.
+            elif self.re_identifier is None:
+                logging.warning(f'Cannot start tracking object {command.object_id}, '
+                                f're-identification is not in the plan')
+            else:
+                # The cutout is taken now, later frames may push the frame out of the buffer.
+                try:
+                    commands.append((command, command.get_cutout(frame_buffer)))
+                # If the image could not be found, an error is raised.
+                except (IndexError, ValueError) as error:
+                    logging.error(error)
+
+        if len(commands) > 0:
+            with self.__condition:
+                self.__pending.extend(commands)
+                self.__condition.notify()
+
+    @property
+    def has_commands(self):
+        """Checks whether process has anything to do, so the caller can skip taking a lock.
+
+        Returns:
+            bool: Whether commands were received or handled by the worker since the last call of process.
+        """
+        return len(self.ws_client.message_queue) > 0 or len(self.__handled) > 0
+
+    @property
+    def pending(self):
+        """Gets the amount of commands that are not yet applied.
+
+        Returns:
+            int: Commands waiting for the worker or to be applied.
+        """
+        with self.__condition:
+            return len(self.__pending) + len(self.__handled)
+
+    def close(self):
+        """Stops the worker after the pending commands, commands that were not applied yet are discarded."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+
+        self.__worker.join()
+        logging.info(f'Handled {self.commands_handled} commands, extracting features {self.batches} times')
+
+    def __apply_handled(self, re_id_data):
+        """Applies the commands handled by the worker to the re-identification data, in the order they were received.
+
+        Args:
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+        """
+        with self.__condition:
+            handled = list(self.__handled)
+            self.__handled.clear()
+
+        for command, feature_map in handled:
+            self.commands_handled += 1
+
+            # Start command, of which the features could not be extracted.
+            if isinstance(command, StartMessage) and feature_map is None:
+                continue
+            if isinstance(command, StartMessage):
+                # Sends the feature map to the orchestrator using a Websocket client.
+                self.ws_client.send_message(UpdateMessage(command.object_id, feature_map))
+
+                # Store the features of the object.
+                re_id_data.add_query_feature(command.object_id, feature_map)
+
+                # Also store the map of the first box_id to the object_id, if we have a box ID.
+                if command.box_id is not None:
+                    re_id_data.add_query_box(command.box_id, command.object_id)
+
+            # Stop command.
+            elif isinstance(command, StopMessage):
+                logging.info(f'Stop tracking object {command.object_id}')
+                re_id_data.remove_query(command.object_id)
+
+            # Update command.
+            elif isinstance(command, UpdateMessage):
+                logging.info(f'Updating object {command.object_id} with feature map {command.feature_map}')
+                re_id_data.add_query_feature(command.object_id, command.feature_map)
+
+    def __handle_commands(self):
+        """Extracts the features of the pending start commands in batches until the worker is closed."""
+        while True:
+            with self.__condition:
+                while len(self.__pending) == 0 and not self.__closed:
+                    self.__condition.wait()
+
+                if len(self.__pending) == 0:
+                    return
+
+                # Take the commands up to the batch size of cutouts, commands without cutout come along.
+                batch = []
+                nr_cutouts = 0
+                while len(self.__pending) > 0 and (self.__pending[0][1] is None or nr_cutouts < self.max_batch):
+                    command, cutout = self.__pending.popleft()
+                    batch.append((command, cutout))
+                    nr_cutouts += cutout is not None
+
+            cutouts = [cutout for _, cutout in batch if cutout is not None]
+            feature_maps = []
+            if len(cutouts) > 0:
+                try:
+                    feature_maps = self.re_identifier.extract_features_from_images(cutouts)
+                    self.batches += 1
+                # A failed extraction drops the start commands of the batch, the other commands are still applied.
+                except Exception as error:  # pylint: disable=broad-except
+                    logging.error(f'Could not extract the features of {len(cutouts)} start commands: {error}')
+                    feature_maps = [None] * len(cutouts)
+
+            feature_maps = iter(feature_maps)
+            with self.__condition:
+                self.__handled.extend((command, next(feature_maps) if cutout is not None else None)
+                                      for command, cutout in batch)
@@ -0,0 +1,121 @@
+"""Contains the pipeline stage class used to run a stage of the pipeline on its own worker thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import queue
+import threading
+
+# Marks the end of the stream, is passed on from stage to stage.
+END_OF_STREAM = object()
+
+
+class PipelineStage:
+    """Runs a function on every item of an input queue on a single worker thread and puts the result in an output queue.
+
+    A stage has exactly one worker, so the items leave the stage in the order in which they entered it.
+    Chaining stages with bounded queues results in a pipeline where every stage works on a different frame,
+    while the order of the frames is preserved.
+
+    Attributes:
+        name (str): Name of the stage, used for the thread name.
+        input_queue (queue.Queue): Queue the stage takes its items from.
+        output_queue (queue.Queue): Bounded queue the stage puts its results in.
+        error (Exception): Exception raised by the stage function, None if no exception occurred.
+        __function (Function): Function applied on every item.
+        __stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+        __thread (threading.Thread): Worker thread of the stage.
+    """
+    def __init__(self, name, function, input_queue, stop_event, queue_size=2):
+        """Inits the stage and creates its output queue.
+
+        Args:
+            name (str): Name of the stage, used for the thread name.
+            function (Function): Function applied on every item.
+            input_queue (queue.Queue): Queue the stage takes its items from.
+            stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+            queue_size (int): Maximum amount of results waiting in the output queue.
+        """
+        self.name = name
+        self.input_queue = input_queue
+        self.output_queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.__function = function
+        self.__stop_event = stop_event
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+
+    def start(self):
+        """Starts the worker thread of the stage."""
+        self.__thread.start()
+
+    def join(self, timeout=None):
+        """Waits until the worker thread of the stage has finished.
+
+        Args:
+            timeout (float): Maximum amount of seconds to wait.
+        """
+        self.__thread.join(timeout)
+
+    def __run(self):
+        """Takes items from the input queue, applies the function and passes the result on until the stream ends."""
+        while not self.__stop_event.is_set():
+            item = get_until_stopped(self.input_queue, self.__stop_event)
+
+            # Pass the end of the stream on to the next stage.
+            if item is END_OF_STREAM:
+                break
+
+            try:
+                result = self.__function(item)
+            # Any exception is stored and reraised by the consumer of the pipeline.
+            # pylint: disable=broad-except
+            except Exception as error:
+                self.error = error
+                break
+
+            put_until_stopped(self.output_queue, result, self.__stop_event)
+
+        put_until_stopped(self.output_queue, END_OF_STREAM, self.__stop_event)
+
+
+def get_until_stopped(input_queue, stop_event, poll_interval=0.1):
+    """Blocking get on a queue that gives up once the stop event is set.
+
+    Args:
+        input_queue (queue.Queue): Queue to get an item from.
+        stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+        poll_interval (float): Seconds between checks of the stop event.
+
+    Returns:
+        object: Item from the queue, END_OF_STREAM if the stop event was set.
+    """
+    while not stop_event.is_set():
+        try:
+            return input_queue.get(timeout=poll_interval)
+        except queue.Empty:
+            continue
+
+    return END_OF_STREAM
+
+
+def put_until_stopped(output_queue, item, stop_event, poll_interval=0.1):
+    """Blocking put on a bounded queue that gives up once the stop event is set.
+
+    Args:
+        output_queue (queue.Queue): Queue to put the item in.
+        item (object): Item to put in the queue.
+        stop_event (threading.Event): Event that is set when the pipeline needs to stop.
+        poll_interval (float): Seconds between checks of the stop event.
+
+    Returns:
+        bool: Whether the item was put in the queue.
+    """
+    while not stop_event.is_set():
+        try:
+            output_queue.put(item, timeout=poll_interval)
+            return True
+        except queue.Full:
+            continue
+
+    return False
@@ -5,18 +5,57 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 
+import os
+import re
 import logging
+import configparser
 
 from processor.input.cam_capture import CamCapture
 from processor.input.hls_capture import HlsCapture
+from processor.input.ffmpeg_capture import FfmpegCapture
+from processor.input.segment_capture import SegmentCapture
+from processor.input.variant_selector import VariantSelector
 from processor.input.image_capture import ImageCapture
 from processor.input.video_capture import VideoCapture
+from processor.input.read_ahead_capture import ReadAheadCapture
+from processor.input.backpressure_capture import BackpressureCapture
+from processor.input.demand_capture import DemandCapture
+from processor.input.recording_capture import RecordingCapture
+from processor.input.replay_capture import ReplayCapture
+
+from processor.pipeline.detection.keyframe_gate import KeyframeGate
+from processor.pipeline.detection.motion_gate import MotionGate
+from processor.pipeline.detection.roi_detector import RoiDetector, parse_regions
+from processor.pipeline.frame_budget import FrameBudget
+from processor.pipeline.checkpoint import Checkpoint
+from processor.pipeline.camera import Camera
+from processor.pipeline.detection.i_yolo_detector import IYoloDetector
+from processor.pipeline.detection.resolution_controller import ResolutionController
+from processor.pipeline.detection.adaptive_resolution_detector import AdaptiveResolutionDetector
+from processor.pipeline.recording.record_log import RecordLog
+from processor.pipeline.recording.record_log_writer import RecordLogWriter
+from processor.pipeline.recording.recording_detector import RecordingDetector
+from processor.pipeline.recording.recording_tracker import RecordingTracker
+from processor.pipeline.recording.recording_re_identifier import RecordingReIdentifier
+from processor.pipeline.recording.replay_detector import ReplayDetector
+from processor.pipeline.recording.replay_tracker import ReplayTracker
+from processor.pipeline.recording.replay_re_identifier import ReplayReIdentifier
+
+from processor.output.output_sinks import OutputSinks
+from processor.output.queued_sink import QueuedSink
+from processor.output.file_sink import FileSink
+from processor.output.data_writer_sink import DataWriterSink
+from processor.utils.datawriter import get_data_writer
 
 from processor.utils.create_runners import \
     create_detector, create_tracker, create_reidentifier, DETECTOR_SWITCH, TRACKER_SWITCH, REID_SWITCH
 
 import processor.scheduling.plan.pipeline_plan as pipeline_plan
 from processor.scheduling.scheduler import Scheduler
+from processor.scheduling.concurrent_scheduler import ConcurrentScheduler, create_executor
+from processor.scheduling.compiled_scheduler import CompiledScheduler
+from processor.scheduling.async_scheduler import AsyncScheduler
+from processor.scheduling.component.budgeted_component import BudgetedComponent
 
 
 def prepare_objects(configs):
@@ -27,24 +66,79 @@ def prepare_objects(configs):
 
     Returns:
         ICapture, IDetector, ITracker, IReIdentifier, str: Capture instance, a detector and tracker and a websocket_id.
+            The tracker and re-identifier are None when their stage is left out of the configured plan.
     """
+    stages = pipeline_plan.parse_plan(configs['Main'].get('plan', 'full'))
+    replayed_stages = prepare_replayed_stages(configs)
+
     # Instantiate the detector, tracker and re-identification.
-    detector = prepare_detector(configs)
-    tracker = prepare_tracker(configs)
-    re_identifier = prepare_reidentifier(configs)
+    # Stages left out of the plan are not created, so their models are never loaded.
+    # Replayed stages return the outputs of the recording that is replayed instead.
+    detector = replayed_stages.get('detection') or prepare_detector(configs)
+    tracker = (replayed_stages.get('tracking') or prepare_tracker(configs)) if 'tracking' in stages else None
+    re_identifier = (replayed_stages.get('re-identification') or prepare_reidentifier(configs)) \
+        if 're-identification' in stages else None
 
     # Capture and websocket url.
     capture = prepare_capture(configs['Input'])
     websocket_url = configs['Orchestrator']['url']
 
+    # Record the frames and the outputs of the stages if a recording is configured.
+    capture, detector, tracker, re_identifier = prepare_recording(configs, capture, detector, tracker, re_identifier)
+
     return capture, detector, tracker, re_identifier, websocket_url
 
 
-def prepare_detector(configs):
+def prepare_cameras(configs, camera_urls):
+    """Read the configuration information and prepare the objects for a processor serving multiple cameras.
+
+    The detector and re-identifier are shared by all cameras, every camera gets its own capture and tracker.
+    A section of a camera, for example [Input camera_1], overrides the general section for that camera.
+
+    Args:
+        configs (configparser.Configparser): Configuration of the application when preparing the streams.
+        camera_urls ([(str, str)]): Id and HLS url of every camera.
+
+    Returns:
+        IDetector, IReIdentifier, [Camera]: Shared detector and re-identifier, and the state of every camera.
+            The re-identifier and the trackers are None when their stage is left out of the configured plan.
+    """
+    stages = pipeline_plan.parse_plan(configs['Main'].get('plan', 'full'))
+
+    detector = prepare_detector(configs, per_camera=False)
+    re_identifier = prepare_reidentifier(configs) if 're-identification' in stages else None
+
+    cameras = [prepare_camera(configs, camera_id, hls_url, stages) for camera_id, hls_url in camera_urls]
+
+    return detector, re_identifier, cameras
+
+
+def prepare_camera(configs, camera_id, hls_url, stages):
+    """Prepares the capture and tracker of a single camera, using the sections of the camera in the configurations.
+
+    Args:
+        configs (configparser.Configparser): Configuration of the application.
+        camera_id (str): Id of the camera.
+        hls_url (str): Url of the HLS stream of the camera.
+        stages ([str]): Stages of the plan, the tracker is None if tracking is left out.
+
+    Returns:
+        Camera: State of the camera without a websocket connection.
+    """
+    input_config = prepare_camera_config(configs, 'Input', camera_id)
+    input_config['hls_url'] = hls_url
+
+    tracker = prepare_tracker(configs) if 'tracking' in stages else None
+    return Camera(camera_id, prepare_capture(input_config), tracker, checkpoint=prepare_checkpoint(configs, camera_id))
+
+
+def prepare_detector(configs, per_camera=True):
     """Creates a detection instance specified inside the configs.
 
     Args:
         configs (configparser.ConfigParser): Configurations containing information about the detection.
+        per_camera (bool): Whether to apply the adaptive resolution and regions of interest of the camera,
+            which a detector shared by multiple cameras cannot.
 
     Returns:
         IDetector: Implementation of the detection interface.
@@ -58,9 +152,48 @@ def prepare_detector(configs):
         raise NameError(f'Incorrect detector. Detector {configs["Main"].get("detector")} not found.')
 
     # Detector exists, so it is created.
-    return create_detector(configs['Main'].get('detector'),
-                           configs
-                           )
+    detector = create_detector(configs['Main'].get('detector'),
+                               configs
+                               )
+
+    return prepare_camera_detector(configs, detector) if per_camera else detector
+
+
+def prepare_camera_detector(configs, detector, camera_id=None):
+    """Applies the adaptive resolution and regions of interest of the camera to a created detector.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the resolution and region configurations.
+        detector (IDetector): The created detector.
+        camera_id (str): Id of the camera, None uses the camera id of the [Input] section.
+
+    Returns:
+        IDetector: The detector itself, or wrapped when the camera adapts its resolution or has regions of interest.
+    """
+    # Let the inference size follow the load if adaptive resolution is enabled.
+    resolution_config = prepare_camera_config(configs, 'Resolution', camera_id)
+    if resolution_config is not None and resolution_config.getboolean('enabled', False) \
+            and isinstance(detector, IYoloDetector):
+        controller = ResolutionController(
+            [int(size) for size in resolution_config.get('sizes').split(',')],
+            detector.img_size,
+            high_latency=resolution_config.getfloat('high_latency'),
+            low_latency=resolution_config.getfloat('low_latency'),
+            max_queue_depth=resolution_config.getint('max_queue_depth', 0),
+            patience=resolution_config.getint('patience', 10),
+            smoothing=resolution_config.getfloat('smoothing', 0.2)
+        )
+        logging.info(f'Adapting inference size between {controller.sizes}')
+        detector = AdaptiveResolutionDetector(detector, controller)
+
+    # Only detect inside the regions of interest of the camera if there are any.
+    roi_config = prepare_camera_config(configs, 'ROI', camera_id)
+    polygons = parse_regions(roi_config.get('regions', '') or '') if roi_config is not None else []
+    if len(polygons) > 0:
+        logging.info(f'Detecting inside {len(polygons)} regions of interest')
+        return RoiDetector(detector, polygons)
+
+    return detector
 
 
 def prepare_tracker(configs):
@@ -122,30 +255,339 @@ def prepare_capture(input_config):
 
     # Switch statement creating the capture.
     if capture_type == 'webcam':
-        return CamCapture(int(input_config['webcam_device_nr']))
-    if capture_type == 'images':
-        return ImageCapture(input_config['images_dir_path'])
-    if capture_type == 'video':
-        return VideoCapture(input_config['video_file_path'])
-    if capture_type == 'hls':
-        return HlsCapture(input_config['hls_url'])
-
+        capture = CamCapture(int(input_config['webcam_device_nr']))
+    elif capture_type == 'images':
+        capture = ImageCapture(input_config['images_dir_path'])
+    elif capture_type == 'video':
+        capture = prepare_video_capture(input_config)
+    elif capture_type == 'hls' and input_config.get('hls_backend', 'opencv').lower() == 'ffmpeg':
+        # The ffmpeg backend starts on the variant closest to the target width, without switching.
+        hls_url = input_config['hls_url']
+        target_width = input_config.getint('hls_target_width', 0)
+        selector = VariantSelector.load(hls_url, target_width) if target_width > 0 else None
+        if selector is not None:
+            hls_url = selector.url
+        capture = FfmpegCapture(hls_url, input_config.getint('ffmpeg_buffers', 160))
+    elif capture_type == 'hls' and input_config.get('hls_backend', 'opencv').lower() == 'segments':
+        capture = SegmentCapture(input_config['hls_url'], target_width=input_config.getint('hls_target_width', 0))
+    elif capture_type == 'hls':
+        # The reading thread of the capture applies the rate policy, decoding only the frames at the target rate.
+        rate_policy = input_config.get('drop_policy', 'none').lower() == 'rate'
+        target_fps = input_config.getfloat('target_fps', 0) if rate_policy else 0
+        capture = HlsCapture(input_config['hls_url'], target_width=input_config.getint('hls_target_width', 0),
+                             target_fps=target_fps)
+    elif capture_type == 'replay':
+        capture = ReplayCapture(RecordLog(input_config['replay_path']))
     # No cv2.VideoCapture returned.
-    raise NameError(f'Input type "{capture_type}" is unknown')
+    else:
+        raise NameError(f'Input type "{capture_type}" is unknown')
+
+    return prepare_backpressure(capture, input_config)
+
+
+def prepare_video_capture(input_config):
+    """Opens the video at its start position, decoding it ahead on a separate thread if configured.
+
+    Frames decoded ahead are stamped with their position in the video, as the time they were decoded is not the time
+    they are processed.
+
+    Args:
+        input_config (SectionProxy): Configurations of the capture.
+
+    Returns:
+        ICapture: The VideoCapture, or a ReadAheadCapture wrapping it.
+    """
+    read_ahead = input_config.getint('video_read_ahead', 0)
+    capture = VideoCapture(input_config['video_file_path'], video_timestamps=read_ahead > 0)
+
+    video_start = input_config.getfloat('video_start', 0)
+    if video_start > 0:
+        capture.seek(video_start)
+
+    if read_ahead > 0:
+        capture = ReadAheadCapture(capture, read_ahead)
+
+    return capture
+
+
+def prepare_backpressure(capture, input_config):
+    """Wraps the capture in a BackpressureCapture if a drop policy is configured.
+
+    Args:
+        capture (ICapture): Capture implementation to wrap.
+        input_config (SectionProxy): Configurations of the capture.
+
+    Returns:
+        ICapture: The capture itself if no frames are dropped, otherwise the wrapped capture.
+    """
+    policy = input_config.get('drop_policy', 'none').lower()
+
+    # An HLS capture applies the rate policy itself.
+    if policy == 'none' or (policy == 'rate' and isinstance(capture, HlsCapture)):
+        return capture
+
+    # Videos are read faster than real-time, so their own frame rate gives the position of a frame.
+    fps = input_config.getfloat('drop_fps', 0)
+    video = capture.capture if isinstance(capture, ReadAheadCapture) else capture
+    if fps == 0 and isinstance(video, VideoCapture):
+        fps = video.fps
+
+    logging.info(f'Dropping frames using the {policy} policy')
+    return BackpressureCapture(capture, policy,
+                               drop_interval=input_config.getint('drop_interval', 0),
+                               max_latency=input_config.getfloat('max_latency', 0.5),
+                               fps=fps,
+                               target_fps=input_config.getfloat('target_fps', 0))
+
+
+def prepare_replayed_stages(configs):
+    """Creates the replay stages returning the outputs of the replayed recording instead of running the stage.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the input and replay configurations.
+
+    Returns:
+        dict[str, IComponent]: Replay stage of every replayed stage, empty if no recording is replayed.
+
+    Raises:
+        NameError: A replayed stage is unknown.
+    """
+    if configs['Input']['type'].lower() != 'replay' or not configs.has_section('Replay'):
+        return {}
+
+    replayed_stages = [stage.strip() for stage in configs['Replay'].get('stages', '').split(',') if stage.strip()]
+    replay_stage_types = {'detection': ReplayDetector, 'tracking': ReplayTracker,
+                          're-identification': ReplayReIdentifier}
+
+    for stage in replayed_stages:
+        if stage not in replay_stage_types:
+            raise NameError(f'Replayed stage "{stage}" is unknown, stages: {list(replay_stage_types)}')
+
+    if len(replayed_stages) == 0:
+        return {}
+
+    logging.info(f'Replaying {", ".join(replayed_stages)} from {configs["Input"]["replay_path"]}')
+    record_log = RecordLog(configs['Input']['replay_path'])
+    return {stage: replay_stage_types[stage](record_log) for stage in replayed_stages}
 
 
-def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer):
+def prepare_recording(configs, capture, detector, tracker, re_identifier):
+    """Wraps the capture and stages to record the frames and the outputs of the stages if a recording is configured.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the record configurations.
+        capture (ICapture): Capture implementation to record.
+        detector (IDetector): Detector to record.
+        tracker (ITracker): Tracker to record, None if left out of the plan.
+        re_identifier (IReIdentifier): Re-identifier to record, None if left out of the plan.
+
+    Returns:
+        ICapture, IDetector, ITracker, IReIdentifier: The capture and stages themselves if nothing is recorded,
+            otherwise wrapped, writing to the same record log.
+    """
+    if not configs.has_section('Record') or configs['Record'].get('path', '') == '':
+        return capture, detector, tracker, re_identifier
+
+    record_config = configs['Record']
+    writer = RecordLogWriter(record_config['path'],
+                             record_config.get('frames', 'encoded').lower(),
+                             configs['Input'].get('video_file_path', ''))
+
+    return RecordingCapture(capture, writer, record_config.get('frame_format', '.jpg')), \
+        RecordingDetector(detector, writer), \
+        RecordingTracker(tracker, writer) if tracker is not None else None, \
+        RecordingReIdentifier(re_identifier, writer) if re_identifier is not None else None
+
+
+def prepare_demand(capture, ws_client, input_config):
+    """Wraps the capture in a DemandCapture following the demand the orchestrator sends to the websocket client.
+
+    Args:
+        capture (ICapture): Capture implementation to wrap.
+        ws_client (WebsocketClient): Websocket client receiving the demand of the camera.
+        input_config (SectionProxy): Configurations of the capture.
+
+    Returns:
+        DemandCapture: The wrapped capture, returning every frame until the orchestrator reports no demand.
+    """
+    return DemandCapture(capture, lambda: ws_client.demand, input_config.getfloat('idle_fps', 1))
+
+
+def prepare_camera_config(configs, section, camera_id=None):
+    """Gets the configurations of a section for the camera that is processed.
+
+    A section named after the section and the camera id, for example [Motion camera_1],
+    overrides the values of the general section for that camera only.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations of the application.
+        section (str): Name of the general section.
+        camera_id (str): Id of the camera, None uses the camera id of the [Input] section.
+
+    Returns:
+        SectionProxy: The section with the values of the camera applied, None if neither section exists.
+    """
+    if camera_id is None:
+        camera_id = configs['Input'].get('camera_id', '')
+    camera_section = f'{section} {camera_id}'
+
+    if not configs.has_section(camera_section):
+        return configs[section] if configs.has_section(section) else None
+
+    merged_configs = configparser.ConfigParser()
+    merged_configs.read_dict({section: {**(configs[section] if configs.has_section(section) else {}),
+                                        **configs[camera_section]}})
+    return merged_configs[section]
+
+
+def prepare_detection_gate(configs, camera_id=None):
+    """Creates the detection gate deciding on which frames the detector runs.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the keyframe and motion configurations.
+        camera_id (str): Id of the camera, None uses the camera id of the [Input] section.
+
+    Returns:
+        IDetectionGate: The motion or keyframe gate, None if the detector runs on every frame.
+    """
+    gate = None
+
+    keyframe_config = prepare_camera_config(configs, 'Keyframes', camera_id)
+    if keyframe_config is not None:
+        interval = keyframe_config.getint('interval', 1)
+        adaptive = keyframe_config.getboolean('adaptive', False)
+
+        # Detecting on every frame does not need a gate.
+        if interval > 1 or adaptive:
+            logging.info(f'Detecting on keyframes, every {interval} frames{" (adaptive)" if adaptive else ""}')
+            gate = KeyframeGate(interval, adaptive,
+                                min_interval=keyframe_config.getint('min_interval', 1),
+                                max_interval=keyframe_config.getint('max_interval', 10),
+                                motion_threshold=keyframe_config.getfloat('motion_threshold', 0.1),
+                                uncertainty_threshold=keyframe_config.getfloat('uncertainty_threshold', 0.5))
+
+    motion_config = prepare_camera_config(configs, 'Motion', camera_id)
+    if motion_config is not None and motion_config.getboolean('enabled', False):
+        logging.info('Skipping detection on frames without motion')
+        gate = MotionGate(width=motion_config.getint('width', 64),
+                          pixel_threshold=motion_config.getint('pixel_threshold', 25),
+                          motion_threshold=motion_config.getfloat('motion_threshold', 0.01),
+                          background_rate=motion_config.getfloat('background_rate', 0),
+                          reuse=motion_config.get('reuse', 'detections').lower(),
+                          max_skipped_frames=motion_config.getint('max_skipped_frames', 0),
+                          gate=gate)
+
+    return gate
+
+
+def prepare_frame_budget(configs):
+    """Creates the latency budget of a frame if one is configured.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the budget configurations.
+
+    Returns:
+        FrameBudget: The frame budget, None if frames have no budget.
+    """
+    budget = configs['Main'].getfloat('frame_budget', 0)
+
+    if budget <= 0:
+        return None
+
+    logging.info(f'Skipping optional stages of frames taking longer than {budget * 1000:.0f} ms')
+    return FrameBudget(budget, configs['Main'].getfloat('cost_smoothing', 0.2))
+
+
+def prepare_checkpoint(configs, camera_id=None):
+    """Creates the checkpoint of the tracker and re-identification state of the camera if one is configured.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the checkpoint configurations.
+        camera_id (str): Id of the camera, None uses the camera id of the [Input] section.
+
+    Returns:
+        Checkpoint: The checkpoint of the camera, None if no checkpoints are taken.
+    """
+    if not configs.has_section('Checkpoint') or configs['Checkpoint'].get('directory', '') == '':
+        return None
+
+    checkpoint_config = configs['Checkpoint']
+    os.makedirs(checkpoint_config['directory'], exist_ok=True)
+
+    # Every camera has its own checkpoint, so a restarted camera only restores its own state.
+    if camera_id is None:
+        camera_id = configs['Input'].get('camera_id', 'camera')
+    file_name = re.sub(r'[^\w.-]', '_', camera_id)
+    path = os.path.join(checkpoint_config['directory'], f'{file_name}.checkpoint')
+
+    logging.info(f'Checkpointing the tracker and re-identification state to {path}')
+    return Checkpoint(path,
+                      interval=checkpoint_config.getfloat('interval', 1),
+                      max_age=checkpoint_config.getfloat('max_age', 30))
+
+
+def prepare_output(configs, sinks, camera_id=None):
+    """Creates the sinks the outputs of processed frames are written to, each by its own worker.
+
+    Besides the given sinks, the files configured in the [Output] section are written.
+
+    Args:
+        configs (configparser.ConfigParser): Configurations containing the output configurations.
+        sinks (dict[str, ISink]): Sinks of the mode that is run by their name, for example the websocket.
+        camera_id (str): Id of the camera added to the configured paths, None if the processor serves one camera.
+
+    Returns:
+        OutputSinks: Callback of processed frames queuing their outputs for every sink.
+    """
+    output_config = configs['Output'] if configs.has_section('Output') else {}
+    sinks = dict(sinks)
+
+    # Every camera of a multi-camera processor writes its own files.
+    suffix = '' if camera_id is None else '_' + re.sub(r'[^\w.-]', '_', camera_id)
+
+    if output_config.get('file_path', '') != '':
+        sinks['file'] = FileSink(f'{output_config["file_path"]}{suffix}.jsonl')
+    for stage in ['detection', 'tracking']:
+        path = output_config.get(f'{stage}_path', '')
+        if path != '':
+            os.makedirs(os.path.dirname(os.path.realpath(path)), exist_ok=True)
+            sinks[stage] = DataWriterSink(get_data_writer(configs, stage, f'{path}{suffix}'), stage)
+
+    # Every sink has its own queue, a key prefixed with the name of a sink overrides the value for that sink.
+    queued_sinks = []
+    for name, sink in sinks.items():
+        queue_size = int(output_config.get(f'{name}_queue_size', output_config.get('queue_size', 8)))
+        max_batch = int(output_config.get(f'{name}_max_batch', output_config.get('max_batch', 4)))
+        drop_policy = output_config.get(f'{name}_drop_policy', output_config.get('drop_policy', 'oldest')).lower()
+
+        logging.info(f'Writing the outputs to the {name} sink, queuing {queue_size} frames ({drop_policy} policy)')
+        queued_sinks.append(QueuedSink(name, sink, queue_size, max_batch, drop_policy))
+
+    return OutputSinks(queued_sinks)
+
+
+def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer, scheduler_config=None,
+                      frame_budget=None):
     """Prepare the Scheduler with a valid plan configuration.
 
     Args:
         detector (IDetector): detector performing the detections on a given frame.
-        tracker (ITracker): tracker performing simple tracking of all objects using the detections.
-        re_identifier (IReIdentifier): re-identifier performing the re-identification stage.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections,
+            None leaves tracking and re-identification out of the plan.
+        re_identifier (IReIdentifier): re-identifier performing the re-identification stage,
+            None leaves re-identification out of the plan.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         frame_buffer (FrameBuffer): buffer of frames and stage information associated with the frame.
+        scheduler_config (SectionProxy): Configurations of the scheduler, the sequential scheduler is used if None.
+        frame_budget (FrameBudget): Budget the stages report their cost to, re-identification and buffering
+            are skipped when a frame runs late. None runs all stages.
 
     Returns:
-        Scheduler: Scheduler that has been configured with a plan.
+        Scheduler, ConcurrentScheduler, CompiledScheduler, AsyncScheduler: Scheduler configured with a plan.
+
+    Raises:
+        NameError: The scheduler type is unknown.
+        ValueError: The concurrent scheduler is configured with a process pool.
     """
     # Get args dict from the used plan.
     plan_args = pipeline_plan.plan_inputs
@@ -157,8 +599,41 @@ def prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, fram
     plan_args['func'] = on_processed_frame
     plan_args['frame_buffer'] = frame_buffer
 
+    # Leave the stages that were not created out of the plan.
+    stages = ['detection']
+    if tracker is not None:
+        stages.append('tracking')
+        if re_identifier is not None:
+            stages.append('re-identification')
+
+    # Let the stages report their costs, skip the optional ones when a frame runs late.
+    if frame_budget is not None:
+        plan_args['detector'] = BudgetedComponent('detection', detector, frame_budget)
+        plan_args['tracker'] = BudgetedComponent('tracking', tracker, frame_budget)
+        plan_args['re_identifier'] = BudgetedComponent('re-identification', re_identifier, frame_budget,
+                                                       optional=True, default_argument=1)
+        plan_args['frame_buffer'] = BudgetedComponent('frame buffer', frame_buffer, frame_budget, optional=True)
+
     # Apply configuration to plan.
-    start_node = pipeline_plan.create_plan(plan_args)
+    start_node = pipeline_plan.create_plan(plan_args, stages)
+
+    scheduler_type = 'sequential' if scheduler_config is None else scheduler_config.get('type', 'sequential').lower()
 
     # Return Scheduler.
-    return Scheduler(start_node)
+    if scheduler_type == 'sequential':
+        return Scheduler(start_node)
+    if scheduler_type == 'compiled':
+        return CompiledScheduler(start_node)
+    if scheduler_type == 'concurrent':
+        # The tracker, re-identification data and frame buffer change every frame, a process pool would lose that.
+        executor_type = scheduler_config.get('executor', 'thread').lower()
+        if executor_type == 'process':
+            raise ValueError('The pipeline plan has stateful components, '
+                             'the concurrent scheduler needs a thread pool (Scheduler.executor = thread)')
+        workers = scheduler_config.getint('workers', 0) or None
+        return ConcurrentScheduler(start_node, create_executor(executor_type, workers))
+    if scheduler_type == 'async':
+        workers = scheduler_config.getint('workers', 0) or None
+        return AsyncScheduler(start_node, create_executor('thread', workers) if workers else None)
+
+    raise NameError(f'Scheduler type "{scheduler_type}" is unknown')
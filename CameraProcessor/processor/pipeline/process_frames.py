@@ -7,74 +7,108 @@ Utrecht University within the Software Project course.
 
 import logging
 import asyncio
+import inspect
+import threading
+import time
 
-from processor.pipeline.frame_buffer import FrameBuffer
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.input.i_capture import FRAME_WAIT_TIMEOUT
 
-from processor.pipeline.reidentification.reid_data import ReidData
+from processor.pipeline.capture_reader import CaptureReader
+from processor.pipeline.frame_budget import FrameBudget
+from processor.pipeline.pipeline_stage import PipelineStage, END_OF_STREAM, get_until_stopped
+from processor.pipeline.stream_options import StreamOptions
+from processor.pipeline.stream_state import StreamState
 
-from processor.websocket.start_message import StartMessage
-from processor.websocket.stop_message import StopMessage
-from processor.websocket.update_message import UpdateMessage
+from processor.pipeline.reidentification.reid_data import ReidData
 
 from processor.pipeline.prepare_pipeline import prepare_scheduler
 from processor.scheduling.plan.pipeline_plan import plan_globals
+from processor.scheduling.async_scheduler import run_function
 
 
-async def process_stream(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None):
+async def process_stream(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None, options=None):
     """Processes a stream of frames, outputs to frame or sends to client.
 
     Outputs to frame using OpenCV if not client is used.
     Sends detections to client if client is used (HlsCapture).
+    A detection gate decides on which frames the detector runs, on the other frames the tracker predicts.
+    Every stage reports its cost to the frame budget,
+    which skips re-identification and buffering of frames running late.
+    A stage left out of the plan (None) passes on the boxes of the previous stage.
 
     Args:
         capture (ICapture): capture object to process a stream of frames.
         detector (IDetector): detector performing the detections on a given frame.
-        tracker (ITracker): tracker performing simple tracking of all objects using the detections.
-        re_identifier (IReIdentifier): re-identifier extracting features and comparing them.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections, None if left out.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them, None if left out.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
-    """
-    # Frame buffer that stores 150 frames (flushes older frames if new frames are added over the limit.
-    frame_buffer = FrameBuffer(150)
-
-    frame_nr = 0
-
-    # Contains re-identification data.
-    re_id_data = ReidData()
-
-    while capture.opened():
-        ret, frame_obj = capture.get_next_frame()
+        options (StreamOptions): Detection gate, frame budget and checkpoint of the run, None uses none of them.
 
-        if not ret:
-            continue
-
-        # Get detections from running detection stage.
-        detected_boxes = detector.detect(frame_obj)
-
-        # Get objects tracked in the current frame from tracking stage.
-        tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
-
-        # Get objects where re-id is performed on the tracked objects.
-        re_id_tracked_boxes = re_identifier.re_identify(frame_obj, tracked_boxes, re_id_data)
-
-        # Buffer the tracked object.
-        frame_buffer.add_frame(frame_obj, re_id_tracked_boxes)
+    Raises:
+        ValueError: A detection gate is given while the tracking stage is left out.
+    """
+    options = options or StreamOptions()
+    detection_gate = options.detection_gate
+    if detection_gate is not None and tracker is None:
+        raise ValueError('Skipping detections needs the tracking stage in the plan')
+
+    # Without a budget the costs of the stages are still measured, but no stage is skipped.
+    frame_budget = options.frame_budget or FrameBudget(0)
+
+    state = StreamState(tracker, ws_client, options.checkpoint)
+    state.start(re_identifier)
+
+    # The event loop is free while no frame is ready, so the websocket client keeps receiving messages.
+    async for frame_obj in capture:
+        frame_budget.start_frame()
+
+        if detection_gate is None:
+            # Get detections from running detection stage.
+            detected_boxes = frame_budget.run('detection', detector.detect, (frame_obj,), optional=False)
+
+            # Get objects tracked in the current frame from tracking stage, the detections without it.
+            tracked_boxes = detected_boxes if tracker is None else frame_budget.run(
+                'tracking', tracker.track, (frame_obj, detected_boxes, state.re_id_data), optional=False
+            )
+        else:
+            # Get detections and tracked objects, the gate decides whether the detector runs.
+            detected_boxes, tracked_boxes = frame_budget.run(
+                'detection', detection_gate.process, (frame_obj, detector, tracker, state.re_id_data), optional=False
+            )
+
+        if re_identifier is None:
+            # The buffer is only used to re-identify, so without the stage nothing is buffered.
+            re_id_tracked_boxes = tracked_boxes
+        else:
+            # Get objects where re-id is performed on the tracked objects, keep the tracked objects when running late.
+            re_id_tracked_boxes = frame_budget.run('re-identification', re_identifier.re_identify,
+                                                   (frame_obj, tracked_boxes, state.re_id_data), default=tracked_boxes)
+
+            # Buffer the tracked object, unless running late.
+            frame_budget.run('frame buffer', state.frame_buffer.add_frame, (frame_obj, re_id_tracked_boxes))
 
         # Handle side effects of frame processing.
         on_processed_frame(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
 
-        # Process the message queue if there is a websocket connection.
-        if ws_client is not None:
-            process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
-
-        frame_nr += 1
+        # Apply the commands of the orchestrator and snapshot the state.
+        state.finish_frame()
 
         await asyncio.sleep(0)
 
-    logging.info(f'capture object stopped after {frame_nr} frames')
+    state.stop()
 
+    if detection_gate is not None:
+        logging.info(f'detector ran on {detection_gate.frames_detected} frames, '
+                     f'skipped {detection_gate.frames_skipped} frames')
+    frame_budget.log()
 
-async def process_stream_scheduler(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None):
+    logging.info(f'capture object stopped after {state.frame_nr} frames')
+
+
+async def process_stream_scheduler(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                                   options=None):
     """Processes a stream of frames using the scheduler, outputs to frame or sends to client.
 
     Outputs to frame using OpenCV if not client is used.
@@ -87,87 +121,494 @@ async def process_stream_scheduler(capture, detector, tracker, re_identifier, on
     Args:
         capture (ICapture): capture object to process a stream of frames.
         detector (IDetector): detector performing the detections on a given frame.
-        tracker (ITracker): tracker performing simple tracking of all objects using the detections.
-        re_identifier (IReIdentifier): re-identifier extracting features and comparing them.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections, None if left out.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them, None if left out.
         on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
         ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        options (StreamOptions): Scheduler configurations, frame budget and checkpoint of the run,
+            None uses the sequential scheduler without budget and checkpoint.
     """
-    # Frame buffer that stores 150 frames (flushes older frames if new frames are added over the limit.
-    frame_buffer = FrameBuffer(150)
-
-    # Create Scheduler by passing all information to construct the schedule nodes and its components.
-    scheduler = prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, frame_buffer)
+    options = options or StreamOptions()
+    frame_budget = options.frame_budget
 
-    frame_nr = 0
+    state = StreamState(tracker, ws_client, options.checkpoint)
 
-    # Contains re-identification data.
-    re_id_data = ReidData()
+    # Create Scheduler by passing all information to construct the schedule nodes and its components.
+    scheduler = prepare_scheduler(detector, tracker, re_identifier, on_processed_frame, state.frame_buffer,
+                                  options.scheduler_config, frame_budget)
 
-    while capture.opened():
-        ret, frame_obj = capture.get_next_frame()
+    state.start(re_identifier)
 
-        if not ret:
-            continue
+    # The event loop is free while no frame is ready, so the websocket client keeps receiving messages.
+    async for frame_obj in capture:
+        if frame_budget is not None:
+            frame_budget.start_frame()
 
         # Enforce keys of used plan globals.
         globals_readonly = plan_globals
         globals_readonly['frame_obj'] = frame_obj
-        globals_readonly['re_id_data'] = re_id_data
+        globals_readonly['re_id_data'] = state.re_id_data
 
-        # Execute scheduler plan on current frame.
-        scheduler.schedule_graph([], globals_readonly)
+        # Execute scheduler plan on current frame, the async scheduler is awaited.
+        if inspect.iscoroutinefunction(scheduler.schedule_graph):
+            await scheduler.schedule_graph([], globals_readonly)
+        else:
+            scheduler.schedule_graph([], globals_readonly)
 
-        # Process the message queue if there is a websocket connection.
-        if ws_client is not None:
-            process_message_queue(ws_client, frame_buffer, re_identifier, re_id_data)
-
-        frame_nr += 1
+        # Apply the commands of the orchestrator and snapshot the state.
+        state.finish_frame()
 
         await asyncio.sleep(0)
 
-    logging.info(f'capture object stopped after {frame_nr} frames')
+    # Release the workers of the scheduler.
+    scheduler.shutdown()
+
+    state.stop()
+
+    if frame_budget is not None:
+        frame_budget.log()
+
+    logging.info(f'capture object stopped after {state.frame_nr} frames')
+
+
+async def process_stream_pipelined(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                                   options=None):
+    """Processes a stream of frames with every stage running on its own worker thread.
 
+    Capturing, detection, tracking and re-identification each run in a separate thread, connected by bounded queues.
+    While frame N is tracked and re-identified, frame N + 1 can already be detected, so the throughput is limited by
+    the slowest stage instead of the sum of all stages. Every stage has a single worker, thus the tracker is updated
+    in frame order and the frames are handed to on_processed_frame in frame order. Tracking and re-identification
+    share the re-identification data and take the same lock, so the two of them run serially and only overlap with
+    capturing and detection.
 
-def process_message_queue(ws_client, framebuffer, re_identifier, re_id_data):
-    """Processes the message queue processing each start and stop command.
+    Buffering the frame, calling on_processed_frame and processing the message queue is done on the event loop,
+    since the websocket client is not thread safe.
 
     Args:
-        ws_client (WebsocketClient): Websocket client to get the message queue from
-        framebuffer (FrameBuffer): Frame buffer containing previous frames and bounding boxes
-        re_identifier (IReIdentifier): re-identifier extracting features and comparing them
-        re_id_data (ReidData): Object containing data necessary for re-identification
+        capture (ICapture): capture object to process a stream of frames.
+        detector (IDetector): detector performing the detections on a given frame.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections, None if left out.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them, None if left out.
+        on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
+        ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        options (StreamOptions): Queue size and checkpoint of the run, None uses the defaults.
+
+    Raises:
+        Exception: Any exception raised while reading the capture or inside one of the stages.
     """
-    # Empty queue if there are messages left that were not sent.
-    while len(ws_client.message_queue) > 0:
-        logging.info(ws_client.message_queue)
-        track_elem = ws_client.message_queue.popleft()
-        # Start command.
-        if isinstance(track_elem, StartMessage):
-            try:
-                feature_map = re_identifier.extract_features_from_image(track_elem.get_cutout(framebuffer))
-
-                # Sends the feature map to the orchestrator using a Websocket client.
-                ws_client.send_message(UpdateMessage(track_elem.object_id, feature_map))
-
-                # Extract the features from this bounding box and store them in the data.
-                re_id_data.add_query_feature(track_elem.object_id, feature_map)
-
-                # Also store the map of the first box_id to the object_id, if we have a box ID.
-                if track_elem.box_id is not None:
-                    re_id_data.add_query_box(track_elem.box_id, track_elem.object_id)
-
-            # If the image could not be found, an error is raised.
-            except IndexError as index_err:
-                logging.error(index_err)
-            except ValueError as value_err:
-                logging.error(value_err)
-
-        # Stop command.
-        elif isinstance(track_elem, StopMessage):
-            logging.info(f'Stop tracking object {track_elem.object_id}')
-            re_id_data.remove_query(track_elem.object_id)
-
-        # Update command.
-        elif isinstance(track_elem, UpdateMessage):
-            logging.info(f'Updating object {track_elem.object_id} with feature map {track_elem.feature_map}')
-            re_id_data.add_query_feature(track_elem.object_id, track_elem.feature_map)
+    options = options or StreamOptions()
+    state = StreamState(tracker, ws_client, options.checkpoint)
+    state.start(re_identifier)
+
+    # Chain the stages with bounded queues, the capture reader fills the first queue.
+    stop_event = threading.Event()
+    capture_reader = CaptureReader(capture, stop_event, options.queue_size)
+    detection_stage = PipelineStage('detection', lambda frame_obj: (frame_obj, detector.detect(frame_obj)),
+                                    capture_reader.output_queue, stop_event, options.queue_size)
+    tracking_stage = PipelineStage('tracking', lambda item: (*item, track_locked(state, *item)),
+                                   detection_stage.output_queue, stop_event, options.queue_size)
+    re_id_stage = PipelineStage('re-identification',
+                                lambda item: (*item, re_identify_locked(state, re_identifier, item[0], item[2])),
+                                tracking_stage.output_queue, stop_event, options.queue_size)
+    stages = [capture_reader, detection_stage, tracking_stage, re_id_stage]
+
+    # An adaptive detector also lowers its inference size when frames are waiting to be detected.
+    detector.set_queue_depth(capture_reader.output_queue.qsize)
+
+    for stage in stages:
+        stage.start()
+
+    loop = asyncio.get_event_loop()
+
+    try:
+        while True:
+            # Wait for the next processed frame without blocking the event loop.
+            item = await loop.run_in_executor(None, get_until_stopped, re_id_stage.output_queue, stop_event)
+
+            if item is END_OF_STREAM:
+                break
+
+            frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes = item
+
+            # Buffer the tracked object, the buffer is only used to re-identify.
+            if re_identifier is not None:
+                state.frame_buffer.add_frame(frame_obj, re_id_tracked_boxes)
+
+            # Handle side effects of frame processing.
+            on_processed_frame(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
+
+            # Apply the commands of the orchestrator and snapshot the state, the lock keeps the tracking stage waiting.
+            state.finish_frame()
+    finally:
+        # Stop all threads, also when the processing got cancelled.
+        stop_event.set()
+        for stage in stages:
+            stage.join()
+
+        state.stop()
+
+    # Reraise the first error that occurred inside the pipeline, reading the capture included.
+    for stage in stages:
+        if stage.error is not None:
+            raise stage.error
+
+    logging.info(f'capture object stopped after {state.frame_nr} frames')
+
+
+async def process_stream_async(capture, detector, tracker, re_identifier, on_processed_frame, ws_client=None,
+                               options=None):
+    """Processes a stream of frames without blocking the event loop.
+
+    Blocking stages (capturing, detection, tracking and re-identification) are offloaded to the executor,
+    stages that are coroutine functions are awaited, so the websocket client keeps reading, writing
+    and reconnecting while frames are processed. Up to max_frames_in_flight frames are processed at the same time:
+    detection of a frame overlaps with tracking and re-identification of the previous frame,
+    while tracking, re-identification and the outputs happen in frame order.
+
+    Args:
+        capture (ICapture): capture object to process a stream of frames.
+        detector (IDetector): detector performing the detections on a given frame.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections, None if left out.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them, None if left out.
+        on_processed_frame (Function): when the frame got processed. Call this function to handle effects.
+        ws_client (WebsocketClient): The websocket client so the message queue can be emptied.
+        options (StreamOptions): Maximum frames in flight, executor and checkpoint of the run, None uses the defaults.
+
+    Raises:
+        Exception: Any exception raised while processing a frame.
+    """
+    options = options or StreamOptions()
+    executor = options.executor
+
+    state = StreamState(tracker, ws_client, options.checkpoint)
+    state.start(re_identifier)
+
+    loop = asyncio.get_event_loop()
+    in_flight = asyncio.Semaphore(options.max_frames_in_flight)
+
+    async def process_frame(frame_obj, previous_detected, detected, previous_tracked, tracked):
+        """Processes a single frame, waiting on the previous frame before each ordered stage.
+
+        Args:
+            frame_obj (FrameObj): The frame to process.
+            previous_detected (asyncio.Future): Completed when the previous frame is detected.
+            detected (asyncio.Future): Completed when this frame is detected.
+            previous_tracked (asyncio.Future): Completed when the previous frame finished all ordered stages.
+            tracked (asyncio.Future): Completed when this frame finished all ordered stages.
+        """
+        try:
+            # Detect in frame order, the detector is not shared between threads.
+            await previous_detected
+            detected_boxes = await run_function(detector.detect, (frame_obj,), executor)
+            detected.set_result(None)
+
+            # Tracking, re-identification and the outputs need to follow frame order.
+            await previous_tracked
+            tracked_boxes = await run_function(track_locked, (state, frame_obj, detected_boxes), executor)
+            re_id_tracked_boxes = await run_function(re_identify_locked,
+                                                     (state, re_identifier, frame_obj, tracked_boxes), executor)
+
+            # Buffer the tracked object, the buffer is only used to re-identify.
+            if re_identifier is not None:
+                state.frame_buffer.add_frame(frame_obj, re_id_tracked_boxes)
+
+            # Handle side effects of frame processing.
+            on_processed_frame(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
+
+            # Apply the commands of the orchestrator and snapshot the state, the lock keeps the next frame waiting.
+            state.finish_frame()
+
+            tracked.set_result(None)
+        except asyncio.CancelledError:
+            for future in (detected, tracked):
+                future.cancel()
+            raise
+        except Exception as error:
+            # Let all later frames fail with the same error.
+            for future in (detected, tracked):
+                if not future.done():
+                    future.set_exception(error)
+            raise
+        finally:
+            in_flight.release()
+
+    # Futures completed when the previous frame finished detection and finished all ordered stages.
+    previous_detected, previous_tracked = completed_future(loop), completed_future(loop)
+    tasks = set()
+
+    try:
+        while await run_function(capture.opened, (), executor):
+            # Wait until a frame finished before reading the next one.
+            await in_flight.acquire()
+
+            ret, frame_obj = await run_function(capture.get_next_frame, (), executor)
+
+            # Wait for the next frame on the executor, so waiting does not keep a core busy.
+            if not ret:
+                in_flight.release()
+                await run_function(capture.wait_for_frame, (FRAME_WAIT_TIMEOUT,), executor)
+                continue
+
+            detected, tracked = loop.create_future(), loop.create_future()
+            tasks.add(loop.create_task(
+                process_frame(frame_obj, previous_detected, detected, previous_tracked, tracked)
+            ))
+            previous_detected, previous_tracked = detected, tracked
+
+            # Stop reading frames as soon as a frame failed.
+            for task in [task for task in tasks if task.done()]:
+                tasks.remove(task)
+                task.result()
+
+        # Wait until the last frames are processed.
+        await previous_tracked
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        state.stop()
+
+    logging.info(f'capture object stopped after {state.frame_nr} frames')
+
+
+def completed_future(loop):
+    """Creates a future that is already completed, used as the previous frame of the first frame.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop of the future.
+
+    Returns:
+        asyncio.Future: Future with result None.
+    """
+    future = loop.create_future()
+    future.set_result(None)
+    return future
+
+
+def track_locked(state, frame_obj, detected_boxes):
+    """Tracking stage of an execution running stages on multiple threads, gets the objects tracked in the frame.
+
+    The tracker reads the re-identification data, so tracking holds the same lock as re-identification
+    and the two never run at the same time.
+
+    Args:
+        state (StreamState): State of the stream, of which the lock is held while tracking.
+        frame_obj (FrameObj): The frame.
+        detected_boxes (BoundingBoxes): Objects detected in the frame.
+
+    Returns:
+        BoundingBoxes: The tracked objects, the detected objects if the tracker is left out.
+    """
+    if state.tracker is None:
+        return detected_boxes
+    with state.lock:
+        return state.tracker.track(frame_obj, detected_boxes, state.re_id_data)
+
+
+def re_identify_locked(state, re_identifier, frame_obj, tracked_boxes):
+    """Re-identification stage of an execution running stages on multiple threads.
+
+    Holds the same lock as tracking, since both use the re-identification data, so the two run serially.
+
+    Args:
+        state (StreamState): State of the stream, of which the lock is held while re-identifying.
+        re_identifier (IReIdentifier): re-identifier extracting features and comparing them, None if left out.
+        frame_obj (FrameObj): The frame.
+        tracked_boxes (BoundingBoxes): Objects tracked in the frame.
+
+    Returns:
+        BoundingBoxes: The objects where re-id is performed, the tracked objects if the re-identifier is left out.
+    """
+    if re_identifier is None:
+        return tracked_boxes
+    with state.lock:
+        return re_identifier.re_identify(frame_obj, tracked_boxes, state.re_id_data)
+
+
+async def process_cameras(cameras, detector, re_identifier, on_processed_frame, executor=None):
+    """Processes the streams of multiple cameras, batching detection and re-identification across the cameras.
+
+    Every iteration the next frame of every camera is read, the frames are detected in a single batch,
+    every camera tracks its own objects and the features of the cutouts of all cameras are extracted in a single batch.
+    Cameras without a new frame are left out of the iteration, cameras of which the capture closed are dropped.
+
+    Args:
+        cameras ([Camera]): cameras to process, each with its own capture, tracker and re-identification data.
+        detector (IDetector): detector shared by all cameras.
+        re_identifier (IReIdentifier): re-identifier shared by all cameras, None if left out.
+        on_processed_frame (Function): when a frame got processed, called with the camera and the boxes of each stage.
+        executor (concurrent.futures.Executor): executor for blocking stages, None uses the default of the loop.
+    """
+    def track(batch, batch_detected_boxes):
+        """Tracking stage, every camera tracks the objects in its own frame.
+
+        Args:
+            batch ([(Camera, FrameObj)]): Every camera with a frame and its frame.
+            batch_detected_boxes ([BoundingBoxes]): Objects detected in every frame.
+
+        Returns:
+            [BoundingBoxes]: Objects tracked in every frame.
+        """
+        return [track_locked(camera, frame_obj, detected_boxes)
+                for (camera, frame_obj), detected_boxes in zip(batch, batch_detected_boxes)]
+
+    # Continue with the tracked objects and queries of every camera from before a restart, and handle its commands.
+    for camera in cameras:
+        camera.start(re_identifier)
+
+    open_cameras = list(cameras)
+
+    # Waits for a frame of every camera that is still waiting, by camera id.
+    frame_waits = {}
+
+    while len(open_cameras) > 0:
+        # Read the next frame of every camera at the same time, so a slow stream does not hold up the others.
+        frames = await asyncio.gather(*(run_function(camera.capture.get_next_frame, (), executor)
+                                        for camera in open_cameras))
+        batch = [(camera, frame_obj) for camera, (ret, frame_obj) in zip(open_cameras, frames) if ret]
+        open_cameras = [camera for camera in open_cameras if camera.capture.opened()]
+
+        # Wait until any camera may have a new frame, without keeping a core busy.
+        if len(batch) == 0:
+            frame_waits = await wait_for_any_frame(open_cameras, frame_waits, executor)
+            continue
+
+        frame_objs = [frame_obj for _, frame_obj in batch]
+
+        # Get detections of all frames from a single run of the detection stage.
+        batch_detected_boxes = await run_function(detector.detect_batch, (frame_objs,), executor)
+
+        # Get objects tracked in the frame of every camera.
+        batch_tracked_boxes = await run_function(track, (batch, batch_detected_boxes), executor)
+
+        # Get objects where re-id is performed, extracting the features of all cameras at once.
+        if re_identifier is None:
+            batch_re_id_boxes = batch_tracked_boxes
+        else:
+            batch_re_id_boxes = await run_function(
+                re_identifier.re_identify_batch,
+                (frame_objs, batch_tracked_boxes, [camera.re_id_data for camera, _ in batch]),
+                executor
+            )
+
+        for (camera, frame_obj), detected_boxes, tracked_boxes, re_id_tracked_boxes in \
+                zip(batch, batch_detected_boxes, batch_tracked_boxes, batch_re_id_boxes):
+            # The buffer is only used to re-identify, so without the stage nothing is buffered.
+            if re_identifier is not None:
+                camera.frame_buffer.add_frame(frame_obj, re_id_tracked_boxes)
+
+            # Handle side effects of frame processing.
+            on_processed_frame(camera, frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
+
+            # Apply the commands of the orchestrator to the camera and snapshot its state.
+            camera.finish_frame()
+
+    # The remaining waits end within the timeout, as their cameras are closed.
+    await asyncio.gather(*frame_waits.values())
+
+    for camera in cameras:
+        camera.stop()
+        logging.info(f'capture object of camera {camera.identifier} stopped after {camera.frame_nr} frames')
+
+
+async def wait_for_any_frame(cameras, frame_waits, executor=None):
+    """Waits until any of the cameras may have a new frame, without keeping a core busy.
+
+    A wait that did not finish is kept for the next call, so every camera has at most one wait running.
+
+    Args:
+        cameras ([Camera]): cameras of which the capture is open.
+        frame_waits (dict[str, asyncio.Future]): Waits for a frame that are still running, by camera id.
+        executor (concurrent.futures.Executor): executor the waits run on, None uses the default of the loop.
+
+    Returns:
+        dict[str, asyncio.Future]: Waits for a frame that are still running, by camera id.
+    """
+    for camera in cameras:
+        if camera.identifier not in frame_waits:
+            frame_waits[camera.identifier] = asyncio.ensure_future(
+                run_function(camera.capture.wait_for_frame, (FRAME_WAIT_TIMEOUT,), executor)
+            )
+
+    if len(frame_waits) == 0:
+        return frame_waits
+
+    await asyncio.wait(frame_waits.values(), return_when=asyncio.FIRST_COMPLETED)
+    return {identifier: wait for identifier, wait in frame_waits.items() if not wait.done()}
+
+
+def process_offline(capture, detector, tracker, det_writer, track_writer, batch_size=8, read_ahead=32,
+                    start_frame_nr=0):
+    """Processes a recorded video as fast as possible, writing the detections and tracks through data writers.
+
+    Aimed at throughput instead of latency: a separate thread decodes ahead into a bounded queue,
+    the detector runs on batches of frames and the tracker then runs on the frames of the batch in order.
+    Nothing is dropped, so every frame of the capture is written with its number in the video (starting at 1),
+    also when the capture started in the middle of the video.
+
+    Args:
+        capture (ICapture): capture object of the recording, should stamp frames with their position in the video.
+        detector (IDetector): detector performing the detections on a batch of frames.
+        tracker (ITracker): tracker performing simple tracking of all objects using the detections, None if left out.
+        det_writer (IDataWriter): data writer the detections are written to.
+        track_writer (IDataWriter): data writer the tracked objects are written to, unused without a tracker.
+        batch_size (int): Maximum amount of frames detected at once.
+        read_ahead (int): Maximum amount of decoded frames waiting to be detected.
+        start_frame_nr (int): Amount of frames of the video before the first frame of the capture.
+
+    Returns:
+        int: Amount of frames processed.
+
+    Raises:
+        Exception: Any exception raised while reading a frame of the capture.
+    """
+    stop_event = threading.Event()
+    reader = CaptureReader(capture, stop_event, max(read_ahead, batch_size), name='decode')
+    reader.start()
+
+    # The tracker keeps the state of the objects, so the frames have to be tracked one by one in order.
+    re_id_data = ReidData()
+    frame_nr = start_frame_nr
+    start_time = time.time()
+    end_of_stream = False
+
+    try:
+        while not end_of_stream:
+            # Wait for the first frame of the batch, then take the frames that are decoded up to the batch size.
+            batch = []
+            while len(batch) < batch_size:
+                frame_obj = reader.output_queue.get()
+                if frame_obj is END_OF_STREAM:
+                    end_of_stream = True
+                    break
+                batch.append(frame_obj)
+
+            if len(batch) == 0:
+                break
+
+            # Get detections of all frames from a single run of the detection stage.
+            batch_detected_boxes = detector.detect_batch(batch)
+
+            for frame_obj, detected_boxes in zip(batch, batch_detected_boxes):
+                frame_nr += 1
+                det_writer.write(BoundingBoxes(detected_boxes.bounding_boxes, frame_nr), frame_obj.shape)
+
+                if tracker is not None:
+                    tracked_boxes = tracker.track(frame_obj, detected_boxes, re_id_data)
+                    track_writer.write(BoundingBoxes(tracked_boxes.bounding_boxes, frame_nr), frame_obj.shape)
+    finally:
+        stop_event.set()
+        reader.join()
+
+    # A frame that could not be read fails the run, instead of writing the results of part of the video.
+    if reader.error is not None:
+        raise reader.error
+
+    frames_processed = frame_nr - start_frame_nr
+    elapsed = time.time() - start_time
+    logging.info(f'processed {frames_processed} frames in {elapsed:.1f} seconds '
+                 f'({frames_processed / elapsed if elapsed > 0 else 0:.1f} frames per second)')
+
+    return frames_processed
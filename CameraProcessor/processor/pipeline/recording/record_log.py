@@ -0,0 +1,156 @@
+"""Contains the RecordLog class, which reads the compact binary log of a recording.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import os
+import logging
+import struct
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+
+# Start of every log, followed by the version of the format.
+MAGIC = b'TTRL'
+VERSION = 1
+
+# Ways the frames are stored: encoded as an image, as index into the video file or not at all.
+FRAME_MODES = ['encoded', 'reference', 'none']
+
+# Record types, the stage records contain the output of that stage.
+FRAME_RECORD = 0
+STAGE_RECORDS = {'detection': 1, 'tracking': 2, 're-identification': 3}
+
+# Type, timestamp and payload length of a record.
+RECORD_HEADER = struct.Struct('<BdI')
+# Width, height and index into the video of a frame, followed by the encoded frame.
+FRAME_HEADER = struct.Struct('<IIq')
+# Amount of boxes of a stage record.
+BOXES_HEADER = struct.Struct('<I')
+# Identifier, object id flag, object id, rectangle and certainty of a box, followed by the length of its class.
+BOX = struct.Struct('<q?qdddddH')
+# Length of a string.
+STRING_HEADER = struct.Struct('<H')
+
+
+def unpack_boxes(payload):
+    """Unpacks the bounding boxes of a stage output.
+
+    Args:
+        payload (bytes): The packed boxes.
+
+    Returns:
+        BoundingBoxes: Output of the stage.
+    """
+    (count,) = BOXES_HEADER.unpack_from(payload)
+    offset = BOXES_HEADER.size
+    bounding_boxes = []
+
+    for _ in range(count):
+        identifier, has_object_id, object_id, x1, y1, x2, y2, certainty, length = BOX.unpack_from(payload, offset)
+        offset += BOX.size
+        classification = payload[offset:offset + length].decode('utf-8')
+        offset += length
+
+        bounding_boxes.append(BoundingBox(identifier, Rectangle(x1, y1, x2, y2), classification, certainty,
+                                          object_id if has_object_id else None))
+
+    return BoundingBoxes(bounding_boxes)
+
+
+class RecordLog:
+    """Reads a binary log written by a RecordLogWriter.
+
+    The outputs of the stages are loaded into memory, the frames are read from the log when they are requested.
+
+    Attributes:
+        path (str): Path of the log.
+        frames (str): Way the frames are stored, one of FRAME_MODES.
+        video_path (str): Path of the video the frame references point into.
+        frame_records ([(float, int, int, int, int, int)]): Timestamp, width, height, reference into the video,
+            offset and length of the encoded frame of every frame, in the order they were recorded.
+        stage_outputs (dict[str, dict[float, BoundingBoxes]]): Output of every stage, by timestamp of the frame.
+    """
+    def __init__(self, path):
+        """Reads the log.
+
+        Args:
+            path (str): Path of the log.
+
+        Raises:
+            ValueError: The file is not a log of a supported version.
+        """
+        self.path = path
+        self.frame_records = []
+        self.stage_outputs = {stage: {} for stage in STAGE_RECORDS}
+        stages = {record_type: stage for stage, record_type in STAGE_RECORDS.items()}
+
+        with open(path, 'rb') as file:
+            header = file.read(len(MAGIC) + 2 + STRING_HEADER.size)
+            if len(header) < len(MAGIC) + 2 + STRING_HEADER.size or header[:len(MAGIC)] != MAGIC \
+                    or header[len(MAGIC)] != VERSION:
+                raise ValueError(f'{path} is not a recording of version {VERSION}')
+
+            self.frames = FRAME_MODES[header[len(MAGIC) + 1]]
+            (length,) = STRING_HEADER.unpack_from(header, len(MAGIC) + 2)
+            self.video_path = file.read(length).decode('utf-8')
+
+            size = os.fstat(file.fileno()).st_size
+
+            while True:
+                record_header = file.read(RECORD_HEADER.size)
+                if len(record_header) < RECORD_HEADER.size:
+                    break
+
+                record_type, timestamp, length = RECORD_HEADER.unpack(record_header)
+                offset = file.tell()
+
+                # A record cut off by a crash while recording is ignored.
+                if offset + length > size:
+                    logging.warning(f'Recording {path} ends with an incomplete record')
+                    break
+
+                # The encoded frames are skipped, they are read when the frame is requested.
+                if record_type == FRAME_RECORD:
+                    width, height, reference = FRAME_HEADER.unpack(file.read(FRAME_HEADER.size))
+                    self.frame_records.append((timestamp, width, height, reference,
+                                               offset + FRAME_HEADER.size, length - FRAME_HEADER.size))
+                    file.seek(offset + length)
+                else:
+                    self.stage_outputs[stages[record_type]][timestamp] = unpack_boxes(file.read(length))
+
+        logging.info(f'Recording {path} has {len(self.frame_records)} frames')
+
+    def read_encoded_frame(self, file, frame_record):
+        """Reads the encoded frame of a frame record from the opened log.
+
+        Args:
+            file (BufferedReader): The log opened for reading.
+            frame_record ((float, int, int, int, int, int)): The frame record, one of frame_records.
+
+        Returns:
+            bytes: The encoded frame, empty if the frame was not stored.
+        """
+        file.seek(frame_record[4])
+        return file.read(frame_record[5])
+
+    def stage_output(self, stage, frame_obj):
+        """Gets the recorded output of a stage on a frame.
+
+        Args:
+            stage (str): The stage, one of STAGE_RECORDS.
+            frame_obj (FrameObj): The frame, identified by its timestamp.
+
+        Returns:
+            BoundingBoxes: Recorded output of the stage.
+
+        Raises:
+            KeyError: The stage was not recorded on the frame.
+        """
+        try:
+            return self.stage_outputs[stage][frame_obj.timestamp]
+        except KeyError:
+            raise KeyError(f'No {stage} recorded on the frame at {frame_obj.timestamp}') from None
@@ -0,0 +1,144 @@
+"""Contains the RecordLogWriter class, which writes frames and the outputs of the stages to a binary log.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import atexit
+import logging
+import threading
+
+from processor.pipeline.recording.record_log import \
+    MAGIC, VERSION, FRAME_MODES, FRAME_RECORD, STAGE_RECORDS, RECORD_HEADER, FRAME_HEADER, BOXES_HEADER, BOX, \
+    STRING_HEADER
+
+
+def pack_string(string):
+    """Packs a string prefixed with its length.
+
+    Args:
+        string (str): The string to pack.
+
+    Returns:
+        bytes: The length and utf-8 encoding of the string.
+    """
+    encoded = string.encode('utf-8')
+    return STRING_HEADER.pack(len(encoded)) + encoded
+
+
+def pack_boxes(bounding_boxes):
+    """Packs the bounding boxes of a stage output.
+
+    Args:
+        bounding_boxes (BoundingBoxes): Output of the stage.
+
+    Returns:
+        bytes: The packed boxes.
+    """
+    parts = [BOXES_HEADER.pack(len(bounding_boxes))]
+
+    for bounding_box in bounding_boxes:
+        classification = str(bounding_box.classification).encode('utf-8')
+        rectangle = bounding_box.rectangle
+        parts.append(BOX.pack(int(bounding_box.identifier),
+                              bounding_box.object_id is not None,
+                              int(bounding_box.object_id) if bounding_box.object_id is not None else 0,
+                              rectangle.x1, rectangle.y1, rectangle.x2, rectangle.y2,
+                              float(bounding_box.certainty),
+                              len(classification)))
+        parts.append(classification)
+
+    return b''.join(parts)
+
+
+class RecordLogWriter:
+    """Writes frames and the outputs of the stages to a binary log.
+
+    The log starts with a header containing the way frames are stored and the path of the recorded video,
+    followed by records of a type, the timestamp of their frame and a payload.
+    Records of multiple threads are written one at a time, so stages may run on different threads.
+    The log is closed when the application exits if it was not closed before.
+
+    Attributes:
+        path (str): Path of the log.
+        frames (str): Way the frames are stored, one of FRAME_MODES.
+        video_path (str): Path of the video the frame references point into.
+        records (int): Amount of records written.
+
+        __file (BufferedWriter): The opened log.
+        __lock (threading.Lock): Lock writing one record at a time.
+    """
+    def __init__(self, path, frames='encoded', video_path=''):
+        """Opens the log and writes its header.
+
+        Args:
+            path (str): Path of the log.
+            frames (str): Way the frames are stored, one of FRAME_MODES.
+            video_path (str): Path of the video the frame references point into.
+
+        Raises:
+            ValueError: The way the frames are stored is unknown.
+        """
+        if frames not in FRAME_MODES:
+            raise ValueError(f'Frames are stored as one of {FRAME_MODES}, not "{frames}"')
+
+        self.path = path
+        self.frames = frames
+        self.video_path = video_path
+        self.records = 0
+
+        self.__file = open(path, 'wb')
+        self.__file.write(MAGIC + bytes([VERSION, FRAME_MODES.index(frames)]) + pack_string(video_path))
+        self.__lock = threading.Lock()
+
+        atexit.register(self.close)
+        logging.info(f'Recording to {path}, storing frames as {frames}')
+
+    def write_frame(self, frame_obj, reference=-1, encoded=b''):
+        """Writes a frame record.
+
+        Args:
+            frame_obj (FrameObj): The frame, its timestamp identifies the frame in the stage records.
+            reference (int): Index of the frame in the video, -1 if the frame is not referenced.
+            encoded (bytes): The encoded frame, empty if the frame is not stored.
+        """
+        width, height = frame_obj.shape
+        self.__write(FRAME_RECORD, frame_obj.timestamp, FRAME_HEADER.pack(width, height, reference) + encoded)
+
+    def write_stage(self, stage, frame_obj, bounding_boxes):
+        """Writes the output of a stage on a frame.
+
+        Args:
+            stage (str): The stage, one of STAGE_RECORDS.
+            frame_obj (FrameObj): The frame the stage ran on.
+            bounding_boxes (BoundingBoxes): Output of the stage.
+        """
+        self.__write(STAGE_RECORDS[stage], frame_obj.timestamp, pack_boxes(bounding_boxes))
+
+    def __write(self, record_type, timestamp, payload):
+        """Writes a record, records written after the log was closed are dropped.
+
+        Args:
+            record_type (int): Type of the record.
+            timestamp (float): Timestamp of the frame of the record.
+            payload (bytes): Content of the record.
+        """
+        with self.__lock:
+            if self.__file.closed:
+                return
+
+            self.__file.write(RECORD_HEADER.pack(record_type, timestamp, len(payload)))
+            self.__file.write(payload)
+            self.records += 1
+
+    def close(self):
+        """Closes the log, closing it again has no effect."""
+        with self.__lock:
+            if self.__file.closed:
+                return
+
+            self.__file.close()
+
+        atexit.unregister(self.close)
+        logging.info(f'Recorded {self.records} records to {self.path}')
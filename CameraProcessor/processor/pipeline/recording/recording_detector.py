@@ -0,0 +1,61 @@
+"""Contains the RecordingDetector class, which records the detections of a wrapped detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class RecordingDetector(IDetector):
+    """Wraps a detector and records the detections of every frame.
+
+    Attributes:
+        detector (IDetector): The wrapped detector.
+        writer (RecordLogWriter): Log the detections are written to.
+    """
+    def __init__(self, detector, writer):
+        """Wraps the detector.
+
+        Args:
+            detector (IDetector): The detector to record.
+            writer (RecordLogWriter): Log the detections are written to.
+        """
+        self.detector = detector
+        self.writer = writer
+
+    def detect(self, frame_obj):
+        """Detects using the wrapped detector and records the detections.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: returns BoundingBoxes object containing a list of BoundingBox objects.
+        """
+        bounding_boxes = self.detector.detect(frame_obj)
+        self.writer.write_stage('detection', frame_obj, bounding_boxes)
+        return bounding_boxes
+
+    def detect_batch(self, frame_objs):
+        """Detects a batch using the wrapped detector and records the detections of every frame.
+
+        Args:
+            frame_objs ([FrameObj]): objects containing frame and timestamp.
+
+        Returns:
+            [BoundingBoxes]: BoundingBoxes object of every frame, in the same order as the frames.
+        """
+        batch_bounding_boxes = self.detector.detect_batch(frame_objs)
+        for frame_obj, bounding_boxes in zip(frame_objs, batch_bounding_boxes):
+            self.writer.write_stage('detection', frame_obj, bounding_boxes)
+        return batch_bounding_boxes
+
+    def set_queue_depth(self, queue_depth):
+        """Passes the amount of frames waiting to be detected on to the wrapped detector.
+
+        Args:
+            queue_depth (func): Function giving the amount of frames waiting to be detected.
+        """
+        self.detector.set_queue_depth(queue_depth)
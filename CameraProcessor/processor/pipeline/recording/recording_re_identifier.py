@@ -0,0 +1,121 @@
+"""Contains the RecordingReIdentifier class, which records the output of a wrapped re-identifier.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.reidentification.i_re_identifier import IReIdentifier
+
+
+class RecordingReIdentifier(IReIdentifier):
+    """Wraps a re-identifier and records the re-identified objects of every frame.
+
+    Feature extraction for the orchestrator is passed on to the wrapped re-identifier without recording.
+
+    Attributes:
+        re_identifier (IReIdentifier): The wrapped re-identifier.
+        writer (RecordLogWriter): Log the re-identified objects are written to.
+    """
+    def __init__(self, re_identifier, writer):
+        """Wraps the re-identifier.
+
+        Args:
+            re_identifier (IReIdentifier): The re-identifier to record.
+            writer (RecordLogWriter): Log the re-identified objects are written to.
+        """
+        self.re_identifier = re_identifier
+        self.writer = writer
+
+    def execute_component(self):
+        """Function given to scheduler, so the scheduler can run the re-identification stage.
+
+        Returns:
+            function: function that the scheduler can run.
+        """
+        return self.re_identify
+
+    @property
+    def feature_map_size(self):
+        """Feature map size of the wrapped re-identifier.
+
+        Returns:
+            int: Size of the feature map.
+        """
+        return self.re_identifier.feature_map_size
+
+    def extract_features(self, cutouts):
+        """Extract features from a list of cutouts using the wrapped re-identifier.
+
+        Args:
+            cutouts ([np.ndarray]): A list of cutouts of the objects to extract features from.
+
+        Returns:
+             [[float]]: Feature vectors of the cutouts.
+        """
+        return self.re_identifier.extract_features(cutouts)
+
+    def extract_features_from_image(self, image):
+        """Extract features from an image using the wrapped re-identifier.
+
+        Args:
+            image (np.ndarray): the image of the object to extract features from.
+
+        Returns:
+            [float]: Feature vector of an image.
+        """
+        return self.re_identifier.extract_features_from_image(image)
+
+    def extract_features_from_images(self, images):
+        """Extract features from multiple images using the wrapped re-identifier.
+
+        Args:
+            images ([np.ndarray]): the images of the objects to extract features from.
+
+        Returns:
+            [[float]]: Feature vector of every image, in the same order as the images.
+        """
+        return self.re_identifier.extract_features_from_images(images)
+
+    def re_identify(self, frame_obj, track_obj, re_id_data):
+        """Re-identifies using the wrapped re-identifier and records the re-identified objects.
+
+        Args:
+            frame_obj (FrameObj):  frame object storing OpenCV frame and timestamp.
+            track_obj (BoundingBoxes): List of bounding boxes from tracking stage.
+            re_id_data (ReidData): Data class containing data about tracked subjects.
+
+        Returns:
+            BoundingBoxes: object containing all re-id tracked boxes (bounding boxes where re-id is performed).
+        """
+        bounding_boxes = self.re_identifier.re_identify(frame_obj, track_obj, re_id_data)
+        self.writer.write_stage('re-identification', frame_obj, bounding_boxes)
+        return bounding_boxes
+
+    def re_identify_batch(self, frame_objs, track_objs, re_id_datas):
+        """Re-identifies a batch using the wrapped re-identifier and records the re-identified objects.
+
+        Args:
+            frame_objs ([FrameObj]): frame objects storing OpenCV frame and timestamp.
+            track_objs ([BoundingBoxes]): Bounding boxes from the tracking stage of every frame.
+            re_id_datas ([ReidData]): Data about the tracked subjects of the camera of every frame.
+
+        Returns:
+            [BoundingBoxes]: re-id tracked boxes of every frame, in the same order as the frames.
+        """
+        batch_bounding_boxes = self.re_identifier.re_identify_batch(frame_objs, track_objs, re_id_datas)
+        for frame_obj, bounding_boxes in zip(frame_objs, batch_bounding_boxes):
+            self.writer.write_stage('re-identification', frame_obj, bounding_boxes)
+        return batch_bounding_boxes
+
+    def similarity(self, query_features, gallery_features):
+        """Calculates the similarity rate between two feature vectors using the wrapped re-identifier.
+
+        Args:
+            query_features ([float]): the feature vector of the query image.
+            gallery_features ([float]): the feature vector of the gallery image.
+
+        Returns:
+            float: The similarity value of two feature vectors.
+        """
+        return self.re_identifier.similarity(query_features, gallery_features)
@@ -0,0 +1,71 @@
+"""Contains the RecordingTracker class, which records the tracked objects of a wrapped tracker.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.tracking.i_tracker import ITracker
+
+
+class RecordingTracker(ITracker):
+    """Wraps a tracker and records the tracked objects of every frame, including the predicted ones.
+
+    Attributes:
+        tracker (ITracker): The wrapped tracker.
+        writer (RecordLogWriter): Log the tracked objects are written to.
+    """
+    def __init__(self, tracker, writer):
+        """Wraps the tracker.
+
+        Args:
+            tracker (ITracker): The tracker to record.
+            writer (RecordLogWriter): Log the tracked objects are written to.
+        """
+        self.tracker = tracker
+        self.writer = writer
+
+    def track(self, frame_obj, det_obj, re_id_data):
+        """Tracks using the wrapped tracker and records the tracked objects.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            det_obj (BoundingBoxes): BoundingBoxes object containing detections from detection stage.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
+        """
+        bounding_boxes = self.tracker.track(frame_obj, det_obj, re_id_data)
+        self.writer.write_stage('tracking', frame_obj, bounding_boxes)
+        return bounding_boxes
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts using the wrapped tracker and records the predicted objects.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted bounding boxes of the tracked objects.
+        """
+        bounding_boxes = self.tracker.predict(frame_obj, re_id_data)
+        self.writer.write_stage('tracking', frame_obj, bounding_boxes)
+        return bounding_boxes
+
+    def motion(self):
+        """Gets the largest speed of the tracked objects of the wrapped tracker.
+
+        Returns:
+            float: Speed in object sizes per frame.
+        """
+        return self.tracker.motion()
+
+    def uncertainty(self):
+        """Gets the largest uncertainty of the position of the tracked objects of the wrapped tracker.
+
+        Returns:
+            float: Standard deviation of the position in object sizes.
+        """
+        return self.tracker.uncertainty()
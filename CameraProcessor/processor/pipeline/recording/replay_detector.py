@@ -0,0 +1,34 @@
+"""Contains the ReplayDetector class, which returns the recorded detections instead of detecting.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class ReplayDetector(IDetector):
+    """Detector returning the recorded detections of a frame, so no detection model is loaded.
+
+    Attributes:
+        record_log (RecordLog): The recording.
+    """
+    def __init__(self, record_log):
+        """Inits the replay detector.
+
+        Args:
+            record_log (RecordLog): The recording.
+        """
+        self.record_log = record_log
+
+    def detect(self, frame_obj):
+        """Gets the recorded detections of the frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: returns BoundingBoxes object containing a list of BoundingBox objects.
+        """
+        return self.record_log.stage_output('detection', frame_obj)
@@ -0,0 +1,48 @@
+"""Contains the ReplayReIdentifier class, which returns the recorded re-identified objects.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.reidentification.i_re_identifier import IReIdentifier
+
+
+class ReplayReIdentifier(IReIdentifier):
+    """Re-identifier returning the recorded re-identified objects of a frame.
+
+    No features are extracted, so queries of the orchestrator cannot be answered.
+
+    Attributes:
+        record_log (RecordLog): The recording.
+    """
+    def __init__(self, record_log):
+        """Inits the replay re-identifier.
+
+        Args:
+            record_log (RecordLog): The recording.
+        """
+        self.record_log = record_log
+
+    def execute_component(self):
+        """Function given to scheduler, so the scheduler can run the re-identification stage.
+
+        Returns:
+            function: function that the scheduler can run.
+        """
+        return self.re_identify
+
+    # pylint: disable=unused-argument
+    def re_identify(self, frame_obj, track_obj, re_id_data):
+        """Gets the recorded re-identified objects of the frame.
+
+        Args:
+            frame_obj (FrameObj):  frame object storing OpenCV frame and timestamp.
+            track_obj (BoundingBoxes): List of bounding boxes from tracking stage.
+            re_id_data (ReidData): Data class containing data about tracked subjects.
+
+        Returns:
+            BoundingBoxes: object containing all re-id tracked boxes (bounding boxes where re-id is performed).
+        """
+        return self.record_log.stage_output('re-identification', frame_obj)
+    # pylint: enable=unused-argument
@@ -0,0 +1,50 @@
+"""Contains the ReplayTracker class, which returns the recorded tracked objects instead of tracking.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.pipeline.tracking.i_tracker import ITracker
+
+
+class ReplayTracker(ITracker):
+    """Tracker returning the recorded tracked objects of a frame, ignoring the detections it is given.
+
+    Attributes:
+        record_log (RecordLog): The recording.
+    """
+    def __init__(self, record_log):
+        """Inits the replay tracker.
+
+        Args:
+            record_log (RecordLog): The recording.
+        """
+        self.record_log = record_log
+
+    # pylint: disable=unused-argument
+    def track(self, frame_obj, det_obj, re_id_data):
+        """Gets the recorded tracked objects of the frame.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            det_obj (BoundingBoxes): BoundingBoxes object containing detections from detection stage.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
+        """
+        return self.record_log.stage_output('tracking', frame_obj)
+
+    def predict(self, frame_obj, re_id_data):
+        """Gets the recorded predicted objects of the frame.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted bounding boxes of the tracked objects.
+        """
+        return self.record_log.stage_output('tracking', frame_obj)
+    # pylint: enable=unused-argument
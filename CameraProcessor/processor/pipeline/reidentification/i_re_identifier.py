@@ -39,7 +39,7 @@ class IReIdentifier(IComponent):
         """
         raise NotImplementedError('Extract features function not implemented')
 
-    def extract_feature_from_image(self, image):
+    def extract_features_from_image(self, image):
         """Extract features from an image.
 
         Args:
@@ -50,6 +50,17 @@ class IReIdentifier(IComponent):
         """
         raise NotImplementedError('Extract features from image function not implemented')
 
+    def extract_features_from_images(self, images):
+        """Extract features from multiple images, by default one image at a time.
+
+        Args:
+            images ([np.ndarray]): the images of the objects to extract features from.
+
+        Returns:
+            [[float]]: Feature vector of every image, in the same order as the images.
+        """
+        return [self.extract_features_from_image(image) for image in images]
+
     def re_identify(self, frame_obj, track_obj, re_id_data):
         """Performing re-identification using a re-identification implementation.
 
@@ -65,6 +76,20 @@ class IReIdentifier(IComponent):
         """
         raise NotImplementedError('Re-identify function not implemented')
 
+    def re_identify_batch(self, frame_objs, track_objs, re_id_datas):
+        """Performing re-identification on frames of multiple cameras, by default on every frame separately.
+
+        Args:
+            frame_objs ([FrameObj]): frame objects storing OpenCV frame and timestamp.
+            track_objs ([BoundingBoxes]): Bounding boxes from the tracking stage of every frame.
+            re_id_datas ([ReidData]): Data about the tracked subjects of the camera of every frame.
+
+        Returns:
+            [BoundingBoxes]: re-id tracked boxes of every frame, in the same order as the frames.
+        """
+        return [self.re_identify(frame_obj, track_obj, re_id_data)
+                for frame_obj, track_obj, re_id_data in zip(frame_objs, track_objs, re_id_datas)]
+
     def similarity(self, query_features, gallery_features):
         """Calculates the similarity rate between two feature vectors.
 
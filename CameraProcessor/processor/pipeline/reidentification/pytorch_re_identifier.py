@@ -64,10 +64,54 @@ class PytorchReIdentifier(IReIdentifier):
         Returns:
             BoundingBoxes: object containing all re-id tracked boxes (bounding boxes where re-id is performed).
         """
+        # Without objects being followed there is nothing to compare the features with, so skip the extraction.
+        if len(re_id_data.get_queries()) == 0:
+            return track_obj
 
+        cutouts = self.extract_cutouts(frame_obj, track_obj.bounding_boxes)
+        return self.match_features(track_obj, self.extract_features(cutouts), re_id_data)
+
+    def re_identify_batch(self, frame_objs, track_objs, re_id_datas):
+        """Performing re-identification on frames of multiple cameras, extracting all features in a single call.
+
+        Args:
+            frame_objs ([FrameObj]): frame objects storing OpenCV frame and timestamp.
+            track_objs ([BoundingBoxes]): Bounding boxes from the tracking stage of every frame.
+            re_id_datas ([ReidData]): Data about the tracked subjects of the camera of every frame.
+
+        Returns:
+            [BoundingBoxes]: re-id tracked boxes of every frame, in the same order as the frames.
+        """
+        # Only frames of cameras following objects need their features extracted.
+        batch = [(i, self.extract_cutouts(frame_obj, track_obj.bounding_boxes))
+                 for i, (frame_obj, track_obj, re_id_data) in enumerate(zip(frame_objs, track_objs, re_id_datas))
+                 if len(re_id_data.get_queries()) > 0]
+        cutouts = [cutout for _, frame_cutouts in batch for cutout in frame_cutouts]
+        if len(cutouts) == 0:
+            return list(track_objs)
+
+        features = self.extract_features(cutouts)
+
+        # Split the features back over the frames they were cut out of.
+        start = 0
+        for i, frame_cutouts in batch:
+            self.match_features(track_objs[i], features[start:start + len(frame_cutouts)], re_id_datas[i])
+            start += len(frame_cutouts)
+
+        return list(track_objs)
+
+    def match_features(self, track_obj, box_features, re_id_data):
+        """Assigns the objects being followed to the tracked boxes with similar features.
+
+        Args:
+            track_obj (BoundingBoxes): List of bounding boxes from tracking stage.
+            box_features ([[float]]): Feature vectors in the same order as the bounding boxes.
+            re_id_data (ReidData): Data class containing data about tracked subjects.
+
+        Returns:
+            BoundingBoxes: object containing all re-id tracked boxes (bounding boxes where re-id is performed).
+        """
         tracked_bounding_boxes = track_obj.bounding_boxes
-        cutouts = self.extract_cutouts(frame_obj, tracked_bounding_boxes)
-        box_features = self.extract_features(cutouts)
 
         # Loop over all objects being followed.
         for query_id in re_id_data.get_queries():
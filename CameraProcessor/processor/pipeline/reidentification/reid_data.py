@@ -94,3 +94,21 @@ class ReidData:
             [float]: Feature vector for the object
         """
         return self.__query_features[object_id]
+
+    def get_state(self):
+        """Gets copies of both dictionaries, so the queries can be restored after a restart.
+
+        Returns:
+            dict[int, int], dict[int, [float]]: The query boxes and query features.
+        """
+        return dict(self.__query_boxes), dict(self.__query_features)
+
+    def set_state(self, state):
+        """Restores the queries from a state returned by get_state.
+
+        Args:
+            state ((dict[int, int], dict[int, [float]])): The query boxes and query features.
+        """
+        query_boxes, query_features = state
+        self.__query_boxes = dict(query_boxes)
+        self.__query_features = dict(query_features)
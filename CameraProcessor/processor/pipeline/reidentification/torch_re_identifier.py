@@ -72,3 +72,14 @@ class TorchReIdentifier(PytorchReIdentifier):
         """
         resized_image = resize_cutout(image, self.config)
         return self.extractor(resized_image).cpu().numpy().tolist()[0]
+
+    def extract_features_from_images(self, images):
+        """Extract features from multiple images in a single call of the extractor.
+
+        Args:
+            images ([np.ndarray]): the images of the objects to extract features from.
+
+        Returns:
+            [[float]]: Feature vector of every image, in the same order as the images.
+        """
+        return self.extract_features([resize_cutout(image, self.config) for image in images])
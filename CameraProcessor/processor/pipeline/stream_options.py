@@ -0,0 +1,43 @@
+"""Contains the StreamOptions class, which bundles the options of a run processing a stream.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+
+class StreamOptions:
+    """Options of a run processing a stream, besides its stages, of which every execution uses the ones it supports.
+
+    Attributes:
+        detection_gate (IDetectionGate): Gate skipping the detector on some frames, None detects on every frame.
+            Used by the sequential execution.
+        frame_budget (FrameBudget): Latency budget of a frame, None never skips a stage.
+            Used by the sequential and scheduler executions.
+        checkpoint (Checkpoint): Checkpoint restoring and snapshotting the tracker and re-id data, None if not used.
+        scheduler_config (SectionProxy): Configurations of the scheduler, the sequential scheduler is used if None.
+        queue_size (int): Maximum amount of frames waiting between two stages of the pipelined execution.
+        max_frames_in_flight (int): Maximum amount of frames processed at the same time by the async execution.
+        executor (concurrent.futures.Executor): Executor for blocking stages of the async execution,
+            None uses the default of the loop.
+    """
+    def __init__(self, detection_gate=None, frame_budget=None, checkpoint=None, scheduler_config=None,
+                 queue_size=2, max_frames_in_flight=2, executor=None):
+        """Inits the options, the defaults add nothing to the stages.
+
+        Args:
+            detection_gate (IDetectionGate): Gate skipping the detector on some frames, None detects on every frame.
+            frame_budget (FrameBudget): Latency budget of a frame, None never skips a stage.
+            checkpoint (Checkpoint): Checkpoint restoring and snapshotting the tracker and re-id data, None if not used.
+            scheduler_config (SectionProxy): Configurations of the scheduler, the sequential scheduler is used if None.
+            queue_size (int): Maximum amount of frames waiting between two stages of the pipelined execution.
+            max_frames_in_flight (int): Maximum amount of frames processed at the same time by the async execution.
+            executor (concurrent.futures.Executor): Executor for blocking stages of the async execution.
+        """
+        self.detection_gate = detection_gate
+        self.frame_budget = frame_budget
+        self.checkpoint = checkpoint
+        self.scheduler_config = scheduler_config
+        self.queue_size = queue_size
+        self.max_frames_in_flight = max_frames_in_flight
+        self.executor = executor
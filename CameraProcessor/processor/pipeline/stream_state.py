@@ -0,0 +1,87 @@
+"""Contains the StreamState class, which holds the state of a processed stream that lasts from frame to frame.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+
+from processor.pipeline.frame_buffer import FrameBuffer
+from processor.pipeline.message_worker import MessageWorker
+from processor.pipeline.reidentification.reid_data import ReidData
+
+
+class StreamState:
+    """State of a processed stream besides its stages: re-identification data, buffered frames and frame count.
+
+    Starting the state restores the tracker and re-identification data from the checkpoint and starts handling
+    the commands of the orchestrator. Between two frames, the handled commands are applied and the state is
+    snapshotted, stopping the state writes the last snapshot. Every execution of the pipeline shares this,
+    the executions with stages on multiple threads take the lock around every use of the tracker and re-id data.
+
+    Attributes:
+        tracker (ITracker): Tracker following the objects of the stream, None if left out.
+        ws_client (WebsocketClient): Connection to the orchestrator, None if not connected.
+        checkpoint (Checkpoint): Checkpoint of the tracker and re-identification data, None if not checkpointed.
+        re_id_data (ReidData): Data about the subjects tracked in the stream.
+        frame_buffer (FrameBuffer): Previous frames of the stream and their bounding boxes.
+        frame_nr (int): Number of frames of the stream that were processed.
+        lock (threading.Lock): Guards the tracker and re-identification data against use by multiple threads.
+
+        __message_worker (MessageWorker): Handles the commands of the orchestrator, None if not started or connected.
+    """
+    def __init__(self, tracker, ws_client=None, checkpoint=None):
+        """Inits the state of a stream of which no frame was processed.
+
+        Args:
+            tracker (ITracker): Tracker following the objects of the stream, None if left out.
+            ws_client (WebsocketClient): Connection to the orchestrator, None if not connected.
+            checkpoint (Checkpoint): Checkpoint of the tracker and re-identification data, None if not checkpointed.
+        """
+        self.tracker = tracker
+        self.ws_client = ws_client
+        self.checkpoint = checkpoint
+
+        self.re_id_data = ReidData()
+
+        # Frame buffer that stores 150 frames (flushes older frames if new frames are added over the limit.
+        self.frame_buffer = FrameBuffer(150)
+        self.frame_nr = 0
+        self.lock = threading.Lock()
+
+        self.__message_worker = None
+
+    def start(self, re_identifier):
+        """Continues with the tracked objects and queries from before a restart and starts handling commands.
+
+        Args:
+            re_identifier (IReIdentifier): re-identifier extracting the features of started objects, None if left out.
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.restore(self.tracker, self.re_id_data)
+
+        # Commands of the orchestrator are handled on a worker, their results are applied between two frames.
+        if self.ws_client is not None:
+            self.__message_worker = MessageWorker(self.ws_client, re_identifier)
+
+    def finish_frame(self):
+        """Applies the handled commands of the orchestrator, snapshots the state and counts the processed frame."""
+        # The lock is only needed when there is something to do, taking it could wait on a stage of the next frame.
+        if (self.__message_worker is not None and self.__message_worker.has_commands) or self.checkpoint is not None:
+            with self.lock:
+                if self.__message_worker is not None:
+                    self.__message_worker.process(self.frame_buffer, self.re_id_data)
+
+                if self.checkpoint is not None:
+                    self.checkpoint.update(self.tracker, self.re_id_data)
+
+        self.frame_nr += 1
+
+    def stop(self):
+        """Stops handling commands and writes the last snapshot of the state."""
+        if self.__message_worker is not None:
+            self.__message_worker.close()
+            self.__message_worker = None
+
+        if self.checkpoint is not None:
+            self.checkpoint.close(self.tracker, self.re_id_data)
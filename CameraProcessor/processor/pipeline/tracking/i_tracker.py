@@ -30,3 +30,47 @@ class ITracker(IComponent):
             BoundingBoxes: object containing all trackers (bounding boxes of tracked objects).
         """
         raise NotImplementedError('Tracking stage not implemented')
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts the positions of the tracked objects in a frame on which no detection was run.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted bounding boxes of the tracked objects.
+        """
+        raise NotImplementedError('Prediction without detections not implemented')
+
+    def motion(self):
+        """Gets the largest speed of the tracked objects, relative to their size.
+
+        Returns:
+            float: Speed in object sizes per frame.
+        """
+        raise NotImplementedError('Motion of the tracked objects not implemented')
+
+    def uncertainty(self):
+        """Gets the largest uncertainty of the position of the tracked objects, relative to their size.
+
+        Returns:
+            float: Standard deviation of the position in object sizes.
+        """
+        raise NotImplementedError('Uncertainty of the tracked objects not implemented')
+
+    def get_state(self):
+        """Gets the state of the tracked objects, so the tracker can be restored after a restart.
+
+        Returns:
+            object: Picklable state of the tracker.
+        """
+        raise NotImplementedError('Getting the state of the tracker not implemented')
+
+    def set_state(self, state):
+        """Restores the tracked objects from a state returned by get_state.
+
+        Args:
+            state (object): State of the tracker.
+        """
+        raise NotImplementedError('Restoring the state of the tracker not implemented')
@@ -260,3 +260,75 @@ class Sort(object):
         if len(ret) > 0:
             return ret
         return np.empty((0, 5))
+
+    def predict(self):
+        """
+        Advances all trackers one frame without detections, used for frames on which no detection was run.
+        Unlike update, a predicted frame is not counted as a missed detection, so tracks are not aged out by it.
+        Returns the predicted boxes of the tracks that were output by the last update, in the same format as update.
+        """
+        self.frame_count += 1
+        ret = []
+        for trk in self.trackers:
+            # Same area correction as KalmanBoxTracker.predict.
+            if (trk.kf.x[6] + trk.kf.x[2]) <= 0:
+                trk.kf.x[6] *= 0.0
+            trk.kf.predict()
+            d = trk.get_state()[0]
+            if np.any(np.isnan(d)):
+                continue
+            if (trk.time_since_update < 1) and (trk.hit_streak >= self.min_hits or self.frame_count <= self.min_hits):
+                ret.append(((np.concatenate((d, [trk.id + 1])).reshape(1, -1))[0], trk.classification, trk.certainty))
+        if len(ret) > 0:
+            return ret
+        return np.empty((0, 5))
+
+    def motion(self):
+        """
+        Returns the largest speed of the active tracks, in box sizes (square root of the area) per frame.
+        """
+        speeds = [np.sqrt(trk.kf.x[4, 0] ** 2 + trk.kf.x[5, 0] ** 2) / np.sqrt(max(trk.kf.x[2, 0], 1e-6))
+                  for trk in self.trackers if trk.time_since_update < 1]
+        return float(max(speeds, default=0.))
+
+    def uncertainty(self):
+        """
+        Returns the largest standard deviation of the estimated centre of the active tracks, in box sizes.
+        """
+        deviations = [np.sqrt(trk.kf.P[0, 0] + trk.kf.P[1, 1]) / np.sqrt(max(trk.kf.x[2, 0], 1e-6))
+                      for trk in self.trackers if trk.time_since_update < 1]
+        return float(max(deviations, default=0.))
+
+    def get_state(self):
+        """
+        Returns the state of all tracks and the track id counter as plain numbers and arrays, so it can be stored.
+        The history of predictions is left out, it is cleared by the next update of a track.
+        """
+        return {
+            'frame_count': self.frame_count,
+            'count': KalmanBoxTracker.count,
+            'trackers': [{
+                'x': trk.kf.x.copy(), 'P': trk.kf.P.copy(), 'id': trk.id, 'classification': trk.classification,
+                'certainty': trk.certainty, 'time_since_update': trk.time_since_update, 'hits': trk.hits,
+                'hit_streak': trk.hit_streak, 'age': trk.age
+            } for trk in self.trackers]
+        }
+
+    def set_state(self, state):
+        """
+        Restores the tracks and the track id counter from a state returned by get_state.
+        """
+        self.frame_count = state['frame_count']
+        self.trackers = []
+        for track_state in state['trackers']:
+            trk = KalmanBoxTracker(np.array([0., 0., 1., 1.]), track_state['classification'], track_state['certainty'])
+            trk.kf.x = track_state['x'].copy()
+            trk.kf.P = track_state['P'].copy()
+            trk.id = track_state['id']
+            trk.time_since_update = track_state['time_since_update']
+            trk.hits = track_state['hits']
+            trk.hit_streak = track_state['hit_streak']
+            trk.age = track_state['age']
+            self.trackers.append(trk)
+        # Continue numbering new tracks after the restored ones, so track ids are never reused.
+        KalmanBoxTracker.count = state['count']
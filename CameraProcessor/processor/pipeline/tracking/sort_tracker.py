@@ -54,3 +54,35 @@ class SortTracker(ISortTracker):
         sort_detections = self.sort.update(detections)
 
         return self.parse_boxes_from_sort(sort_detections, frame_obj.shape, re_id_data)
+
+    def predict(self, frame_obj, re_id_data):
+        """Predicts the trackers in a frame without detections using the Kalman filters of SORT.
+
+        Args:
+            frame_obj (FrameObj): frame object storing OpenCV frame and timestamp.
+            re_id_data (ReidData): Object containing data necessary for re-identification.
+
+        Returns:
+            BoundingBoxes: object containing the predicted trackers.
+        """
+        return self.parse_boxes_from_sort(self.sort.predict(), frame_obj.shape, re_id_data)
+
+    def motion(self):
+        """See base class."""
+        return self.sort.motion()
+
+    def uncertainty(self):
+        """See base class."""
+        return self.sort.uncertainty()
+
+    def get_state(self):
+        """See base class."""
+        return self.sort.get_state()
+
+    def set_state(self, state):
+        """Restores the trackers of SORT from a state returned by get_state.
+
+        Args:
+            state (object): State of the tracker.
+        """
+        self.sort.set_state(state)
@@ -0,0 +1,134 @@
+"""Entry point supervising the stream of every camera in a forked worker process, sharing the model weights.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import sys
+import signal
+import logging
+import asyncio
+import functools
+
+import torch
+
+from processor.main import select_process_stream, enforce_multi_deploy_environment_variables
+from processor.utils.config_parser import ConfigParser
+from processor.utils.supervisor import Supervisor
+from processor.pipeline.prepare_pipeline import \
+    prepare_detector, prepare_camera_detector, prepare_reidentifier, prepare_camera, prepare_frame_budget, \
+    prepare_demand, prepare_output
+import processor.scheduling.plan.pipeline_plan as pipeline_plan
+
+from processor.websocket.websocket_client import WebsocketClient
+from processor.output.websocket_sink import WebsocketSink
+
+
+def run_worker(configs, detector, re_identifier, websocket_url, worker_threads, camera_id, hls_url):
+    """Processes the stream of a single camera, inside a worker forked by the supervisor.
+
+    Args:
+        configs (configparser.ConfigParser): configurations of the application.
+        detector (IDetector): detector loaded by the supervisor.
+        re_identifier (IReIdentifier): re-identifier loaded by the supervisor, None if left out.
+        websocket_url (str): Url of the orchestrator websocket.
+        worker_threads (int): Threads used by the models of the worker.
+        camera_id (str): Id of the camera, under which the worker identifies to the orchestrator.
+        hls_url (str): Url of the HLS stream of the camera.
+    """
+    # The thread pool of the models is only started in the worker, after the fork.
+    torch.set_num_threads(worker_threads)
+
+    asyncio.get_event_loop().run_until_complete(
+        deploy_worker(configs, detector, re_identifier, websocket_url, camera_id, hls_url)
+    )
+
+
+async def deploy_worker(configs, detector, re_identifier, websocket_url, camera_id, hls_url):
+    """Connects the camera to the orchestrator and starts the process_frames loop.
+
+    Args:
+        configs (configparser.ConfigParser): configurations of the application.
+        detector (IDetector): detector loaded by the supervisor.
+        re_identifier (IReIdentifier): re-identifier loaded by the supervisor, None if left out.
+        websocket_url (str): Url of the orchestrator websocket.
+        camera_id (str): Id of the camera, under which the worker identifies to the orchestrator.
+        hls_url (str): Url of the HLS stream of the camera.
+    """
+    configs['Input']['type'] = 'hls'
+    camera = prepare_camera(configs, camera_id, hls_url, pipeline_plan.parse_plan(configs['Main'].get('plan', 'full')))
+
+    websocket_client = WebsocketClient(websocket_url, camera_id)
+    await websocket_client.connect()
+
+    # Sends the bounding boxes to the orchestrator using the websocket client, every worker writes its own files.
+    output = prepare_output(configs, {'websocket': WebsocketSink(websocket_client, asyncio.get_running_loop())},
+                            camera_id)
+
+    await select_process_stream(configs, prepare_frame_budget(configs), camera_id)(
+        # Lower the frame rate while the orchestrator reports that nothing needs the output of the camera.
+        prepare_demand(camera.capture, websocket_client, configs['Input']),
+        # The adaptive resolution and regions of interest of the camera only change the copy of the worker.
+        prepare_camera_detector(configs, detector, camera_id),
+        camera.tracker,
+        re_identifier,
+        # Function to call when frame is processed, only queuing the outputs for the sinks.
+        output,
+        websocket_client
+    )
+    output.close()
+
+
+def main():
+    """Loads the models once and supervises a forked worker process for every camera.
+
+    Raises:
+        EnvironmentError: CAMERAS or ORCHESTRATOR_URL is missing, or the models are loaded on a GPU.
+    """
+    # Load the config file.
+    config_parser = ConfigParser('configs.ini', True)
+    configs = config_parser.configs
+
+    camera_urls, websocket_url = enforce_multi_deploy_environment_variables(configs)
+
+    # Every worker uses its own threads, so limit them to not oversubscribe the cores.
+    worker_threads = configs['Supervisor'].getint('worker_threads', 0) or torch.get_num_threads()
+
+    # A forked worker cannot use the OpenMP thread pool of its parent and may deadlock on it.
+    # So the supervisor runs the models on a single thread, which does not start the pool.
+    torch.set_num_threads(1)
+
+    # Load the models before forking, so the workers share their weights.
+    stages = pipeline_plan.parse_plan(configs['Main'].get('plan', 'full'))
+    detector = prepare_detector(configs, per_camera=False)
+    re_identifier = prepare_reidentifier(configs) if 're-identification' in stages else None
+
+    # A CUDA context cannot be used by a forked process.
+    if getattr(detector, 'device', torch.device('cpu')).type != 'cpu':
+        raise EnvironmentError('Worker processes can only share models loaded on the CPU, '
+                               'use deploy_multi mode to share models on a GPU.')
+
+    supervisor_config = configs['Supervisor']
+    supervisor = Supervisor(
+        functools.partial(run_worker, configs, detector, re_identifier, websocket_url, worker_threads),
+        camera_urls,
+        restart_delay=supervisor_config.getfloat('restart_delay', 5),
+        max_restarts=supervisor_config.getint('max_restarts', -1)
+    )
+
+    # Stop the workers when the supervisor is stopped.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    supervisor.run()
+
+
+if __name__ == '__main__':
+    # Configure the logger.
+    logging.basicConfig(filename='supervisor.log', filemode='w',
+                        format='%(asctime)s %(levelname)s %(processName)s - %(message)s',
+                        level=logging.INFO,
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    logging.getLogger().addHandler(logging.StreamHandler(sys.stdout))
+
+    # Run the main function.
+    main()
@@ -0,0 +1,144 @@
+"""Defines the asyncio scheduler class, which executes nodes without blocking the event loop.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import asyncio
+import functools
+import inspect
+
+
+async def run_function(function, arguments, executor=None, inline=False):
+    """Runs a function without blocking the event loop.
+
+    Coroutine functions are awaited on the event loop, inline functions are called on the event loop
+    and all other functions are offloaded to the executor.
+
+    Args:
+        function (func): function to run.
+        arguments (tuple): arguments to call the function with.
+        executor (concurrent.futures.Executor): executor for blocking functions, None uses the default of the loop.
+        inline (bool): whether the function has to be called on the event loop.
+
+    Returns:
+        object: output of the function.
+    """
+    if inspect.iscoroutinefunction(function):
+        return await function(*arguments)
+
+    if inline:
+        out = function(*arguments)
+    else:
+        out = await asyncio.get_running_loop().run_in_executor(executor, functools.partial(function, *arguments))
+
+    # The function may still return an awaitable, for example a wrapped coroutine function.
+    if inspect.isawaitable(out):
+        return await out
+
+    return out
+
+
+class AsyncScheduler:
+    """Scheduler of which schedule_graph is a coroutine, executing all ready nodes concurrently.
+
+    Components with a coroutine function as work function are awaited on the event loop,
+    components with an attribute inline set to True are called on the event loop
+    and all other components are run on the executor, so the event loop stays responsive.
+
+    Attributes:
+        start_node (INode): INode representing the initial input node, starting point of the graph.
+        executor (concurrent.futures.Executor): executor for blocking components, None uses the default of the loop.
+    """
+
+    def __init__(self, start_node, executor=None):
+        """Inits AsyncScheduler with a starting node that contains the graph.
+
+        Args:
+            start_node (INode): INode representing the initial input node, starting point of the graph.
+            executor (concurrent.futures.Executor): executor for blocking components,
+                None uses the default of the loop.
+        """
+        self.start_node = start_node
+        self.executor = executor
+
+        self.__ready = []
+        self.__queued = set()
+
+    async def schedule_graph(self, inputs, global_readonly):
+        """Executes an iteration on the graph.
+
+        Args:
+            inputs ([object]): list of objects passed to the starting node to start an iteration.
+            global_readonly (dict[str, object]): list of objects that can be used by all nodes,
+                should never modify (use as readonly).
+
+        Raises:
+            Exception: a node was pushed while it wasn't executable, or a component raised an exception.
+        """
+        self.__queued = set()
+        self.__ready = []
+
+        # Assign inputs to initial/start node.
+        for i, node_input in enumerate(inputs):
+            self.start_node.assign(node_input, i)
+
+        self.push(self.start_node)
+
+        # Tasks of components that are running, mapped to their node.
+        running = {}
+
+        while self.__ready or running:
+            ready_nodes, self.__ready = self.__ready, []
+
+            for node in ready_nodes:
+                if not node.executable():
+                    raise Exception('Node in queue should be executable.')
+
+                task = asyncio.ensure_future(run_function(
+                    node.component.execute_component(),
+                    node.prepare_arguments(global_readonly),
+                    self.executor,
+                    getattr(node.component, 'inline', False)
+                ))
+                running[task] = node
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            # Join the results and notify the next layer.
+            for task in done:
+                node = running.pop(task)
+                node.propagate(task.result(), self.notify)
+
+    def notify(self, ready_nodes):
+        """Marks nodes as ready to be executed.
+
+        Args:
+            ready_nodes ([INode]): nodes to execute.
+        """
+        for node in ready_nodes:
+            self.push(node)
+
+    def push(self, node):
+        """Mark node as ready when it hasn't been marked yet in the current iteration.
+
+        Args:
+            node (INode): node to execute when it is its first occurrence this iteration.
+        """
+        if id(node) not in self.__queued:
+            self.__ready.append(node)
+            self.__queued.add(id(node))
+
+    def shutdown(self):
+        """Shuts down the executor if one was given, waiting on running components."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    @property
+    def queue_size(self):
+        """Get the amount of nodes ready to be executed.
+
+        Returns:
+            int: amount of nodes ready to be executed.
+        """
+        return len(self.__ready)
@@ -0,0 +1,61 @@
+"""Microbenchmark comparing the overhead of the interpreted and compiled scheduler on the pipeline plan.
+
+Run with: python -m processor.scheduling.benchmark [iterations]
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import sys
+import timeit
+
+import processor.scheduling.plan.pipeline_plan as pipeline_plan
+from processor.scheduling.component.func_call_component import FuncCallComponent
+from processor.scheduling.scheduler import Scheduler
+from processor.scheduling.compiled_scheduler import CompiledScheduler
+
+
+def create_no_op_plan():
+    """Creates the pipeline plan where every component does no work.
+
+    Returns:
+        ScheduleNode: the starting node of the plan.
+    """
+    plan_args = dict(pipeline_plan.plan_inputs)
+    plan_args['detector'] = FuncCallComponent(lambda frame_obj: None)
+    plan_args['tracker'] = FuncCallComponent(lambda frame_obj, detected_boxes, re_id_data: None)
+    plan_args['re_identifier'] = FuncCallComponent(lambda frame_obj, tracked_boxes, re_id_data: None)
+    plan_args['frame_buffer'] = FuncCallComponent(lambda frame_obj, re_id_tracked_boxes: None)
+    plan_args['func'] = lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes: None
+
+    return pipeline_plan.create_plan(plan_args)
+
+
+def benchmark(iterations):
+    """Times the scheduling overhead of both schedulers.
+
+    Args:
+        iterations (int): amount of iterations of the plan per scheduler.
+
+    Returns:
+        dict[str, float]: microseconds per iteration for each scheduler.
+    """
+    globals_readonly = {'frame_obj': object(), 're_id_data': object()}
+
+    results = {}
+    for name, scheduler in [('interpreted', Scheduler(create_no_op_plan())),
+                            ('compiled', CompiledScheduler(create_no_op_plan()))]:
+        seconds = timeit.timeit(lambda scheduler=scheduler: scheduler.schedule_graph([], globals_readonly),
+                                number=iterations)
+        results[name] = seconds / iterations * 1e6
+
+    return results
+
+
+if __name__ == '__main__':
+    nr_iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    timings = benchmark(nr_iterations)
+
+    for scheduler_name, microseconds in timings.items():
+        print(f'{scheduler_name:>12}: {microseconds:.2f} us per iteration')
+    print(f'{"speedup":>12}: {timings["interpreted"] / timings["compiled"]:.1f}x')
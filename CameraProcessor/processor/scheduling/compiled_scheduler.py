@@ -0,0 +1,145 @@
+"""Defines the plan compiler and the compiled scheduler, which run a plan as a flat list of steps.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.scheduling.compiled_step import CompiledStep
+
+
+def collect_nodes(start_node):
+    """Collects all nodes reachable from the start node.
+
+    Args:
+        start_node (INode): INode representing the initial input node, starting point of the graph.
+
+    Returns:
+        [INode]: all nodes of the plan, in order of discovery.
+    """
+    nodes = []
+    seen = {id(start_node)}
+    pending = [start_node]
+
+    # Breadth first, taking the nodes to visit from a separate list instead of the list being built.
+    while len(pending) > 0:
+        node = pending.pop(0)
+        nodes.append(node)
+
+        for out_node, _ in node.out_nodes:
+            if id(out_node) not in seen:
+                seen.add(id(out_node))
+                pending.append(out_node)
+
+    return nodes
+
+
+def compile_plan(start_node):
+    """Walks the node graph once and compiles it into a topologically ordered list of steps.
+
+    Every step gets its own argument slots, which the output of earlier steps is written into directly.
+    The work function of every component is requested once, so components must return the same function every time.
+
+    Args:
+        start_node (INode): INode representing the initial input node, starting point of the graph.
+
+    Returns:
+        [CompiledStep]: steps of the plan, the first step is the start node.
+
+    Raises:
+        Exception: the plan contains a cycle, or a node argument is never provided or provided more than once.
+    """
+    nodes = collect_nodes(start_node)
+
+    # Count the incoming connections of every node to sort the nodes topologically.
+    in_degree = {id(node): 0 for node in nodes}
+    for node in nodes:
+        for out_node, _ in node.out_nodes:
+            in_degree[id(out_node)] += 1
+
+    order = []
+    ready = [node for node in nodes if in_degree[id(node)] == 0]
+    while ready:
+        node = ready.pop(0)
+        order.append(node)
+        for out_node, _ in node.out_nodes:
+            in_degree[id(out_node)] -= 1
+            if in_degree[id(out_node)] == 0:
+                ready.append(out_node)
+
+    if len(order) != len(nodes) or order[0] is not start_node:
+        raise Exception('Plan should contain no cycles and the start node should be its only input node.')
+
+    # Preallocate the argument slots of every node.
+    slots = {id(node): [None] * node.input_count for node in order}
+
+    # Check that each argument is provided exactly once, the start node gets its arguments from the inputs.
+    provided = {id(node): [0] * node.input_count for node in order}
+    for node in order:
+        for arg_nr in node.global_map.values():
+            provided[id(node)][arg_nr] += 1
+        for out_node, arg_nr in node.out_nodes:
+            provided[id(out_node)][arg_nr] += 1
+
+    for node in order[1:]:
+        if any(count != 1 for count in provided[id(node)]):
+            raise Exception('Every argument of a node should be provided exactly once by the plan.')
+
+    return [
+        CompiledStep(
+            node.component.execute_component(),
+            slots[id(node)],
+            tuple(node.global_map.items()),
+            tuple((slots[id(out_node)], arg_nr) for out_node, arg_nr in node.out_nodes)
+        )
+        for node in order
+    ]
+
+
+class CompiledScheduler:
+    """Scheduler that compiles the plan once and executes it as a tight loop over the compiled steps.
+
+    Avoids the queue, the set of queued nodes and the argument array allocations of the sequential scheduler,
+    while executing the nodes in a valid order of the same plan.
+
+    Attributes:
+        start_node (INode): INode representing the initial input node, starting point of the graph.
+        program ([CompiledStep]): compiled steps of the plan in execution order.
+    """
+
+    def __init__(self, start_node):
+        """Inits CompiledScheduler by compiling the plan of the starting node.
+
+        Args:
+            start_node (INode): INode representing the initial input node, starting point of the graph.
+        """
+        self.start_node = start_node
+        self.program = compile_plan(start_node)
+
+    def schedule_graph(self, inputs, global_readonly):
+        """Executes an iteration on the compiled plan.
+
+        Args:
+            inputs ([object]): list of objects passed to the starting node to start an iteration.
+            global_readonly (dict[str, object]): list of objects that can be used by all nodes,
+                should never modify (use as readonly).
+        """
+        # Assign inputs to initial/start node.
+        start_arguments = self.program[0].arguments
+        for i, node_input in enumerate(inputs):
+            start_arguments[i] = node_input
+
+        for function, arguments, global_bindings, out_bindings in self.program:
+            for key, arg_nr in global_bindings:
+                arguments[arg_nr] = global_readonly.get(key)
+
+            out = function(*arguments)
+
+            # Empty the argument slots, so the objects of this iteration are not kept alive until the next one.
+            arguments[:] = [None] * len(arguments)
+
+            # Write the output directly into the argument slots of the next layer.
+            for out_arguments, arg_nr in out_bindings:
+                out_arguments[arg_nr] = out
+
+    def shutdown(self):
+        """Releases the resources of the scheduler, the compiled scheduler holds none."""
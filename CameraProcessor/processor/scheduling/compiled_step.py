@@ -0,0 +1,22 @@
+"""Defines a single step of a compiled plan.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from typing import NamedTuple
+
+
+class CompiledStep(NamedTuple):
+    """A single node of a compiled plan.
+
+    Attributes:
+        function (func): work function of the component of the node.
+        arguments (list): preallocated argument slots of the work function, reused every iteration.
+        global_bindings (tuple): tuples of global name and argument index to fill in before execution.
+        out_bindings (tuple): tuples of the argument slots of a later step and the index to put the output in.
+    """
+    function: object
+    arguments: list
+    global_bindings: tuple
+    out_bindings: tuple
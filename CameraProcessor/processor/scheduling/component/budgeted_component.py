@@ -0,0 +1,50 @@
+"""Component running another component within the latency budget of a frame.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.scheduling.component.i_component import IComponent
+
+
+class BudgetedComponent(IComponent):
+    """Component reporting the cost of another component to a frame budget, skipping it when it is optional and late.
+
+    Attributes:
+        stage (str): Name of the stage the component performs.
+        component (IComponent): The wrapped component.
+        frame_budget (FrameBudget): Budget the cost is reported to.
+        optional (bool): Whether the component may be skipped.
+        default_argument (int): Index of the argument that is output when skipped, None outputs None.
+        inline (bool): whether a concurrent scheduler has to run the function on its own thread, as the wrapped one.
+    """
+    def __init__(self, stage, component, frame_budget, optional=False, default_argument=None):
+        """Inits BudgetedComponent.
+
+        Args:
+            stage (str): Name of the stage the component performs.
+            component (IComponent): The component to wrap.
+            frame_budget (FrameBudget): Budget the cost is reported to.
+            optional (bool): Whether the component may be skipped.
+            default_argument (int): Index of the argument that is output when skipped, None outputs None.
+        """
+        self.stage = stage
+        self.component = component
+        self.frame_budget = frame_budget
+        self.optional = optional
+        self.default_argument = default_argument
+        self.inline = getattr(component, 'inline', False)
+
+    def execute_component(self):
+        """See base class."""
+        return self.__run
+
+    def __run(self, *arguments):
+        """Runs the wrapped component on the given inputs within the frame budget.
+
+        Returns:
+            object: Output of the wrapped component, or the default argument when skipped.
+        """
+        default = None if self.default_argument is None else arguments[self.default_argument]
+        return self.frame_budget.run(self.stage, self.component.execute_component(), arguments,
+                                     default=default, optional=self.optional)
@@ -8,14 +8,21 @@ from processor.scheduling.component.i_component import IComponent
 
 
 class FuncCallComponent(IComponent):
-    """Component that holds a single function that can be run by the Scheduler."""
-    def __init__(self, func):
+    """Component that holds a single function that can be run by the Scheduler.
+
+    Attributes:
+        inline (bool): whether a concurrent scheduler has to run the function on its own thread.
+    """
+    def __init__(self, func, inline=False):
         """Inits FuncCallComponent.
 
         Args:
             func (function): function to pass to scheduler.
+            inline (bool): whether a concurrent scheduler has to run the function on its own thread,
+                needed when the function uses the asyncio event loop.
         """
         self.__func = func
+        self.inline = inline
 
     def execute_component(self):
         """See base class."""
@@ -0,0 +1,157 @@
+"""Defines the concurrent scheduler class, which executes independent nodes at the same time using a pool.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def run_component(component, arguments):
+    """Executes the work function of a component on a worker of the pool.
+
+    Args:
+        component (IComponent): component to execute.
+        arguments (tuple): arguments to call the work function of the component with.
+
+    Returns:
+        object: output of the component.
+    """
+    return component.execute_component()(*arguments)
+
+
+def create_executor(executor_type, workers=None):
+    """Creates the pool used by the concurrent scheduler.
+
+    Args:
+        executor_type (str): type of the pool, only thread is supported.
+        workers (int): maximum amount of workers in the pool, None uses the default of the pool.
+
+    Returns:
+        concurrent.futures.Executor: the created pool.
+
+    Raises:
+        NameError: the executor type is unknown.
+    """
+    executor_type = executor_type.lower()
+
+    if executor_type == 'thread':
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scheduler')
+
+    raise NameError(f'Executor type "{executor_type}" is unknown')
+
+
+class ConcurrentScheduler:
+    """Scheduler that sends all nodes that are ready at the same time to a pool to execute them concurrently.
+
+    The output of a node is only passed to the next layer after its component has finished,
+    so downstream nodes are notified in the thread calling schedule_graph and never run before their inputs are done.
+
+    Components with an attribute inline set to True are executed on the thread calling schedule_graph,
+    which is necessary for components that use the asyncio event loop, such as sending websocket messages.
+
+    Only thread pools are used, since a process pool would pickle the components for every execution
+    and lose the state they change, such as the tracker and the re-identification data.
+
+    Attributes:
+        start_node (INode): INode representing the initial input node, starting point of the graph.
+        executor (concurrent.futures.Executor): pool executing the components.
+    """
+
+    def __init__(self, start_node, executor):
+        """Inits ConcurrentScheduler with a starting node that contains the graph and the pool to execute it with.
+
+        Args:
+            start_node (INode): INode representing the initial input node, starting point of the graph.
+            executor (concurrent.futures.Executor): pool executing the components.
+        """
+        self.start_node = start_node
+        self.executor = executor
+
+        self.__ready = []
+        self.__queued = set()
+
+    def schedule_graph(self, inputs, global_readonly):
+        """Executes an iteration on the graph.
+
+        Assigns the input object to the start node and starts the iteration with the start node.
+        Submits all ready nodes to the pool and waits until any of them completes,
+        after which its output is passed to the next layer, until no nodes are running anymore.
+
+        Args:
+            inputs ([object]): list of objects passed to the starting node to start an iteration.
+            global_readonly (dict[str, object]): list of objects that can be used by all nodes,
+                should never modify (use as readonly).
+
+        Raises:
+            Exception: a node was pushed while it wasn't executable, or a component raised an exception.
+        """
+        self.__queued = set()
+        self.__ready = []
+
+        # Assign inputs to initial/start node.
+        for i, node_input in enumerate(inputs):
+            self.start_node.assign(node_input, i)
+
+        self.push(self.start_node)
+
+        # Futures of components that are running, mapped to their node.
+        running = {}
+
+        while self.__ready or running:
+            ready_nodes, self.__ready = self.__ready, []
+
+            for node in ready_nodes:
+                if not node.executable():
+                    raise Exception('Node in queue should be executable.')
+
+                arguments = node.prepare_arguments(global_readonly)
+
+                # Inline components run right away, their output is passed on in the same way.
+                if getattr(node.component, 'inline', False):
+                    node.propagate(run_component(node.component, arguments), self.notify)
+                else:
+                    running[self.executor.submit(run_component, node.component, arguments)] = node
+
+            # Nothing left to wait on, inline components may have notified new nodes.
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            # Join the results and notify the next layer.
+            for future in done:
+                node = running.pop(future)
+                node.propagate(future.result(), self.notify)
+
+    def notify(self, ready_nodes):
+        """Marks nodes as ready to be executed.
+
+        Args:
+            ready_nodes ([INode]): nodes to execute.
+        """
+        for node in ready_nodes:
+            self.push(node)
+
+    def push(self, node):
+        """Mark node as ready when it hasn't been marked yet in the current iteration.
+
+        Args:
+            node (INode): node to execute when it is its first occurrence this iteration.
+        """
+        if id(node) not in self.__queued:
+            self.__ready.append(node)
+            self.__queued.add(id(node))
+
+    def shutdown(self):
+        """Shuts down the pool, waiting on running components."""
+        self.executor.shutdown(wait=True)
+
+    @property
+    def queue_size(self):
+        """Get the amount of nodes ready to be executed.
+
+        Returns:
+            int: amount of nodes ready to be executed.
+        """
+        return len(self.__ready)
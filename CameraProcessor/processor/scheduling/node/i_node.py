@@ -54,6 +54,35 @@ class INode:
         """
         raise NotImplementedError('Function should execute the associated internal component.')
 
+    def prepare_arguments(self, global_readonly):
+        """Fills in the globals and returns the arguments to execute the component with.
+
+        Used by schedulers that execute the component elsewhere, for example on a worker of a pool.
+
+        Args:
+            global_readonly ([object]): list of objects that can be used by all nodes,
+                should never modify (use as readonly).
+
+        Raises:
+            NotImplementedError: occurs when this method is not overridden
+                to ensure this function is defined.
+        """
+        raise NotImplementedError('Function to prepare the arguments of the component not implemented.')
+
+    def propagate(self, out, notify):
+        """Pass the output of a component executed elsewhere to the next layer.
+
+        Args:
+            out (object): output of the component.
+            notify (Callable[[List[INode]], None]): function to pass nodes to that can
+                be executed after the component was executed.
+
+        Raises:
+            NotImplementedError: occurs when this method is not overridden
+                to ensure this function is defined.
+        """
+        raise NotImplementedError('Function to pass the output of the component to the next layer not implemented.')
+
     def assign(self, arg, arg_nr):
         """Store argument for later component execution.
 
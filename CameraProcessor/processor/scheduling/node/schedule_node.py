@@ -49,8 +49,8 @@ class ScheduleNode(INode):
         # Arguments necessary before run is input count of component work function minus available used globals.
         self.__needed_args = self.input_count - len(self.global_map)
 
-        # Keeping the numpy array and only emptying would be preferred.
-        self.__arguments = np.empty(self.input_count, dtype=object)
+        # Keep the numpy array and only empty it, preventing an allocation every iteration.
+        self.__arguments.fill(None)
 
     def executable(self):
         """Checks whether all arguments needed for execution are provided.
@@ -77,6 +77,24 @@ class ScheduleNode(INode):
             global_readonly (dict[str, object]): list of objects that can be used by all nodes,
                 should never modify (use as readonly).
 
+        Raises:
+            Exception: node is not ready to execute.
+        """
+        # Fold arguments into components work function and receive component output.
+        out = self.component.execute_component()(*self.prepare_arguments(global_readonly))
+
+        self.propagate(out, notify)
+
+    def prepare_arguments(self, global_readonly):
+        """Fills in the globals used by the component and returns all arguments to execute the component with.
+
+        Args:
+            global_readonly (dict[str, object]): list of objects that can be used by all nodes,
+                should never modify (use as readonly).
+
+        Returns:
+            tuple: arguments to call the work function of the component with.
+
         Raises:
             Exception: node is not ready to execute.
         """
@@ -87,9 +105,16 @@ class ScheduleNode(INode):
             if key in global_readonly.keys():
                 self.__arguments[arg_nr] = global_readonly[key]
 
-        # Fold arguments into components work function and receive component output.
-        out = self.component.execute_component()(*self.__arguments)
+        return tuple(self.__arguments)
 
+    def propagate(self, out, notify):
+        """Passes the output of the component to the next layer, notifies the scheduler and resets the node.
+
+        Args:
+            out (object): output of the component.
+            notify (Callable[[List[INode]], None]): function to pass nodes to that can be
+                executed after the component was executed.
+        """
         ready_nodes = []
 
         # Assign output of component to all nodes in the next layer.
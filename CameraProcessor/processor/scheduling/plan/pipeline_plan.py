@@ -24,61 +24,112 @@ plan_globals = {
 }
 
 
-def create_plan(plan_args):
+# Stages of the pipeline in order, every stage needs the stages before it.
+pipeline_stages = ['detection', 'tracking', 're-identification']
+
+# Built-in plans, mapped to the stages they contain.
+plans = {
+    'detect': ['detection'],
+    'detect_track': ['detection', 'tracking'],
+    'full': pipeline_stages
+}
+
+
+def parse_plan(plan):
+    """Gets the stages of a built-in plan, or of a plan declared as a comma separated list of stages.
+
+    Args:
+        plan (str): Name of a built-in plan, or stages separated by commas, for example "detection, tracking".
+
+    Returns:
+        [str]: The stages of the plan in order.
+
+    Raises:
+        NameError: The plan is unknown, or its stages are not the first stages of the pipeline.
+    """
+    if plan.lower() in plans:
+        return list(plans[plan.lower()])
+
+    stages = [stage.strip().lower() for stage in plan.split(',') if stage.strip() != '']
+
+    if len(stages) == 0 or stages != pipeline_stages[:len(stages)]:
+        raise NameError(f'Plan "{plan}" is unknown, use one of {list(plans.keys())} '
+                        f'or the first stages of {pipeline_stages} separated by commas')
+
+    return stages
+
+
+def create_plan(plan_args, stages=None):
     """Create a plan using the configuration for the entire pipeline.
 
+    Stages left out of the plan are not part of the graph, the function node receives the output of the last stage
+    in the plan in their place. The frame buffer is only part of the graph when re-identification is.
+
     Args:
         plan_args (dict[str, obj]): Dictionary containing every argument based on the name.
+        stages ([str]): Stages in the plan, see parse_plan, None uses all stages.
 
     Returns:
         ScheduleNode: the starting node of the plan.
     """
+    stages = pipeline_stages if stages is None else stages
+
     # Final node executing a function that takes all previous component outputs as input.
+    # The function may send websocket messages, so it is executed on the thread of the scheduler.
     func_node = ScheduleNode(
         4,
         [],
-        FuncCallComponent(plan_args['func']),
+        FuncCallComponent(plan_args['func'], inline=True),
         {
             'frame_obj': 0
         }
     )
 
-    # Frame buffer node storing frame with all information gathered from re-id stage.
-    frame_buffer_node = ScheduleNode(
-        2,
-        [],
-        plan_args['frame_buffer'],
-        {
-            'frame_obj': 0
-        }
-    )
+    # Outputs of a stage that is left out are taken over by the last stage in the plan.
+    if 're-identification' in stages:
+        # Frame buffer node storing frame with all information gathered from re-id stage.
+        frame_buffer_node = ScheduleNode(
+            2,
+            [],
+            plan_args['frame_buffer'],
+            {
+                'frame_obj': 0
+            }
+        )
 
-    # Node that executes re-identification.
-    re_id_node = ScheduleNode(
-        3,
-        [(frame_buffer_node, 1), (func_node, 3)],
-        plan_args['re_identifier'],
-        {
-            'frame_obj': 0,
-            're_id_data': 2
-        }
-    )
+        # Node that executes re-identification.
+        re_id_node = ScheduleNode(
+            3,
+            [(frame_buffer_node, 1), (func_node, 3)],
+            plan_args['re_identifier'],
+            {
+                'frame_obj': 0,
+                're_id_data': 2
+            }
+        )
+        tracker_out_nodes = [(func_node, 2), (re_id_node, 1)]
+    else:
+        tracker_out_nodes = [(func_node, 2), (func_node, 3)]
 
-    # Node that executes tracking.
-    tracker_node = ScheduleNode(
-        3,
-        [(func_node, 2), (re_id_node, 1)],
-        plan_args['tracker'],
-        {
-            'frame_obj': 0,
-            're_id_data': 2
-        }
-    )
+    if 'tracking' in stages:
+        # Node that executes tracking.
+        tracker_node = ScheduleNode(
+            3,
+            tracker_out_nodes,
+            plan_args['tracker'],
+            {
+                'frame_obj': 0,
+                're_id_data': 2
+            }
+        )
+        detection_out_nodes = [(tracker_node, 1), (func_node, 1)]
+    else:
+        detection_out_nodes = [(func_node, 1), (func_node, 2), (func_node, 3)]
 
     # Node that executes detection.
     detection_node = ScheduleNode(
         1,
-        [(tracker_node, 1), (func_node, 1)],
+        detection_out_nodes,
         plan_args['detector'],
         {
             'frame_obj': 0
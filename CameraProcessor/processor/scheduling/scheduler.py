@@ -75,6 +75,9 @@ class Scheduler:
             self.__queue.put(node)
             self.__queued.add(id(node))
 
+    def shutdown(self):
+        """Releases the resources of the scheduler, the sequential scheduler holds none."""
+
     @property
     def queue_size(self):
         """Get the size of the queue.
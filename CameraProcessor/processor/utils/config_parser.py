@@ -49,10 +49,10 @@ class ConfigParser:
         self.__convert_paths_to_absolute()
 
     def __convert_paths_to_absolute(self):
-        """Converts keys that end with path to absolute paths."""
+        """Converts keys that end with path to absolute paths, empty paths stay empty to disable what they configure."""
         for section in self.configs:
             for section_key in self.configs[section]:
-                if section_key.endswith('path'):
+                if section_key.endswith('path') and self.configs[section][section_key] != '':
                     self.configs[section][section_key] = \
                         os.path.realpath(os.path.join(self.root_path, self.configs[section][section_key]))
 
@@ -102,6 +102,11 @@ class ConfigParser:
             logging.info('Environment variable: HLS_STREAM_URL used.')
             self.configs['Input']['hls_url'] = hls_stream_url
 
+        cameras = os.getenv('CAMERAS')
+        if cameras is not None:
+            logging.info('Environment variable: CAMERAS used.')
+            self.configs['Input']['cameras'] = cameras
+
     @staticmethod
     def __parse_int_tuple(item):
         """Converter for parsing a tuple.
@@ -0,0 +1,134 @@
+"""Contains the Supervisor class, which forks a worker process per camera and restarts crashed workers.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import time
+import signal
+import logging
+import multiprocessing
+
+
+class Supervisor:
+    """Forks a worker process per camera and restarts the workers that crashed.
+
+    The workers are forked, so everything loaded before starting the supervisor,
+    like the weights of the models, is shared copy-on-write instead of loaded by every worker.
+    A forked worker only gets the thread that forked it, so thread pools (like the OpenMP pool of torch) and CUDA
+    contexts should not be started before the workers are forked, the workers start their own.
+    A worker that exits with exit code 0 finished its stream and is not restarted.
+
+    Attributes:
+        target (func): Function run by a worker, called with the id and HLS url of its camera.
+        camera_urls ([(str, str)]): Id and HLS url of every camera.
+        restart_delay (float): Seconds waited before a crashed worker is restarted.
+        max_restarts (int): Maximum amount of restarts of a camera, negative restarts forever.
+        poll_interval (float): Seconds between checks of the workers.
+        restarts (dict[str, int]): Amount of restarts of every camera.
+
+        __context (multiprocessing.context.BaseContext): Context forking the workers.
+        __workers (dict[str, multiprocessing.Process]): Running worker of every camera.
+        __restart_times (dict[str, float]): Time at which a crashed camera is restarted.
+    """
+    def __init__(self, target, camera_urls, restart_delay=5., max_restarts=-1, poll_interval=1.):
+        """Inits the supervisor without starting the workers.
+
+        Args:
+            target (func): Function run by a worker, called with the id and HLS url of its camera.
+            camera_urls ([(str, str)]): Id and HLS url of every camera.
+            restart_delay (float): Seconds waited before a crashed worker is restarted.
+            max_restarts (int): Maximum amount of restarts of a camera, negative restarts forever.
+            poll_interval (float): Seconds between checks of the workers.
+        """
+        self.target = target
+        self.camera_urls = dict(camera_urls)
+        self.restart_delay = restart_delay
+        self.max_restarts = max_restarts
+        self.poll_interval = poll_interval
+        self.restarts = {camera_id: 0 for camera_id in self.camera_urls}
+
+        self.__context = multiprocessing.get_context('fork')
+        self.__workers = {}
+        self.__restart_times = {}
+
+    def start(self):
+        """Forks a worker for every camera."""
+        for camera_id in self.camera_urls:
+            self.__start_worker(camera_id)
+
+    def poll(self):
+        """Checks the workers, restarting the crashed workers once their restart delay passed.
+
+        Returns:
+            bool: Whether there are workers running or waiting to be restarted.
+        """
+        for camera_id, worker in list(self.__workers.items()):
+            if worker.is_alive():
+                continue
+
+            worker.join()
+            del self.__workers[camera_id]
+
+            if worker.exitcode == 0:
+                logging.info(f'Worker of camera {camera_id} finished')
+            elif 0 <= self.max_restarts <= self.restarts[camera_id]:
+                logging.error(f'Worker of camera {camera_id} crashed with exit code {worker.exitcode}, '
+                              f'giving up after {self.restarts[camera_id]} restarts')
+            else:
+                logging.warning(f'Worker of camera {camera_id} crashed with exit code {worker.exitcode}, '
+                                f'restarting in {self.restart_delay} seconds')
+                self.__restart_times[camera_id] = time.time() + self.restart_delay
+
+        for camera_id, restart_time in list(self.__restart_times.items()):
+            if time.time() >= restart_time:
+                del self.__restart_times[camera_id]
+                self.restarts[camera_id] += 1
+                self.__start_worker(camera_id)
+
+        return len(self.__workers) > 0 or len(self.__restart_times) > 0
+
+    def run(self):
+        """Starts the workers and supervises them until all finished, stopping them when interrupted."""
+        self.start()
+
+        try:
+            while self.poll():
+                time.sleep(self.poll_interval)
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Terminates all workers and cancels pending restarts."""
+        self.__restart_times = {}
+
+        for worker in self.__workers.values():
+            worker.terminate()
+        for worker in self.__workers.values():
+            worker.join()
+
+        self.__workers = {}
+
+    def __start_worker(self, camera_id):
+        """Forks the worker of a camera.
+
+        Args:
+            camera_id (str): Id of the camera.
+        """
+        worker = self.__context.Process(target=self.__run_target, args=(camera_id, self.camera_urls[camera_id]),
+                                        name=f'worker {camera_id}', daemon=True)
+        worker.start()
+        self.__workers[camera_id] = worker
+        logging.info(f'Started worker of camera {camera_id} with pid {worker.pid}')
+
+    def __run_target(self, camera_id, hls_url):
+        """Runs the target inside the worker.
+
+        Args:
+            camera_id (str): Id of the camera.
+            hls_url (str): Url of the HLS stream of the camera.
+        """
+        # The signal handlers of the supervisor are inherited by the fork, the worker should just terminate.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        self.target(camera_id, hls_url)
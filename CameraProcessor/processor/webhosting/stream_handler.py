@@ -9,11 +9,11 @@ import time
 import logging
 import tornado.web
 import tornado.gen
-import cv2
+import tornado.ioloop
 
-import processor.utils.display as display
+from processor.output.mjpeg_sink import MjpegSink
 from processor.pipeline.process_frames import process_stream
-from processor.pipeline.prepare_pipeline import prepare_objects
+from processor.pipeline.prepare_pipeline import prepare_objects, prepare_output
 
 # Tornado example gotten from: https://github.com/wildfios/Tornado-mjpeg-streamer-python.
 # Combined with: https://github.com/wildfios/Tornado-mjpeg-streamer-python/issues/7.
@@ -53,35 +53,26 @@ class StreamHandler(tornado.web.RequestHandler):
         # Every .1 seconds the buffer gets flushed.
         self.__flush_interval = .1
 
+        # The tiled image is drawn and encoded by the sink, which hands it back to the IOLoop to write.
+        output = prepare_output(self.configs, {'stream': MjpegSink(tornado.ioloop.IOLoop.current(),
+                                                                   self.__write_image)})
+
         # Get the objects needed for process_stream and starts the function.
         capture, detector, tracker, re_identifier, _ = prepare_objects(self.configs)
-        yield process_stream(capture, detector, tracker, re_identifier, self.__frame_processed, None)
+        yield process_stream(capture, detector, tracker, re_identifier, output, None)
 
-        # Close capture and send response.
+        # Close capture, let the IOLoop write the last encoded images and send response.
         capture.close()
+        output.close()
+        yield tornado.gen.moment
         self.finish()
 
-    def __frame_processed(self, frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes):
-        """When the frame got processed, this function gets called to put it in the buffer.
+    def __write_image(self, img):
+        """When the tiled image of a processed frame got encoded, this function gets called to put it in the buffer.
 
         Args:
-            frame_obj (FrameObj): Frame object containing the frame.
-            detected_boxes (BoundingBoxes): Boxes generated by the detection.
-            tracked_boxes (BoundingBoxes): The tracked boxes from the frame processing loop.
-            re_id_tracked_boxes (BoundingBoxes): Boxes where re-id is performed after tracking.
+            img (bytes): The tiled image encoded as JPEG.
         """
-
-        img_tile = display.generate_tiled_image(frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes)
-
-        # Encode the frame to jpg format.
-        ret, jpeg = cv2.imencode('.jpg', img_tile)
-
-        # Frame was not retrieved.
-        if not ret:
-            return
-
-        img = jpeg.tobytes()
-
         # Write to the buffer.
         try:
             self.write('--jpgboundary')
@@ -0,0 +1,79 @@
+"""Contains DemandMessage class which holds how much the output of the processor is needed.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from processor.websocket.i_message import IMessage
+
+
+class DemandMessage(IMessage):
+    """DemandMessage class that stores the demand of the camera, computed by the orchestrator."""
+    def __init__(self, demand):
+        """Constructor for the DemandMessage class.
+
+        Args:
+            demand (int): Amount of clients watching the camera plus the amount of objects being tracked.
+
+        Raises:
+            TypeError: Demand has to be an integer.
+        """
+        if not isinstance(demand, int):
+            raise TypeError('Demand should be an integer')
+
+        self.__demand = demand
+
+    @staticmethod
+    def from_message(message):
+        """Converts a python dict representation of the message to a DemandMessage.
+
+        Args:
+            message (dict): Python dict representation of an incoming JSON message.
+
+        Returns:
+            (DemandMessage): DemandMessage constructed from the dict.
+        """
+        if 'demand' not in message.keys():
+            raise KeyError('demand missing')
+
+        return DemandMessage(message['demand'])
+
+    def to_message(self):
+        """Converts the DemandMessage to a dict representation.
+
+        Returns:
+            (dict): Python dict representation of the message.
+        """
+        return {
+            'type': 'demand',
+            'demand': self.__demand
+        }
+
+    @property
+    def demand(self):
+        """Get the demand.
+
+        Returns:
+            (int): Demand of the camera, zero if nothing needs the output of the processor.
+        """
+        return self.__demand
+
+    def __eq__(self, other):
+        """Function that checks whether the current DemandMessage is the same as the given one.
+
+        Args:
+            other (DemandMessage): DemandMessage to compare with.
+
+        Returns:
+            bool: Whether the messages are the same.
+        """
+        return self.__demand == other.demand
+
+    def __repr__(self):
+        """Converts the DemandMessage to a string.
+
+        Returns:
+            str: String representation of a DemandMessage.
+        """
+        return f'DemandMessage(demand: {self.__demand})'
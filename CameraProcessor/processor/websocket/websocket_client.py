@@ -15,6 +15,7 @@ from tornado import websocket
 from processor.websocket.start_message import StartMessage
 from processor.websocket.stop_message import StopMessage
 from processor.websocket.update_message import UpdateMessage
+from processor.websocket.demand_message import DemandMessage
 from processor.utils.authentication import get_token
 
 
@@ -31,6 +32,7 @@ class WebsocketClient:
         write_queue ([str]): Stores messages that could not be sent due to a closed socket.
         message_queue (Queue): Stores commands sent from orchestrator.
         identifier (str): Identifier of the camera processor for the orchestrator.
+        demand (int): Demand of the camera sent by the orchestrator, None until the orchestrator sent it.
     """
 
     def __init__(self, websocket_url, identifier=None):
@@ -47,6 +49,7 @@ class WebsocketClient:
         self.write_queue = []
         self.message_queue = deque()
         self.identifier = identifier
+        self.demand = None
 
     async def connect(self):
         """Connect to the websocket url asynchronously.
@@ -233,7 +236,8 @@ class WebsocketClient:
             class_dict = {
                 'start': StartMessage,
                 'stop': StopMessage,
-                'featureMap': UpdateMessage
+                'featureMap': UpdateMessage,
+                'demand': DemandMessage
             }
 
             # Each API message must contain a type.
@@ -249,8 +253,12 @@ class WebsocketClient:
             # Create command from websocket message.
             command = class_dict[msg_type].from_message(message_object)
 
+            # Apply the demand directly, so a processor that is not processing frames resumes immediately.
+            if isinstance(command, DemandMessage):
+                self.demand = command.demand
             # Append it to the message queue.
-            self.message_queue.append(command)
+            else:
+                self.message_queue.append(command)
             logging.info(f'Received message: {str(command)}')
 
         # Catch exceptions that can occur whilst converting message to an object.
@@ -278,3 +286,16 @@ class WebsocketClient:
             asyncio.get_running_loop().create_task(self.__write_message(json_message))
         except RuntimeError:
             return
+
+    def send_json_threadsafe(self, json_message, loop):
+        """Sends a serialized message from a thread other than the one running the event loop of the client.
+
+        Args:
+            json_message (str): JSON of the message to be sent.
+            loop (asyncio.AbstractEventLoop): Event loop the client runs on.
+        """
+        try:
+            asyncio.run_coroutine_threadsafe(self.__write_message(json_message), loop)
+        # The event loop was closed.
+        except RuntimeError:
+            return
@@ -0,0 +1,180 @@
+"""Tests the backpressure capture and its drop policies.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+import asyncio
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from processor.input.i_capture import FRAME_WAIT_TIMEOUT
+from processor.input.backpressure_capture import BackpressureCapture
+
+
+def read_all(capture, processing_time=0.0):
+    """Reads all frames from the capture, simulating a pipeline that takes a fixed time per frame.
+
+    While no new frame is ready, the next frame is waited for.
+
+    Args:
+        capture (ICapture): The capture to read.
+        processing_time (float): Seconds spent on every returned frame.
+
+    Returns:
+        [FrameObj]: All returned frames.
+    """
+    frames = []
+    while capture.opened():
+        ret, frame_obj = capture.get_next_frame()
+        if ret:
+            frames.append(frame_obj)
+            time.sleep(processing_time)
+        else:
+            capture.wait_for_frame(FRAME_WAIT_TIMEOUT)
+    return frames
+
+
+class TestBackpressureCapture:
+    """Tests the drop policies of the backpressure capture."""
+    def test_no_policy_returns_all(self):
+        """Tests whether all frames are returned without a drop policy."""
+        capture = BackpressureCapture(FakeCapture(10))
+        frames = read_all(capture)
+        capture.close()
+
+        assert len(frames) == 10
+        assert capture.frames_read == 10
+        assert capture.frames_dropped == 0
+
+    def test_nth_policy(self):
+        """Tests whether every nth frame is dropped."""
+        capture = BackpressureCapture(FakeCapture(10), 'nth', drop_interval=3)
+        frames = read_all(capture)
+        capture.close()
+
+        # Frames 3, 6 and 9 are dropped.
+        assert [frame_obj.timestamp * 100 for frame_obj in frames] == pytest.approx([0, 1, 3, 4, 6, 7, 9])
+        assert capture.frames_dropped == 3
+        assert capture.frames_returned == 7
+
+    @pytest.mark.timeout(10)
+    def test_nth_policy_skips_decoding(self):
+        """Tests whether frames dropped by the nth policy are skipped without decoding them."""
+        fake_capture = FakeCapture(30)
+        capture = BackpressureCapture(fake_capture, 'nth', drop_interval=3)
+        read_all(capture)
+        capture.close()
+
+        assert capture.frames_skipped == capture.frames_dropped == fake_capture.frames_skipped == 10
+
+    def test_rate_policy(self):
+        """Tests whether the rate policy returns every fifth frame of a 25 fps video at 5 fps, decoding no others."""
+        fake_capture = FakeCapture(100, fps=25)
+        capture = BackpressureCapture(fake_capture, 'rate', fps=25, target_fps=5)
+        frames = read_all(capture)
+        capture.close()
+
+        assert [round(frame_obj.timestamp * 25) for frame_obj in frames] == list(range(0, 100, 5))
+        assert fake_capture.frames_skipped == capture.frames_skipped == 80
+
+    @pytest.mark.timeout(10)
+    def test_rate_policy_realtime(self):
+        """Tests whether the rate policy positions frames by the time they are read without a frame rate."""
+        capture = BackpressureCapture(FakeCapture(50, fps=100, realtime=True), 'rate', target_fps=20)
+        frames = read_all(capture)
+        capture.close()
+
+        # The capture takes 0.5 seconds, so about 10 frames are returned at 20 frames per second.
+        assert 8 <= len(frames) <= 12
+
+    def test_deadline_policy_drops_late_frames(self):
+        """Tests whether frames are dropped when the pipeline is slower than the stream."""
+        capture = BackpressureCapture(FakeCapture(20, fps=100), 'deadline', max_latency=0.02)
+        frames = read_all(capture, processing_time=0.03)
+        capture.close()
+
+        assert capture.frames_dropped > 0
+        assert len(frames) + capture.frames_dropped == 20
+
+    @pytest.mark.timeout(10)
+    def test_deadline_policy_uses_fps(self):
+        """Tests whether the fps is used for captures that timestamp frames when they are read."""
+        capture = BackpressureCapture(FakeCapture(20, fps=1e9), 'deadline', max_latency=0.02, fps=100)
+        read_all(capture, processing_time=0.03)
+        capture.close()
+
+        assert capture.frames_dropped > 0
+
+    def test_deadline_policy_keeps_up(self):
+        """Tests whether no frames are dropped when the pipeline keeps up with the stream."""
+        capture = BackpressureCapture(FakeCapture(10, fps=1), 'deadline', max_latency=0.5)
+        frames = read_all(capture)
+        capture.close()
+
+        assert len(frames) == 10
+
+    @pytest.mark.timeout(10)
+    def test_latest_policy(self):
+        """Tests whether only the most recent frame is returned when the pipeline is slower than the stream."""
+        capture = BackpressureCapture(FakeCapture(30, fps=200, realtime=True), 'latest')
+        frames = read_all(capture, processing_time=0.02)
+        capture.close()
+
+        timestamps = [frame_obj.timestamp for frame_obj in frames]
+        assert capture.frames_dropped > 0
+        assert len(frames) + capture.frames_dropped == capture.frames_read
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.timeout(10)
+    def test_latest_policy_iteration(self):
+        """Tests whether iterating waits for the reading thread and ends when the capture is done."""
+        capture = BackpressureCapture(FakeCapture(20, fps=200, realtime=True), 'latest')
+        frames = list(capture)
+        capture.close()
+
+        assert len(frames) + capture.frames_dropped == capture.frames_read == 20
+
+        # A closed capture has nothing to wait for.
+        start = time.perf_counter()
+        capture.wait_for_frame(1.)
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.timeout(10)
+    def test_latest_policy_honours_timeout(self):
+        """Tests whether the latest policy returns at once without a new frame and waits at most the timeout."""
+        capture = BackpressureCapture(FakeCapture(3, fps=1, realtime=True), 'latest')
+        assert capture.wait_for_frame(1.)
+        assert capture.get_next_frame()[0]
+
+        # The next frame is due after a second.
+        start = time.perf_counter()
+        assert not capture.get_next_frame()[0]
+        assert not capture.wait_for_frame(0.1)
+        assert 0.05 < time.perf_counter() - start < 0.5
+
+        capture.close()
+
+    @pytest.mark.timeout(10)
+    def test_latest_policy_async_iteration(self):
+        """Tests whether asynchronous iteration returns the frames in order."""
+        async def read_async(capture):
+            return [frame_obj async for frame_obj in capture]
+
+        capture = BackpressureCapture(FakeCapture(20, fps=200, realtime=True), 'latest')
+        frames = asyncio.run(read_async(capture))
+        capture.close()
+
+        timestamps = [frame_obj.timestamp for frame_obj in frames]
+        assert len(frames) > 0
+        assert timestamps == sorted(timestamps)
+
+    def test_unknown_policy(self):
+        """Tests whether an unknown policy raises a NameError."""
+        with pytest.raises(NameError):
+            BackpressureCapture(FakeCapture(), 'unknown')
+
+
+if __name__ == '__main__':
+    pytest.main(TestBackpressureCapture)
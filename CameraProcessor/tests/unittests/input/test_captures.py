@@ -6,7 +6,9 @@ Utrecht University within the Software Project course.
 """
 import pytest
 
+from tests.conftest import get_test_configs
 from processor.input.hls_capture import HlsCapture
+from processor.input.video_capture import VideoCapture
 
 
 # pylint: disable=attribute-defined-outside-init
@@ -75,3 +77,15 @@ class TestCaptures:
         # Invalid hls stream url throws exception.
         with pytest.raises(TimeoutError):
             self.capture = HlsCapture('http://181.83.10.9:8001/mjpg/video.mjpg', 2)
+
+    def test_video_timestamps(self):
+        """Checks whether a video capture with video timestamps stamps frames with their position in the video."""
+        self.capture = VideoCapture(get_test_configs()['Yolov5']['source_path'], video_timestamps=True)
+
+        timestamps = []
+        while self.capture.opened():
+            ret, frame_obj = self.capture.get_next_frame()
+            if ret:
+                timestamps.append(frame_obj.timestamp)
+
+        assert timestamps == pytest.approx([frame_nr / self.capture.fps for frame_nr in range(len(timestamps))])
@@ -0,0 +1,77 @@
+"""Tests the pool of keep-alive HTTP connections.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import urllib.error
+import pytest
+
+from tests.unittests.utils.local_http_server import LocalHttpServer
+from processor.input.connection_pool import ConnectionPool
+
+
+@pytest.fixture(name='http_server')
+def fixture_http_server(tmp_path):
+    """Serves a directory with a single file.
+
+    Args:
+        tmp_path (Path): Directory to serve.
+
+    Returns:
+        LocalHttpServer: The server, closed after the test.
+    """
+    (tmp_path / 'segment.ts').write_bytes(b'segment')
+    local_server = LocalHttpServer(tmp_path)
+    yield local_server
+    local_server.close()
+
+
+class TestConnectionPool:
+    """Tests reusing connections."""
+    def test_keep_alive(self, http_server):
+        """Tests whether requests to the same host reuse a single connection.
+
+        Args:
+            http_server (LocalHttpServer): Local server serving the segment.
+        """
+        pool = ConnectionPool()
+        bodies = [pool.get(f'{http_server.url}/segment.ts') for _ in range(5)]
+        pool.close()
+
+        assert bodies == [b'segment'] * 5
+        assert pool.requests == 5
+        assert pool.connections_opened == http_server.connections == 1
+
+    def test_reconnect(self, http_server):
+        """Tests whether a connection closed in the meantime is replaced.
+
+        Args:
+            http_server (LocalHttpServer): Local server serving the segment.
+        """
+        pool = ConnectionPool()
+        pool.get(f'{http_server.url}/segment.ts')
+        pool.close()
+        pool.get(f'{http_server.url}/segment.ts')
+
+        assert pool.connections_opened == http_server.connections == 2
+
+    def test_not_found(self, http_server):
+        """Tests whether an error response raises an HTTPError, without breaking the next request.
+
+        Args:
+            http_server (LocalHttpServer): Local server serving the segment.
+        """
+        pool = ConnectionPool()
+        with pytest.raises(urllib.error.HTTPError):
+            pool.get(f'{http_server.url}/missing.ts')
+        assert pool.get(f'{http_server.url}/segment.ts') == b'segment'
+
+    def test_refused(self):
+        """Tests whether a failing connection raises a ConnectionError."""
+        with pytest.raises(ConnectionError):
+            ConnectionPool(timeout=1).get('http://127.0.0.1:1/segment.ts')
+
+
+if __name__ == '__main__':
+    pytest.main(TestConnectionPool)
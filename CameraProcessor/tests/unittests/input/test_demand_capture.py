@@ -0,0 +1,79 @@
+"""Tests the demand capture lowering the frame rate without demand.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from processor.input.demand_capture import DemandCapture
+
+
+def read_all(capture, demands=None):
+    """Reads all frames from the capture, changing the demand before every read.
+
+    Args:
+        capture (DemandCapture): The capture to read.
+        demands ([int]): Demand before every read, the demand stays unchanged after the list.
+
+    Returns:
+        [float]: Timestamps of the returned frames.
+    """
+    timestamps = []
+    reads = 0
+    while capture.opened():
+        if demands is not None and reads < len(demands):
+            capture.demand = lambda demand=demands[reads]: demand
+        reads += 1
+
+        ret, frame_obj = capture.get_next_frame()
+        if ret:
+            timestamps.append(frame_obj.timestamp)
+    return timestamps
+
+
+class TestDemandCapture:
+    """Tests the demand capture with and without demand."""
+    def test_unknown_demand_returns_all(self):
+        """Tests whether all frames are returned while the orchestrator did not send a demand."""
+        capture = DemandCapture(FakeCapture(10), lambda: None, idle_fps=0)
+
+        assert len(read_all(capture)) == 10
+        assert capture.frames_skipped == 0
+
+    def test_demand_returns_all(self):
+        """Tests whether all frames are returned while there is demand."""
+        capture = DemandCapture(FakeCapture(10), lambda: 1, idle_fps=0)
+
+        assert len(read_all(capture)) == 10
+
+    @pytest.mark.timeout(10)
+    def test_no_demand_pauses(self):
+        """Tests whether no frames are returned without demand when the idle frame rate is zero."""
+        fake_capture = FakeCapture(10)
+        capture = DemandCapture(fake_capture, lambda: 0, idle_fps=0)
+
+        assert len(read_all(capture)) == 0
+        assert capture.frames_skipped == fake_capture.frames_skipped == 10
+
+    @pytest.mark.timeout(10)
+    def test_no_demand_lowers_frame_rate(self):
+        """Tests whether only the idle frame rate is returned without demand."""
+        capture = DemandCapture(FakeCapture(20, fps=100, realtime=True), lambda: 0, idle_fps=10)
+
+        # The capture takes 0.2 seconds, so about 2 frames are returned at 10 frames per second.
+        assert 1 <= len(read_all(capture)) <= 3
+
+    @pytest.mark.timeout(10)
+    def test_resumes_immediately(self):
+        """Tests whether the frame read right after the demand returns is returned."""
+        capture = DemandCapture(FakeCapture(10, fps=100), lambda: 0, idle_fps=0)
+        timestamps = read_all(capture, [0, 0, 0, 0, 0, 1])
+
+        assert timestamps[0] * 100 == pytest.approx(5)
+        assert len(timestamps) == 5
+
+
+if __name__ == '__main__':
+    pytest.main(TestDemandCapture)
@@ -0,0 +1,61 @@
+"""Tests the ffmpeg capture and the ownership of its buffers.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from tests.conftest import get_test_configs
+from processor.input.ffmpeg_capture import FfmpegCapture
+
+
+def get_video_path():
+    """Get the path to a video.
+
+    Returns:
+        str: File path to the video.
+    """
+    return get_test_configs()['Yolov5']['source_path']
+
+
+class TestFfmpegCapture:
+    """Tests decoding a video into the ring of buffers."""
+    @pytest.mark.timeout(60)
+    def test_frames(self):
+        """Tests whether the frames have the size of the video and increasing timestamps."""
+        capture = FfmpegCapture(get_video_path(), buffers=4)
+        frames = list(capture)
+        capture.close()
+
+        timestamps = [frame_obj.timestamp for frame_obj in frames]
+        assert len(frames) > 0
+        assert all(frame_obj.shape == (capture.width, capture.height) for frame_obj in frames)
+        assert timestamps == sorted(set(timestamps))
+
+    @pytest.mark.timeout(60)
+    def test_owned_frames_are_kept(self):
+        """Tests whether frames held by the pipeline are not overwritten, dropping new frames instead."""
+        capture = FfmpegCapture(get_video_path(), buffers=3)
+        held = []
+        for frame_obj in capture:
+            held.append((frame_obj, frame_obj.frame.copy()))
+        capture.close()
+
+        assert capture.frames_dropped > 0
+        assert capture.buffers_owned == len(held) <= 3
+        assert all((frame_obj.frame == copy).all() for frame_obj, copy in held)
+
+    @pytest.mark.timeout(60)
+    def test_released_frames_are_reused(self):
+        """Tests whether a buffer returns to the ring when the frame is not used anymore."""
+        capture = FfmpegCapture(get_video_path(), buffers=3)
+        nr_frames = sum(1 for _ in capture)
+        capture.close()
+
+        assert nr_frames > 3
+        assert capture.buffers_owned == 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestFfmpegCapture)
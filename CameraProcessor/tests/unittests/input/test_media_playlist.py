@@ -0,0 +1,67 @@
+"""Tests parsing HLS media playlists.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.input.media_playlist import MediaPlaylist, resolve_url
+
+# Live media playlist as published by the video forwarder.
+LIVE_PLAYLIST = '\n'.join([
+    '#EXTM3U',
+    '#EXT-X-VERSION:3',
+    '#EXT-X-TARGETDURATION:2',
+    '#EXT-X-MEDIA-SEQUENCE:41',
+    '#EXTINF:2.000000,',
+    'stream_V0_41.ts',
+    '#EXTINF:2.000000,',
+    'stream_V0_42.ts',
+    '#EXTINF:1.500000,',
+    'stream_V0_43.ts'
+]) + '\n'
+
+
+class TestMediaPlaylist:
+    """Tests parsing the segments of a media playlist."""
+    def test_live_playlist(self):
+        """Tests whether the segments are numbered from the media sequence and resolved against the playlist."""
+        playlist = MediaPlaylist.parse('https://host/1/stream_V0.m3u8?Bearer=token', LIVE_PLAYLIST)
+
+        assert playlist.target_duration == 2
+        assert not playlist.ended
+        assert [(sequence, duration) for sequence, _, duration, _ in playlist.segments] == \
+               [(41, 2.), (42, 2.), (43, 1.5)]
+        assert playlist.segments[0][1] == 'https://host/1/stream_V0_41.ts?Bearer=token'
+        assert all(program_date_time is None for *_, program_date_time in playlist.segments)
+
+    def test_program_date_time(self):
+        """Tests whether segments without a program date time continue from the previous segment."""
+        playlist = MediaPlaylist.parse('http://host/stream.m3u8', LIVE_PLAYLIST.replace(
+            '#EXTINF:2.000000,\nstream_V0_41.ts',
+            '#EXT-X-PROGRAM-DATE-TIME:1970-01-01T00:01:40.000Z\n#EXTINF:2.000000,\nstream_V0_41.ts'
+        ) + '#EXT-X-ENDLIST\n')
+
+        assert playlist.ended
+        assert [program_date_time for *_, program_date_time in playlist.segments] == [100., 102., 104.]
+
+    def test_master_playlist(self):
+        """Tests whether a master playlist is not parsed as media playlist."""
+        with pytest.raises(ValueError):
+            MediaPlaylist.parse('http://host/stream.m3u8',
+                                '#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=480x270\nstream_V0.m3u8\n')
+
+    def test_not_a_playlist(self):
+        """Tests whether a response that is not a playlist is refused."""
+        with pytest.raises(ValueError):
+            MediaPlaylist.parse('http://host/stream.m3u8', '<html>Not found</html>')
+
+    def test_resolve_url(self):
+        """Tests whether absolute urls and urls with a query of their own are kept."""
+        assert resolve_url('http://host/a/stream.m3u8?t=1', 'http://other/b.ts') == 'http://other/b.ts?t=1'
+        assert resolve_url('http://host/a/stream.m3u8?t=1', 'b.ts?t=2') == 'http://host/a/b.ts?t=2'
+
+
+if __name__ == '__main__':
+    pytest.main(TestMediaPlaylist)
@@ -0,0 +1,124 @@
+"""Tests the read-ahead capture decoding frames on a separate thread.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+import asyncio
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from processor.input.read_ahead_capture import ReadAheadCapture
+
+
+def wait_until(condition, timeout=5.):
+    """Waits until the condition holds.
+
+    Args:
+        condition (function): Returns whether the condition holds.
+        timeout (float): Seconds to wait at most.
+
+    Returns:
+        bool: Whether the condition holds.
+    """
+    end_time = time.time() + timeout
+    while not condition() and time.time() < end_time:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestReadAheadCapture:
+    """Tests the read-ahead capture."""
+    @pytest.mark.timeout(30)
+    def test_returns_every_frame_in_order(self):
+        """Tests whether every frame is returned once, in order and with its timestamp."""
+        capture = ReadAheadCapture(FakeCapture(20, fps=10), queue_size=4)
+
+        timestamps = [frame_obj.timestamp for frame_obj in capture]
+
+        assert timestamps == pytest.approx([frame_nr / 10 for frame_nr in range(20)])
+        assert capture.frames_read == 20
+        assert not capture.opened()
+
+    @pytest.mark.timeout(30)
+    def test_read_ahead_is_bounded(self):
+        """Tests whether the decoder thread stops reading when the queue is full."""
+        fake_capture = FakeCapture(20)
+        capture = ReadAheadCapture(fake_capture, queue_size=4)
+
+        assert wait_until(lambda: fake_capture.frame_nr == 4)
+        time.sleep(0.1)
+        assert fake_capture.frame_nr == 4
+
+        # Taking a frame makes room for the next one.
+        ret, _ = capture.get_next_frame()
+        assert ret
+        assert wait_until(lambda: fake_capture.frame_nr == 5)
+
+        capture.close()
+
+    @pytest.mark.timeout(30)
+    def test_seek(self):
+        """Tests whether a seek drops the frames decoded ahead and continues from the position."""
+        capture = ReadAheadCapture(FakeCapture(20, fps=10), queue_size=4)
+        assert capture.wait_for_frame(5)
+        capture.get_next_frame()
+
+        assert capture.seek(1.5)
+        timestamps = [frame_obj.timestamp for frame_obj in capture]
+
+        assert timestamps == pytest.approx([frame_nr / 10 for frame_nr in range(15, 20)])
+
+    @pytest.mark.timeout(30)
+    def test_seek_after_end(self):
+        """Tests whether a capture that read all frames continues after a seek back."""
+        capture = ReadAheadCapture(FakeCapture(5, fps=10), queue_size=2)
+        assert len(list(capture)) == 5
+
+        capture.seek(0.3)
+
+        assert capture.opened()
+        assert len(list(capture)) == 2
+
+    @pytest.mark.timeout(30)
+    def test_close(self):
+        """Tests whether closing stops the decoder thread and waiting returns."""
+        capture = ReadAheadCapture(FakeCapture(20, realtime=True, fps=10), queue_size=4)
+        capture.close()
+
+        start_time = time.time()
+        capture.wait_for_frame(5)
+        assert time.time() - start_time < 1
+        assert not capture.opened()
+
+    @pytest.mark.timeout(30)
+    def test_capture_error(self):
+        """Tests whether an error of the wrapped capture is raised after the frames decoded before it."""
+        capture = ReadAheadCapture(FakeCapture(10, fail_at=3), queue_size=4)
+        frames = []
+
+        with pytest.raises(RuntimeError, match='Could not decode frame 3'):
+            while capture.opened():
+                if capture.get_next_frame()[0]:
+                    frames.append(None)
+                else:
+                    capture.wait_for_frame()
+
+        assert len(frames) == 3
+        assert not capture.opened()
+        assert capture.wait_for_frame(5)
+
+    @pytest.mark.timeout(30)
+    def test_async_iteration(self):
+        """Tests whether the frames can be iterated asynchronously."""
+        capture = ReadAheadCapture(FakeCapture(10, fps=10, realtime=True), queue_size=2)
+
+        async def read_all():
+            return [frame_obj async for frame_obj in capture]
+
+        assert len(asyncio.run(read_all())) == 10
+
+
+if __name__ == '__main__':
+    pytest.main(TestReadAheadCapture)
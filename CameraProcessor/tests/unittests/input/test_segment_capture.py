@@ -0,0 +1,88 @@
+"""Tests the segment capture playing an HLS stream served by a local server.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import ffmpeg
+import pytest
+
+from tests.conftest import get_test_configs
+from tests.unittests.utils.local_http_server import LocalHttpServer
+from processor.input.segment_capture import SegmentCapture
+
+
+@pytest.fixture(name='hls_server', scope='module')
+def fixture_hls_server(tmp_path_factory):
+    """Serves an HLS stream of the test video, pre-generated in segments of a second.
+
+    Args:
+        tmp_path_factory (TempPathFactory): Creates the directory of the stream.
+
+    Returns:
+        LocalHttpServer: The server, closed after the tests of the module.
+    """
+    directory = tmp_path_factory.mktemp('hls')
+    # pylint: disable=no-member
+    (ffmpeg
+     .input(get_test_configs()['Yolov5']['source_path'])
+     .output(str(directory / 'stream.m3u8'), format='hls', hls_time=1, hls_list_size=0, hls_playlist_type='vod',
+             force_key_frames='expr:gte(t,n_forced*1)', an=None)
+     .run(quiet=True))
+    # pylint: enable=no-member
+
+    local_server = LocalHttpServer(directory)
+    yield local_server
+    local_server.close()
+
+
+class TestSegmentCapture:
+    """Tests fetching, decoding and timestamping the segments."""
+    @pytest.mark.timeout(120)
+    def test_exact_timestamps(self, hls_server):
+        """Tests whether every frame is played with the presentation timestamp of the stream.
+
+        Args:
+            hls_server (LocalHttpServer): Local server serving the HLS stream of the test video.
+        """
+        capture = SegmentCapture(f'{hls_server.url}/stream.m3u8', realtime=False)
+        frames = list(capture)
+        capture.close()
+
+        # pylint: disable=no-member
+        start_time = float(ffmpeg.probe(str(hls_server.directory / 'stream0.ts'))['format']['start_time'])
+        # pylint: enable=no-member
+        timestamps = [frame_obj.timestamp for frame_obj in frames]
+
+        assert capture.segments_fetched > 1
+        assert capture.frames_dropped == 0
+        assert timestamps == sorted(set(timestamps))
+        assert timestamps[0] == pytest.approx(start_time, abs=0.001)
+
+    @pytest.mark.timeout(120)
+    def test_keep_alive(self, hls_server):
+        """Tests whether the playlist and all segments are fetched over a single connection.
+
+        Args:
+            hls_server (LocalHttpServer): Local server serving the HLS stream of the test video.
+        """
+        connections = hls_server.connections
+        capture = SegmentCapture(f'{hls_server.url}/stream.m3u8', realtime=False)
+        nr_frames = sum(1 for _ in capture)
+        capture.close()
+
+        assert nr_frames > 0
+        assert hls_server.connections - connections == 1
+
+    def test_missing_stream(self, hls_server):
+        """Tests whether a stream that cannot be loaded raises a TimeoutError.
+
+        Args:
+            hls_server (LocalHttpServer): Local server serving the HLS stream of the test video.
+        """
+        with pytest.raises(TimeoutError):
+            SegmentCapture(f'{hls_server.url}/missing.m3u8', retries=1)
+
+
+if __name__ == '__main__':
+    pytest.main(TestSegmentCapture)
@@ -0,0 +1,100 @@
+"""Tests the selection of the variant of an HLS stream.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.input.variant_selector import VariantSelector, UP_WINDOWS
+
+# Master playlist as published by the video forwarder.
+MASTER_PLAYLIST = '\n'.join([
+    '#EXTM3U',
+    '#EXT-X-VERSION:3',
+    '#EXT-X-STREAM-INF:BANDWIDTH=880000,RESOLUTION=480x270,CODECS="avc1.4d401e"',
+    'stream_V0.m3u8',
+    '',
+    '#EXT-X-STREAM-INF:BANDWIDTH=1567500,RESOLUTION=858x482,CODECS="avc1.4d401f"',
+    'stream_V1.m3u8',
+    '',
+    '#EXT-X-STREAM-INF:BANDWIDTH=3135000,RESOLUTION=1280x720,CODECS="avc1.4d401f"',
+    'stream_V2.m3u8'
+]) + '\n'
+
+
+def create_selector(target_width=640):
+    """Creates a selector over the variants of the master playlist.
+
+    Args:
+        target_width (int): Input width of the detector.
+
+    Returns:
+        VariantSelector: The selector.
+    """
+    return VariantSelector(VariantSelector.parse_master_playlist('https://host/1/stream.m3u8', MASTER_PLAYLIST),
+                           target_width)
+
+
+class TestVariantSelector:
+    """Tests parsing the master playlist and switching variants."""
+    def test_parse_master_playlist(self):
+        """Tests whether the variant urls are resolved against the master playlist, keeping its query."""
+        variants = VariantSelector.parse_master_playlist('https://host/1/stream.m3u8?Bearer=token', MASTER_PLAYLIST)
+
+        assert [(width, height) for width, height, _ in variants] == [(480, 270), (858, 482), (1280, 720)]
+        assert variants[0][2] == 'https://host/1/stream_V0.m3u8?Bearer=token'
+
+    def test_media_playlist(self):
+        """Tests whether a playlist without variants has nothing to select."""
+        playlist = '#EXTM3U\n#EXTINF:2.0,\nstream1.ts\n'
+        assert not VariantSelector.parse_master_playlist('https://host/1/stream.m3u8', playlist)
+
+    @pytest.mark.parametrize('target_width, width', [(640, 480), (800, 858), (1920, 1280), (100, 480)])
+    def test_closest_variant(self, target_width, width):
+        """Tests whether the stream starts on the variant closest to the detector input size.
+
+        Args:
+            target_width (int): Input width of the detector.
+            width (int): Width of the variant the stream should start on.
+        """
+        selector = create_selector(target_width)
+        assert selector.variants[selector.index][0] == width
+
+    def test_switch_down_and_up(self):
+        """Tests whether the variant switches down when falling behind and back up after enough headroom."""
+        selector = create_selector(1280)
+
+        assert selector.update(0.9, 1.)
+        assert selector.url == 'https://host/1/stream_V1.m3u8'
+        assert selector.update(0.85, 1.)
+        assert not selector.update(0.9, 1.)
+        assert selector.index == 0
+
+        assert not any(selector.update(0.1, 1.) for _ in range(UP_WINDOWS - 1))
+        assert selector.update(0.1, 1.)
+        assert selector.index == 1
+        assert selector.switches == 3
+
+    def test_slow_processing_keeps_variant(self):
+        """Tests whether frames dropped by slow processing do not switch down, but hold off switching up."""
+        selector = create_selector(1280)
+        assert selector.update(0.9, 1.)
+
+        assert not any(selector.update(0.1, 0.5) for _ in range(UP_WINDOWS * 2))
+        assert selector.index == 1
+
+    def test_never_above_preferred(self):
+        """Tests whether headroom never switches above the variant closest to the detector input size."""
+        selector = create_selector(640)
+        assert not any(selector.update(0.1, 1.) for _ in range(UP_WINDOWS * 2))
+        assert selector.index == selector.preferred
+
+    def test_no_variants(self):
+        """Tests whether a selector needs variants."""
+        with pytest.raises(ValueError):
+            VariantSelector([], 640)
+
+
+if __name__ == '__main__':
+    pytest.main(TestVariantSelector)
@@ -0,0 +1,144 @@
+"""Tests the queued sinks writing the outputs of processed frames on their own workers.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import time
+import json
+import threading
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_blocked_sink import FakeBlockedSink
+from tests.unittests.utils.fake_failing_sink import FakeFailingSink
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.output.file_sink import FileSink
+from processor.output.output_sinks import OutputSinks
+from processor.output.queued_sink import QueuedSink
+
+
+def frame_outputs(nr_frames):
+    """Creates the outputs of processed frames with a single tracked box.
+
+    Args:
+        nr_frames (int): Amount of frames.
+
+    Returns:
+        [(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]: Outputs of every frame.
+    """
+    capture = FakeCapture(nr_frames)
+    outputs = []
+    for _ in range(nr_frames):
+        _, frame_obj = capture.get_next_frame()
+        bounding_boxes = BoundingBoxes([BoundingBox(1, Rectangle(0.1, 0.2, 0.3, 0.4), 'person', 0.9)])
+        outputs.append((frame_obj, bounding_boxes, bounding_boxes, bounding_boxes))
+    return outputs
+
+
+class TestOutputSinks:
+    """Tests queuing, batching and dropping the outputs of the sinks."""
+    @pytest.mark.parametrize('drop_policy, written', [('oldest', [0, 3, 4]), ('newest', [0, 1, 2])])
+    def test_drop_policy(self, drop_policy, written):
+        """Tests whether a full queue drops the configured frame without waiting for the sink.
+
+        Args:
+            drop_policy (str): Policy when the queue is full.
+            written ([int]): Numbers of the frames that are written.
+        """
+        outputs = frame_outputs(5)
+        sink = FakeBlockedSink()
+        queued_sink = QueuedSink('blocked', sink, queue_size=2, max_batch=1, drop_policy=drop_policy)
+
+        # The worker takes the first frame and waits on the sink, the other frames fill the queue.
+        queued_sink.put(outputs[0])
+        while queued_sink.queue_depth > 0:
+            time.sleep(.01)
+        for outputs_of_frame in outputs[1:]:
+            queued_sink.put(outputs_of_frame)
+
+        sink.released.set()
+        queued_sink.close()
+
+        assert [batch[0] for batch in sink.batches] == [outputs[i][0].timestamp for i in written]
+        assert queued_sink.stats()['dropped'] == 2
+        assert queued_sink.stats()['written'] == 3
+        assert sink.closed
+
+    def test_batches(self):
+        """Tests whether queued frames are written in batches of at most the maximum size, in order."""
+        outputs = frame_outputs(7)
+        sink = FakeBlockedSink()
+        queued_sink = QueuedSink('blocked', sink, queue_size=10, max_batch=3, drop_policy='block')
+
+        for outputs_of_frame in outputs:
+            queued_sink.put(outputs_of_frame)
+        sink.released.set()
+        queued_sink.close()
+
+        assert max(len(batch) for batch in sink.batches) <= 3
+        assert sum(sink.batches, []) == [frame_obj.timestamp for frame_obj, _, _, _ in outputs]
+        assert queued_sink.stats()['dropped'] == 0
+
+    def test_failing_sink(self, tmp_path):
+        """Tests whether a failing sink is counted without affecting the other sinks.
+
+        Args:
+            tmp_path (Path): Temporary directory the file sink writes to.
+        """
+        path = os.path.join(tmp_path, 'boxes.jsonl')
+        output = OutputSinks([QueuedSink('failing', FakeFailingSink(), drop_policy='block'),
+                              QueuedSink('file', FileSink(path), drop_policy='block')])
+
+        outputs = frame_outputs(4)
+        for outputs_of_frame in outputs:
+            output(*outputs_of_frame)
+        output.close()
+
+        stats = output.stats()
+        assert stats['failing']['errors'] > 0
+        assert stats['failing']['written'] == 0
+        assert stats['file']['written'] == 4
+
+        with open(path, encoding='utf-8') as file:
+            lines = [json.loads(line) for line in file]
+        assert [line['frameId'] for line in lines] == [frame_obj.timestamp for frame_obj, _, _, _ in outputs]
+        assert lines[0]['boxes'][0]['boxId'] == 1
+
+    @pytest.mark.timeout(10)
+    def test_close_while_blocked(self):
+        """Tests whether closing releases a blocked frame loop and leaves the sink open until it is written."""
+        outputs = frame_outputs(3)
+        sink = FakeBlockedSink()
+        queued_sink = QueuedSink('blocked', sink, queue_size=1, max_batch=1, drop_policy='block')
+
+        # The worker takes the first frame and waits on the sink, the second frame fills the queue.
+        queued_sink.put(outputs[0])
+        while queued_sink.queue_depth > 0:
+            time.sleep(.01)
+        queued_sink.put(outputs[1])
+        putter = threading.Thread(target=queued_sink.put, args=(outputs[2],))
+        putter.start()
+
+        queued_sink.close(timeout=.1)
+        putter.join(5)
+        assert not putter.is_alive()
+        assert not sink.closed
+
+        sink.released.set()
+        while not sink.closed:
+            time.sleep(.01)
+        assert sum(sink.batches, []) == [frame_obj.timestamp for frame_obj, _, _, _ in outputs[:2]]
+        assert queued_sink.stats()['dropped'] == 1
+
+    def test_unknown_drop_policy(self):
+        """Tests whether an unknown drop policy raises an error."""
+        with pytest.raises(NameError):
+            QueuedSink('blocked', FakeBlockedSink(), drop_policy='random')
+
+
+if __name__ == '__main__':
+    pytest.main(TestOutputSinks)
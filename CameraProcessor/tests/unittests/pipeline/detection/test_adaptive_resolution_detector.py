@@ -0,0 +1,50 @@
+"""Tests the adaptive resolution detector.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from tests.unittests.utils.fake_sized_detector import FakeSizedDetector
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.resolution_controller import ResolutionController
+from processor.pipeline.detection.adaptive_resolution_detector import AdaptiveResolutionDetector
+from processor.pipeline.detection.roi_detector import RoiDetector, parse_regions
+
+
+class TestAdaptiveResolutionDetector:
+    """Tests the detector wrapper letting the resolution controller change the inference size."""
+    def test_detector_switches_size(self):
+        """Tests whether the wrapped detector gets a smaller size when its detections are too slow."""
+        detector = FakeSizedDetector(0.0001)
+        controller = ResolutionController([320, 480, 640], 640, high_latency=0.04, low_latency=0.02, patience=2)
+        adaptive_detector = AdaptiveResolutionDetector(detector, controller)
+
+        frame_obj = FrameObj(np.zeros((48, 64, 3), dtype=np.uint8), 0)
+        for _ in range(10):
+            adaptive_detector.detect(frame_obj)
+
+        # Detecting at 480 pixels takes 48 ms and at 320 pixels 32 ms, which is in between the low and high latency.
+        assert detector.img_size == 320
+
+    def test_wrapped_detector_gets_queue_depth(self):
+        """Tests whether the queue depth reaches the adaptive detector through the wrappers around it."""
+        detector = FakeSizedDetector(0)
+        controller = ResolutionController([320, 640], 640, high_latency=0.04, low_latency=0.02, patience=2)
+        roi_detector = RoiDetector(AdaptiveResolutionDetector(detector, controller),
+                                   parse_regions('(0, 0) (1, 0) (1, 1)'))
+
+        roi_detector.set_queue_depth(lambda: 2)
+
+        frame_obj = FrameObj(np.zeros((48, 64, 3), dtype=np.uint8), 0)
+        for _ in range(2):
+            roi_detector.detect(frame_obj)
+
+        # The detections are fast, so only the waiting frames lower the size.
+        assert detector.img_size == 320
+
+
+if __name__ == '__main__':
+    pytest.main(TestAdaptiveResolutionDetector)
@@ -0,0 +1,99 @@
+"""Tests the keyframe gate and the predictions of the SORT tracker between keyframes.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import configparser
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_moving_detector import FakeMovingDetector
+from processor.pipeline.detection.keyframe_gate import KeyframeGate
+from processor.pipeline.reidentification.reid_data import ReidData
+from processor.pipeline.tracking.sort_tracker import SortTracker
+
+
+def create_tracker(max_age=30):
+    """Creates a SORT tracker.
+
+    Args:
+        max_age (int): Amount of frames a tracker persists while not found.
+
+    Returns:
+        SortTracker: The tracker.
+    """
+    configs = configparser.ConfigParser()
+    configs.read_dict({'SORT': {'max_age': max_age, 'min_hits': 0, 'iou_threshold': 0.3}})
+    return SortTracker(configs['SORT'])
+
+
+def run_gate(gate, detector, tracker, nr_frames):
+    """Runs the gate on a number of frames.
+
+    Args:
+        gate (KeyframeGate): The gate to run.
+        detector (FakeMovingDetector): Detector of the gate.
+        tracker (SortTracker): Tracker of the gate.
+        nr_frames (int): Amount of frames to process.
+
+    Returns:
+        [(BoundingBoxes, BoundingBoxes)]: Detected and tracked boxes of every frame.
+    """
+    capture = FakeCapture(nr_frames, shape=(400, 400))
+    re_id_data = ReidData()
+    outputs = []
+    while capture.opened():
+        _, frame_obj = capture.get_next_frame()
+        outputs.append(gate.process(frame_obj, detector, tracker, re_id_data))
+        detector.next_frame()
+    return outputs
+
+
+class TestKeyframeGate:
+    """Tests the keyframe gate."""
+    def test_fixed_interval(self):
+        """Tests whether the detector only runs on every interval-th frame and objects are tracked on every frame."""
+        gate = KeyframeGate(interval=3)
+        detector = FakeMovingDetector(0.01)
+        outputs = run_gate(gate, detector, create_tracker(), 9)
+
+        assert detector.detections == 3
+        assert (gate.frames_detected, gate.frames_skipped) == (3, 6)
+        assert [len(detected_boxes.bounding_boxes) for detected_boxes, _ in outputs] == [1, 0, 0] * 3
+        assert all(len(tracked_boxes.bounding_boxes) == 1 for _, tracked_boxes in outputs)
+
+    def test_predictions_follow_motion(self):
+        """Tests whether the predicted boxes keep moving in the direction of the object."""
+        outputs = run_gate(KeyframeGate(interval=4), FakeMovingDetector(0.01), create_tracker(), 12)
+
+        positions = [tracked_boxes.bounding_boxes[0].rectangle.x1 for _, tracked_boxes in outputs]
+        assert positions[-1] > positions[4] > positions[0]
+        assert positions[-1] == pytest.approx(0.1 + 0.01 * 11, abs=0.02)
+
+    def test_predictions_keep_tracks_alive(self):
+        """Tests whether predicted frames do not count as missed detections."""
+        tracker = create_tracker(max_age=1)
+        outputs = run_gate(KeyframeGate(interval=5), FakeMovingDetector(0), tracker, 6)
+
+        identifiers = {tracked_boxes.bounding_boxes[0].identifier for _, tracked_boxes in outputs}
+        assert len(identifiers) == 1
+
+    def test_adaptive_interval(self):
+        """Tests whether the interval grows for a static object and shrinks for a fast object."""
+        gate = KeyframeGate(interval=2, adaptive=True, max_interval=6)
+        run_gate(gate, FakeMovingDetector(0), create_tracker(), 40)
+        assert gate.interval == 6
+
+        gate = KeyframeGate(interval=6, adaptive=True, max_interval=6, motion_threshold=0.02)
+        run_gate(gate, FakeMovingDetector(0.02), create_tracker(), 30)
+        assert gate.interval < 6
+
+    def test_invalid_interval(self):
+        """Tests whether an interval smaller than 1 raises a ValueError."""
+        with pytest.raises(ValueError):
+            KeyframeGate(interval=0)
+
+
+if __name__ == '__main__':
+    pytest.main(TestKeyframeGate)
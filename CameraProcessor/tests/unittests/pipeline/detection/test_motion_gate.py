@@ -0,0 +1,120 @@
+"""Tests the motion gate skipping detection on static frames.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from tests.unittests.utils.fake_moving_detector import FakeMovingDetector
+from tests.unittests.pipeline.detection.test_keyframe_gate import create_tracker
+from processor.data_object.frame_obj import FrameObj
+from processor.pipeline.detection.keyframe_gate import KeyframeGate
+from processor.pipeline.detection.motion_gate import MotionGate
+from processor.pipeline.reidentification.reid_data import ReidData
+
+
+def create_frames(nr_frames, moving_frames=()):
+    """Creates gray frames, with a white square moving over the frames in moving_frames.
+
+    Args:
+        nr_frames (int): Amount of frames to create.
+        moving_frames ([int]): Numbers of the frames in which the square moved.
+
+    Returns:
+        [FrameObj]: The frames.
+    """
+    frames = []
+    position = 0
+    for frame_nr in range(nr_frames):
+        if frame_nr in moving_frames:
+            position += 40
+        frame = np.full((240, 320, 3), 100, dtype=np.uint8)
+        frame[100:140, position:position + 40] = 255
+        frames.append(FrameObj(frame, frame_nr / 10))
+    return frames
+
+
+def run_gate(gate, frames, detector=None, tracker=None):
+    """Runs the gate on the frames.
+
+    Args:
+        gate (MotionGate): The gate to run.
+        frames ([FrameObj]): The frames to process.
+        detector (IDetector): Detector of the gate, a static FakeMovingDetector if None.
+        tracker (ITracker): Tracker of the gate, a SORT tracker if None.
+
+    Returns:
+        [(BoundingBoxes, BoundingBoxes)], FakeMovingDetector: Detected and tracked boxes of every frame,
+                                                              and the detector.
+    """
+    detector = detector or FakeMovingDetector(0)
+    tracker = tracker or create_tracker()
+    re_id_data = ReidData()
+    return [gate.process(frame_obj, detector, tracker, re_id_data) for frame_obj in frames], detector
+
+
+class TestMotionGate:
+    """Tests the motion gate."""
+    def test_static_frames_are_skipped(self):
+        """Tests whether the detector only runs on the first frame of a static scene, reusing its detections."""
+        gate = MotionGate()
+        outputs, detector = run_gate(gate, create_frames(10))
+
+        assert detector.detections == 1
+        assert (gate.frames_detected, gate.frames_skipped) == (1, 9)
+        assert all(len(detected_boxes.bounding_boxes) == 1 for detected_boxes, _ in outputs)
+        assert all(len(tracked_boxes.bounding_boxes) == 1 for _, tracked_boxes in outputs)
+
+    def test_motion_runs_detector(self):
+        """Tests whether frames in which the square moved are detected."""
+        gate = MotionGate()
+        _, detector = run_gate(gate, create_frames(10, moving_frames=[3, 7]))
+
+        assert detector.detections == 3
+
+    def test_slow_change_is_detected(self):
+        """Tests whether small changes add up against the last detected frame when differencing."""
+        frames = []
+        for frame_nr in range(20):
+            frame = np.full((240, 320, 3), 100, dtype=np.uint8)
+            frame[:, :frame_nr * 2] = 255
+            frames.append(FrameObj(frame, frame_nr / 10))
+
+        # Every frame changes less than 1 % of the pixels compared with the previous one.
+        _, detector = run_gate(MotionGate(motion_threshold=0.05), frames)
+
+        assert 1 < detector.detections < 20
+
+    def test_background_model_absorbs_noise(self):
+        """Tests whether the background model ignores small uniform changes like lighting."""
+        frames = [FrameObj(np.full((240, 320, 3), 100 + frame_nr, dtype=np.uint8), frame_nr / 10)
+                  for frame_nr in range(20)]
+        _, detector = run_gate(MotionGate(background_rate=0.5), frames)
+
+        assert detector.detections == 1
+
+    def test_max_skipped_frames(self):
+        """Tests whether detection is forced after the maximum amount of static frames."""
+        _, detector = run_gate(MotionGate(max_skipped_frames=3), create_frames(9))
+
+        assert detector.detections == 3
+
+    def test_predict_reuse(self):
+        """Tests whether the tracker predicts on static frames when reuse is predict."""
+        gate = MotionGate(reuse='predict', gate=KeyframeGate(interval=2))
+        outputs, detector = run_gate(gate, create_frames(6, moving_frames=[1, 2, 3, 4, 5]))
+
+        # The wrapped keyframe gate only detects on every second frame with motion.
+        assert detector.detections == 3
+        assert all(len(tracked_boxes.bounding_boxes) == 1 for _, tracked_boxes in outputs)
+
+    def test_unknown_reuse(self):
+        """Tests whether an unknown reuse mode raises a NameError."""
+        with pytest.raises(NameError):
+            MotionGate(reuse='unknown')
+
+
+if __name__ == '__main__':
+    pytest.main(TestMotionGate)
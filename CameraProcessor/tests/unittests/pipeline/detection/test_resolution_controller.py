@@ -0,0 +1,56 @@
+"""Tests the controller switching the inference size.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.pipeline.detection.resolution_controller import ResolutionController
+
+
+class TestResolutionController:
+    """Tests the controller switching the inference size."""
+    def test_lowers_size_when_slow(self):
+        """Tests whether the size is lowered one step at a time when the latency stays high."""
+        controller = ResolutionController([320, 480, 640], 640, high_latency=0.1, low_latency=0.05, patience=3)
+
+        sizes = [controller.update(0.2) for _ in range(9)]
+
+        assert sizes == [640, 640, 480, 480, 480, 480, 480, 480, 320]
+
+    def test_raises_size_when_fast(self):
+        """Tests whether the size is raised when the latency stays low and no frames are waiting."""
+        controller = ResolutionController([320, 640], 320, high_latency=0.1, low_latency=0.05, patience=3)
+
+        assert [controller.update(0.01, queue_depth=1) for _ in range(3)] == [320] * 3
+        assert [controller.update(0.01) for _ in range(3)] == [320, 320, 640]
+
+    def test_hysteresis(self):
+        """Tests whether a latency between the low and high latency does not switch and resets the patience."""
+        controller = ResolutionController([320, 640], 640, high_latency=0.1, low_latency=0.05, patience=3,
+                                          smoothing=1)
+
+        sizes = [controller.update(latency) for latency in [0.2, 0.2, 0.07, 0.2, 0.2, 0.07, 0.07, 0.07]]
+
+        assert sizes == [640] * 8
+        assert controller.switches == 0
+
+    def test_queue_depth_lowers_size(self):
+        """Tests whether waiting frames lower the size, even when a single detection is fast enough."""
+        controller = ResolutionController([320, 640], 640, high_latency=0.1, low_latency=0.05, patience=2)
+
+        assert [controller.update(0.07, queue_depth=2) for _ in range(2)] == [640, 320]
+
+    def test_closest_initial_size(self):
+        """Tests whether the closest available size is used initially."""
+        assert ResolutionController([320, 640], 600, high_latency=0.1, low_latency=0.05).size == 640
+
+    def test_invalid_latencies(self):
+        """Tests whether a low latency above the high latency raises a ValueError."""
+        with pytest.raises(ValueError):
+            ResolutionController([320], 320, high_latency=0.05, low_latency=0.1)
+
+
+if __name__ == '__main__':
+    pytest.main(TestResolutionController)
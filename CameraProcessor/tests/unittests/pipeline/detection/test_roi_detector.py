@@ -0,0 +1,94 @@
+"""Tests the region of interest detector and the parsing of regions.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import numpy as np
+import pytest
+
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.frame_obj import FrameObj
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.i_detector import IDetector
+from processor.pipeline.detection.roi_detector import RoiDetector, parse_regions
+
+
+class CropDetector(IDetector):
+    """Detector returning fixed boxes in coordinates of the frame it gets, remembering the shape of that frame.
+
+    Attributes:
+        rectangles ([Rectangle]): The boxes to return.
+        shape ((int, int)): Width and height of the last frame.
+    """
+    def __init__(self, rectangles):
+        """Inits the detector.
+
+        Args:
+            rectangles ([Rectangle]): The boxes to return.
+        """
+        self.rectangles = rectangles
+        self.shape = None
+
+    def detect(self, frame_obj):
+        """See base class."""
+        self.shape = frame_obj.shape
+        return BoundingBoxes([BoundingBox(i, rectangle, 'person', 0.9) for i, rectangle in enumerate(self.rectangles)])
+
+
+def detect(regions, rectangles):
+    """Detects on a 200x100 frame with the given regions and boxes returned by the wrapped detector.
+
+    Args:
+        regions (str): Regions of interest.
+        rectangles ([Rectangle]): Boxes returned by the wrapped detector, relative to the crop.
+
+    Returns:
+        BoundingBoxes, CropDetector: Boxes found and the wrapped detector.
+    """
+    detector = CropDetector(rectangles)
+    frame_obj = FrameObj(np.zeros((100, 200, 3), dtype=np.uint8), 0)
+    return RoiDetector(detector, parse_regions(regions)).detect(frame_obj), detector
+
+
+class TestRoiDetector:
+    """Tests the region of interest detector."""
+    def test_crop_and_map_back(self):
+        """Tests whether the detector runs on the crop and boxes are mapped back to the full frame."""
+        bounding_boxes, detector = detect('(0.5, 0.5) (1, 1)', [Rectangle(0, 0, 0.5, 0.5)])
+
+        assert detector.shape == (100, 50)
+        rectangle = bounding_boxes.bounding_boxes[0].rectangle
+        assert (rectangle.x1, rectangle.y1, rectangle.x2, rectangle.y2) == pytest.approx((0.5, 0.5, 0.75, 0.75))
+
+    def test_boxes_outside_mask_are_dropped(self):
+        """Tests whether boxes in the crop but outside the polygon are dropped."""
+        # Triangle of which the bounding crop is the whole frame.
+        bounding_boxes, _ = detect('(0, 0) (1, 0) (0, 1)', [Rectangle(0, 0, 0.2, 0.2), Rectangle(0.8, 0.8, 1, 1)])
+
+        assert len(bounding_boxes.bounding_boxes) == 1
+        assert bounding_boxes.bounding_boxes[0].rectangle.x1 == pytest.approx(0)
+
+    def test_crop_of_multiple_regions(self):
+        """Tests whether the crop contains all regions."""
+        _, detector = detect('(0.1, 0.1) (0.2, 0.2); (0.6, 0.5) (0.7, 0.5) (0.7, 0.6)', [])
+
+        assert detector.shape == (120, 50)
+
+    def test_parse_invalid_regions(self):
+        """Tests whether regions with too few or not normalized points raise a ValueError."""
+        with pytest.raises(ValueError):
+            parse_regions('(0.1, 0.1)')
+        with pytest.raises(ValueError):
+            parse_regions('(0.1, 0.1) (1.5, 0.5)')
+
+    def test_no_regions(self):
+        """Tests whether an empty regions string gives no regions and the detector needs at least one."""
+        assert parse_regions('') == []
+        with pytest.raises(ValueError):
+            RoiDetector(CropDetector([]), [])
+
+
+if __name__ == '__main__':
+    pytest.main(TestRoiDetector)
@@ -0,0 +1,58 @@
+"""Tests the camera state and the parsing of the cameras of a multi-camera processor.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_detector import FakeDetector
+from tests.unittests.utils.fake_tracker import FakeTracker
+from processor.pipeline.camera import Camera, parse_cameras
+
+
+class TestCamera:
+    """Tests the camera state and parse_cameras."""
+    def test_parse_cameras(self):
+        """Tests whether the id and url of every camera are parsed in order."""
+        camera_urls = parse_cameras('camera_1=https://host/1/stream.m3u8; camera_2 = https://host/2/stream.m3u8;')
+
+        assert camera_urls == [('camera_1', 'https://host/1/stream.m3u8'), ('camera_2', 'https://host/2/stream.m3u8')]
+
+    def test_parse_no_cameras(self):
+        """Tests whether an empty declaration has no cameras."""
+        assert parse_cameras('') == []
+
+    @pytest.mark.parametrize('cameras', ['camera_1', 'camera_1=', '=https://host/1/stream.m3u8',
+                                         'camera_1=https://host/1/stream.m3u8;camera_1=https://host/2/stream.m3u8'])
+    def test_parse_invalid_cameras(self, cameras):
+        """Tests whether cameras without id or url, or with the same id, raise a ValueError.
+
+        Args:
+            cameras (str): The declared cameras.
+        """
+        with pytest.raises(ValueError):
+            parse_cameras(cameras)
+
+    def test_cameras_have_own_state(self):
+        """Tests whether every camera has its own re-identification data and frame buffer."""
+        first = Camera('camera_1', FakeCapture(), FakeTracker())
+        second = Camera('camera_2', FakeCapture(), FakeTracker())
+
+        first.re_id_data.add_query_feature(1, [0.5])
+
+        assert len(second.re_id_data.get_queries()) == 0
+        assert first.frame_buffer is not second.frame_buffer
+        assert first.ws_client is None
+
+    def test_default_detect_batch(self):
+        """Tests whether a detector without batching detects every frame of the batch."""
+        capture = FakeCapture(3)
+        frame_objs = [capture.get_next_frame()[1] for _ in range(3)]
+
+        assert len(FakeDetector().detect_batch(frame_objs)) == 3
+
+
+if __name__ == '__main__':
+    pytest.main(TestCamera)
@@ -0,0 +1,137 @@
+"""Tests the checkpoint restoring the tracker and re-identification state after a restart.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import configparser
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_tracker import FakeTracker
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.checkpoint import Checkpoint
+from processor.pipeline.reidentification.reid_data import ReidData
+from processor.pipeline.tracking.sort_tracker import SortTracker
+
+
+def create_tracker():
+    """Creates a SORT tracker.
+
+    Returns:
+        SortTracker: The tracker.
+    """
+    configs = configparser.ConfigParser()
+    configs.read_dict({'SORT': {'max_age': 30, 'min_hits': 0, 'iou_threshold': 0.3}})
+    return SortTracker(configs['SORT'])
+
+
+def track(tracker, re_id_data, capture, x1_values):
+    """Tracks a box of every x1 value on the next frame of the capture.
+
+    Args:
+        tracker (SortTracker): The tracker.
+        re_id_data (ReidData): Re-identification data of the tracker.
+        capture (FakeCapture): Capture giving the frames.
+        x1_values ([float]): Left side of every detected box.
+
+    Returns:
+        BoundingBoxes: The tracked boxes.
+    """
+    _, frame_obj = capture.get_next_frame()
+    detections = BoundingBoxes([BoundingBox(i, Rectangle(x1, 0.2, x1 + 0.1, 0.8), 'person', 0.9)
+                                for i, x1 in enumerate(x1_values)])
+    return tracker.track(frame_obj, detections, re_id_data)
+
+
+class TestCheckpoint:
+    """Tests snapshotting and restoring the state."""
+    def test_track_ids_continue(self, tmp_path):
+        """Tests whether a restored tracker keeps the ids of its objects and never reuses an id.
+
+        Args:
+            tmp_path (Path): Temporary directory the snapshot is written to.
+        """
+        path = os.path.join(tmp_path, 'camera.checkpoint')
+        capture = FakeCapture(10, shape=(400, 400))
+
+        tracker, re_id_data = create_tracker(), ReidData()
+        for _ in range(3):
+            tracked_boxes = track(tracker, re_id_data, capture, [0.1, 0.5])
+        re_id_data.add_query_box(tracked_boxes.bounding_boxes[0].identifier, 42)
+        re_id_data.add_query_feature(42, [1., 2., 3.])
+
+        checkpoint = Checkpoint(path)
+        checkpoint.close(tracker, re_id_data)
+
+        # A new tracker starts numbering from the start, the restored one continues.
+        restored_tracker, restored_re_id_data = create_tracker(), ReidData()
+        assert Checkpoint(path).restore(restored_tracker, restored_re_id_data)
+
+        restored_boxes = track(restored_tracker, restored_re_id_data, capture, [0.1, 0.5, 0.8])
+        ids = sorted(bounding_box.identifier for bounding_box in tracked_boxes)
+        restored_ids = sorted(bounding_box.identifier for bounding_box in restored_boxes)
+
+        assert restored_ids[:2] == ids
+        assert restored_ids[2] == max(ids) + 1
+        assert list(restored_re_id_data.get_queries()) == [42]
+        assert [bounding_box.object_id for bounding_box in restored_boxes
+                if bounding_box.identifier == tracked_boxes.bounding_boxes[0].identifier] == [42]
+
+    def test_stale_snapshot(self, tmp_path):
+        """Tests whether a snapshot older than the maximum age is not restored.
+
+        Args:
+            tmp_path (Path): Temporary directory the snapshot is written to.
+        """
+        path = os.path.join(tmp_path, 'camera.checkpoint')
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(1, [0.])
+        Checkpoint(path).close(None, re_id_data)
+
+        restored_re_id_data = ReidData()
+        assert not Checkpoint(path, max_age=-1).restore(None, restored_re_id_data)
+        assert len(restored_re_id_data.get_queries()) == 0
+
+    def test_missing_snapshot(self, tmp_path):
+        """Tests whether nothing is restored without a snapshot.
+
+        Args:
+            tmp_path (Path): Temporary directory the snapshot is written to.
+        """
+        assert not Checkpoint(os.path.join(tmp_path, 'camera.checkpoint')).restore(create_tracker(), ReidData())
+
+    def test_tracker_without_state(self, tmp_path):
+        """Tests whether the re-identification data is still checkpointed when the tracker has no state.
+
+        Args:
+            tmp_path (Path): Temporary directory the snapshot is written to.
+        """
+        path = os.path.join(tmp_path, 'camera.checkpoint')
+        re_id_data = ReidData()
+        re_id_data.add_query_feature(7, [0.])
+        Checkpoint(path).close(FakeTracker(), re_id_data)
+
+        restored_re_id_data = ReidData()
+        assert Checkpoint(path).restore(FakeTracker(), restored_re_id_data)
+        assert list(restored_re_id_data.get_queries()) == [7]
+
+    def test_update_interval(self, tmp_path):
+        """Tests whether update only snapshots once the interval passed.
+
+        Args:
+            tmp_path (Path): Temporary directory the snapshot is written to.
+        """
+        checkpoint = Checkpoint(os.path.join(tmp_path, 'camera.checkpoint'), interval=60)
+        for _ in range(5):
+            checkpoint.update(None, ReidData())
+        checkpoint.close()
+
+        assert checkpoint.snapshots == 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestCheckpoint)
@@ -0,0 +1,72 @@
+"""Tests the frame budget skipping optional stages of frames running late.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+import pytest
+
+from processor.pipeline.frame_budget import FrameBudget
+from processor.scheduling.component.budgeted_component import BudgetedComponent
+from processor.scheduling.component.func_call_component import FuncCallComponent
+
+
+class TestFrameBudget:
+    """Tests the frame budget."""
+    def test_measure_reports_cost(self):
+        """Tests whether the cost of a stage is measured and smoothed."""
+        frame_budget = FrameBudget(0, smoothing=0.5)
+        with frame_budget.measure('stage'):
+            time.sleep(0.02)
+        frame_budget.record('stage', 0)
+
+        assert frame_budget.costs['stage'] == pytest.approx(0.01, abs=0.005)
+
+    def test_no_budget_never_skips(self):
+        """Tests whether a budget of 0 runs every stage."""
+        frame_budget = FrameBudget(0)
+        frame_budget.record('stage', 10)
+
+        assert frame_budget.run('stage', lambda: 'ran', ()) == 'ran'
+
+    def test_late_optional_stage_is_skipped(self):
+        """Tests whether an optional stage is skipped when its cost does not fit in the time left."""
+        frame_budget = FrameBudget(0.05)
+        frame_budget.record('optional', 0.03)
+        frame_budget.start_frame()
+
+        assert frame_budget.run('optional', lambda: 'ran', ()) == 'ran'
+
+        # Spend most of the budget on a required stage.
+        frame_budget.run('required', time.sleep, (0.03,), optional=False)
+
+        assert frame_budget.run('optional', lambda: 'ran', (), default='skipped') == 'skipped'
+        assert frame_budget.skipped == {'optional': 1}
+
+    def test_skipped_stage_is_retried(self):
+        """Tests whether the estimate of a skipped stage decays until the stage runs again."""
+        frame_budget = FrameBudget(0.01, smoothing=0.5)
+        frame_budget.record('optional', 0.04)
+
+        results = []
+        for _ in range(5):
+            frame_budget.start_frame()
+            results.append(frame_budget.run('optional', lambda: 'ran', (), default='skipped'))
+
+        assert results[0] == 'skipped'
+        assert 'ran' in results
+
+    def test_budgeted_component(self):
+        """Tests whether a skipped component outputs its default argument."""
+        frame_budget = FrameBudget(0.01)
+        frame_budget.record('re-identification', 1)
+        component = BudgetedComponent('re-identification', FuncCallComponent(lambda frame, boxes: 're-identified'),
+                                      frame_budget, optional=True, default_argument=1)
+
+        frame_budget.start_frame()
+        assert component.execute_component()('frame', 'boxes') == 'boxes'
+
+
+if __name__ == '__main__':
+    pytest.main(TestFrameBudget)
@@ -0,0 +1,125 @@
+"""Tests the message worker handling the commands of the orchestrator next to the frame loop.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_batching_re_identifier import FakeBatchingReIdentifier
+from tests.unittests.utils.fake_websocket import FakeWebsocket
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.frame_buffer import FrameBuffer
+from processor.pipeline.message_worker import MessageWorker
+from processor.pipeline.reidentification.reid_data import ReidData
+from processor.websocket.start_message import StartMessage
+from processor.websocket.stop_message import StopMessage
+
+
+def buffer_frame(nr_boxes):
+    """Creates a frame buffer containing a frame with boxes.
+
+    Args:
+        nr_boxes (int): Amount of boxes in the frame.
+
+    Returns:
+        FrameBuffer, float: The frame buffer and the timestamp of the frame.
+    """
+    _, frame_obj = FakeCapture(1, shape=(100, 100)).get_next_frame()
+    frame_buffer = FrameBuffer(10)
+    frame_buffer.add_frame(frame_obj, BoundingBoxes([BoundingBox(i, Rectangle(0, 0, 0.1 * (i + 1), 0.5), 'person', 1)
+                                                     for i in range(nr_boxes)]))
+    return frame_buffer, frame_obj.timestamp
+
+
+def process_until_applied(message_worker, frame_buffer, re_id_data):
+    """Processes like the frame loop until all commands are applied.
+
+    Args:
+        message_worker (MessageWorker): The message worker.
+        frame_buffer (FrameBuffer): Frame buffer containing the frame of the commands.
+        re_id_data (ReidData): Re-identification data the commands are applied to.
+    """
+    message_worker.process(frame_buffer, re_id_data)
+    while message_worker.pending > 0:
+        time.sleep(.01)
+        message_worker.process(frame_buffer, re_id_data)
+
+
+class TestMessageWorker:
+    """Tests handling the commands on the worker and applying them between frames."""
+    def test_start_batched(self):
+        """Tests whether the features of pending start commands are extracted at once and applied between frames."""
+        frame_buffer, timestamp = buffer_frame(3)
+        ws_client = FakeWebsocket()
+        re_identifier = FakeBatchingReIdentifier()
+        message_worker = MessageWorker(ws_client, re_identifier)
+        re_id_data = ReidData()
+
+        # Start commands are not applied while the features are being extracted.
+        re_identifier.released.clear()
+        ws_client.message_queue.extend(StartMessage(i + 10, frame_id=timestamp, box_id=i) for i in range(3))
+        message_worker.process(frame_buffer, re_id_data)
+        assert len(re_id_data.get_queries()) == 0
+
+        re_identifier.released.set()
+        process_until_applied(message_worker, frame_buffer, re_id_data)
+        message_worker.close()
+
+        assert re_identifier.batch_sizes == [3]
+        assert sorted(re_id_data.get_queries()) == [10, 11, 12]
+        assert re_id_data.get_object_id_for_box(1) == 11
+
+    def test_command_order(self):
+        """Tests whether a stop command received after a start command is applied after it."""
+        frame_buffer, timestamp = buffer_frame(1)
+        ws_client = FakeWebsocket()
+        message_worker = MessageWorker(ws_client, FakeBatchingReIdentifier())
+        re_id_data = ReidData()
+
+        ws_client.message_queue.extend([StartMessage(5, frame_id=timestamp, box_id=0), StopMessage(5)])
+        process_until_applied(message_worker, frame_buffer, re_id_data)
+        message_worker.close()
+
+        assert len(re_id_data.get_queries()) == 0
+        assert message_worker.commands_handled == 2
+
+    def test_max_batch(self):
+        """Tests whether the features of at most the maximum amount of cutouts are extracted at once."""
+        frame_buffer, timestamp = buffer_frame(5)
+        ws_client = FakeWebsocket()
+        re_identifier = FakeBatchingReIdentifier()
+        message_worker = MessageWorker(ws_client, re_identifier, max_batch=2)
+        re_id_data = ReidData()
+
+        re_identifier.released.clear()
+        ws_client.message_queue.extend(StartMessage(i, frame_id=timestamp, box_id=i) for i in range(5))
+        message_worker.process(frame_buffer, re_id_data)
+        re_identifier.released.set()
+        process_until_applied(message_worker, frame_buffer, re_id_data)
+        message_worker.close()
+
+        assert max(re_identifier.batch_sizes) <= 2
+        assert sum(re_identifier.batch_sizes) == 5
+        assert len(re_id_data.get_queries()) == 5
+
+    def test_missing_frame(self):
+        """Tests whether a start command of a frame that is not buffered is dropped."""
+        frame_buffer, timestamp = buffer_frame(1)
+        ws_client = FakeWebsocket()
+        message_worker = MessageWorker(ws_client, FakeBatchingReIdentifier())
+        re_id_data = ReidData()
+
+        ws_client.message_queue.append(StartMessage(1, frame_id=timestamp + 1, box_id=0))
+        process_until_applied(message_worker, frame_buffer, re_id_data)
+        message_worker.close()
+
+        assert len(re_id_data.get_queries()) == 0
+
+
+if __name__ == '__main__':
+    pytest.main(TestMessageWorker)
@@ -0,0 +1,139 @@
+"""Testing files for the pipeline stage.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import queue
+import threading
+import time
+import pytest
+
+from processor.pipeline.pipeline_stage import PipelineStage, END_OF_STREAM, get_until_stopped, put_until_stopped
+
+
+def drain(output_queue):
+    """Gets all items from a queue until the end of the stream.
+
+    Args:
+        output_queue (queue.Queue): Queue to drain.
+
+    Returns:
+        list: Items that were in the queue before the end of the stream.
+    """
+    items = []
+    while (item := output_queue.get(timeout=5)) is not END_OF_STREAM:
+        items.append(item)
+    return items
+
+
+class TestPipelineStage:
+    """Tests pipeline_stage.py."""
+
+    @pytest.mark.timeout(10)
+    def test_chained_stages_keep_order(self):
+        """Tests whether chained stages apply all functions and keep the order of the items."""
+        stop_event = threading.Event()
+        input_queue = queue.Queue()
+        first = PipelineStage('first', lambda item: item * 2, input_queue, stop_event)
+        second = PipelineStage('second', lambda item: item + 1, first.output_queue, stop_event)
+        first.start()
+        second.start()
+
+        # Feed the items from another thread, the stage queues are bounded.
+        def feed():
+            """Puts the items and the end of the stream into the input queue."""
+            for i in range(50):
+                input_queue.put(i)
+            input_queue.put(END_OF_STREAM)
+        threading.Thread(target=feed, daemon=True).start()
+
+        assert drain(second.output_queue) == [i * 2 + 1 for i in range(50)]
+        first.join(5)
+        second.join(5)
+
+    @pytest.mark.timeout(10)
+    def test_stages_overlap(self):
+        """Tests whether two slow stages work on different items at the same time."""
+        stop_event = threading.Event()
+        input_queue = queue.Queue()
+
+        def slow(item):
+            """Passes the item on after a delay.
+
+            Args:
+                item (int): The item.
+
+            Returns:
+                int: The same item.
+            """
+            time.sleep(0.05)
+            return item
+
+        first = PipelineStage('first', slow, input_queue, stop_event)
+        second = PipelineStage('second', slow, first.output_queue, stop_event)
+        for i in range(10):
+            input_queue.put(i)
+        input_queue.put(END_OF_STREAM)
+
+        start = time.monotonic()
+        first.start()
+        second.start()
+        assert drain(second.output_queue) == list(range(10))
+
+        # Sequential execution would take 20 * 0.05 seconds.
+        assert time.monotonic() - start < 0.9
+
+    @pytest.mark.timeout(10)
+    def test_error_is_stored_and_ends_stream(self):
+        """Tests whether an exception in the stage function ends the stream and is stored in the stage."""
+        stop_event = threading.Event()
+        input_queue = queue.Queue()
+
+        def fail(item):
+            """Passes the item on, failing on the third item.
+
+            Args:
+                item (int): The item.
+
+            Returns:
+                int: The same item.
+
+            Raises:
+                ValueError: The item is the third item.
+            """
+            if item == 2:
+                raise ValueError('test error')
+            return item
+
+        stage = PipelineStage('failing', fail, input_queue, stop_event)
+        for i in range(5):
+            input_queue.put(i)
+        stage.start()
+
+        assert drain(stage.output_queue) == [0, 1]
+        stage.join(5)
+        assert isinstance(stage.error, ValueError)
+
+    @pytest.mark.timeout(10)
+    def test_stop_event_stops_blocked_stage(self):
+        """Tests whether a stage blocked on an empty input queue stops when the stop event is set."""
+        stop_event = threading.Event()
+        stage = PipelineStage('blocked', lambda item: item, queue.Queue(), stop_event)
+        stage.start()
+        stop_event.set()
+        stage.join(5)
+        assert stage.output_queue.empty()
+
+    def test_queue_helpers_give_up_when_stopped(self):
+        """Tests whether the queue helpers return once the stop event is set."""
+        stop_event = threading.Event()
+        stop_event.set()
+        full_queue = queue.Queue(maxsize=1)
+        full_queue.put(1)
+        assert not put_until_stopped(full_queue, 2, stop_event, 0.01)
+        assert get_until_stopped(queue.Queue(), stop_event, 0.01) is END_OF_STREAM
+
+
+if __name__ == '__main__':
+    pytest.main(TestPipelineStage)
@@ -5,14 +5,20 @@ Utrecht University within the Software Project course.
 © Copyright Utrecht University (Department of Information and Computing Sciences)
 """
 import asyncio
+import configparser
 import pytest
 
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_data_writer import FakeDataWriter
 from tests.unittests.utils.fake_detector import FakeDetector
 from tests.unittests.utils.fake_tracker import FakeTracker
 from tests.unittests.utils.fake_re_identifier import FakeReIdentifier
 from tests.unittests.utils.fake_websocket import FakeWebsocket
-from processor.pipeline.prepare_pipeline import prepare_objects
-from processor.pipeline.process_frames import process_stream
+from processor.pipeline.prepare_pipeline import prepare_objects, prepare_scheduler
+from processor.pipeline.frame_buffer import FrameBuffer
+from processor.pipeline.process_frames import \
+    process_stream, process_stream_pipelined, process_stream_async, process_cameras, process_offline
+from processor.pipeline.camera import Camera
 from processor.pipeline.detection.yolov5_detector import Yolov5Detector
 from processor.pipeline.detection.yolor_detector import YolorDetector
 from processor.input.video_capture import VideoCapture
@@ -55,15 +61,6 @@ class TestProcessFrames:
         """
         return YolorDetector(configs['Yolor'], configs['Filter'])
 
-    # pylint: disable=useless-return
-    def __get_sort_tracker(self):
-        """Get the SORT tracker.
-
-        Returns:
-            FakeTracker: Fake tracker implementation.
-        """
-        return FakeTracker()
-
     @pytest.mark.timeout(180)
     def test_process_stream_with_yolov5(self, configs):
         """Tests process_stream function using Yolov5.
@@ -120,6 +117,171 @@ class TestProcessFrames:
         asyncio.get_event_loop().run_until_complete(self.await_detection(capture, detector, tracker, re_identifier))
         capture.close()
 
+    @pytest.mark.timeout(180)
+    def test_process_stream_pipelined_with_fake(self, configs):
+        """Tests whether process_stream_pipelined processes all frames in order with fake stages.
+
+        Args:
+            configs (ConfigParser): Configurations of the test.
+        """
+        capture = self.__get_video(configs)
+        timestamps = []
+
+        # Process the stream and close the capture.
+        asyncio.get_event_loop().run_until_complete(process_stream_pipelined(
+            capture,
+            FakeDetector(),
+            FakeTracker(),
+            FakeReIdentifier(),
+            lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+            timestamps.append(frame_obj.timestamp),
+            FakeWebsocket()
+        ))
+        capture.close()
+
+        assert len(timestamps) > 0
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.timeout(60)
+    def test_process_stream_pipelined_capture_error(self):
+        """Tests whether process_stream_pipelined raises the error of a frame that could not be read."""
+        timestamps = []
+
+        with pytest.raises(RuntimeError, match='Could not decode frame 3'):
+            asyncio.run(process_stream_pipelined(
+                FakeCapture(10, fail_at=3),
+                FakeDetector(),
+                FakeTracker(),
+                FakeReIdentifier(),
+                lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+                timestamps.append(frame_obj.timestamp)
+            ))
+
+        # The frames read before the error are processed.
+        assert len(timestamps) == 3
+
+    @pytest.mark.timeout(180)
+    def test_process_stream_async_with_fake(self, configs):
+        """Tests whether process_stream_async processes all frames in order while the event loop stays responsive.
+
+        Args:
+            configs (ConfigParser): Configurations of the test.
+        """
+        capture = self.__get_video(configs)
+        timestamps = []
+        ticks = []
+
+        async def tick():
+            """Counts the times the event loop got to run it."""
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0.001)
+
+        async def run():
+            """Processes the stream while ticking."""
+            ticker = asyncio.ensure_future(tick())
+            await process_stream_async(
+                capture,
+                FakeDetector(),
+                FakeTracker(),
+                FakeReIdentifier(),
+                lambda frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+                timestamps.append(frame_obj.timestamp),
+                FakeWebsocket()
+            )
+            ticker.cancel()
+
+        # Process the stream and close the capture.
+        asyncio.get_event_loop().run_until_complete(run())
+        capture.close()
+
+        assert len(timestamps) > 0
+        assert timestamps == sorted(timestamps)
+        assert len(ticks) > 0
+
+    def test_scheduler_refuses_process_pool(self):
+        """Tests whether the concurrent scheduler refuses a process pool, which would lose the state of the stages."""
+        configs = configparser.ConfigParser()
+        configs.read_dict({'Scheduler': {'type': 'concurrent', 'executor': 'process'}})
+
+        with pytest.raises(ValueError, match='thread pool'):
+            prepare_scheduler(FakeDetector(), FakeTracker(), FakeReIdentifier(), lambda *boxes: None,
+                              FrameBuffer(10), configs['Scheduler'])
+
+    @pytest.mark.timeout(180)
+    def test_process_cameras_with_fake(self):
+        """Tests whether process_cameras processes the frames of every camera in order, with its own state."""
+        cameras = [Camera('camera_1', FakeCapture(5), FakeTracker(), FakeWebsocket()),
+                   Camera('camera_2', FakeCapture(8), FakeTracker(), FakeWebsocket())]
+        timestamps = {camera.identifier: [] for camera in cameras}
+
+        asyncio.get_event_loop().run_until_complete(process_cameras(
+            cameras,
+            FakeDetector(),
+            FakeReIdentifier(),
+            lambda camera, frame_obj, detected_boxes, tracked_boxes, re_id_tracked_boxes:
+            timestamps[camera.identifier].append(frame_obj.timestamp)
+        ))
+
+        assert [len(timestamps['camera_1']), len(timestamps['camera_2'])] == [5, 8]
+        assert all(camera_timestamps == sorted(camera_timestamps) for camera_timestamps in timestamps.values())
+        assert [camera.frame_nr for camera in cameras] == [5, 8]
+
+    @pytest.mark.timeout(60)
+    @pytest.mark.parametrize('batch_size', [1, 3, 20])
+    def test_process_offline_with_fake(self, batch_size):
+        """Tests whether process_offline writes every frame in order, numbered from 1.
+
+        Args:
+            batch_size (int): Maximum amount of frames detected at once.
+        """
+        det_writer = FakeDataWriter()
+        track_writer = FakeDataWriter()
+
+        frames = process_offline(FakeCapture(10, shape=(48, 64)), FakeDetector(), FakeTracker(),
+                                 det_writer, track_writer, batch_size=batch_size, read_ahead=4)
+
+        assert frames == 10
+        for writer in [det_writer, track_writer]:
+            assert [bounding_boxes.image_id for bounding_boxes, _ in writer.written] == list(range(1, 11))
+            assert all(shape == (64, 48) for _, shape in writer.written)
+
+    @pytest.mark.timeout(60)
+    def test_process_offline_without_tracker(self):
+        """Tests whether process_offline only writes detections when tracking is left out of the plan."""
+        det_writer = FakeDataWriter()
+        track_writer = FakeDataWriter()
+
+        process_offline(FakeCapture(5), FakeDetector(), None, det_writer, track_writer, batch_size=2)
+
+        assert len(det_writer.written) == 5
+        assert len(track_writer.written) == 0
+
+    @pytest.mark.timeout(60)
+    def test_process_offline_from_middle(self):
+        """Tests whether process_offline numbers the frames by their position in the video after a seek."""
+        det_writer = FakeDataWriter()
+        capture = FakeCapture(10, fps=10)
+        capture.seek(0.4)
+
+        frames = process_offline(capture, FakeDetector(), None, det_writer, FakeDataWriter(),
+                                 batch_size=2, start_frame_nr=capture.frame_nr)
+
+        assert frames == 6
+        assert [bounding_boxes.image_id for bounding_boxes, _ in det_writer.written] == list(range(5, 11))
+
+    @pytest.mark.timeout(60)
+    def test_process_offline_capture_error(self):
+        """Tests whether process_offline raises the error of a frame that could not be read, instead of hanging."""
+        det_writer = FakeDataWriter()
+
+        with pytest.raises(RuntimeError, match='Could not decode frame 5'):
+            process_offline(FakeCapture(10, fail_at=5), FakeDetector(), FakeTracker(), det_writer, FakeDataWriter(),
+                            batch_size=2, read_ahead=2)
+
+        # The frames read before the error are processed.
+        assert [bounding_boxes.image_id for bounding_boxes, _ in det_writer.written] == list(range(1, 6))
+
     async def await_detection(self, capture, detector, tracker, re_identifier):
         """Async function that runs process_stream.
 
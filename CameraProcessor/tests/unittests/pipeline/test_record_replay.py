@@ -0,0 +1,137 @@
+"""Tests recording the frames and stage outputs to a binary log and replaying them.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import numpy as np
+import pytest
+
+from tests.unittests.utils.fake_capture import FakeCapture
+from tests.unittests.utils.fake_detector import FakeDetector
+from tests.unittests.utils.fake_tracker import FakeTracker
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.input.recording_capture import RecordingCapture
+from processor.input.replay_capture import ReplayCapture
+from processor.pipeline.recording.record_log import RecordLog
+from processor.pipeline.recording.record_log_writer import RecordLogWriter
+from processor.pipeline.recording.recording_detector import RecordingDetector
+from processor.pipeline.recording.recording_tracker import RecordingTracker
+from processor.pipeline.recording.replay_detector import ReplayDetector
+from processor.pipeline.recording.replay_tracker import ReplayTracker
+from processor.pipeline.reidentification.reid_data import ReidData
+
+
+def record(path, frames, nr_frames=5):
+    """Records a fake capture, detector and tracker.
+
+    Args:
+        path (str): Path of the log.
+        frames (str): Way the frames are stored.
+        nr_frames (int): Amount of frames recorded.
+
+    Returns:
+        [(FrameObj, BoundingBoxes, BoundingBoxes)]: Every recorded frame with its detections and tracked objects.
+    """
+    writer = RecordLogWriter(path, frames)
+    capture = RecordingCapture(FakeCapture(nr_frames), writer, frame_format='.png')
+    detector = RecordingDetector(FakeDetector(), writer)
+    tracker = RecordingTracker(FakeTracker(), writer)
+    re_id_data = ReidData()
+
+    recorded = []
+    while capture.opened():
+        _, frame_obj = capture.get_next_frame()
+        detected_boxes = detector.detect(frame_obj)
+        recorded.append((frame_obj, detected_boxes, tracker.track(frame_obj, detected_boxes, re_id_data)))
+    capture.close()
+
+    return recorded
+
+
+class TestRecordReplay:
+    """Tests recording and replaying the capture and stages."""
+    def test_replay_encoded(self, tmp_path):
+        """Tests whether encoded frames and the stage outputs are replayed exactly.
+
+        Args:
+            tmp_path (Path): Temporary directory the recording is written to.
+        """
+        path = os.path.join(tmp_path, 'recording.bin')
+        recorded = record(path, 'encoded')
+
+        record_log = RecordLog(path)
+        capture = ReplayCapture(record_log)
+        detector = ReplayDetector(record_log)
+        tracker = ReplayTracker(record_log)
+
+        replayed = []
+        while capture.opened():
+            _, frame_obj = capture.get_next_frame()
+            detected_boxes = detector.detect(frame_obj)
+            replayed.append((frame_obj, detected_boxes, tracker.track(frame_obj, BoundingBoxes([]), ReidData())))
+        capture.close()
+
+        assert len(replayed) == len(recorded)
+        for (frame_obj, detected_boxes, tracked_boxes), (replayed_frame_obj, replayed_detected_boxes,
+                                                           replayed_tracked_boxes) in zip(recorded, replayed):
+            assert replayed_frame_obj.timestamp == frame_obj.timestamp
+            assert np.array_equal(replayed_frame_obj.frame, frame_obj.frame)
+            assert replayed_detected_boxes == detected_boxes
+            assert replayed_tracked_boxes == tracked_boxes
+
+    def test_replay_without_frames(self, tmp_path):
+        """Tests whether a recording without frames replays blank frames of the recorded size.
+
+        Args:
+            tmp_path (Path): Temporary directory the recording is written to.
+        """
+        path = os.path.join(tmp_path, 'recording.bin')
+        record(path, 'none', nr_frames=3)
+
+        capture = ReplayCapture(RecordLog(path))
+        shapes = []
+        while capture.opened():
+            _, frame_obj = capture.get_next_frame()
+            shapes.append(frame_obj.shape)
+
+        assert shapes == [(64, 48)] * 3
+
+    def test_boxes_round_trip(self, tmp_path):
+        """Tests whether object ids, certainties and classifications are stored exactly.
+
+        Args:
+            tmp_path (Path): Temporary directory the recording is written to.
+        """
+        path = os.path.join(tmp_path, 'recording.bin')
+        _, frame_obj = FakeCapture(1).get_next_frame()
+        bounding_boxes = BoundingBoxes([BoundingBox(3, Rectangle(0.1, 0.2, 0.3, 0.4), 'person', 0.123456789, 7),
+                                        BoundingBox(4, Rectangle(0, 0, 1, 1), 'car', 0.5)])
+
+        writer = RecordLogWriter(path, 'none')
+        writer.write_stage('re-identification', frame_obj, bounding_boxes)
+        writer.close()
+
+        replayed_boxes = RecordLog(path).stage_output('re-identification', frame_obj)
+        assert replayed_boxes == bounding_boxes
+        assert [bounding_box.object_id for bounding_box in replayed_boxes] == [7, None]
+
+    def test_missing_output(self, tmp_path):
+        """Tests whether replaying a stage on a frame it did not run on raises an error.
+
+        Args:
+            tmp_path (Path): Temporary directory the recording is written to.
+        """
+        path = os.path.join(tmp_path, 'recording.bin')
+        record(path, 'none', nr_frames=1)
+        _, frame_obj = FakeCapture(1).get_next_frame()
+
+        with pytest.raises(KeyError):
+            RecordLog(path).stage_output('re-identification', frame_obj)
+
+
+if __name__ == '__main__':
+    pytest.main(TestRecordReplay)
@@ -54,6 +54,25 @@ class TestScheduleNode:
         schedule_node = ScheduleNode(1, [], InputComponent(), {})
         assert pytest.raises(IndexError, schedule_node.assign, 'val', 2)
 
+    def test_prepare_arguments_fills_globals(self):
+        """Tests whether prepare_arguments gives the assigned arguments together with the globals."""
+        schedule_node = ScheduleNode(2, [], InputComponent(), {'global_var': 1})
+        schedule_node.assign('val', 0)
+        assert schedule_node.prepare_arguments({'global_var': 'global'}) == ('val', 'global')
+
+    def test_propagate_assigns_output_and_resets(self):
+        """Tests whether propagate passes the output to the next layer, notifies ready nodes and resets the node."""
+        out_node = ScheduleNode(1, [], InputComponent(), {})
+        schedule_node = ScheduleNode(1, [(out_node, 0)], InputComponent(), {})
+        schedule_node.assign('val', 0)
+
+        notified = []
+        schedule_node.propagate('out', notified.extend)
+
+        assert notified == [out_node]
+        assert out_node.prepare_arguments({}) == ('out',)
+        assert not schedule_node.executable()
+
 
 if __name__ == '__main__':
     pytest.main(TestScheduleNode)
@@ -0,0 +1,106 @@
+"""Tests the built-in and declared pipeline plans.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from processor.scheduling.plan import pipeline_plan
+from processor.scheduling.component.func_call_component import FuncCallComponent
+from processor.scheduling.scheduler import Scheduler
+from processor.scheduling.compiled_scheduler import CompiledScheduler, compile_plan
+
+
+def create_plan(stages, outputs, executed):
+    """Creates the pipeline plan with components recording their execution.
+
+    Args:
+        stages ([str]): Stages of the plan.
+        outputs ([tuple]): List the arguments of the function node are appended to.
+        executed ([str]): List the names of the executed components are appended to.
+
+    Returns:
+        ScheduleNode: the starting node of the plan.
+    """
+    def component(name):
+        """Creates a component recording its execution.
+
+        Args:
+            name (str): Name of the component, which it outputs.
+
+        Returns:
+            FuncCallComponent: The component.
+        """
+        def execute(*_):
+            """Records the execution, ignoring the inputs.
+
+            Returns:
+                str: Name of the component.
+            """
+            executed.append(name)
+            return name
+        return FuncCallComponent(execute)
+
+    plan_args = dict(pipeline_plan.plan_inputs)
+    plan_args['detector'] = component('detection')
+    plan_args['tracker'] = component('tracking')
+    plan_args['re_identifier'] = component('re-identification')
+    plan_args['frame_buffer'] = component('frame buffer')
+    plan_args['func'] = lambda *arguments: outputs.append(arguments)
+
+    return pipeline_plan.create_plan(plan_args, stages)
+
+
+class TestPipelinePlan:
+    """Tests the pipeline plans."""
+    @pytest.mark.parametrize('plan, stages, output', [
+        ('detect', ['detection'], ('frame', 'detection', 'detection', 'detection')),
+        ('detect_track', ['detection', 'tracking'], ('frame', 'detection', 'tracking', 'tracking')),
+        ('full', ['detection', 'tracking', 're-identification', 'frame buffer'],
+         ('frame', 'detection', 'tracking', 're-identification'))
+    ])
+    def test_built_in_plans(self, plan, stages, output):
+        """Tests whether left out stages are not part of the graph and their outputs are taken over.
+
+        Args:
+            plan (str): Name of the built-in plan.
+            stages ([str]): Stages executed by the plan.
+            output (tuple): Arguments the function node is called with.
+        """
+        outputs, executed = [], []
+        start_node = create_plan(pipeline_plan.parse_plan(plan), outputs, executed)
+
+        Scheduler(start_node).schedule_graph([], {'frame_obj': 'frame', 're_id_data': None})
+
+        assert sorted(executed) == sorted(stages)
+        assert outputs == [output]
+        assert len(compile_plan(start_node)) == len(stages) + 1
+
+    def test_compiled_plan(self):
+        """Tests whether a plan without tracking runs on the compiled scheduler."""
+        outputs = []
+        scheduler = CompiledScheduler(create_plan(['detection'], outputs, []))
+
+        for _ in range(2):
+            scheduler.schedule_graph([], {'frame_obj': 'frame', 're_id_data': None})
+
+        assert outputs == [('frame', 'detection', 'detection', 'detection')] * 2
+
+    def test_declared_plan(self):
+        """Tests whether a plan can be declared as the first stages of the pipeline."""
+        assert pipeline_plan.parse_plan('Detection, tracking') == ['detection', 'tracking']
+
+    @pytest.mark.parametrize('plan', ['unknown', 'tracking', 'detection, re-identification', ''])
+    def test_invalid_plan(self, plan):
+        """Tests whether unknown plans and plans skipping a needed stage raise a NameError.
+
+        Args:
+            plan (str): The invalid plan.
+        """
+        with pytest.raises(NameError):
+            pipeline_plan.parse_plan(plan)
+
+
+if __name__ == '__main__':
+    pytest.main(TestPipelinePlan)
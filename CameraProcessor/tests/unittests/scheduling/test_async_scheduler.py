@@ -0,0 +1,95 @@
+"""Tests the asyncio scheduler using the schedules of the schedule wrapper.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import asyncio
+import threading
+import time
+import pytest
+
+from tests.unittests.scheduling.utils.schedule_wrapper import ScheduleWrapper
+from processor.scheduling.async_scheduler import AsyncScheduler, run_function
+from processor.scheduling.component.func_call_component import FuncCallComponent
+from processor.scheduling.node.schedule_node import ScheduleNode
+
+
+class TestAsyncScheduler:
+    """Tests functionality of the asyncio scheduler class with different schedules."""
+    def test_schedule_graph(self):
+        """Tests whether the big schedule gives the same output as the sequential scheduler."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_big_schedule()
+        scheduler = AsyncScheduler(schedule_wrapper.schedule_input_node)
+
+        for _ in range(2):
+            asyncio.run(scheduler.schedule_graph(['big'], {}))
+            assert schedule_wrapper.schedule_output_node.component.out == \
+                   'big,start,start,first_arg,big,start,start,second_arg,merged'
+
+    def test_global_schedule_graph(self):
+        """Test whether globals are passed to the components."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_global_schedule()
+        scheduler = AsyncScheduler(schedule_wrapper.schedule_input_node)
+
+        global_readonly = schedule_wrapper.global_readonly
+        global_readonly['global_var'] = 'global'
+
+        asyncio.run(scheduler.schedule_graph([], global_readonly))
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'global,start'
+
+    def test_coroutine_component_is_awaited(self):
+        """Tests whether a component with a coroutine function as work function is awaited."""
+        results = []
+
+        async def add_suffix(value):
+            await asyncio.sleep(0)
+            return value + ',awaited'
+
+        output_node = ScheduleNode(1, [], FuncCallComponent(results.append, inline=True), {})
+        start_node = ScheduleNode(1, [(output_node, 0)], FuncCallComponent(add_suffix), {})
+
+        asyncio.run(AsyncScheduler(start_node).schedule_graph(['value'], {}))
+
+        assert results == ['value,awaited']
+
+    @pytest.mark.timeout(10)
+    def test_event_loop_stays_responsive(self):
+        """Tests whether the event loop keeps running other tasks while a blocking component runs."""
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        start_node = ScheduleNode(1, [], FuncCallComponent(lambda _: time.sleep(0.2)), {})
+        scheduler = AsyncScheduler(start_node)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            await scheduler.schedule_graph(['value'], {})
+            ticker.cancel()
+
+        asyncio.run(run())
+
+        # A blocked event loop would only tick once.
+        assert len(ticks) > 5
+
+    def test_run_function_threads(self):
+        """Tests whether blocking functions run on the executor and inline functions on the event loop."""
+        async def run():
+            return await run_function(threading.current_thread, ()), \
+                await run_function(threading.current_thread, (), inline=True)
+
+        blocking_thread, inline_thread = asyncio.run(run())
+
+        assert blocking_thread is not threading.current_thread()
+        assert inline_thread is threading.current_thread()
+
+
+if __name__ == '__main__':
+    pytest.main(TestAsyncScheduler)
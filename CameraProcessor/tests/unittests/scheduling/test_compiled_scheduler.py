@@ -0,0 +1,85 @@
+"""Tests the plan compiler and the compiled scheduler using the schedules of the schedule wrapper.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+
+from tests.unittests.scheduling.utils.schedule_wrapper import ScheduleWrapper
+from processor.scheduling.compiled_scheduler import CompiledScheduler, compile_plan
+from processor.scheduling.component.func_call_component import FuncCallComponent
+from processor.scheduling.node.schedule_node import ScheduleNode
+from processor.scheduling.benchmark import create_no_op_plan, benchmark
+
+
+class TestCompiledScheduler:
+    """Tests functionality of the compiled scheduler and the plan compiler."""
+    def test_small_schedule_graph(self):
+        """Tests whether a schedule only containing an output node gives correct output."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_empty_schedule()
+        scheduler = CompiledScheduler(schedule_wrapper.schedule_input_node)
+
+        scheduler.schedule_graph(['small'], {})
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'small'
+
+    def test_schedule_graph_multiple_iterations(self):
+        """Tests whether the big schedule gives the same output as the sequential scheduler every iteration."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_big_schedule()
+        scheduler = CompiledScheduler(schedule_wrapper.schedule_input_node)
+
+        for _ in range(3):
+            scheduler.schedule_graph(['big'], {})
+            assert schedule_wrapper.schedule_output_node.component.out == \
+                   'big,start,start,first_arg,big,start,start,second_arg,merged'
+
+    def test_global_schedule_graph(self):
+        """Test whether the precomputed global bindings are filled in every iteration."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_global_schedule()
+        scheduler = CompiledScheduler(schedule_wrapper.schedule_input_node)
+
+        for value in ['first', 'second']:
+            scheduler.schedule_graph([], {'global_var': value})
+            assert schedule_wrapper.schedule_output_node.component.out == f'{value},start'
+
+    def test_compile_pipeline_plan_order(self):
+        """Tests whether every step of the pipeline plan comes after all steps it depends on."""
+        program = compile_plan(create_no_op_plan())
+
+        # Detection, tracking, re-identification and the two output nodes.
+        assert len(program) == 5
+
+        # Every output binding points to the slots of a later step.
+        slot_ids = [id(step.arguments) for step in program]
+        for i, step in enumerate(program):
+            for out_arguments, _ in step.out_bindings:
+                assert slot_ids.index(id(out_arguments)) > i
+
+    def test_compile_detects_missing_argument(self):
+        """Tests whether a node of which an argument is never provided cannot be compiled."""
+        output_node = ScheduleNode(2, [], FuncCallComponent(lambda first, second: None), {})
+        start_node = ScheduleNode(1, [(output_node, 0)], FuncCallComponent(lambda value: value), {})
+
+        assert pytest.raises(Exception, compile_plan, start_node)
+
+    def test_compile_detects_cycle(self):
+        """Tests whether a plan containing a cycle cannot be compiled."""
+        first_node = ScheduleNode(1, [], FuncCallComponent(lambda value: value), {})
+        second_node = ScheduleNode(1, [(first_node, 0)], FuncCallComponent(lambda value: value), {})
+        first_node.out_nodes.append((second_node, 0))
+
+        assert pytest.raises(Exception, compile_plan, first_node)
+
+    def test_benchmark(self):
+        """Tests whether the benchmark times both schedulers."""
+        timings = benchmark(10)
+        assert set(timings.keys()) == {'interpreted', 'compiled'}
+        assert all(timing > 0 for timing in timings.values())
+
+
+if __name__ == '__main__':
+    pytest.main(TestCompiledScheduler)
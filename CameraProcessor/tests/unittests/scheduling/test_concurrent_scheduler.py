@@ -0,0 +1,153 @@
+"""Tests the concurrent scheduler using the schedules of the schedule wrapper.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+import pytest
+
+from tests.unittests.scheduling.utils.schedule_wrapper import ScheduleWrapper
+from processor.scheduling.concurrent_scheduler import ConcurrentScheduler, create_executor
+from processor.scheduling.component.func_call_component import FuncCallComponent
+from processor.scheduling.node.schedule_node import ScheduleNode
+
+
+def create_concurrent_scheduler(schedule_wrapper):
+    """Creates a concurrent scheduler for the plan of the schedule wrapper, running on a pool of two threads.
+
+    Args:
+        schedule_wrapper (ScheduleWrapper): wrapper containing a prepared schedule.
+
+    Returns:
+        ConcurrentScheduler: the concurrent scheduler running the schedule.
+    """
+    return ConcurrentScheduler(schedule_wrapper.schedule_input_node, create_executor('thread', 2))
+
+
+class TestConcurrentScheduler:
+    """Tests functionality of the concurrent scheduler class with different schedules."""
+    def test_small_schedule_graph(self):
+        """Tests whether a schedule only containing an output node gives correct output."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_empty_schedule()
+        scheduler = create_concurrent_scheduler(schedule_wrapper)
+
+        scheduler.schedule_graph(['small'], {})
+        scheduler.shutdown()
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'small'
+
+    @pytest.mark.parametrize('iterations', [1, 3])
+    def test_schedule_graph(self, iterations):
+        """Tests whether the big schedule gives the same output as the sequential scheduler for every iteration.
+
+        Args:
+            iterations (int): amount of times the graph is scheduled.
+        """
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_big_schedule()
+        scheduler = create_concurrent_scheduler(schedule_wrapper)
+
+        for _ in range(iterations):
+            scheduler.schedule_graph(['big'], {})
+            assert schedule_wrapper.schedule_output_node.component.out == \
+                   'big,start,start,first_arg,big,start,start,second_arg,merged'
+
+        scheduler.shutdown()
+
+    def test_global_schedule_graph(self):
+        """Test whether globals are passed to components executed on the pool."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_global_schedule()
+        scheduler = create_concurrent_scheduler(schedule_wrapper)
+
+        global_readonly = schedule_wrapper.global_readonly
+        global_readonly['global_var'] = 'global'
+
+        scheduler.schedule_graph([], global_readonly)
+        scheduler.shutdown()
+
+        assert schedule_wrapper.schedule_output_node.component.out == 'global,start'
+
+    @pytest.mark.timeout(10)
+    def test_independent_nodes_run_concurrently(self):
+        """Tests whether two ready nodes are executed at the same time and joined before the next layer."""
+        barrier = threading.Barrier(2, timeout=5)
+        results = []
+
+        def wait_on_other(value):
+            """Waits until the other node is running at the same time.
+
+            Args:
+                value (str): The input of the node.
+
+            Returns:
+                str: The same input.
+            """
+            barrier.wait()
+            return value
+
+        output_node = ScheduleNode(2, [], FuncCallComponent(lambda first, second: results.append((first, second))), {})
+        first_node = ScheduleNode(1, [(output_node, 0)], FuncCallComponent(wait_on_other), {})
+        second_node = ScheduleNode(1, [(output_node, 1)], FuncCallComponent(wait_on_other), {})
+        start_node = ScheduleNode(1, [(first_node, 0), (second_node, 0)], FuncCallComponent(lambda value: value), {})
+
+        scheduler = ConcurrentScheduler(start_node, create_executor('thread', 2))
+        scheduler.schedule_graph(['value'], {})
+        scheduler.shutdown()
+
+        assert results == [('value', 'value')]
+
+    def test_inline_component_runs_on_calling_thread(self):
+        """Tests whether inline components are executed on the thread calling schedule_graph."""
+        threads = []
+        output_node = ScheduleNode(1, [], FuncCallComponent(lambda _: threads.append(threading.current_thread()),
+                                                            inline=True), {})
+        start_node = ScheduleNode(1, [(output_node, 0)], FuncCallComponent(lambda value: value), {})
+
+        scheduler = ConcurrentScheduler(start_node, create_executor('thread', 2))
+        scheduler.schedule_graph(['value'], {})
+        scheduler.shutdown()
+
+        assert threads == [threading.current_thread()]
+
+    def test_component_exception_is_raised(self):
+        """Tests whether an exception inside a component executed on the pool is raised by schedule_graph."""
+        def fail(_):
+            """Fails the component.
+
+            Raises:
+                ValueError: Always.
+            """
+            raise ValueError('test error')
+
+        start_node = ScheduleNode(1, [], FuncCallComponent(fail), {})
+        scheduler = ConcurrentScheduler(start_node, create_executor('thread', 2))
+
+        with pytest.raises(ValueError):
+            scheduler.schedule_graph(['value'], {})
+        scheduler.shutdown()
+
+    def test_unknown_executor(self):
+        """Tests whether an unknown executor type, such as a process pool, raises a NameError."""
+        with pytest.raises(NameError):
+            create_executor('unknown')
+        with pytest.raises(NameError):
+            create_executor('process')
+
+    def test_push_removes_duplicates(self):
+        """Tests whether duplicates are not marked as ready twice."""
+        schedule_wrapper = ScheduleWrapper()
+        schedule_wrapper.prepare_empty_schedule()
+        scheduler = create_concurrent_scheduler(schedule_wrapper)
+
+        scheduler.push(schedule_wrapper.schedule_input_node)
+        scheduler.push(schedule_wrapper.schedule_input_node)
+        scheduler.shutdown()
+
+        assert scheduler.queue_size == 1
+
+
+if __name__ == '__main__':
+    pytest.main(TestConcurrentScheduler)
@@ -0,0 +1,36 @@
+"""Mock re-identifier recording the batches it extracts features of, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+
+from tests.unittests.utils.fake_re_identifier import FakeReIdentifier
+
+
+class FakeBatchingReIdentifier(FakeReIdentifier):
+    """Fake re-identifier recording the amount of images of every extraction, which waits until it is released.
+
+    Attributes:
+        batch_sizes ([int]): Amount of images of every extraction.
+        released (threading.Event): Set to let extractions continue.
+    """
+    def __init__(self):
+        """Inits the re-identifier as released."""
+        self.batch_sizes = []
+        self.released = threading.Event()
+        self.released.set()
+
+    def extract_features_from_images(self, images):
+        """Records the amount of images and returns a feature vector of the height of every image.
+
+        Args:
+            images ([np.ndarray]): the images of the objects to extract features from.
+
+        Returns:
+            [[float]]: Feature vector of every image.
+        """
+        self.released.wait()
+        self.batch_sizes.append(len(images))
+        return [[float(image.shape[0])] for image in images]
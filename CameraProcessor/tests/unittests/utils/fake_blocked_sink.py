@@ -0,0 +1,37 @@
+"""Mock sink of which writing waits until it is released, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import threading
+
+from processor.output.i_sink import ISink
+
+
+class FakeBlockedSink(ISink):
+    """Sink of which writing waits until it is released, recording every written batch.
+
+    Attributes:
+        batches ([[float]]): Timestamps of the frames of every written batch.
+        released (threading.Event): Set to let writing continue.
+        closed (bool): Whether the sink was closed.
+    """
+    def __init__(self):
+        """Inits the sink as blocked."""
+        self.batches = []
+        self.released = threading.Event()
+        self.closed = False
+
+    def write(self, outputs):
+        """Waits until the sink is released, then records the batch.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+        """
+        self.released.wait()
+        self.batches.append([frame_obj.timestamp for frame_obj, _, _, _ in outputs])
+
+    def close(self):
+        """Marks the sink as closed."""
+        self.closed = True
@@ -0,0 +1,115 @@
+"""Mock capture for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+import numpy as np
+
+from processor.input.i_capture import ICapture
+from processor.data_object.frame_obj import FrameObj
+
+
+class FakeCapture(ICapture):
+    """A fake capture returning a fixed number of blank frames at a given frame rate.
+
+    Attributes:
+        nr_frames (int): Number of frames the capture returns.
+        fps (float): Frame rate of the frame timestamps, frames are also returned at this rate if realtime is set.
+        realtime (bool): Whether get_next_frame waits until the next frame is due.
+        frame_nr (int): Number of frames returned or skipped.
+        frames_skipped (int): Number of frames skipped without creating them.
+        start_time (float): Time the first frame was requested.
+        fail_at (int): Number of the frame of which reading raises an error, None if reading never fails.
+    """
+    def __init__(self, nr_frames=10, fps=100, realtime=False, shape=(48, 64), fail_at=None):
+        """Inits the fake capture.
+
+        Args:
+            nr_frames (int): Number of frames the capture returns.
+            fps (float): Frame rate of the frame timestamps.
+            realtime (bool): Whether get_next_frame waits until the next frame is due.
+            shape ((int, int)): Height and width of the frames.
+            fail_at (int): Number of the frame of which reading raises an error, like a corrupt frame of a file.
+        """
+        self.nr_frames = nr_frames
+        self.fps = fps
+        self.realtime = realtime
+        self.fail_at = fail_at
+        self.frame_nr = 0
+        self.frames_skipped = 0
+        self.start_time = None
+        self.__shape = shape
+
+    def opened(self):
+        """Capture is opened as long as not all frames were returned.
+
+        Returns:
+            bool: Whether there are frames left.
+        """
+        return self.frame_nr < self.nr_frames
+
+    def close(self):
+        """Closes the capture by skipping all frames that are left."""
+        self.frame_nr = self.nr_frames
+
+    def skip_frame(self):
+        """Skips the next frame without creating it, like a grab without decoding.
+
+        Returns:
+            bool: Whether a frame was left to skip.
+        """
+        if not self.opened():
+            return False
+
+        if self.start_time is None:
+            self.start_time = time.time()
+
+        if self.realtime:
+            time.sleep(max(0.0, self.start_time + self.frame_nr / self.fps - time.time()))
+
+        self.frame_nr += 1
+        self.frames_skipped += 1
+        return True
+
+    def seek(self, seconds):
+        """Moves to the frame at a position in the stream.
+
+        Args:
+            seconds (float): Position to move to.
+
+        Returns:
+            bool: Always True, the capture moved.
+        """
+        self.frame_nr = min(round(seconds * self.fps), self.nr_frames)
+        self.start_time = None
+        return True
+
+    def get_next_frame(self):
+        """Gets the next blank frame, of which the timestamp is its position in the stream.
+
+        Returns:
+            bool, FrameObj: Whether a frame was left, and the frame.
+
+        Raises:
+            RuntimeError: The frame is the frame reading fails at.
+        """
+        if not self.opened():
+            return False, None
+
+        if self.frame_nr == self.fail_at:
+            raise RuntimeError(f'Could not decode frame {self.frame_nr}')
+
+        if self.start_time is None:
+            self.start_time = time.time()
+
+        timestamp = self.frame_nr / self.fps
+
+        # Wait until the frame is due.
+        if self.realtime:
+            time.sleep(max(0.0, self.start_time + timestamp - time.time()))
+
+        self.frame_nr += 1
+        frame = np.full((*self.__shape, 3), self.frame_nr % 256, dtype=np.uint8)
+        return True, FrameObj(frame, timestamp)
@@ -0,0 +1,34 @@
+"""Mock data writer for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.data_writer.i_data_writer import IDataWriter
+
+
+class FakeDataWriter(IDataWriter):
+    """Data writer keeping the written bounding boxes in a list.
+
+    Attributes:
+        written ([(BoundingBoxes, (int, int))]): The written bounding boxes with the shape of their frame.
+        closed (bool): Whether the writer was closed.
+    """
+    def __init__(self):
+        """Inits an empty writer."""
+        super().__init__()
+        self.written = []
+        self.closed = False
+
+    def write(self, bounding_boxes, shape):
+        """Keeps the bounding boxes.
+
+        Args:
+            bounding_boxes (BoundingBoxes): Bounding boxes to write.
+            shape ((int, int)): Width and height of the frame.
+        """
+        self.written.append((bounding_boxes, shape))
+
+    def close(self):
+        """Marks the writer as closed."""
+        self.closed = True
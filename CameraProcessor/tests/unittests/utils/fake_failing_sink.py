@@ -0,0 +1,21 @@
+"""Mock sink of which writing always fails, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.output.i_sink import ISink
+
+
+class FakeFailingSink(ISink):
+    """Sink of which writing always fails."""
+    def write(self, outputs):
+        """Raises an error.
+
+        Args:
+            outputs ([(FrameObj, BoundingBoxes, BoundingBoxes, BoundingBoxes)]): Outputs of every frame of the batch.
+
+        Raises:
+            OSError: Always.
+        """
+        raise OSError('Sink failed')
@@ -0,0 +1,46 @@
+"""Mock detector detecting a moving object, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from processor.data_object.bounding_box import BoundingBox
+from processor.data_object.bounding_boxes import BoundingBoxes
+from processor.data_object.rectangle import Rectangle
+from processor.pipeline.detection.i_detector import IDetector
+
+
+class FakeMovingDetector(IDetector):
+    """Detector detecting a single box moving horizontally at a constant speed.
+
+    Attributes:
+        speed (float): Horizontal movement per frame, relative to the frame width.
+        frame_nr (int): Number of the current frame.
+        detections (int): Amount of times detect was called.
+    """
+    def __init__(self, speed):
+        """Inits the detector.
+
+        Args:
+            speed (float): Horizontal movement per frame, relative to the frame width.
+        """
+        self.speed = speed
+        self.frame_nr = 0
+        self.detections = 0
+
+    def next_frame(self):
+        """Moves the box to the next frame."""
+        self.frame_nr += 1
+
+    def detect(self, frame_obj):
+        """Detects the box at its position in the current frame.
+
+        Args:
+            frame_obj (FrameObj): object containing frame and timestamp.
+
+        Returns:
+            BoundingBoxes: The single moving box.
+        """
+        self.detections += 1
+        x1 = 0.1 + self.speed * self.frame_nr
+        return BoundingBoxes([BoundingBox(0, Rectangle(x1, 0.2, x1 + 0.2, 0.8), 'person', 0.9)])
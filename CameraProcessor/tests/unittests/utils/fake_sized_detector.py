@@ -0,0 +1,46 @@
+"""Mock detector of which the latency depends on its inference size, for testing.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import time
+
+from tests.unittests.utils.fake_detector import FakeDetector
+
+
+class FakeSizedDetector(FakeDetector):
+    """Fake detector of which the latency is proportional to its inference size.
+
+    Attributes:
+        img_size (int): Inference size in pixels.
+        seconds_per_pixel (float): Latency per pixel of inference size.
+    """
+    def __init__(self, seconds_per_pixel):
+        """Inits the detector.
+
+        Args:
+            seconds_per_pixel (float): Latency per pixel of inference size.
+        """
+        self.img_size = 640
+        self.seconds_per_pixel = seconds_per_pixel
+
+    def set_img_size(self, img_size):
+        """Changes the inference size.
+
+        Args:
+            img_size (int): Inference size in pixels.
+        """
+        self.img_size = img_size
+
+    def detect(self, frame_obj):
+        """Sleeps proportionally to the inference size, after which random bounding boxes are detected.
+
+        Args:
+            frame_obj (FrameObj): Object containing the frame.
+
+        Returns:
+            BoundingBoxes: Dummy bounding boxes.
+        """
+        time.sleep(self.img_size * self.seconds_per_pixel)
+        return super().detect(frame_obj)
@@ -0,0 +1,25 @@
+"""Defines the request handler of the local HTTP server, keeping connections alive.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+from http.server import SimpleHTTPRequestHandler
+
+
+class KeepAliveRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files over HTTP/1.1, so connections are kept alive, counting the connections."""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        """Counts the new connection."""
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keeps the test output clean by not logging the requests.
+
+        Args:
+            format (str): Format string of the message.
+        """
@@ -0,0 +1,53 @@
+"""Defines a local HTTP server serving the files of a directory, used by the unit tests of the HLS captures.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+
+import threading
+import functools
+from http.server import ThreadingHTTPServer
+
+from tests.unittests.utils.keep_alive_request_handler import KeepAliveRequestHandler
+
+
+class LocalHttpServer:
+    """Local HTTP server on a free port, serving a directory on a separate thread.
+
+    Attributes:
+        directory (str): Directory served.
+        url (str): Url of the root of the directory.
+
+        __server (ThreadingHTTPServer): The server.
+        __thread (threading.Thread): Thread serving the requests.
+    """
+    def __init__(self, directory):
+        """Starts serving the directory.
+
+        Args:
+            directory (str): Directory to serve.
+        """
+        self.directory = directory
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                            functools.partial(KeepAliveRequestHandler, directory=str(directory)))
+        self.__server.connections = 0
+        self.__server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.__server.server_address[1]}'
+
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    @property
+    def connections(self):
+        """Gets the amount of connections accepted.
+
+        Returns:
+            int: Amount of connections.
+        """
+        return self.__server.connections
+
+    def close(self):
+        """Stops serving."""
+        self.__server.shutdown()
+        self.__server.server_close()
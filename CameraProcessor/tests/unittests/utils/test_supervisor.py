@@ -0,0 +1,89 @@
+"""Tests the supervisor forking and restarting the worker processes.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import os
+import sys
+import time
+import functools
+import multiprocessing
+import pytest
+
+from processor.utils.supervisor import Supervisor
+
+
+def crash_first_runs(runs, crashes, camera_id, hls_url):
+    """Worker that crashes the first runs, counting the runs of every camera.
+
+    Args:
+        runs (multiprocessing.Array): Amount of runs of every camera, indexed by the camera id.
+        crashes (int): Amount of runs that crash.
+        camera_id (str): Id of the camera, the index in runs.
+        hls_url (str): Url of the camera, unused.
+    """
+    # pylint: disable=unused-argument
+    with runs.get_lock():
+        runs[int(camera_id)] += 1
+        run = runs[int(camera_id)]
+
+    if run <= crashes:
+        sys.exit(1)
+
+
+def store_pid(pids, camera_id, hls_url):
+    """Worker that stores its pid and keeps running.
+
+    Args:
+        pids (multiprocessing.Array): Pid of every camera, indexed by the camera id.
+        camera_id (str): Id of the camera, the index in pids.
+        hls_url (str): Url of the camera, unused.
+    """
+    # pylint: disable=unused-argument
+    pids[int(camera_id)] = os.getpid()
+    time.sleep(60)
+
+
+class TestSupervisor:
+    """Tests the supervisor with workers that finish, crash or keep running."""
+    @pytest.mark.timeout(20)
+    def test_restarts_crashed_workers(self):
+        """Tests whether a crashed worker is restarted, and a finished worker is not."""
+        runs = multiprocessing.get_context('fork').Array('i', 2)
+        supervisor = Supervisor(functools.partial(crash_first_runs, runs, 2), [('0', 'url'), ('1', 'url')],
+                                restart_delay=0, poll_interval=0.01)
+        supervisor.run()
+
+        # Both cameras crash twice and finish in the third run.
+        assert list(runs) == [3, 3]
+        assert supervisor.restarts == {'0': 2, '1': 2}
+
+    @pytest.mark.timeout(20)
+    def test_max_restarts(self):
+        """Tests whether the supervisor gives up on a camera after the maximum amount of restarts."""
+        runs = multiprocessing.get_context('fork').Array('i', 1)
+        supervisor = Supervisor(functools.partial(crash_first_runs, runs, 10), [('0', 'url')],
+                                restart_delay=0, max_restarts=1, poll_interval=0.01)
+        supervisor.run()
+
+        assert list(runs) == [2]
+        assert supervisor.restarts == {'0': 1}
+
+    @pytest.mark.timeout(20)
+    def test_workers_are_forked(self):
+        """Tests whether every camera runs in its own process, which is terminated when stopped."""
+        pids = multiprocessing.get_context('fork').Array('i', 2)
+        supervisor = Supervisor(functools.partial(store_pid, pids), [('0', 'url'), ('1', 'url')])
+        supervisor.start()
+
+        while 0 in list(pids):
+            time.sleep(0.01)
+        supervisor.stop()
+
+        assert len({*pids, os.getpid()}) == 3
+        assert not supervisor.poll()
+
+
+if __name__ == '__main__':
+    pytest.main(TestSupervisor)
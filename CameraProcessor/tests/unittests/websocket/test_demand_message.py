@@ -0,0 +1,68 @@
+"""Tests DemandMessage by checking properties.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import pytest
+from processor.websocket.demand_message import DemandMessage
+
+
+# pylint: disable=attribute-defined-outside-init,no-member
+class TestDemandMessage:
+    """Testing DemandMessage.
+
+    Attributes:
+        data (DemandMessage): Example DemandMessage.
+        other (DemandMessage): Other DemandMessage.
+        demand (int): Demand of the camera.
+    """
+    def setup_method(self):
+        """Setup method."""
+        self.demand = 2
+        self.data = DemandMessage(self.demand)
+
+    def test_init(self):
+        """Tests init."""
+        assert self.data.demand == self.demand
+
+    def test_invalid_init(self):
+        """Tests whether an error is raised when the values in the DemandMessage are invalid."""
+        with pytest.raises(TypeError):
+            DemandMessage(1.)  # Test with float rather than int.
+        with pytest.raises(TypeError):
+            DemandMessage('1')  # Test with string rather than int.
+
+    def test_invalid_from_message(self):
+        """Tests whether a message with missing keys raises Exceptions."""
+        # Create invalid messages.
+        missing_demand_message = {'type': 'demand'}
+
+        # Test whether from_message raises exception with invalid messages.
+        with pytest.raises(KeyError):
+            DemandMessage.from_message(missing_demand_message)
+
+    def test_eq(self):
+        """Tests eq function."""
+        self.other = DemandMessage(self.demand)
+        assert self.data == self.other
+
+        # To make sure it also detects when message is not the same.
+        assert self.data != DemandMessage(self.demand + 1)
+
+    def test_repr(self):
+        """Tests the __repr__ function."""
+        assert str(self.data).startswith('DemandMessage(')
+
+    def test_message_parsing(self):
+        """Tests that a DemandMessage constructed from a message can be converted into the original message.
+
+        This method tests both the from_message and to_message functionality of the class.
+        """
+        dict_message = {'type': 'demand', 'demand': self.demand}
+        message = DemandMessage.from_message(dict_message)
+        assert message.to_message() == dict_message
+
+
+if __name__ == '__main__':
+    pytest.main(TestDemandMessage)
@@ -21,6 +21,7 @@ from processor.websocket.boxes_message import BoxesMessage
 from processor.websocket.start_message import StartMessage
 from processor.websocket.stop_message import StopMessage
 from processor.websocket.update_message import UpdateMessage
+from processor.websocket.demand_message import DemandMessage
 
 
 # pylint: disable=protected-access.
@@ -36,6 +37,7 @@ class TestWebsocketClient(WebsocketCoroutines):
     stop_message = StopMessage.from_message({'type': 'stop', 'objectId': 1})
     feature_map_message = UpdateMessage.from_message({'objectId': 1, 'featureMap': [1.1]})
     boxes_message = BoxesMessage(1., BoundingBoxes([]))
+    demand_message = DemandMessage.from_message({'type': 'demand', 'demand': 0})
 
     def get_app(self):
         """Tornado testing creates the application and starts it in the background.
@@ -156,6 +158,19 @@ class TestWebsocketClient(WebsocketCoroutines):
 
         assert dummy_websocket.message_queue.popleft() == self.start_message
 
+    @tornado.testing.gen_test(timeout=10)
+    def test_receive_demand_message(self):
+        """Writes demand message to echo websocket and check that the demand is applied without queueing it."""
+        dummy_websocket = yield self.dummy_ws_connect('/echo', 'mock_id')
+        assert dummy_websocket.demand is None
+        dummy_websocket.send_message(self.demand_message)
+
+        # Give the event loop the control to send the message.
+        yield asyncio.sleep(4)
+
+        assert dummy_websocket.demand == 0
+        assert len(dummy_websocket.message_queue) == 0
+
     @tornado.testing.gen_test(timeout=10)
     def test_dont_receive_boxes_message(self):
         """Writes start message to echo websocket and check that it is not added to message queue.
@@ -14,6 +14,7 @@ from tornado.websocket import WebSocketHandler
 from src.objects.object_management import objects
 from src.objects.tracking_object import TrackingObject
 from src.objects.connections import processors, clients
+from src.objects.demand import update_demand
 import src.utility.logger as logger
 
 
@@ -25,6 +26,7 @@ class ClientSocket(WebSocketHandler):
         authorized (bool): Shows whether the websocket connection is authorized.
         auth (Auth): Authorization object for the websocket handler
         uses_images (bool): Bool indicating whether this client should receive images
+        subscriptions (Optional[Set[str]]): Identifiers of the cameras the client watches, None watches all cameras
     """
 
     def __init__(self, application, request):
@@ -38,6 +40,7 @@ class ClientSocket(WebSocketHandler):
         self.identifier = max(clients.keys(), default=0) + 1
         self.authorized = False
         self.uses_images = False
+        self.subscriptions = None
 
         # Load the auth object from app settings.
         self.auth = self.application.settings.get('client_auth')
@@ -68,6 +71,7 @@ class ClientSocket(WebSocketHandler):
         # Add the client directly if auth is disabled.
         if self.auth is None:
             clients[self.identifier] = self
+            update_demand()
 
     # pylint: disable=broad-except
     def on_message(self, message):
@@ -79,10 +83,12 @@ class ClientSocket(WebSocketHandler):
         Args:
             message (string):
                 JSON with at least a "type" property. This property can have the following values
-                    - "start" | This command is used to start the tracking of an object in the specified frame,
-                                see start_tracking, for the other expected properties.
-                    - "stop"  | This command is used to stop the tracking of an object,
-                                see stop_tracking, for the other expected properties.
+                    - "start"            | This command is used to start the tracking of an object in the specified
+                                           frame, see start_tracking, for the other expected properties.
+                    - "stop"             | This command is used to stop the tracking of an object,
+                                           see stop_tracking, for the other expected properties.
+                    - "setSubscriptions" | This command sets the cameras the client watches,
+                                           see set_subscriptions, for the other expected properties.
         """
         logger.log_message_receive(message, '/client', self.request.remote_ip)
 
@@ -94,6 +100,8 @@ class ClientSocket(WebSocketHandler):
             actions = {
                 'setUsesImages':
                     lambda: self.set_uses_image(message_object),
+                'setSubscriptions':
+                    lambda: self.set_subscriptions(message_object),
                 'start':
                     lambda: self.start_tracking(message_object),
                 'stop':
@@ -154,6 +162,9 @@ class ClientSocket(WebSocketHandler):
         clients.pop(self.identifier, None)
         logger.log(f'Client with id {self.identifier} disconnected.')
 
+        # The cameras the client watched may no longer be needed.
+        update_demand()
+
     def authenticate(self, message):
         """Authenticates a client.
 
@@ -167,6 +178,7 @@ class ClientSocket(WebSocketHandler):
             self.auth.validate(message['jwt'])
             self.authorized = True
             clients[self.identifier] = self
+            update_demand()
 
     def set_uses_image(self, message):
         """Set whether this client uses images.
@@ -190,6 +202,19 @@ class ClientSocket(WebSocketHandler):
                     }
                     self.send_message(json.dumps(client_message))
 
+    def set_subscriptions(self, message):
+        """Set the cameras this client watches, so processors of other cameras can lower their processing rate.
+
+        Args:
+            message (json):
+                JSON message that was received. It should contain the following property
+                    - "cameraIds" | a list of the identifiers of the watched cameras, or null to watch all cameras
+        """
+        camera_ids = message['cameraIds']
+        self.subscriptions = None if camera_ids is None else set(camera_ids)
+
+        update_demand()
+
     @staticmethod
     def start_tracking(message):
         """Creates tracking object and sends start tracking command to specified processor.
@@ -261,6 +286,9 @@ class ClientSocket(WebSocketHandler):
                     client_message
                 ))
 
+        # Every processor is needed to re-identify the new object.
+        update_demand()
+
     @staticmethod
     def stop_tracking(message):
         """Removes tracking object and sends stop tracking command to all processors.
@@ -294,3 +322,5 @@ class ClientSocket(WebSocketHandler):
                 }))
 
         logger.log(f'stopped tracking of object with id {object_id}')
+
+        update_demand()
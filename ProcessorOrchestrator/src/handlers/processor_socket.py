@@ -14,6 +14,7 @@ from tornado.websocket import WebSocketHandler
 
 from src.objects.object_management import objects
 from src.objects.connections import processors
+from src.objects.demand import send_demand
 import src.handlers.client_socket as client_socket
 import src.utility.logger as logger
 
@@ -25,6 +26,7 @@ class ProcessorSocket(WebSocketHandler):
         identifier (int): Serves as the unique identifier to this object.
         authorized (bool): Shows whether the connection is authorized.
         auth (Auth): Authorization object for the websocket handler.
+        demand (Optional[int]): The demand that was last sent to the processor, None if it was never sent.
     """
 
     def __init__(self, application, request):
@@ -37,6 +39,7 @@ class ProcessorSocket(WebSocketHandler):
         super().__init__(application, request)
         self.identifier = None
         self.authorized = False
+        self.demand = None
 
         # Load the auth object from app settings.
         self.auth = self.application.settings.get('processor_auth')
@@ -178,6 +181,9 @@ class ProcessorSocket(WebSocketHandler):
                 'featureMap': tracking_object[0].feature_map
             }))
 
+        # Let the processor know how much its output is needed.
+        send_demand(self, force=True)
+
     def send_bounding_boxes(self, message):
         """Sends bounding boxes to all clients.
 
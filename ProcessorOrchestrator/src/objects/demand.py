@@ -0,0 +1,57 @@
+"""Demand component deciding how much the output of every processor is needed.
+
+This file contains functions that compute the demand of a camera, the amount of clients watching the camera plus the
+amount of objects being tracked, and push it to the processors whenever it changed. A processor without demand lowers
+its processing rate, and resumes as soon as its demand is above zero again.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import json
+
+import src.objects.object_management as object_management
+from src.objects.connections import processors, clients
+
+
+def camera_demand(camera_id):
+    """Computes the demand of a camera.
+
+    Every client subscribed to the camera adds one, a client that never set its subscriptions watches all cameras.
+    Every object that is being tracked adds one, since it can be re-identified on any camera.
+
+    Args:
+        camera_id (str): The identifier of the processor of the camera.
+
+    Returns:
+        int: The demand of the camera, zero if nothing needs its output.
+    """
+    watching_clients = [client for client in list(clients.values())
+                        if client.subscriptions is None or camera_id in client.subscriptions]
+
+    return len(watching_clients) + len(object_management.objects)
+
+
+def update_demand():
+    """Sends the demand of every processor of which the demand changed since it was last sent."""
+    for processor in list(processors.values()):
+        send_demand(processor)
+
+
+def send_demand(processor, force=False):
+    """Sends the demand of a processor if it changed since it was last sent.
+
+    Args:
+        processor (ProcessorSocket): The processor to send the demand to.
+        force (bool): Whether to send the demand even if it did not change.
+    """
+    demand = camera_demand(processor.identifier)
+
+    if demand == processor.demand and not force:
+        return
+
+    processor.demand = demand
+    processor.send_message(json.dumps({
+        'type': 'demand',
+        'demand': demand
+    }))
@@ -14,6 +14,7 @@ import time
 from datetime import datetime, timedelta
 
 from src.objects.connections import processors
+import src.objects.demand as demand
 
 
 def start_tracking_timeout_monitoring(timeout, event_loop):
@@ -65,6 +66,10 @@ def monitor_tracking_timeout(timeout):
     for tracking_object in delete_list:
         tracking_object.remove_self()
 
+    # Processors may no longer be needed without the expired objects.
+    if len(delete_list) > 0:
+        demand.update_demand()
+
     # Sleep so that checking only happens once every second.
     time.sleep(1)
 
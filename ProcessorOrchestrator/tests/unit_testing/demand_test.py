@@ -0,0 +1,62 @@
+"""Tests the demand of the cameras.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+
+Unit testing module that only tests the demand computation and the sending of demand messages.
+"""
+import pytest
+
+from src.objects.connections import processors, clients
+from src.objects.demand import camera_demand, update_demand
+from src.objects.tracking_object import TrackingObject
+from tests.unit_testing.fake_processor import FakeProcessor
+from tests.unit_testing.fake_client import FakeClient
+
+
+@pytest.fixture(autouse=True)
+def clear_connections():
+    """Removes the fake connections after every test."""
+    yield
+    processors.clear()
+    clients.clear()
+
+
+def test_no_demand_without_clients_and_objects():
+    """Tests whether a camera that nobody watches while no object is tracked has no demand."""
+    assert camera_demand('camera') == 0
+
+
+def test_subscribed_clients_add_demand():
+    """Tests whether only clients watching the camera add demand."""
+    FakeClient(1, {'camera'})
+    FakeClient(2, {'other camera'})
+    FakeClient(3)
+
+    assert camera_demand('camera') == 2
+    assert camera_demand('unwatched camera') == 1
+
+
+def test_tracked_objects_add_demand():
+    """Tests whether a tracked object adds demand to every camera."""
+    tracking_object = TrackingObject(None)
+    demand = camera_demand('camera')
+    tracking_object.remove_self()
+
+    assert demand == 1
+    assert camera_demand('camera') == 0
+
+
+def test_demand_sent_when_changed():
+    """Tests whether the demand is only sent to processors of which the demand changed."""
+    watched = FakeProcessor('watched')
+    unwatched = FakeProcessor('unwatched')
+
+    update_demand()
+    FakeClient(1, {'watched'})
+    update_demand()
+    update_demand()
+
+    assert watched.messages == [{'type': 'demand', 'demand': 0}, {'type': 'demand', 'demand': 1}]
+    assert unwatched.messages == [{'type': 'demand', 'demand': 0}]
@@ -0,0 +1,21 @@
+"""Fake client socket with subscriptions, used by the unit tests.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+from src.objects.connections import clients
+
+
+class FakeClient:
+    """Client socket with subscriptions."""
+
+    def __init__(self, identifier, subscriptions=None):
+        """Registers the client under the identifier.
+
+        Args:
+            identifier (int): The identifier of the client.
+            subscriptions (Optional[Set[str]]): The cameras the client watches, None watches all cameras.
+        """
+        self.subscriptions = subscriptions
+        clients[identifier] = self
@@ -0,0 +1,32 @@
+"""Fake processor socket storing the messages sent to it, used by the unit tests.
+
+This program has been developed by students from the bachelor Computer Science at
+Utrecht University within the Software Project course.
+© Copyright Utrecht University (Department of Information and Computing Sciences)
+"""
+import json
+
+from src.objects.connections import processors
+
+
+class FakeProcessor:
+    """Processor socket storing the messages sent to it."""
+
+    def __init__(self, identifier):
+        """Registers the processor under the identifier.
+
+        Args:
+            identifier (str): The identifier of the processor.
+        """
+        self.identifier = identifier
+        self.demand = None
+        self.messages = []
+        processors[identifier] = self
+
+    def send_message(self, message):
+        """Stores the message.
+
+        Args:
+            message (string): The message that is sent.
+        """
+        self.messages.append(json.loads(message))